@@ -0,0 +1,94 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Synthetic tables for benchmarks."""
+
+from __future__ import annotations
+
+import random
+import string
+from typing import Any
+
+# Column of every benchmark table used as file name.
+ID_COLUMN = "id"
+
+
+def parse_columns(spec: str) -> dict[str, str]:
+    """Build table columns from a column mix.
+
+    Parameters
+    ----------
+    spec : str
+        Comma separated ``TYPE:COUNT`` pairs, e.g. ``"INT:3,TEXT:2"``.
+
+    Returns
+    -------
+    dict[str, str]
+        ``id`` column followed by ``int_0``, ``int_1``, ``text_0`` ...
+
+    Raises
+    ------
+    ValueError
+        If a pair is malformed.
+    """
+    columns = {ID_COLUMN: "INT"}
+    for part in spec.split(","):
+        column_type, _, count = part.strip().partition(":")
+        if not column_type or not count.isdigit():
+            msg = f"Column mix must look like 'INT:3,TEXT:2', got {part!r}"
+            raise ValueError(msg)
+        for i in range(int(count)):
+            columns[f"{column_type.lower()}_{i}"] = column_type.upper()
+    return columns
+
+
+def generate_rows(columns: dict[str, str],
+                  rows: int,
+                  *,
+                  cardinality: int = 100,
+                  seed: int = 0,
+                  ) -> list[dict[str, Any]]:
+    """Generate records for a table.
+
+    Parameters
+    ----------
+    columns : dict[str, str]
+        Table columns from ``parse_columns``.
+    rows : int
+        Number of records.
+    cardinality : int, optional
+        Distinct values of every non id column, by default 100.
+    seed : int, optional
+        Seed of the generator, by default 0.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Records with ids ``0 .. rows - 1``.
+    """
+    rng = random.Random(seed)  # noqa: S311 - not for crypto
+    words = ["".join(rng.choices(string.ascii_lowercase, k=8))
+             for _ in range(cardinality)]
+    result = []
+    for i in range(rows):
+        record: dict[str, Any] = {}
+        for name, column_type in columns.items():
+            if name == ID_COLUMN:
+                record[name] = i
+            elif column_type == "INT":
+                record[name] = rng.randrange(cardinality)
+            else:
+                record[name] = rng.choice(words)
+        result.append(record)
+    return result
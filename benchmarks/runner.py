@@ -0,0 +1,372 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark runner.
+
+Times ``new_data``, ``find`` by id (generator file shortcut), ``find`` by
+a plain column (full scan), ``update`` and ``delete`` of the sync and
+async managers on synthetic tables and reports throughput and latency
+percentiles as JSON::
+
+    python -m benchmarks --rows 1000,100000 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.data import ID_COLUMN, generate_rows, parse_columns
+from pyfiles_db import FilesDB
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+TABLE = "bench"
+
+
+@dataclass
+class BenchmarkConfig:
+    """Options of a benchmark run."""
+
+    rows: list[int] = field(default_factory=lambda: [1000])
+    columns: str = "INT:3,TEXT:2"
+    modes: list[str] = field(default_factory=lambda: ["sync", "async"])
+    lookups: int = 1000
+    scans: int = 5
+    updates: int = 1000
+    deletes: int = 1000
+    concurrency: int = 64
+    io_workers: int | None = None
+    storage: Path | None = None
+    seed: int = 0
+    label: str = ""
+
+
+def percentile(samples: Sequence[float], p: float) -> float:
+    """Return the nearest-rank percentile.
+
+    Parameters
+    ----------
+    samples : Sequence[float]
+        Sorted samples.
+    p : float
+        Percentile in ``(0, 100]``.
+
+    Returns
+    -------
+    float
+        The percentile, 0.0 for no samples.
+    """
+    if not samples:
+        return 0.0
+    return samples[max(0, math.ceil(p / 100 * len(samples)) - 1)]
+
+
+def summarize(operation: str,
+              mode: str,
+              rows: int,
+              latencies_ns: list[int],
+              elapsed_ns: int,
+              ) -> dict[str, Any]:
+    """Build the report of one operation.
+
+    Parameters
+    ----------
+    operation : str
+        Name of the operation.
+    mode : str
+        ``sync`` or ``async``.
+    rows : int
+        Rows of the table.
+    latencies_ns : list[int]
+        Latency of every call.
+    elapsed_ns : int
+        Wall time of all calls.
+
+    Returns
+    -------
+    dict[str, Any]
+        Count, throughput and p50/p95/p99 latency in milliseconds.
+    """
+    samples = sorted(latency / 1e6 for latency in latencies_ns)
+    seconds = elapsed_ns / 1e9
+    return {
+        "operation": operation,
+        "mode": mode,
+        "rows": rows,
+        "count": len(samples),
+        "seconds": round(seconds, 6),
+        "ops_per_sec": round(len(samples) / seconds, 2) if seconds else 0.0,
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+    }
+
+
+def _timed(fn: Callable[[], object]) -> int:
+    start = time.perf_counter_ns()
+    fn()
+    return time.perf_counter_ns() - start
+
+
+async def _timed_async(fn: Callable[[], Awaitable[object]]) -> int:
+    start = time.perf_counter_ns()
+    await fn()
+    return time.perf_counter_ns() - start
+
+
+class _Workload:
+    """Records and the calls made against one table."""
+
+    def __init__(self, config: BenchmarkConfig, rows: int) -> None:
+        self.columns = parse_columns(config.columns)
+        self.records = generate_rows(self.columns, rows, seed=config.seed)
+        rng = random.Random(config.seed)  # noqa: S311 - not for crypto
+        self.lookups = [rng.randrange(rows) for _ in range(config.lookups)]
+        self.updates = [rng.randrange(rows) for _ in range(config.updates)]
+        self.deletes = rng.sample(range(rows), min(config.deletes, rows))
+        scan_column = next(name for name in self.columns
+                           if name != ID_COLUMN)
+        self.scans = [
+            f"{scan_column} == {self.records[rng.randrange(rows)][scan_column]}"
+            for _ in range(config.scans)]
+
+    def updated(self, file_id: int) -> dict[str, Any]:
+        record = dict(self.records[file_id])
+        for name, column_type in self.columns.items():
+            if name != ID_COLUMN and column_type == "INT":
+                record[name] += 1
+                break
+        return record
+
+
+def bench_sync(config: BenchmarkConfig,
+               rows: int,
+               storage: Path,
+               ) -> list[dict[str, Any]]:
+    """Benchmark the sync manager.
+
+    Parameters
+    ----------
+    config : BenchmarkConfig
+        Options of the run.
+    rows : int
+        Rows of the table.
+    storage : Path
+        Empty database location.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Report of every operation.
+    """
+    work = _Workload(config, rows)
+    db = FilesDB().init_sync(storage)
+    db.create_table(TABLE, work.columns, id_generator=ID_COLUMN)
+    report = []
+
+    def measure(operation: str, calls: list[Callable[[], object]]) -> None:
+        start = time.perf_counter_ns()
+        latencies = [_timed(call) for call in calls]
+        report.append(summarize(operation, "sync", rows, latencies,
+                                time.perf_counter_ns() - start))
+
+    measure("new_data", [partial(db.new_data, TABLE, r)
+                         for r in work.records])
+    measure("find_id", [partial(db.find, TABLE, f"{ID_COLUMN} == {i}")
+                        for i in work.lookups])
+    measure("find_scan", [partial(db.find, TABLE, c) for c in work.scans])
+    measure("update", [partial(db.update, TABLE, str(i), work.updated(i))
+                       for i in work.updates])
+    measure("delete", [partial(db.delete, TABLE, str(i))
+                       for i in work.deletes])
+    return report
+
+
+async def bench_async(config: BenchmarkConfig,
+                      rows: int,
+                      storage: Path,
+                      ) -> list[dict[str, Any]]:
+    """Benchmark the async manager.
+
+    Writes are issued ``config.concurrency`` at a time, reads one by one.
+
+    Parameters
+    ----------
+    config : BenchmarkConfig
+        Options of the run.
+    rows : int
+        Rows of the table.
+    storage : Path
+        Empty database location.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Report of every operation.
+    """
+    work = _Workload(config, rows)
+    db = FilesDB().init_async(storage, io_workers=config.io_workers)
+    await db.create_table(TABLE, work.columns, id_generator=ID_COLUMN)
+    report = []
+
+    async def measure(operation: str,
+                      calls: list[Callable[[], Awaitable[object]]],
+                      concurrency: int,
+                      ) -> None:
+        latencies: list[int] = []
+        start = time.perf_counter_ns()
+        for i in range(0, len(calls), concurrency):
+            latencies.extend(await asyncio.gather(
+                *(_timed_async(call) for call in calls[i:i + concurrency])))
+        report.append(summarize(operation, "async", rows, latencies,
+                                time.perf_counter_ns() - start))
+
+    writes = config.concurrency
+    await measure("new_data", [partial(db.new_data, TABLE, r)
+                               for r in work.records], writes)
+    await measure("find_id",
+                  [partial(db.find, TABLE, f"{ID_COLUMN} == {i}")
+                   for i in work.lookups], 1)
+    await measure("find_scan", [partial(db.find, TABLE, c)
+                                for c in work.scans], 1)
+    await measure("update",
+                  [partial(db.update, TABLE, str(i), work.updated(i))
+                   for i in work.updates], writes)
+    await measure("delete", [partial(db.delete, TABLE, str(i))
+                             for i in work.deletes], writes)
+    db.close()
+    return report
+
+
+def run(config: BenchmarkConfig) -> dict[str, Any]:
+    """Run every mode on every table size.
+
+    Parameters
+    ----------
+    config : BenchmarkConfig
+        Options of the run.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``environment`` of the run and ``results`` of every operation.
+    """
+    results: list[dict[str, Any]] = []
+    for rows in config.rows:
+        for mode in config.modes:
+            storage = Path(tempfile.mkdtemp(prefix="pyfiles_db-bench-",
+                                            dir=config.storage))
+            try:
+                if mode == "sync":
+                    results.extend(bench_sync(config, rows, storage))
+                else:
+                    results.extend(asyncio.run(
+                        bench_async(config, rows, storage)))
+            finally:
+                shutil.rmtree(storage, ignore_errors=True)
+    environment = asdict(config)
+    environment["storage"] = str(config.storage or tempfile.gettempdir())
+    environment.update(python=platform.python_version(),
+                       platform=platform.platform(),
+                       started=time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    return {"environment": environment, "results": results}
+
+
+def _parse_args(
+        argv: Sequence[str] | None,
+        ) -> tuple[BenchmarkConfig, Path | None]:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark pyfiles_db operations.")
+    parser.add_argument("--rows", default="1000",
+                        help="comma separated table sizes, e.g. "
+                             "1000,100000,1000000 (default: 1000)")
+    parser.add_argument("--columns", default="INT:3,TEXT:2",
+                        help="column mix besides id (default: INT:3,TEXT:2)")
+    parser.add_argument("--modes", default="sync,async",
+                        help="managers to run (default: sync,async)")
+    parser.add_argument("--lookups", type=int, default=1000,
+                        help="finds by id (default: 1000)")
+    parser.add_argument("--scans", type=int, default=5,
+                        help="finds by a plain column (default: 5)")
+    parser.add_argument("--updates", type=int, default=1000,
+                        help="updates (default: 1000)")
+    parser.add_argument("--deletes", type=int, default=1000,
+                        help="deletes (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=64,
+                        help="concurrent async writes (default: 64)")
+    parser.add_argument("--io-workers", type=int, default=None,
+                        help="threads of the async I/O pool, 0 uses aiofiles")
+    parser.add_argument("--storage", type=Path, default=None,
+                        help="parent folder of the temporary databases")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="",
+                        help="free text stored with the results, e.g. a "
+                             "commit hash")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    if unknown := set(modes) - {"sync", "async"}:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    config = BenchmarkConfig(
+        rows=[int(rows) for rows in args.rows.split(",")],
+        columns=args.columns,
+        modes=modes,
+        lookups=args.lookups,
+        scans=args.scans,
+        updates=args.updates,
+        deletes=args.deletes,
+        concurrency=args.concurrency,
+        io_workers=args.io_workers,
+        storage=args.storage,
+        seed=args.seed,
+        label=args.label)
+    return config, args.output
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None, optional
+        Arguments, by default ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    config, output = _parse_args(argv)
+    text = json.dumps(run(config), indent=2)
+    if output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        output.write_text(text + "\n")
+    return 0
@@ -0,0 +1,146 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Startup benchmark.
+
+Times ``from pyfiles_db import FilesDB`` plus ``init_sync``/``init_async``
+in fresh interpreters, the cost every short-lived CLI or serverless call
+pays, and fails when the median exceeds a budget::
+
+    python -m benchmarks.startup --runs 20 --budget-ms 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyfiles_db
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Modules a sync-only process should never pay for.
+HEAVY_MODULES = ("aiofiles", "asyncio", "concurrent.futures", "logging")
+DEFAULT_BUDGET_MS = 100.0
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from pyfiles_db import FilesDB
+getattr(FilesDB(), sys.argv[1])(storage=sys.argv[2])
+elapsed = time.perf_counter() - start
+heavy = [m for m in sys.argv[3].split(",") if m in sys.modules]
+sys.stdout.write(json.dumps({"elapsed": elapsed, "heavy_modules": heavy}))
+"""
+
+
+def _child_env() -> dict[str, str]:
+    """Return environment that lets a child import this ``pyfiles_db``."""
+    source = str(Path(pyfiles_db.__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    path = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = source if not path else source + os.pathsep + path
+    return env
+
+
+def measure(mode: str, runs: int) -> dict[str, Any]:
+    """Time startup of one manager in ``runs`` fresh interpreters.
+
+    Parameters
+    ----------
+    mode : str
+        ``"sync"`` or ``"async"``.
+    runs : int
+        Number of interpreters to start.
+
+    Returns
+    -------
+    dict[str, Any]
+        Median and maximum of the in-process startup and of the whole
+        interpreter, and heavy modules that got imported.
+    """
+    env = _child_env()
+    startup: list[float] = []
+    process: list[float] = []
+    heavy: set[str] = set()
+    with tempfile.TemporaryDirectory(prefix="pyfiles_db_startup_") as tmp:
+        for _ in range(runs):
+            start = time.perf_counter()
+            out = subprocess.run(  # noqa: S603 - fixed interpreter and code
+                [sys.executable, "-c", _CHILD, f"init_{mode}",
+                 str(Path(tmp) / "db"), ",".join(HEAVY_MODULES)],
+                capture_output=True, check=True, env=env, text=True)
+            process.append(time.perf_counter() - start)
+            child = json.loads(out.stdout)
+            startup.append(child["elapsed"])
+            heavy.update(child["heavy_modules"])
+    return {
+        "mode": mode,
+        "runs": runs,
+        "median_ms": statistics.median(startup) * 1000,
+        "max_ms": max(startup) * 1000,
+        "process_median_ms": statistics.median(process) * 1000,
+        "heavy_modules": sorted(heavy),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the startup benchmark from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None, optional
+        Arguments, by default ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        0 if every mode is within budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Time import and manager creation in fresh "
+                    "interpreters.")
+    parser.add_argument("--runs", type=int, default=20,
+                        help="interpreters per mode (default: 20)")
+    parser.add_argument("--modes", default="sync,async",
+                        help="comma separated managers (default: sync,async)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="maximal median startup in milliseconds "
+                             f"(default: {DEFAULT_BUDGET_MS:g})")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+    results = [measure(mode, args.runs) for mode in args.modes.split(",")]
+    over = [r["mode"] for r in results if r["median_ms"] > args.budget_ms]
+    text = json.dumps({"budget_ms": args.budget_ms, "over_budget": over,
+                       "results": results}, indent=2)
+    if args.output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        args.output.write_text(text + "\n")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,17 @@
 
 """Init library."""
 
-from .files_db import FilesDB
+from typing import TYPE_CHECKING
+
+from pyfiles_db.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .files_db import FilesDB
 
 __all__ = ["FilesDB"]
+
+# Submodules are imported on first attribute access, so importing the
+# package stays cheap.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "FilesDB": ".files_db",
+})
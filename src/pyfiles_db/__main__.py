@@ -0,0 +1,143 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Command line: bulk import and export, and the local server."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from pyfiles_db.files_db import FilesDB
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+class _Progress:
+    """Progress line of records done and throughput on a terminal."""
+
+    def __init__(self, out: TextIO, verb: str) -> None:
+        self._out = out
+        self._verb = verb
+
+    def __call__(self, rows: int, seconds: float) -> None:
+        rate = rows / seconds if seconds > 0 else 0.0
+        self._out.write(f"\r{self._verb} {rows} records ({rate:,.0f}/s)")
+        self._out.flush()
+
+    def done(self, rows: int, seconds: float) -> None:
+        self(rows, seconds)
+        self._out.write(f" in {seconds:.1f}s\n")
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyfiles_db",
+        description="Stream records between a table and a JSON lines or "
+                    "CSV file, or serve the storage to local processes.")
+    parser.add_argument("--storage", type=Path, default=None,
+                        help="database folder (default: the library "
+                             "default)")
+    parser.add_argument("--format", choices=sorted(set(_SUFFIXES.values())),
+                        help="file format (default: from the suffix)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="do not show progress")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("import", help="add records from a file")
+    load.add_argument("table")
+    load.add_argument("file", type=Path)
+    load.add_argument("--batch-size", type=int, default=10_000,
+                      help="records validated and written together")
+    dump = commands.add_parser("export", help="write records to a file")
+    dump.add_argument("table")
+    dump.add_argument("file", type=Path)
+    dump.add_argument("--condition", help="condition as accepted by find")
+    serve = commands.add_parser(
+        "serve", help="own the storage and serve it on a Unix socket")
+    # Also accepted after the command; SUPPRESS keeps the global value.
+    serve.add_argument("--storage", type=Path, default=argparse.SUPPRESS,
+                       help="database folder")
+    serve.add_argument("--socket", type=Path, required=True,
+                       help="path of the socket to create")
+    serve.add_argument("--write-window", type=float, default=0.002,
+                       help="seconds to coalesce concurrent writes of a "
+                            "table (default: 0.002)")
+    serve.add_argument("--cache-records", type=int, default=100_000,
+                       help="records kept by the result cache, 0 to turn "
+                            "it off (default: 100000)")
+    return parser
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """Serve the storage until interrupted."""
+    from pyfiles_db.database_manager.server import serve  # noqa: PLC0415
+    from pyfiles_db.utils import ResultCache  # noqa: PLC0415
+
+    cache = (ResultCache(max_records=args.cache_records)
+             if args.cache_records > 0 else None)
+    db = FilesDB().init_async(storage=args.storage,
+                              write_window=args.write_window,
+                              result_cache=cache)
+    if not args.quiet:
+        sys.stderr.write(f"serving {args.storage or 'default storage'} "
+                         f"on {args.socket}\n")
+    serve(db, args.socket)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None, optional
+        Arguments without the program name, by default ``sys.argv``.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return _serve(args)
+    fmt = args.format or _SUFFIXES.get(args.file.suffix.lower())
+    if fmt is None:
+        parser.error(f"cannot tell the format of {args.file}, use --format")
+    db = FilesDB().init_sync(storage=args.storage)
+    progress = _Progress(sys.stderr, f"{args.command}ed")
+    report = None if args.quiet else progress
+    start = time.perf_counter()
+    if args.command == "import":
+        load = db.import_csv if fmt == "csv" else db.import_jsonl
+        rows = load(args.table, args.file, batch_size=args.batch_size,
+                    progress=report)
+    else:
+        dump = db.export_csv if fmt == "csv" else db.export_jsonl
+        rows = dump(args.table, args.file, args.condition, progress=report)
+    if report is not None:
+        progress.done(rows, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
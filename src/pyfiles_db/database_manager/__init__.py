@@ -14,9 +14,37 @@
 
 """Init database managers."""
 
-from ._db import _DB
-from .async_db import _DBasync
-from .meta import META
-from .sync_db import _DBsync
+from typing import TYPE_CHECKING
 
-__all__ = ["META", "_DB", "_DBasync", "_DBsync"]
+from pyfiles_db.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from ._db import _DB
+    from ._schema import Record
+    from .async_db import _DBasync
+    from .client import _DBclient, _DBclientAsync
+    from .meta import META
+    from .server import Server
+    from .sync_db import _DBsync
+
+__all__ = [
+    "META",
+    "_DB",
+    "Record",
+    "Server",
+    "_DBasync",
+    "_DBclient",
+    "_DBclientAsync",
+    "_DBsync",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "_DB": "._db",
+    "_DBasync": ".async_db",
+    "_DBclient": ".client",
+    "_DBclientAsync": ".client",
+    "META": ".meta",
+    "Record": "._schema",
+    "Server": ".server",
+    "_DBsync": ".sync_db",
+})
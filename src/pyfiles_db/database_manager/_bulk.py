@@ -0,0 +1,196 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Streaming readers and writers of JSON lines and CSV files."""
+
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from pyfiles_db.errors import DataIsUncorrectError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from pyfiles_db.database_manager._schema import _Schema
+
+JSONL = "jsonl"
+CSV = "csv"
+FORMATS = (JSONL, CSV)
+# Records per chunk of an import or export.
+BATCH_SIZE = 10_000
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:  # noqa: UP047
+    """Split an iterable into lists of at most ``size`` items.
+
+    Parameters
+    ----------
+    items : Iterable[T]
+        Items to split.
+    size : int
+        Maximum length of a chunk.
+
+    Yields
+    ------
+    list[T]
+        Consecutive items.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def read_rows(path: Path,
+              fmt: str,
+              schema: _Schema,
+              ) -> Iterator[dict[str, Any]]:
+    """Stream the records of an import file.
+
+    Parameters
+    ----------
+    path : Path
+        JSON lines or CSV file. A CSV file starts with a header row of
+        column names.
+    fmt : str
+        ``"jsonl"`` or ``"csv"``.
+    schema : _Schema
+        Validator of the target table, converting text values.
+
+    Yields
+    ------
+    dict[str, Any]
+        Record to validate.
+
+    Raises
+    ------
+    DataIsUncorrectError
+        If a JSON line is not an object or a value is not in the text
+        form of its column type.
+    """
+    with Path.open(path, encoding="utf-8", newline="") as f:
+        if fmt == CSV:
+            for row in csv.DictReader(f):
+                yield schema.load(row, text=True)
+            return
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise DataIsUncorrectError(data=row)
+            yield schema.load(row, text=False)
+
+
+class RowWriter:
+    """Writer of exported records to an open text file.
+
+    Parameters
+    ----------
+    f : IO[str]
+        File opened for writing with ``newline=""``.
+    fmt : str
+        ``"jsonl"`` or ``"csv"``. CSV files get a header row of the
+        table columns.
+    schema : _Schema
+        Validator of the exported table, decoding stored records.
+    """
+
+    def __init__(self, f: IO[str], fmt: str, schema: _Schema) -> None:
+        """Init writer.
+
+        Parameters
+        ----------
+        f : IO[str]
+            Output file.
+        fmt : str
+            ``"jsonl"`` or ``"csv"``.
+        schema : _Schema
+            Validator of the exported table.
+        """
+        self._f = f
+        self._schema = schema
+        self._csv: csv.DictWriter[str] | None = None
+        if fmt == CSV:
+            self._csv = csv.DictWriter(f, list(schema.columns),
+                                       extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, records: Iterable[dict[str, Any]]) -> None:
+        """Write stored records.
+
+        Parameters
+        ----------
+        records : Iterable[dict[str, Any]]
+            Records as read from their files; they are decoded in place.
+        """
+        schema = self._schema
+        if self._csv is not None:
+            self._csv.writerows(schema.dump(schema.decode(record), text=True)
+                                for record in records)
+            return
+        self._f.writelines(
+            json.dumps(schema.dump(schema.decode(record), text=False),
+                       ensure_ascii=False) + "\n"
+            for record in records)
+
+
+def check_bulk(fmt: str, batch_size: int) -> None:
+    """Validate the options of an import or export.
+
+    Parameters
+    ----------
+    fmt : str
+        File format.
+    batch_size : int
+        Records per chunk.
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown or ``batch_size`` is not positive.
+    """
+    if fmt not in FORMATS:
+        msg = f"format must be one of {FORMATS}, got {fmt!r}"
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+
+
+def row_filter(column: str,
+               test: Callable[[Any], bool],
+               ) -> Callable[[dict[str, Any]], bool]:
+    """Return a predicate on records from a test of a column value.
+
+    Parameters
+    ----------
+    column : str
+        Column of the condition.
+    test : Callable[[Any], bool]
+        Test of the column value.
+
+    Returns
+    -------
+    Callable[[dict[str, Any]], bool]
+        True for records with a matching value.
+    """
+    return lambda record: column in record and test(record[column])
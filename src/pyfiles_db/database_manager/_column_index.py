@@ -0,0 +1,224 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory index of one column."""
+
+from __future__ import annotations
+
+import bisect
+import json
+from typing import TYPE_CHECKING, Any
+
+from pyfiles_db.database_manager._query import (
+    COMPARISONS,
+    CONTAINS,
+    EQ,
+    STARTSWITH,
+    matcher,
+    order_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Journal operations, one JSON array per line.
+ADD = "+"
+REMOVE = "-"
+_GRAM = 3
+
+
+def _grams(text: str) -> set[str]:
+    """Return the trigrams of a string."""
+    return {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class _ColumnIndex:
+    """Column values mapped to file ids.
+
+    Distinct values are kept sorted, so prefix lookups are a binary
+    search and ordered reads need no sort. String values are also split
+    into trigrams for substring lookups. The index lives in a journal
+    file of ``["+", file_id, value]`` and ``["-", file_id]``
+    lines that writers append to and readers replay.
+    """
+
+    def __init__(self) -> None:
+        """Init empty index."""
+        self._ids: dict[Any, dict[str, None]] = {}
+        self._values: dict[str, Any] = {}
+        # Insertion number of every file id, to return ids in the order
+        # records were added like a full scan does.
+        self._seq: dict[str, int] = {}
+        self._next = 0
+        self._sorted: list[Any] = []
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed file ids."""
+        return len(self._values)
+
+    def add(self, file_id: str, value: Any) -> None:  # noqa: ANN401
+        """Index a value of a record, replacing its previous value.
+
+        Parameters
+        ----------
+        file_id : str
+            Name of the record file.
+        value : Any
+            Column value of the record.
+        """
+        if file_id in self._values:
+            self.remove(file_id)
+        try:
+            hash(value)
+        except TypeError:
+            # Lists and objects never match a condition value.
+            return
+        self._values[file_id] = value
+        self._seq[file_id] = self._next
+        self._next += 1
+        ids = self._ids.get(value)
+        if ids is None:
+            ids = self._ids[value] = {}
+            bisect.insort(self._sorted, value, key=order_key)
+            if isinstance(value, str):
+                for gram in _grams(value):
+                    self._trigrams.setdefault(gram, set()).add(value)
+        ids[file_id] = None
+
+    def remove(self, file_id: str) -> None:
+        """Drop a record from the index.
+
+        Parameters
+        ----------
+        file_id : str
+            Name of the record file.
+        """
+        if file_id not in self._values:
+            return
+        value = self._values.pop(file_id)
+        del self._seq[file_id]
+        ids = self._ids[value]
+        del ids[file_id]
+        if ids:
+            return
+        del self._ids[value]
+        del self._sorted[bisect.bisect_left(self._sorted, order_key(value),
+                                            key=order_key)]
+        if isinstance(value, str):
+            for gram in _grams(value):
+                values = self._trigrams[gram]
+                values.discard(value)
+                if not values:
+                    del self._trigrams[gram]
+
+    def file_ids(self) -> list[str]:
+        """Return every indexed file id.
+
+        Returns
+        -------
+        list[str]
+            File ids in insertion order.
+        """
+        return list(self._values)
+
+    def replay(self, raw: bytes) -> None:
+        """Apply journal lines.
+
+        Parameters
+        ----------
+        raw : bytes
+            Complete lines of the journal.
+        """
+        for line in raw.splitlines():
+            if not line:
+                continue
+            op = json.loads(line)
+            if op[0] == ADD:
+                self.add(op[1], op[2])
+            elif op[0] == REMOVE:
+                self.remove(op[1])
+
+    def snapshot(self) -> str:
+        """Serialize the index as a journal of additions.
+
+        Returns
+        -------
+        str
+            Journal lines in insertion order.
+        """
+        ordered = sorted(self._values, key=self._seq.__getitem__)
+        return "".join(json.dumps([ADD, file_id, self._values[file_id]]) + "\n"
+                       for file_id in ordered)
+
+    def _matching_values(self, operator: str, value: Any) -> Iterable[Any]:  # noqa: ANN401
+        """Return distinct indexed values satisfying a condition."""
+        if operator == EQ:
+            return (value,) if value in self._ids else ()
+        if operator in COMPARISONS:
+            test = matcher(operator, value)
+            return [v for v in self._ids if test(v)]
+        if operator == STARTSWITH:
+            start = bisect.bisect_left(self._sorted, order_key(value),
+                                       key=order_key)
+            found = []
+            for candidate in self._sorted[start:]:
+                if (not isinstance(candidate, str)
+                        or not candidate.startswith(value)):
+                    break
+                found.append(candidate)
+            return found
+        if operator == CONTAINS and len(value) >= _GRAM:
+            sets = sorted((self._trigrams.get(g, set()) for g in _grams(value)),
+                          key=len)
+            values = set.intersection(*sets) if sets else set()
+            return [v for v in values if value in v]
+        return [v for v in self._ids if isinstance(v, str) and value in v]
+
+    def candidates(self, operator: str, value: Any) -> list[str]:  # noqa: ANN401
+        """Return file ids whose indexed value satisfies a condition.
+
+        Parameters
+        ----------
+        operator : str
+            Operator of the condition.
+        value : Any
+            Condition value converted to the column type.
+
+        Returns
+        -------
+        list[str]
+            File ids in insertion order. Records are read and checked
+            again, as they may have changed since they were indexed.
+        """
+        ids = [file_id for v in self._matching_values(operator, value)
+               for file_id in self._ids[v]]
+        ids.sort(key=self._seq.__getitem__)
+        return ids
+
+    def ordered(self, *, descending: bool = False) -> list[str]:
+        """Return every indexed file id sorted by its value.
+
+        Parameters
+        ----------
+        descending : bool, optional
+            Largest values first, by default False.
+
+        Returns
+        -------
+        list[str]
+            File ids by value; ids with equal values in insertion order.
+        """
+        values = reversed(self._sorted) if descending else self._sorted
+        return [file_id for v in values for file_id in self._ids[v]]
@@ -15,9 +15,11 @@
 """Abstrct database manager."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, overload
+
+from pyfiles_db.database_manager._schema import Record
 
 
 class _DB(ABC):
@@ -37,6 +39,7 @@ class _DB(ABC):
     def create_table(self, table_name: str,
                      columns: dict[str, str],
                      id_generator: str | int | None = None,
+                     bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
                      ) -> None | Coroutine[Any, Any, None]:
         """Create a new table.
 
@@ -50,6 +53,10 @@ class _DB(ABC):
             default None
             str is name of column data when need use how nameing of file
             None use simple id generator (increment, not recominded)
+        bloom : bool | Sequence[str]
+            default False
+            True keeps a Bloom filter over file ids, a sequence of
+            columns keeps filters over their values too
         """
 
     @abstractmethod
@@ -65,7 +72,185 @@ class _DB(ABC):
         """
 
     @abstractmethod
-    def find(self, table_name: str, condition: str) -> list[dict[str, Any]]:
+    def insert_many(self,
+                    table_name: str,
+                    records: Sequence[dict[str, Any]],
+                    ) -> list[str]:
+        """Add several records with one validation pass.
+
+        Parameters
+        ----------
+        table_name : str
+            name of data table
+        records : Sequence[dict[str, Any]]
+            records to save
+
+        Returns
+        -------
+        list[str]
+            file ids of the records, in order
+        """
+
+    @abstractmethod
+    def import_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     *,
+                     batch_size: int = 10_000,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Stream records from a JSON lines file into a table.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        path : str | Path
+            file to read
+        batch_size : int
+            default 10000
+            records validated and written together
+        progress : Callable[[int, float], None] | None
+            default None
+            called after every chunk with records done and seconds
+
+        Returns
+        -------
+        int
+            number of imported records
+        """
+
+    @abstractmethod
+    def import_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   *,
+                   batch_size: int = 10_000,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Stream records from a CSV file into a table.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        path : str | Path
+            file to read
+        batch_size : int
+            default 10000
+            records validated and written together
+        progress : Callable[[int, float], None] | None
+            default None
+            called after every chunk with records done and seconds
+
+        Returns
+        -------
+        int
+            number of imported records
+        """
+
+    @abstractmethod
+    def export_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     condition: str | None = None,
+                     *,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Stream records of a table into a JSON lines file.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        path : str | Path
+            file to write
+        condition : str | None
+            default None
+            condition as accepted by find
+        progress : Callable[[int, float], None] | None
+            default None
+            called after every chunk with records done and seconds
+
+        Returns
+        -------
+        int
+            number of exported records
+        """
+
+    @abstractmethod
+    def export_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   condition: str | None = None,
+                   *,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Stream records of a table into a CSV file.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        path : str | Path
+            file to write
+        condition : str | None
+            default None
+            condition as accepted by find
+        progress : Callable[[int, float], None] | None
+            default None
+            called after every chunk with records done and seconds
+
+        Returns
+        -------
+        int
+            number of exported records
+        """
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["dict"] = ...,
+             ) -> list[dict[str, Any]]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["record"],
+             ) -> list[Record]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["columns"],
+             ) -> dict[str, Sequence[Any]]: ...
+
+    @abstractmethod
+    def find(self,  # noqa: PLR0913 - keyword-only options
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = None,
+             descending: bool = False,
+             limit: int | None = None,
+             result_type: str = "dict",
+             ) -> (list[dict[str, Any]] | list[Record]
+                   | dict[str, Sequence[Any]]):
         """Find information in database.
 
         Parameters
@@ -74,10 +259,23 @@ class _DB(ABC):
             name of table
         condition : str
             maybe  is "id == 1"
+        order_by : str | None
+            default None
+            column to sort records by
+        descending : bool
+            default False
+            largest values first
+        limit : int | None
+            default None
+            maximum number of records
+        result_type : str
+            default "dict"
+            "record" returns slotted record objects instead of dicts,
+            "columns" returns one sequence per column
 
         Returns
         -------
-        list[dict[str, Any]]
+        list[dict[str, Any]] | list[Record] | dict[str, Sequence[Any]]
             all data in table
         """
 
@@ -99,6 +297,54 @@ class _DB(ABC):
             new data when need save
         """
     @abstractmethod
+    def patch(self,
+              table_name: str,
+              file_id: str,
+              changes: dict[str, Any],
+              ) -> bool:
+        """Change some fields of a record.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        file_id : str
+            name of file in table
+        changes : dict[str, Any]
+            new values of some columns
+
+        Returns
+        -------
+        bool
+            True if the record was written
+        """
+
+    @abstractmethod
+    def upsert(self,
+               table_name: str,
+               data: dict[str, Any],
+               *,
+               on: str | None = None,
+               ) -> str:
+        """Insert a record or patch the record with the same key.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        data : dict[str, Any]
+            record to save
+        on : str | None
+            default None
+            key column, None for the id_generator column
+
+        Returns
+        -------
+        str
+            file id of the record
+        """
+
+    @abstractmethod
     def delete(self,
                 table_name: str,
                 file_id: str,
@@ -113,6 +359,155 @@ class _DB(ABC):
             name of file in table
         """
 
+    @abstractmethod
+    def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete every record matching a condition.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        condition : str
+            condition of find
+
+        Returns
+        -------
+        int
+            number of deleted records
+        """
+
+    @abstractmethod
+    def update_where(self,
+                     table_name: str,
+                     condition: str,
+                     changes: dict[str, Any],
+                     ) -> int:
+        """Change fields of every record matching a condition.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        condition : str
+            condition of find
+        changes : dict[str, Any]
+            new values of some columns
+
+        Returns
+        -------
+        int
+            number of written records
+        """
+
+    @abstractmethod
+    def create_index(self, table_name: str, column_name: str) -> int:
+        """Index a column of a table.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table db
+        column_name : str
+            name of column
+
+        Returns
+        -------
+        int
+            number of indexed records
+        """
+
+    @abstractmethod
+    def create_numeric_index(self, table_name: str, column_name: str) -> int:
+        """Keep an int64 sidecar of an INT column for comparisons.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table db
+        column_name : str
+            name of INT column
+
+        Returns
+        -------
+        int
+            number of rows in the sidecar
+        """
+
+    @abstractmethod
+    def explain(self,
+                table_name: str,
+                condition: str,
+                *,
+                order_by: str | None = None,
+                descending: bool = False,
+                limit: int | None = None,
+                ) -> dict[str, Any]:
+        """Report how find would locate records.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table db
+        condition : str
+            condition of find
+        order_by : str | None
+            default None
+            column to sort records by
+        descending : bool
+            default False
+            largest values first
+        limit : int | None
+            default None
+            maximum number of records
+
+        Returns
+        -------
+        dict[str, Any]
+            access path, number of candidate records and sort method
+        """
+
+    @abstractmethod
+    def join(self,
+             left_table: str,
+             right_table: str,
+             on: str | tuple[str, str],
+             condition: str | None = None,
+             ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables on equal column values.
+
+        Parameters
+        ----------
+        left_table : str
+            name of left table
+        right_table : str
+            name of right table
+        on : str | tuple[str, str]
+            join column of both tables or (left, right) columns
+        condition : str | None
+            default None
+            condition on the left table
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            pairs of left and right records
+        """
+
+    @abstractmethod
+    def compact(self, table_name: str) -> int:
+        """Repair the index and rebuild Bloom filters of a table.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table db
+
+        Returns
+        -------
+        int
+            number of dropped file ids
+        """
+
 class _AsyncDB(ABC):
     @abstractmethod
     def __init__(self, storage: str | Path, meta_file: str) -> None:
@@ -130,6 +525,7 @@ class _AsyncDB(ABC):
     async def create_table(self, table_name: str,
                      columns: dict[str, str],
                      id_generator: str | int | None = None,
+                     bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
                      ) -> None:
         """Create a new table (async).
 
@@ -142,6 +538,9 @@ class _AsyncDB(ABC):
         id_generator : str | int | None
             If a string, this is the column name used as file identifier.
             If None, an integer auto-increment generator is used.
+        bloom : bool | Sequence[str]
+            True keeps a Bloom filter over file ids, a sequence of
+            columns keeps filters over their values too.
         """
 
     @abstractmethod
@@ -157,10 +556,177 @@ class _AsyncDB(ABC):
         """
 
     @abstractmethod
+    async def insert_many(self,
+                          table_name: str,
+                          records: Sequence[dict[str, Any]],
+                          ) -> list[str]:
+        """Add several records with one validation pass (async).
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        records : Sequence[dict[str, Any]]
+            Records to save.
+
+        Returns
+        -------
+        list[str]
+            File ids of the records, in order.
+        """
+
+    @abstractmethod
+    async def import_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           *,
+                           batch_size: int = 10_000,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Stream records from a JSON lines file into a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read.
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with records done and seconds.
+
+        Returns
+        -------
+        int
+            Number of imported records.
+        """
+
+    @abstractmethod
+    async def import_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         *,
+                         batch_size: int = 10_000,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Stream records from a CSV file into a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read.
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with records done and seconds.
+
+        Returns
+        -------
+        int
+            Number of imported records.
+        """
+
+    @abstractmethod
+    async def export_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           condition: str | None = None,
+                           *,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Stream records of a table into a JSON lines file.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to write.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with records done and seconds.
+
+        Returns
+        -------
+        int
+            Number of exported records.
+        """
+
+    @abstractmethod
+    async def export_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         condition: str | None = None,
+                         *,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Stream records of a table into a CSV file.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to write.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with records done and seconds.
+
+        Returns
+        -------
+        int
+            Number of exported records.
+        """
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["dict"] = ...,
+                   ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["record"],
+                   ) -> list[Record]: ...
+
+    @overload
     async def find(self,
                    table_name: str,
                    condition: str,
-                   ) -> list[dict[str, Any]]:
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["columns"],
+                   ) -> dict[str, Sequence[Any]]: ...
+
+    @abstractmethod
+    async def find(self,  # noqa: PLR0913 - keyword-only options
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = None,
+                   descending: bool = False,
+                   limit: int | None = None,
+                   result_type: str = "dict",
+                   ) -> (list[dict[str, Any]] | list[Record]
+                         | dict[str, Sequence[Any]]):
         """Find information in database.
 
         Parameters
@@ -169,10 +735,23 @@ class _AsyncDB(ABC):
             name of table
         condition : str
             maybe  is "id == 1"
+        order_by : str | None
+            default None
+            column to sort records by
+        descending : bool
+            default False
+            largest values first
+        limit : int | None
+            default None
+            maximum number of records
+        result_type : str
+            default "dict"
+            "record" returns slotted record objects instead of dicts,
+            "columns" returns one sequence per column
 
         Returns
         -------
-        list[dict[str, Any]]
+        list[dict[str, Any]] | list[Record] | dict[str, Sequence[Any]]
             all data in table
         """
 
@@ -194,6 +773,53 @@ class _AsyncDB(ABC):
             new data when need save
         """
 
+    @abstractmethod
+    async def patch(self,
+                    table_name: str,
+                    file_id: str,
+                    changes: dict[str, Any],
+                    ) -> bool:
+        """Change some fields of a record.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        file_id : str
+            Name of file in table.
+        changes : dict[str, Any]
+            New values of some columns.
+
+        Returns
+        -------
+        bool
+            True if the record was written.
+        """
+
+    @abstractmethod
+    async def upsert(self,
+                     table_name: str,
+                     data: dict[str, Any],
+                     *,
+                     on: str | None = None,
+                     ) -> str:
+        """Insert a record or patch the record with the same key.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        data : dict[str, Any]
+            Record to save.
+        on : str | None
+            Key column, default None for the id_generator column.
+
+        Returns
+        -------
+        str
+            File id of the record.
+        """
+
     @abstractmethod
     async def delete(self,
                 table_name: str,
@@ -208,3 +834,151 @@ class _AsyncDB(ABC):
         file_id : str
             name of file in table
         """
+
+    @abstractmethod
+    async def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete every record matching a condition.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition of find.
+
+        Returns
+        -------
+        int
+            Number of deleted records.
+        """
+
+    @abstractmethod
+    async def update_where(self,
+                           table_name: str,
+                           condition: str,
+                           changes: dict[str, Any],
+                           ) -> int:
+        """Change fields of every record matching a condition.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition of find.
+        changes : dict[str, Any]
+            New values of some columns.
+
+        Returns
+        -------
+        int
+            Number of written records.
+        """
+
+    @abstractmethod
+    async def create_index(self, table_name: str, column_name: str) -> int:
+        """Index a column of a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            Name of the column.
+
+        Returns
+        -------
+        int
+            Number of indexed records.
+        """
+
+    @abstractmethod
+    async def create_numeric_index(self,
+                                   table_name: str,
+                                   column_name: str,
+                                   ) -> int:
+        """Keep an int64 sidecar of an INT column for comparisons.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            Name of the INT column.
+
+        Returns
+        -------
+        int
+            Number of rows in the sidecar.
+        """
+
+    @abstractmethod
+    async def explain(self,
+                      table_name: str,
+                      condition: str,
+                      *,
+                      order_by: str | None = None,
+                      descending: bool = False,
+                      limit: int | None = None,
+                      ) -> dict[str, Any]:
+        """Report how find would locate records.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition of find.
+        order_by : str | None
+            Column to sort records by, default None.
+        descending : bool
+            Largest values first, default False.
+        limit : int | None
+            Maximum number of records, default None.
+
+        Returns
+        -------
+        dict[str, Any]
+            Access path, number of candidate records and sort method.
+        """
+
+    @abstractmethod
+    async def join(self,
+                   left_table: str,
+                   right_table: str,
+                   on: str | tuple[str, str],
+                   condition: str | None = None,
+                   ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables on equal column values.
+
+        Parameters
+        ----------
+        left_table : str
+            Name of the left table.
+        right_table : str
+            Name of the right table.
+        on : str | tuple[str, str]
+            Join column of both tables or (left, right) columns.
+        condition : str | None
+            Condition on the left table, default None.
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            Pairs of left and right records.
+        """
+
+    @abstractmethod
+    async def compact(self, table_name: str) -> int:
+        """Repair the index and rebuild Bloom filters of a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            Number of dropped file ids.
+        """
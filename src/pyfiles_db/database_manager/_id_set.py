@@ -0,0 +1,155 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resident set of the file ids of a table."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Longest decimal id stored as a JSON number, so it stays an int64.
+_MAX_DIGITS = 18
+
+
+def _number(file_id: str) -> int | None:
+    """Return the int a file id spells in canonical decimal, or None."""
+    if (0 < len(file_id) <= _MAX_DIGITS and file_id.isascii()
+            and file_id.isdigit() and (file_id == "0" or file_id[0] != "0")):
+        return int(file_id)
+    return None
+
+
+class _IdSet:
+    """File ids of a table in insertion order.
+
+    Backed by a dict, so membership, insert and delete are O(1) and an
+    id is never listed twice. On disk the ids are a JSON list where a
+    run of consecutive decimal ids is one ``[first, last]`` pair, a lone
+    decimal id is a number and any other id is a string; lists of
+    strings written by older versions load unchanged.
+    """
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        """Init set.
+
+        Parameters
+        ----------
+        ids : Iterable[str], optional
+            File ids in insertion order; repeats are dropped.
+        """
+        self._ids: dict[str, None] = dict.fromkeys(ids)
+
+    def __len__(self) -> int:
+        """Return number of file ids."""
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over file ids in insertion order."""
+        return iter(self._ids)
+
+    def __contains__(self, file_id: object) -> bool:
+        """Check whether a file id is in the set."""
+        return file_id in self._ids
+
+    def add(self, file_id: str) -> bool:
+        """Append a file id.
+
+        Parameters
+        ----------
+        file_id : str
+            File id to add.
+
+        Returns
+        -------
+        bool
+            False if the id was already in the set.
+        """
+        if file_id in self._ids:
+            return False
+        self._ids[file_id] = None
+        return True
+
+    def discard(self, file_id: str) -> bool:
+        """Remove a file id if present.
+
+        Parameters
+        ----------
+        file_id : str
+            File id to remove.
+
+        Returns
+        -------
+        bool
+            True if the id was in the set.
+        """
+        if file_id not in self._ids:
+            return False
+        del self._ids[file_id]
+        return True
+
+    def to_json(self) -> list[str | int | list[int]]:
+        """Return the compact form written to ``.json``.
+
+        Returns
+        -------
+        list[str | int | list[int]]
+            Ids in insertion order with decimal runs folded.
+        """
+        items: list[str | int | list[int]] = []
+        first = last = -1
+        for file_id in self._ids:
+            number = _number(file_id)
+            if number is not None and last >= 0 and number == last + 1:
+                last = number
+                continue
+            if last >= 0:
+                items.append(first if first == last else [first, last])
+            if number is None:
+                items.append(file_id)
+                first = last = -1
+            else:
+                first = last = number
+        if last >= 0:
+            items.append(first if first == last else [first, last])
+        return items
+
+    @classmethod
+    def from_json(cls, items: Iterable[str | int | list[int]]) -> _IdSet:
+        """Load ids written by :meth:`to_json` or an older plain list.
+
+        Parameters
+        ----------
+        items : Iterable[str | int | list[int]]
+            The ``FILE_IDS`` list of ``.json``.
+
+        Returns
+        -------
+        _IdSet
+            Loaded ids.
+        """
+        ids = cls()
+        names = ids._ids
+        for item in items:
+            if isinstance(item, str):
+                names.setdefault(item)
+            elif isinstance(item, int):
+                names.setdefault(str(item))
+            else:
+                first, last = item
+                for number in range(first, last + 1):
+                    names.setdefault(str(number))
+        return ids
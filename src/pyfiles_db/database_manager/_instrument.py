@@ -0,0 +1,135 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Instrumentation of database operations."""
+
+from __future__ import annotations
+
+import time
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
+
+from pyfiles_db.metrics import OperationStats
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from pyfiles_db.metrics import MetricsSink
+
+# Shared by every call while instrumentation is off.
+_DISABLED: nullcontext[None] = nullcontext()
+
+
+class _Observation(AbstractContextManager[OperationStats]):
+    """Times an operation and hands its counters to the sink."""
+
+    __slots__ = ("_sink", "_start", "stats")
+
+    def __init__(self, sink: MetricsSink, stats: OperationStats) -> None:
+        self._sink = sink
+        self.stats = stats
+        self._start = 0.0
+
+    def __enter__(self) -> OperationStats:
+        self._start = time.perf_counter()
+        return self.stats
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc: BaseException | None,
+                 tb: TracebackType | None,
+                 ) -> None:
+        self.stats.elapsed = time.perf_counter() - self._start
+        self.stats.error = exc_type is not None
+        self._sink.record(self.stats)
+
+
+class _FanOut:
+    """Sink forwarding counters to several sinks."""
+
+    __slots__ = ("_sinks",)
+
+    def __init__(self, sinks: tuple[MetricsSink, ...]) -> None:
+        self._sinks = sinks
+
+    def record(self, stats: OperationStats) -> None:
+        for sink in self._sinks:
+            sink.record(stats)
+
+
+def combine_sinks(*sinks: MetricsSink | None) -> MetricsSink | None:
+    """Merge the enabled sinks into one.
+
+    Parameters
+    ----------
+    *sinks : MetricsSink | None
+        Sinks, None for the disabled ones.
+
+    Returns
+    -------
+    MetricsSink | None
+        The only enabled sink, a fan-out over several, or None.
+    """
+    enabled = tuple(sink for sink in sinks if sink is not None)
+    if not enabled:
+        return None
+    if len(enabled) == 1:
+        return enabled[0]
+    return _FanOut(enabled)
+
+
+def observe(sink: MetricsSink | None,
+            operation: str,
+            table: str,
+            condition: str | None = None,
+            access_path: str | None = None,
+            ) -> AbstractContextManager[OperationStats | None]:
+    """Instrument one operation.
+
+    Parameters
+    ----------
+    sink : MetricsSink | None
+        Receiver of the counters, None when instrumentation is off.
+    operation : str
+        Name of the operation.
+    table : str
+        Name of the table.
+    condition : str | None, optional
+        Condition of a query.
+    access_path : str | None, optional
+        How records are located, when known up front.
+
+    Returns
+    -------
+    AbstractContextManager[OperationStats | None]
+        Yields counters to fill, or None when instrumentation is off.
+    """
+    if sink is None:
+        return _DISABLED
+    return _Observation(sink, OperationStats(operation, table, condition,
+                                             access_path))
+
+
+def set_access_path(stats: OperationStats | None, access_path: str) -> None:
+    """Record how an operation located its records.
+
+    Parameters
+    ----------
+    stats : OperationStats | None
+        Counters of the operation, None when instrumentation is off.
+    access_path : str
+        E.g. ``"generator"``, ``"scan"`` or ``"bloom"``.
+    """
+    if stats is not None:
+        stats.access_path = access_path
@@ -0,0 +1,169 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers of joins between tables."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+# Strategies used for the right table, reported as the access path.
+GENERATOR = "generator"
+INDEX = "index"
+HASH = "hash"
+
+Row = tuple[str, dict[str, Any]]
+
+
+def join_columns(on: str | tuple[str, str]) -> tuple[str, str]:
+    """Return the join column of the left and of the right table.
+
+    Parameters
+    ----------
+    on : str | tuple[str, str]
+        Column of both tables, or a ``(left, right)`` pair.
+
+    Returns
+    -------
+    tuple[str, str]
+        Left and right column.
+    """
+    if isinstance(on, str):
+        return on, on
+    left, right = on
+    return left, right
+
+
+def join_key(record: dict[str, Any], column: str) -> Hashable | None:
+    """Return the value a record is joined on.
+
+    Parameters
+    ----------
+    record : dict[str, Any]
+        Record of a table.
+    column : str
+        Join column.
+
+    Returns
+    -------
+    Hashable | None
+        The column value, None if it is missing or cannot be hashed;
+        such records join nothing.
+    """
+    value = record.get(column)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
+def build_hash(rows: Iterable[Row], column: str) -> dict[Hashable, list[Row]]:
+    """Group rows by their join value in one pass.
+
+    Parameters
+    ----------
+    rows : Iterable[Row]
+        File ids and records of the build side.
+    column : str
+        Join column.
+
+    Returns
+    -------
+    dict[Hashable, list[Row]]
+        Rows by join value, in input order.
+    """
+    table: dict[Hashable, list[Row]] = {}
+    for row in rows:
+        key = join_key(row[1], column)
+        if key is not None:
+            table.setdefault(key, []).append(row)
+    return table
+
+
+def pair(left: Row, right: Row) -> dict[str, dict[str, Any]]:
+    """Return one result of a join.
+
+    Parameters
+    ----------
+    left : Row
+        File id and record of the left table.
+    right : Row
+        File id and record of the right table.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        ``{"left": {file_id: record}, "right": {file_id: record}}``.
+    """
+    return {"left": {left[0]: left[1]}, "right": {right[0]: right[1]}}
+
+
+def probe_hash(table: dict[Hashable, list[Row]],
+               rows: Iterable[Row],
+               column: str,
+               *,
+               build_left: bool,
+               ) -> list[dict[str, dict[str, Any]]]:
+    """Stream rows through a hash table built over the other side.
+
+    Parameters
+    ----------
+    table : dict[Hashable, list[Row]]
+        Build side, from ``build_hash``.
+    rows : Iterable[Row]
+        Probe side, read once.
+    column : str
+        Join column of the probe side.
+    build_left : bool
+        Whether the hash table holds the left table.
+
+    Returns
+    -------
+    list[dict[str, dict[str, Any]]]
+        Joined pairs in probe order.
+    """
+    result: list[dict[str, dict[str, Any]]] = []
+    for row in rows:
+        key = join_key(row[1], column)
+        if key is None:
+            continue
+        matches = table.get(key, ())
+        if build_left:
+            result.extend(pair(match, row) for match in matches)
+        else:
+            result.extend(pair(row, match) for match in matches)
+    return result
+
+
+def join_keys(rows: Iterable[Row], column: str) -> list[Hashable]:
+    """Return the distinct join values of rows.
+
+    Parameters
+    ----------
+    rows : Iterable[Row]
+        File ids and records.
+    column : str
+        Join column.
+
+    Returns
+    -------
+    list[Hashable]
+        Join values in first-seen order.
+    """
+    keys = (join_key(record, column) for _, record in rows)
+    return [key for key in dict.fromkeys(keys) if key is not None]
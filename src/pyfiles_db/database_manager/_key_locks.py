@@ -0,0 +1,69 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-key locks for the async database manager."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Hashable
+
+
+@dataclass
+class _Held:
+    """Lock of a key and the callers holding or awaiting it."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class _KeyLocks:
+    """Serialize coroutines working on the same key.
+
+    A key has a lock only while some caller holds or awaits it, so keys
+    of finished calls take no memory.
+    """
+
+    def __init__(self) -> None:
+        """Init without held keys."""
+        self._held: dict[Hashable, _Held] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key to serialize on.
+
+        Yields
+        ------
+        None
+            While no other caller holds the key.
+        """
+        held = self._held.setdefault(key, _Held())
+        held.users += 1
+        try:
+            async with held.lock:
+                yield
+        finally:
+            held.users -= 1
+            if not held.users:
+                del self._held[key]
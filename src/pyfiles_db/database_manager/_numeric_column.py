@@ -0,0 +1,167 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Contiguous int64 sidecar of an INT column."""
+
+from __future__ import annotations
+
+import operator as op
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from pyfiles_db.database_manager._query import COMPARISONS, EQ
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+# First character of an id line: the row value is exact, or the column
+# value does not fit in int64 and the record is always a candidate.
+EXACT = "="
+LOOSE = "?"
+_COMPARE: dict[str, Callable[[Any, Any], Any]] = {EQ: op.eq, **COMPARISONS}
+
+
+def encode_rows(items: Iterable[tuple[str, Any]]) -> tuple[bytes, bytes]:
+    """Return the values and id lines of new sidecar rows.
+
+    Parameters
+    ----------
+    items : Iterable[tuple[str, Any]]
+        File ids and column values. Values that are not int never match
+        a condition on an INT column and get no row.
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+        Native int64 values and id lines, one per row.
+    """
+    values = array("q")
+    lines = []
+    for file_id, value in items:
+        if type(value) is not int:
+            continue
+        exact = INT64_MIN <= value <= INT64_MAX
+        values.append(value if exact else 0)
+        lines.append(f"{EXACT if exact else LOOSE}{file_id}\n")
+    return values.tobytes(), "".join(lines).encode()
+
+
+class _NumericColumn:
+    """File ids of the rows of a sidecar, as replayed by a reader.
+
+    ``.num-<column>`` holds one native int64 per row and
+    ``.numids-<column>`` one id line per row. Writers append the value
+    before the id line, so every replayed id has its value. Rows are
+    never rewritten: a record written again gets another row and a
+    deleted record keeps its rows until the table is compacted, so
+    candidates are read and checked again.
+
+    Parameters
+    ----------
+    inode : int
+        Inode of the id file, replaced when the sidecar is rebuilt.
+    """
+
+    def __init__(self, inode: int) -> None:
+        """Init empty sidecar.
+
+        Parameters
+        ----------
+        inode : int
+            Inode of the id file.
+        """
+        self.inode = inode
+        self.offset = 0
+        self.ids: list[str] = []
+        self.loose: list[int] = []
+
+    def replay(self, raw: bytes) -> None:
+        """Add id lines read from the id file.
+
+        Parameters
+        ----------
+        raw : bytes
+            Complete id lines.
+        """
+        for line in raw.decode().splitlines():
+            if line[0] == LOOSE:
+                self.loose.append(len(self.ids))
+            self.ids.append(line[1:])
+        self.offset += len(raw)
+
+    def candidates(self,
+                   values_path: Path,
+                   operator: str,
+                   value: int,
+                   ) -> list[str]:
+        """Return file ids of rows satisfying a comparison.
+
+        The comparison runs on a read-only ``numpy.memmap`` of the
+        values, so only pages of the value file are touched and no
+        record is decoded.
+
+        Parameters
+        ----------
+        values_path : Path
+            Path to the value file.
+        operator : str
+            ``==`` or a comparison operator.
+        value : int
+            Condition value within int64.
+
+        Returns
+        -------
+        list[str]
+            Distinct file ids in row order.
+        """
+        size = min(len(self.ids), values_path.stat().st_size // 8)
+        if not size:
+            return []
+        values = np.memmap(values_path, dtype=np.int64, mode="r",
+                           shape=(size,))
+        rows = np.flatnonzero(_COMPARE[operator](values, value)).tolist()
+        del values
+        if self.loose:
+            rows = sorted({*rows, *(i for i in self.loose if i < size)})
+        ids = self.ids
+        return list(dict.fromkeys(ids[i] for i in rows))
+
+
+def can_filter(operator: str, value: Any) -> bool:  # noqa: ANN401
+    """Return whether a sidecar answers a condition.
+
+    Parameters
+    ----------
+    operator : str
+        Operator of the condition.
+    value : Any
+        Condition value converted to the column type.
+
+    Returns
+    -------
+    bool
+        True with NumPy installed, for ``==`` and comparisons with an
+        int64 value.
+    """
+    return (np is not None and operator in _COMPARE
+            and type(value) is int and INT64_MIN <= value <= INT64_MAX)
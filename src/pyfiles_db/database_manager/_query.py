@@ -0,0 +1,210 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parsing and matching of ``find`` conditions."""
+
+from __future__ import annotations
+
+import heapq
+import operator as op
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pyfiles_db.errors import InvalidConditionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+EQ = "=="
+STARTSWITH = "STARTSWITH"
+CONTAINS = "CONTAINS"
+# Operators only defined for TEXT columns.
+TEXT_OPERATORS = frozenset({STARTSWITH, CONTAINS})
+# Comparisons besides ``==``; values of another type never match.
+COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "!=": op.ne, "<": op.lt, "<=": op.le, ">": op.gt, ">=": op.ge,
+}
+# Comparisons by order, undefined for BYTES (stored as base85 text).
+ORDERINGS = frozenset({"<", "<=", ">", ">="})
+
+_CONDITION = re.compile(
+    r"^\s*(?P<column>[^\s=<>!]+)\s*(?:"
+    r"(?P<symbol>==|!=|<=|>=|<|>)|\s(?P<keyword>STARTSWITH|CONTAINS)\s)"
+    r"(?P<value>.*)$",
+    re.IGNORECASE | re.DOTALL)
+
+
+@dataclass(frozen=True, slots=True)
+class _Condition:
+    """Parsed ``<column> <operator> <value>`` condition."""
+
+    column: str
+    operator: str
+    value: str
+
+
+def parse_condition(condition: str) -> _Condition:
+    """Parse a ``find`` condition.
+
+    ``==`` keeps the original behaviour of dropping every space of an
+    unquoted value, and so do the other comparisons; a value in single
+    or double quotes is taken as is.
+
+    Parameters
+    ----------
+    condition : str
+        E.g. ``"id == 5"``, ``"age >= 18"``, ``"name STARTSWITH 'Jo'"``
+        or ``"email CONTAINS '@corp'"``.
+
+    Returns
+    -------
+    _Condition
+        Column, upper-case operator and raw value.
+
+    Raises
+    ------
+    InvalidConditionError
+        If the condition has no supported operator.
+    """
+    match = _CONDITION.match(condition)
+    if match is None:
+        raise InvalidConditionError(
+            condition, "expected '<column> ==|!=|<|<=|>|>=|STARTSWITH|"
+            "CONTAINS <value>'")
+    operator = match["symbol"] or match["keyword"].upper()
+    value = match["value"].strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":  # noqa: PLR2004
+        value = value[1:-1]
+    elif operator not in TEXT_OPERATORS:
+        value = value.replace(" ", "")
+    return _Condition(match["column"], operator, value)
+
+
+def matcher(operator: str, value: Any) -> Callable[[Any], bool]:  # noqa: ANN401
+    """Return the test of a column value against a typed condition value.
+
+    Parameters
+    ----------
+    operator : str
+        Operator of the condition.
+    value : Any
+        Condition value converted to the column type.
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        True for matching column values.
+    """
+    if operator == STARTSWITH:
+        return lambda v: isinstance(v, str) and v.startswith(value)
+    if operator == CONTAINS:
+        return lambda v: isinstance(v, str) and value in v
+    compare = COMPARISONS.get(operator)
+    if compare is None:
+        return lambda v: bool(v == value)
+
+    def test(v: Any) -> bool:  # noqa: ANN401
+        if type(v) is not type(value):
+            return False
+        return bool(compare(v, value))
+
+    return test
+
+
+def order_key(value: Any) -> tuple[str, Any]:  # noqa: ANN401
+    """Sort key keeping values of different types apart.
+
+    Parameters
+    ----------
+    value : Any
+        Column value.
+
+    Returns
+    -------
+    tuple[str, Any]
+        Type name and value.
+    """
+    return type(value).__name__, value
+
+
+def order_rows(rows: Iterable[tuple[str, dict[str, Any]]],
+               column: str,
+               *,
+               descending: bool,
+               limit: int | None,
+               ) -> list[tuple[str, dict[str, Any]]]:
+    """Sort records by a column, keeping only the first ``limit``.
+
+    With a limit a bounded heap selects the records in O(n log k) time
+    and O(k) memory instead of sorting them all. Records without the
+    column come last, records with equal values keep their order.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple[str, dict[str, Any]]]
+        File ids and records.
+    column : str
+        Column to sort by.
+    descending : bool
+        Largest values first.
+    limit : int | None
+        Maximum number of records to return, None for all.
+
+    Returns
+    -------
+    list[tuple[str, dict[str, Any]]]
+        Sorted file ids and records.
+    """
+    def key(row: tuple[str, dict[str, Any]]) -> tuple[bool, str, Any]:
+        record = row[1]
+        present = column in record
+        # Missing values sort after every value in both directions.
+        return (present if descending else not present,
+                *order_key(record.get(column)))
+
+    if limit is None:
+        return sorted(rows, key=key, reverse=descending)
+    if descending:
+        return heapq.nlargest(limit, rows, key=key)
+    return heapq.nsmallest(limit, rows, key=key)
+
+
+def sort_method(access_path: str,
+                order: tuple[str, bool] | None,
+                limit: int | None,
+                ) -> str | None:
+    """Return how ``find`` sorts records read through an access path.
+
+    Parameters
+    ----------
+    access_path : str
+        Access path chosen for the condition.
+    order : tuple[str, bool] | None
+        Column to sort by and whether descending.
+    limit : int | None
+        Maximum number of records.
+
+    Returns
+    -------
+    str | None
+        None without ``order``, ``"index"`` when records are read in
+        index order, ``"heap"`` for a bounded top-k selection and
+        ``"full"`` for a complete sort.
+    """
+    if order is None:
+        return None
+    if access_path == "index_order":
+        return "index"
+    return "full" if limit is None else "heap"
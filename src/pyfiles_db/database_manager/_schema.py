@@ -0,0 +1,628 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Column types and per-table record validators."""
+
+from __future__ import annotations
+
+import base64
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from pyfiles_db.errors import (
+    DataIsUncorrectError,
+    InvalidConditionError,
+    NotFoundColumnError,
+    UnknownDataTypeError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, MutableSequence
+
+RESULT_TYPES = ("dict", "record", "columns")
+# Typecodes of the arrays holding INT and FLOAT columns of a columnar
+# result; other columns are lists.
+_ARRAY_TYPECODES = {"INT": "q", "FLOAT": "d"}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_TRUE = frozenset({"true", "1"})
+_FALSE = frozenset({"false", "0"})
+
+
+def _is_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_float(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bytes(value: object) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview))
+
+
+def _parse_bool(text: str) -> bool:
+    lowered = text.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    msg = f"not a BOOL value: {text!r}"
+    raise ValueError(msg)
+
+
+def _dump_bool(value: bool) -> str:  # noqa: FBT001
+    return "true" if value else "false"
+
+
+def _encode_datetime(value: datetime) -> int:
+    """Return microseconds since the epoch; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _encode_bytes(value: bytes | bytearray | memoryview) -> str:
+    return base64.b85encode(bytes(value)).decode("ascii")
+
+
+def _decode_bytes(value: str) -> bytes:
+    return base64.b85decode(value)
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnType:
+    """How values of one column type are checked and stored.
+
+    ``encode`` and ``decode`` are None for types stored as plain JSON.
+    ``load`` and ``dump`` convert values from and to their text form in
+    imports and exports; ``load`` defaults to ``parse``. Values of types
+    that are not ``json`` are also text in JSON lines.
+    """
+
+    check: Callable[[Any], bool]
+    parse: Callable[[str], Any]
+    encode: Callable[[Any], Any] | None = None
+    decode: Callable[[Any], Any] | None = None
+    load: Callable[[str], Any] | None = None
+    dump: Callable[[Any], str] = str
+    json: bool = True
+
+
+# DATETIME is stored as integer microseconds since the epoch (UTC), so
+# it compares and sorts as a number; BYTES as a base85 string.
+TYPES: dict[str, _ColumnType] = {
+    "INT": _ColumnType(_is_int, int),
+    "TEXT": _ColumnType(lambda v: isinstance(v, str), str),
+    "FLOAT": _ColumnType(_is_float, float, float),
+    "BOOL": _ColumnType(lambda v: isinstance(v, bool), _parse_bool,
+                        dump=_dump_bool),
+    "DATETIME": _ColumnType(lambda v: isinstance(v, datetime),
+                            datetime.fromisoformat, _encode_datetime,
+                            _decode_datetime, dump=datetime.isoformat,
+                            json=False),
+    "BYTES": _ColumnType(_is_bytes, str.encode, _encode_bytes, _decode_bytes,
+                         load=_decode_bytes, dump=_encode_bytes, json=False),
+}
+
+
+class Record:
+    """Record of a ``find`` result with ``result_type="record"``.
+
+    Every table gets a subclass with one slot per column, so a record
+    has neither an instance ``__dict__`` nor a wrapping dict keyed by its
+    file id. Columns missing from the stored record are None.
+
+    Attributes
+    ----------
+    file_id : str
+        Name of the record file.
+    """
+
+    __slots__ = ("file_id",)
+    _fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, file_id: str, record: dict[str, Any]) -> None:
+        """Init record.
+
+        Parameters
+        ----------
+        file_id : str
+            Name of the record file.
+        record : dict[str, Any]
+            Fields of the record.
+        """
+        self.file_id = file_id
+        for name in self._fields:
+            setattr(self, name, record.get(name))
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...  # noqa: ANN401
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields of the record.
+
+        Returns
+        -------
+        dict[str, Any]
+            Column names mapped to values.
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: object) -> bool:
+        """Compare class, file id and fields."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self.file_id == other.file_id
+                and self.to_dict() == other.to_dict())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the file id and fields."""
+        fields = "".join(f", {name}={getattr(self, name)!r}"
+                         for name in self._fields)
+        return f"{type(self).__name__}(file_id={self.file_id!r}{fields})"
+
+
+# Result of ``find`` in any of the result types.
+FindResult = list[dict[str, Any]] | list[Record] | dict[str, Sequence[Any]]
+
+
+def copy_found(result: FindResult) -> FindResult:
+    """Copy a ``find`` result so it can be changed without the original.
+
+    Parameters
+    ----------
+    result : FindResult
+        Records keyed by file id, record objects or columns.
+
+    Returns
+    -------
+    FindResult
+        Copy of the result, down to the records and column sequences.
+    """
+    if isinstance(result, dict):
+        return {name: values[:] for name, values in result.items()}
+    copied: list[Any] = []
+    for item in result:
+        if isinstance(item, Record):
+            copied.append(type(item)(item.file_id, item.to_dict()))
+        else:
+            copied.append({name: dict(record)
+                           for name, record in item.items()})
+    return copied
+
+
+class _Schema:
+    """Validator of the records of one table, compiled from its columns.
+
+    Checks, encoders and decoders are looked up once per table instead
+    of once per field, and tables with only JSON types skip encoding and
+    decoding entirely.
+
+    Parameters
+    ----------
+    table_name : str
+        Name of the table folder, used in errors.
+    columns : dict[str, str]
+        Column names mapped to their types.
+
+    Raises
+    ------
+    UnknownDataTypeError
+        If a column has an unknown type.
+    """
+
+    __slots__ = ("_checks", "_decoders", "_dumpers", "_encoders", "_loaders",
+                 "_names", "_parsers", "_record_class", "columns",
+                 "table_name")
+
+    def __init__(self, table_name: str, columns: dict[str, str]) -> None:
+        """Compile the validator.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        columns : dict[str, str]
+            Column names mapped to their types.
+
+        Raises
+        ------
+        UnknownDataTypeError
+            If a column has an unknown type.
+        """
+        self.table_name = table_name
+        self.columns = columns
+        types = {}
+        for name, column_type in columns.items():
+            if column_type not in TYPES:
+                raise UnknownDataTypeError
+            types[name] = TYPES[column_type]
+        self._names = frozenset(columns)
+        self._checks = [(name, t.check) for name, t in types.items()]
+        self._parsers = {name: t.parse for name, t in types.items()}
+        self._encoders = [(name, t.encode) for name, t in types.items()
+                          if t.encode is not None]
+        self._decoders = [(name, t.decode) for name, t in types.items()
+                          if t.decode is not None]
+        self._record_class: type[Record] | None = None
+        # Text form of every column for CSV, of non-JSON types for JSON.
+        self._loaders = {
+            text: {name: t.load or t.parse for name, t in types.items()
+                   if text or not t.json}
+            for text in (True, False)}
+        self._dumpers = {
+            text: {name: t.dump for name, t in types.items()
+                   if text or not t.json}
+            for text in (True, False)}
+
+    @property
+    def codec(self) -> bool:
+        """Whether stored records differ from the records of the API."""
+        return bool(self._encoders)
+
+    def _check_columns(self, record: dict[str, Any]) -> None:
+        if not self._names.issuperset(record):
+            column = next(c for c in record if c not in self._names)
+            raise NotFoundColumnError(column_name=column,
+                                      table_name=self.table_name)
+
+    def _encode(self, record: dict[str, Any]) -> dict[str, Any]:
+        if not self._encoders:
+            return record
+        stored = dict(record)
+        for name, encode in self._encoders:
+            if name in stored:
+                stored[name] = encode(stored[name])
+        return stored
+
+    def validate(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Check a record and return it in its stored form.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            Record, or some fields of a record.
+
+        Returns
+        -------
+        dict[str, Any]
+            The record itself, or an encoded copy.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        """
+        self._check_columns(record)
+        for name, check in self._checks:
+            if name in record and not check(record[name]):
+                raise DataIsUncorrectError(data=record)
+        return self._encode(record)
+
+    def validate_many(self,
+                      records: Iterable[dict[str, Any]],
+                      ) -> list[dict[str, Any]]:
+        """Check records column by column and return their stored form.
+
+        Parameters
+        ----------
+        records : Iterable[dict[str, Any]]
+            Records to insert.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Records in their stored form.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        """
+        records = list(records)
+        for record in records:
+            self._check_columns(record)
+        for name, check in self._checks:
+            values = [record[name] for record in records if name in record]
+            if not all(map(check, values)):
+                bad = next(r for r in records
+                           if name in r and not check(r[name]))
+                raise DataIsUncorrectError(data=bad)
+        return [self._encode(record) for record in records]
+
+    def decode(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Turn a stored record back into API values, in place.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            Record read from its file.
+
+        Returns
+        -------
+        dict[str, Any]
+            The same record.
+        """
+        for name, decode in self._decoders:
+            if name in record:
+                record[name] = decode(record[name])
+        return record
+
+    def load(self, row: dict[str, Any], *, text: bool) -> dict[str, Any]:
+        """Convert an imported row to API values.
+
+        Parameters
+        ----------
+        row : dict[str, Any]
+            CSV row or decoded JSON line.
+        text : bool
+            Whether every value is text, as in CSV, where an empty value
+            is a missing field. Otherwise only string values of DATETIME
+            and BYTES columns are converted.
+
+        Returns
+        -------
+        dict[str, Any]
+            Record to validate.
+
+        Raises
+        ------
+        DataIsUncorrectError
+            If a value is not in the text form of its column type.
+        """
+        loaders = self._loaders[text]
+        record = {}
+        for name, value in row.items():
+            if text and value == "":
+                continue
+            load = loaders.get(name)
+            if load is not None and isinstance(value, str):
+                try:
+                    record[name] = load(value)
+                except ValueError as e:
+                    raise DataIsUncorrectError(data=row) from e
+            else:
+                record[name] = value
+        return record
+
+    def dump(self,
+             record: dict[str, Any],
+             *,
+             text: bool,
+             ) -> dict[str, Any]:
+        """Convert a decoded record to its exported form.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            Record with API values.
+        text : bool
+            Turn every value into text, as for CSV. Otherwise only
+            DATETIME and BYTES values become text.
+
+        Returns
+        -------
+        dict[str, Any]
+            Exported fields.
+        """
+        dumpers = self._dumpers[text]
+        return {name: value if value is None or name not in dumpers
+                else dumpers[name](value)
+                for name, value in record.items()}
+
+    def parse(self, column: str, text: str) -> Any:  # noqa: ANN401
+        """Convert a condition value to the stored form of a column.
+
+        Parameters
+        ----------
+        column : str
+            Column of the condition.
+        text : str
+            Value as written in the condition.
+
+        Returns
+        -------
+        Any
+            Value comparable with stored records.
+
+        Raises
+        ------
+        InvalidConditionError
+            If the text is not a value of the column type.
+        """
+        try:
+            value = self._parsers[column](text)
+        except ValueError as e:
+            raise InvalidConditionError(text, str(e)) from e
+        return self._encode({column: value})[column]
+
+    def record_class(self) -> type[Record]:
+        """Return the slotted record class of the table, built once.
+
+        Returns
+        -------
+        type[Record]
+            Subclass of ``Record`` with one slot per column.
+
+        Raises
+        ------
+        ValueError
+            If a column name is not an identifier or shadows a
+            ``Record`` attribute.
+        """
+        if self._record_class is None:
+            fields = tuple(self.columns)
+            for name in fields:
+                if not name.isidentifier() or hasattr(Record, name):
+                    msg = (f"column {name!r} of {self.table_name} cannot be "
+                           "a record attribute")
+                    raise ValueError(msg)
+            self._record_class = type(
+                f"{self.table_name}_Record", (Record,),
+                {"__slots__": fields, "_fields": fields})
+        return self._record_class
+
+    def check_result_type(self, result_type: str) -> None:
+        """Check that ``find`` can return a result type for the table.
+
+        Parameters
+        ----------
+        result_type : str
+            ``"dict"``, ``"record"`` or ``"columns"``.
+
+        Raises
+        ------
+        ValueError
+            If the result type is unknown, or the table columns cannot
+            be record attributes or share the ``file_id`` column.
+        """
+        if result_type not in RESULT_TYPES:
+            msg = f"result_type must be one of {RESULT_TYPES}"
+            raise ValueError(msg)
+        if result_type == "record":
+            self.record_class()
+        elif result_type == "columns" and "file_id" in self.columns:
+            msg = f"column 'file_id' of {self.table_name} hides the file ids"
+            raise ValueError(msg)
+
+    def shape(self,
+              result: list[dict[str, Any]],
+              result_type: str,
+              ) -> FindResult:
+        """Return a cached ``find`` result in the requested result type.
+
+        Parameters
+        ----------
+        result : list[dict[str, Any]]
+            Decoded records keyed by file id.
+        result_type : str
+            Type checked by ``check_result_type``.
+
+        Returns
+        -------
+        FindResult
+            The result itself, record objects or columns.
+        """
+        if result_type == "dict":
+            return result
+        collector = _Collector(self, result_type, decode=False)
+        for found in result:
+            collector.extend(found.items())
+        return collector.result()
+
+
+class _Collector:
+    """Build a ``find`` result while its records are read.
+
+    Every record is decoded and turned into the requested result type as
+    it arrives: a record object, or one value appended to each column
+    sequence. INT columns fill ``array("q")`` and FLOAT columns
+    ``array("d")`` buffers; other columns, and INT or FLOAT columns with
+    a missing or out-of-range value, are lists (None for missing values).
+
+    Parameters
+    ----------
+    schema : _Schema
+        Schema of the table.
+    result_type : str
+        Type checked by ``check_result_type``.
+    decode : bool, optional
+        Decode stored records, by default True. Records of a cached
+        result are decoded already.
+    """
+
+    __slots__ = ("_columns", "_decode", "_file_ids", "_make", "_rows",
+                 "result_type", "schema")
+
+    def __init__(self,
+                 schema: _Schema,
+                 result_type: str,
+                 *,
+                 decode: bool = True,
+                 ) -> None:
+        """Init empty result.
+
+        Parameters
+        ----------
+        schema : _Schema
+            Schema of the table.
+        result_type : str
+            Type checked by ``check_result_type``.
+        decode : bool, optional
+            Decode stored records, by default True.
+        """
+        self.schema = schema
+        self.result_type = result_type
+        self._decode = decode and schema.codec
+        self._rows: list[Any] = []
+        self._file_ids: list[str] = []
+        self._columns: dict[str, MutableSequence[Any]] = {}
+        if result_type == "columns":
+            self._columns = {
+                name: array(_ARRAY_TYPECODES[t]) if t in _ARRAY_TYPECODES
+                else [] for name, t in schema.columns.items()}
+        self._make = (schema.record_class() if result_type == "record"
+                      else None)
+
+    def extend(self, rows: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Add records in result order.
+
+        Parameters
+        ----------
+        rows : Iterable[tuple[str, dict[str, Any]]]
+            File ids with their records.
+        """
+        for file_id, record in rows:
+            if self._decode:
+                self.schema.decode(record)
+            if self._make is not None:
+                self._rows.append(self._make(file_id, record))
+            elif self.result_type != "columns":
+                self._rows.append({file_id: record})
+            else:
+                self._file_ids.append(file_id)
+                for column, values in self._columns.items():
+                    value = record.get(column)
+                    try:
+                        values.append(value)
+                    except (TypeError, OverflowError):
+                        self._columns[column] = [*values, value]
+
+    def result(self) -> FindResult:
+        """Return the result.
+
+        Returns
+        -------
+        FindResult
+            Records keyed by file id, record objects, or ``file_id`` and
+            every column mapped to its values.
+        """
+        if self.result_type == "columns":
+            return {"file_id": self._file_ids, **self._columns}
+        return self._rows
@@ -0,0 +1,98 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Read coalescing for the async database manager."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyfiles_db.database_manager._schema import FindResult, copy_found
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+Result = FindResult
+
+
+@dataclass
+class _Flight:
+    """Read running for the first caller, awaited by the others."""
+
+    task: asyncio.Future[Result]
+    waiters: int = 0
+
+
+class _SingleFlight:
+    """Run identical concurrent reads once.
+
+    The first caller of a key starts the read as a task; callers of the
+    same key arriving before it finishes await that task instead of
+    reading again. Once it finishes the key is forgotten, so the next
+    call reads again. When a read was shared every caller gets its own
+    copy of the result. The task is shielded, so a cancelled caller does
+    not cancel the read of the others.
+    """
+
+    def __init__(self) -> None:
+        """Init without reads in flight."""
+        self._flights: dict[Hashable, _Flight] = {}
+        # Calls served by a read of another caller.
+        self.coalesced = 0
+
+    async def run(self,
+                  key: Hashable,
+                  read: Callable[[], Awaitable[Result]],
+                  ) -> tuple[Result, bool]:
+        """Return the result of ``read``, shared with identical calls.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of the read; include everything the result depends
+            on, such as the table version.
+        read : Callable[[], Awaitable[Result]]
+            Reads the result, called only when no read of ``key`` runs.
+
+        Returns
+        -------
+        tuple[Result, bool]
+            The result and whether it came from another caller's read.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.waiters += 1
+            self.coalesced += 1
+            return copy_found(await asyncio.shield(flight.task)), True
+        task = asyncio.ensure_future(read())
+        flight = self._flights[key] = _Flight(task)
+        task.add_done_callback(partial(self._land, key, flight))
+        result = await asyncio.shield(task)
+        return (copy_found(result) if flight.waiters else result), False
+
+    def _land(self,
+              key: Hashable,
+              flight: _Flight,
+              task: asyncio.Future[Result],
+              ) -> None:
+        """Forget a finished read."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not task.cancelled():
+            # Retrieved here, in case every caller was cancelled.
+            task.exception()
@@ -0,0 +1,1332 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk layout of meta and table files."""
+
+from __future__ import annotations
+
+import errno
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pyfiles_db.database_manager._column_index import (
+    ADD,
+    REMOVE,
+    _ColumnIndex,
+)
+from pyfiles_db.database_manager._id_set import _IdSet
+from pyfiles_db.database_manager._numeric_column import (
+    _NumericColumn,
+    can_filter,
+    encode_rows,
+)
+from pyfiles_db.database_manager._query import EQ
+from pyfiles_db.database_manager.meta import META
+from pyfiles_db.errors import PathNotAvaibleError
+from pyfiles_db.utils import BloomFilter, DirHandle, FileLock, write_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Collection,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+
+    from pyfiles_db.metrics import OperationStats
+
+T = TypeVar("T")
+
+# Smallest Bloom filter capacity. Rebuilt filters are sized for twice
+# the records of the table.
+_BLOOM_MIN_CAPACITY = 1024
+
+
+def changed_fields(record: dict[str, Any],
+                   changes: dict[str, Any],
+                   ) -> dict[str, Any]:
+    """Return the fields of ``changes`` that differ from a record.
+
+    Parameters
+    ----------
+    record : dict[str, Any]
+        Stored record.
+    changes : dict[str, Any]
+        New values of some columns.
+
+    Returns
+    -------
+    dict[str, Any]
+        Fields that are missing from the record or have another value.
+    """
+    return {column: value for column, value in changes.items()
+            if column not in record or record[column] != value}
+
+
+def removed_ids(names: Sequence[str],
+                errors: Sequence[BaseException | None],
+                ) -> tuple[list[str], int, BaseException | None]:
+    """Sort out the result of ``remove_records``.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        Removed file ids.
+    errors : Sequence[BaseException | None]
+        Error of every file id.
+
+    Returns
+    -------
+    tuple[list[str], int, BaseException | None]
+        File ids to drop from the index (removed or already missing),
+        number of removed records and the first other error.
+    """
+    dropped: list[str] = []
+    deleted = 0
+    first: BaseException | None = None
+    for name, error in zip(names, errors, strict=True):
+        if error is None:
+            deleted += 1
+        elif not isinstance(error, FileNotFoundError):
+            first = first or error
+            continue
+        dropped.append(name)
+    return dropped, deleted, first
+
+
+def written_ids(items: Sequence[tuple[str, dict[str, Any], dict[str, Any]]],
+                results: Sequence[int | BaseException],
+                stats: OperationStats | None = None,
+                ) -> tuple[list[tuple[str, dict[str, Any]]],
+                           BaseException | None]:
+    """Sort out the result of ``write_records`` for changed records.
+
+    Parameters
+    ----------
+    items : Sequence[tuple[str, dict[str, Any], dict[str, Any]]]
+        File ids, old records and changed fields.
+    results : Sequence[int | BaseException]
+        Size of every written record, or its error.
+    stats : OperationStats | None, optional
+        Counters of the running operation.
+
+    Returns
+    -------
+    tuple[list[tuple[str, dict[str, Any]]], BaseException | None]
+        File ids and changed fields of written records, and the first
+        error.
+    """
+    written: list[tuple[str, dict[str, Any]]] = []
+    first: BaseException | None = None
+    for (name, _, diff), result in zip(items, results, strict=True):
+        if isinstance(result, BaseException):
+            first = first or result
+            continue
+        written.append((name, diff))
+        if stats is not None:
+            stats.files_opened += 1
+            stats.bytes_written += result
+    return written, first
+
+
+class _MetaStorage:
+    """Meta file guarded by a cross-process lock.
+
+    Every change is a read-modify-write of the file on disk under the
+    exclusive meta lock, so concurrent processes never overwrite each
+    other's tables or id counters. With ``initial_meta`` the storage
+    folder and meta file are created on first access, not up front.
+    """
+
+    def __init__(self,
+                 storage: Path,
+                 meta_file: str,
+                 initial_meta: dict[str, Any] | None = None,
+                 ) -> None:
+        """Init meta storage.
+
+        Parameters
+        ----------
+        storage : Path
+            Path to the database location.
+        meta_file : str
+            Name of the meta file.
+        initial_meta : dict[str, Any] | None, optional
+            Meta information written if the meta file does not exist,
+            by default None (the database must exist).
+        """
+        self.path = storage / meta_file
+        self.lock = FileLock(storage / f".{meta_file}.lock")
+        self._initial_meta = initial_meta
+        self._ready = initial_meta is None
+        self._ready_lock = threading.Lock()
+
+    def _ensure(self) -> None:
+        """Create the storage folder and meta file once.
+
+        Raises
+        ------
+        PathNotAvaibleError
+            If the path is not available.
+        NotADirectoryError
+            If the path exists but is not a directory.
+        """
+        if self._ready:
+            return
+        with self._ready_lock:
+            if self._ready:
+                return
+            storage = self.path.parent
+            storage.mkdir(parents=True, exist_ok=True)
+            if not storage.exists():
+                raise PathNotAvaibleError
+            if not storage.is_dir():
+                raise NotADirectoryError
+            with self.lock.exclusive():
+                if not self.path.exists():
+                    write_atomic(self.path, json.dumps(self._initial_meta))
+            self._ready = True
+
+    def read(self) -> dict[str, Any]:
+        """Read meta information under a shared lock.
+
+        Returns
+        -------
+        dict[str, Any]
+            Meta information.
+        """
+        self._ensure()
+        with self.lock.shared(), Path.open(self.path) as f:
+            meta: dict[str, Any] = json.load(f)
+        return meta
+
+    def update(self,
+               change: Callable[[dict[str, Any]], T],
+               ) -> tuple[dict[str, Any], T]:
+        """Apply ``change`` to the current meta and save it.
+
+        Parameters
+        ----------
+        change : Callable[[dict[str, Any]], T]
+            Mutates the meta in place. If it raises, nothing is written.
+
+        Returns
+        -------
+        tuple[dict[str, Any], T]
+            Saved meta information and the value returned by ``change``.
+        """
+        self._ensure()
+        with self.lock.exclusive():
+            with Path.open(self.path) as f:
+                meta: dict[str, Any] = json.load(f)
+            result = change(meta)
+            write_atomic(self.path, json.dumps(meta))
+        return meta, result
+
+    def allocate_ids(self,
+                     table: str,
+                     count: int,
+                     ) -> tuple[dict[str, Any], list[int]]:
+        """Reserve ``count`` ids of an auto increment table.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+        count : int
+            Number of ids to reserve.
+
+        Returns
+        -------
+        tuple[dict[str, Any], list[int]]
+            Saved meta information and the reserved ids.
+        """
+        def reserve(meta: dict[str, Any]) -> list[int]:
+            start: int = meta[table][META.GENERATOR]
+            meta[table][META.GENERATOR] = start + count
+            return list(range(start, start + count))
+        return self.update(reserve)
+
+
+def in_index_order(names: Sequence[str],
+                   rows: Iterable[tuple[str, dict[str, Any]]],
+                   ) -> list[tuple[str, dict[str, Any]]]:
+    """Put rows read out of order back in the order of the index file.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        File ids in index order.
+    rows : Iterable[tuple[str, dict[str, Any]]]
+        File ids with their records, file ids taken from ``names``.
+
+    Returns
+    -------
+    list[tuple[str, dict[str, Any]]]
+        The rows in the order of ``names``.
+    """
+    position = {name: i for i, name in enumerate(names)}
+    return sorted(rows, key=lambda row: position[row[0]])
+
+
+class _TableStorage:
+    """Folder of a single table.
+
+    ``.json`` holds the file ids and is only rewritten under the
+    exclusive table lock. Its ids stay resident as an :class:`_IdSet`,
+    read again only when another process replaced the file. Record files
+    are replaced atomically, so they can be read without any lock.
+
+    With ``bloom_columns`` the table also keeps Bloom filters, ``.bloom``
+    over file ids and ``.bloom-<column>`` over column values. They are
+    updated together with the index, and :meth:`might_contain` answers
+    lookups of absent keys from memory.
+
+    Column indexes live in ``.idx-<column>`` journals. ``.json`` lists
+    the indexed columns, so every writer, in any process, appends its
+    changes to them under the exclusive table lock. Readers replay only
+    the lines appended since their last lookup.
+
+    INT columns listed under ``NUMERIC`` in ``.json`` also keep an int64
+    sidecar in ``.num-<column>`` and ``.numids-<column>``, appended to
+    by every writer and queried with NumPy.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 bloom_columns: Sequence[str] | None = None,
+                 bloom_max_age: float = 0.0,
+                 ) -> None:
+        """Init table storage.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the table folder.
+        bloom_columns : Sequence[str] | None, optional
+            Columns with a Bloom filter, by default None (no filters).
+            An empty sequence keeps only the file id filter.
+        bloom_max_age : float, optional
+            Seconds a loaded filter is trusted without checking whether
+            another process changed it, by default 0.0 (check with a
+            ``stat`` on every lookup).
+        """
+        self.path = path
+        self.index_path = path / ".json"
+        self.lock = FileLock(path / ".lock")
+        # Record files are opened relative to the folder descriptor.
+        self.dir = DirHandle(path)
+        self.bloom_columns = (None if bloom_columns is None
+                              else list(bloom_columns))
+        self.bloom_max_age = bloom_max_age
+        # Filter name -> (file stat key, checked at, filter).
+        self._blooms: dict[str, tuple[tuple[int, int, int], float,
+                                      BloomFilter]] = {}
+        # Indexed and numeric columns as last read from ``.json``.
+        self.index_columns: list[str] = []
+        self.numeric_columns: list[str] = []
+        self._index_columns_read = False
+        # Column -> (file stat key, journal generation, bytes replayed,
+        # index). Replays of the async pool threads are serialized.
+        self._indexes: dict[str, tuple[tuple[int, int, int], str, int,
+                                       _ColumnIndex]] = {}
+        self._index_lock = threading.Lock()
+        self._numeric: dict[str, _NumericColumn] = {}
+        # (file stat key, ``.json`` without the ids, ids) as last read
+        # or written.
+        self._file_ids: tuple[tuple[int, int, int], dict[str, Any],
+                              _IdSet] | None = None
+
+    def create(self) -> None:
+        """Create the table folder and an empty index file."""
+        self.path.mkdir(parents=False, exist_ok=True)
+        # A folder created again is another directory.
+        self.dir.close()
+        self._file_ids = None
+        write_atomic(self.index_path, json.dumps({META.FILE_IDS: []}))
+        if self.bloom_columns is not None:
+            for name in self._bloom_names():
+                self._save_bloom(name, BloomFilter(_BLOOM_MIN_CAPACITY))
+
+    def _bloom_names(self) -> list[str]:
+        """Return file names of the table filters."""
+        if self.bloom_columns is None:
+            return []
+        return [".bloom", *(f".bloom-{c}" for c in self.bloom_columns)]
+
+    def _save_bloom(self, name: str, bloom: BloomFilter) -> None:
+        """Write a filter and keep it loaded."""
+        path = self.path / name
+        write_atomic(path, bloom.to_bytes())
+        st = path.stat()
+        self._blooms[name] = ((st.st_ino, st.st_mtime_ns, st.st_size),
+                              time.monotonic(), bloom)
+
+    def _load_bloom(self, name: str) -> BloomFilter | None:
+        """Return a filter, reloaded if another process replaced it."""
+        cached = self._blooms.get(name)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self.bloom_max_age:
+            return cached[2]
+        path = self.path / name
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._blooms.pop(name, None)
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if cached is not None and cached[0] == key:
+            self._blooms[name] = (key, now, cached[2])
+            return cached[2]
+        try:
+            bloom = BloomFilter.from_bytes(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        self._blooms[name] = (key, now, bloom)
+        return bloom
+
+    def might_contain(self, column: str | None, value: Any) -> bool:  # noqa: ANN401
+        """Check a key against the Bloom filter.
+
+        Parameters
+        ----------
+        column : str | None
+            Column of the value, None for a file id.
+        value : Any
+            Value to look up.
+
+        Returns
+        -------
+        bool
+            False only if no record has the key, True if it may exist
+            or the table has no filter for the column.
+        """
+        if column is None:
+            name = ".bloom"
+        elif self.bloom_columns is not None and column in self.bloom_columns:
+            name = f".bloom-{column}"
+        else:
+            return True
+        bloom = self._load_bloom(name)
+        return bloom is None or str(value) in bloom
+
+    def record_path(self, file_id: str | int) -> Path:
+        """Return path of the record file.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+
+        Returns
+        -------
+        Path
+            Path to the record file.
+        """
+        return self.path / f"{file_id}.json"
+
+    def not_found(self, file_id: str | int) -> FileNotFoundError:
+        """Return the error of a missing record file.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+
+        Returns
+        -------
+        FileNotFoundError
+            Same error as opening the missing file raises.
+        """
+        return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT),
+                                 str(self.record_path(file_id)))
+
+    def read_record(self,
+                    file_id: str | int,
+                    stats: OperationStats | None = None,
+                    ) -> dict[str, Any] | None:
+        """Read and decode a record file.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The record, None if the file does not exist.
+        """
+        if stats is not None:
+            stats.files_opened += 1
+        try:
+            raw = self.dir.read(f"{file_id}.json")
+        except FileNotFoundError:
+            return None
+        if stats is not None:
+            stats.bytes_read += len(raw)
+            stats.records_decoded += 1
+        record: dict[str, Any] = json.loads(raw)
+        return record
+
+    def iter_records(self,
+                     names: Iterable[str],
+                     stats: OperationStats | None = None,
+                     readahead: int = 0,
+                     ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Read records one by one.
+
+        Records deleted after ``names`` was read are skipped.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            File ids to read.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+        readahead : int, optional
+            Record files announced to the kernel ahead of reading them,
+            by default 0 (read through the descriptor pool).
+
+        Yields
+        ------
+        tuple[str, dict[str, Any]]
+            File id and record.
+        """
+        if readahead <= 0:
+            for name in names:
+                record = self.read_record(name, stats)
+                if record is not None:
+                    yield name, record
+            return
+        files = self.dir.read_many((f"{name}.json" for name in names),
+                                   readahead)
+        for file_name, raw in files:
+            if stats is not None:
+                stats.files_opened += 1
+            if raw is None:
+                continue
+            if stats is not None:
+                stats.bytes_read += len(raw)
+                stats.records_decoded += 1
+            yield file_name.removesuffix(".json"), json.loads(raw)
+
+    def physical_order(self, names: Sequence[str]) -> list[str]:
+        """Sort file ids by the inode of their record files.
+
+        File systems mostly allocate inodes and data blocks together,
+        so reading in inode order turns a scan of a churned table into
+        near-sequential I/O. The inodes come from one ``os.scandir`` of
+        the folder; file ids without a record file are dropped, files
+        not in ``names`` are never read.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            File ids, as listed by the index file.
+
+        Returns
+        -------
+        list[str]
+            The same file ids in inode order.
+        """
+        wanted = set(names)
+        inodes: dict[str, int] = {}
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                name = entry.name.removesuffix(".json")
+                if name in wanted and entry.name != name:
+                    inodes[name] = entry.inode()
+        return sorted(inodes, key=inodes.__getitem__)
+
+    def write_record(self,
+                     file_id: str | int,
+                     data: dict[str, Any],
+                     stats: OperationStats | None = None,
+                     *,
+                     new: bool = False,
+                     ) -> int:
+        """Replace a record file atomically.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+        data : dict[str, Any]
+            Record to save.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+        new : bool, optional
+            Only create the record file, by default False. Of writers
+            racing for one id in several processes, one wins.
+
+        Returns
+        -------
+        int
+            Size of the written record.
+
+        Raises
+        ------
+        FileExistsError
+            If ``new`` is set and the record file exists.
+        """
+        text = json.dumps(data)
+        self.dir.write_atomic(f"{file_id}.json", text, exclusive=new)
+        if stats is not None:
+            stats.files_opened += 1
+            stats.bytes_written += len(text)
+        return len(text)
+
+    def write_records(self,
+                      items: Sequence[tuple[str | int, dict[str, Any]]],
+                      *,
+                      new: bool = False,
+                      ) -> list[int | OSError]:
+        """Replace several record files.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str | int, dict[str, Any]]]
+            File ids and records to save.
+        new : bool, optional
+            Only create the record files, by default False.
+
+        Returns
+        -------
+        list[int | OSError]
+            Size of every written record, or the error that stopped it
+            (FileExistsError for a record file that exists when ``new``
+            is set).
+        """
+        results: list[int | OSError] = []
+        for file_id, data in items:
+            try:
+                results.append(self.write_record(file_id, data, new=new))
+            except OSError as e:
+                results.append(e)
+        return results
+
+    def remove_record(self, file_id: str | int) -> None:
+        """Remove a record file.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the record file does not exist.
+        """
+        try:
+            self.dir.remove(f"{file_id}.json")
+        except FileNotFoundError:
+            raise self.not_found(file_id) from None
+
+    def close(self) -> None:
+        """Close the folder descriptor and pooled record files."""
+        self.dir.close()
+
+    def remove_records(self, file_ids: Iterable[str]) -> list[OSError | None]:
+        """Remove several record files.
+
+        Parameters
+        ----------
+        file_ids : Iterable[str]
+            File ids to remove.
+
+        Returns
+        -------
+        list[OSError | None]
+            Error of every file id (FileNotFoundError for a missing
+            record), None when it was removed.
+        """
+        errors: list[OSError | None] = []
+        for file_id in file_ids:
+            try:
+                self.remove_record(file_id)
+            except OSError as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
+
+    def read_file_ids(self, stats: OperationStats | None = None) -> list[str]:
+        """Read file ids under a shared lock.
+
+        Parameters
+        ----------
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str]
+            File ids in insertion order.
+        """
+        with self.lock.shared():
+            _, ids = self._load_ids(stats)
+            return list(ids)
+
+    def known(self,
+              file_ids: Iterable[str],
+              stats: OperationStats | None = None,
+              ) -> set[str]:
+        """Return the file ids that are already in the table.
+
+        Parameters
+        ----------
+        file_ids : Iterable[str]
+            File ids to look up.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        set[str]
+            The given ids listed in ``.json``.
+        """
+        with self.lock.shared():
+            _, ids = self._load_ids(stats)
+            return {name for name in file_ids if name in ids}
+
+    def _load_ids(self,
+                  stats: OperationStats | None = None,
+                  ) -> tuple[dict[str, Any], _IdSet]:
+        """Return ``.json`` and its ids, under a table lock.
+
+        The resident copy is reused while the file keeps its stat key.
+        """
+        st = self.index_path.stat()
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._file_ids
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        with Path.open(self.index_path, "rb") as f:
+            raw = f.read()
+        if stats is not None:
+            stats.files_opened += 1
+            stats.bytes_read += len(raw)
+        data = json.loads(raw)
+        ids = _IdSet.from_json(data.pop(META.FILE_IDS))
+        self._set_index_columns(data)
+        self._file_ids = (key, data, ids)
+        return data, ids
+
+    def _save_ids(self,
+                  data: dict[str, Any],
+                  ids: _IdSet,
+                  stats: OperationStats | None = None,
+                  ) -> None:
+        """Rewrite ``.json`` and keep it resident, under the exclusive lock.
+
+        Callers drop the resident copy before changing it, so a failed
+        write leaves nothing stale behind.
+        """
+        text = json.dumps({META.FILE_IDS: ids.to_json(), **data})
+        write_atomic(self.index_path, text)
+        st = self.index_path.stat()
+        self._set_index_columns(data)
+        self._file_ids = ((st.st_ino, st.st_mtime_ns, st.st_size), data, ids)
+        if stats is not None:
+            stats.files_opened += 1
+            stats.bytes_written += len(text)
+
+    def commit(self,
+               added: Sequence[str] = (),
+               removed: Iterable[str] = (),
+               stats: OperationStats | None = None,
+               records: Sequence[dict[str, Any]] = (),
+               ) -> None:
+        """Add and remove file ids in one index rewrite.
+
+        Parameters
+        ----------
+        added : Sequence[str]
+            File ids to append; ids already in the table keep their
+            place.
+        removed : Iterable[str]
+            File ids to drop.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+        records : Sequence[dict[str, Any]], optional
+            Records of ``added`` in the same order, added to the column
+            Bloom filters and indexes.
+        """
+        drop = set(removed)
+        with self.lock.exclusive():
+            data, ids = self._load_ids(stats)
+            self._file_ids = None
+            for name in drop:
+                ids.discard(name)
+            for name in added:
+                ids.add(name)
+            self._save_ids(data, ids, stats)
+            if added and self.bloom_columns is not None:
+                self._add_to_blooms(ids, added, records)
+            for column in self.index_columns:
+                lines = [[REMOVE, name] for name in drop]
+                lines.extend([ADD, name, record[column]]
+                             for name, record in zip(added, records,
+                                                     strict=False)
+                             if column in record)
+                self._append_index(column, lines)
+            for column in self.numeric_columns:
+                self._append_numeric(column, [
+                    (name, record[column])
+                    for name, record in zip(added, records, strict=False)
+                    if column in record])
+
+    def _add_to_blooms(self,
+                       names: Collection[str],
+                       added: Sequence[str],
+                       records: Sequence[dict[str, Any]],
+                       ) -> None:
+        """Add new keys to the filters, under the exclusive table lock.
+
+        A file id filter over its capacity is rebuilt from ``names``;
+        column filters keep working with more false positives until the
+        table is compacted.
+        """
+        bloom = self._load_bloom(".bloom")
+        keys: Iterable[str] = added
+        if bloom is None or bloom.count + len(added) > bloom.capacity:
+            bloom = BloomFilter(max(2 * len(names), _BLOOM_MIN_CAPACITY))
+            keys = names
+        for name in keys:
+            bloom.add(name)
+        self._save_bloom(".bloom", bloom)
+        for column in self.bloom_columns or ():
+            values = [r[column] for r in records if column in r]
+            if not values:
+                continue
+            name = f".bloom-{column}"
+            column_bloom = self._load_bloom(name)
+            if column_bloom is None:
+                # Without a filter every lookup goes to the disk anyway.
+                continue
+            for value in values:
+                column_bloom.add(str(value))
+            self._save_bloom(name, column_bloom)
+
+    def compact(self, stats: OperationStats | None = None) -> int:
+        """Drop ids of missing records and rebuild indexes and filters.
+
+        Parameters
+        ----------
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        int
+            Number of file ids dropped from the index.
+        """
+        with self.lock.exclusive():
+            data, ids = self._load_ids(stats)
+            self._file_ids = None
+            existing = {entry.name.removesuffix(".json")
+                        for entry in os.scandir(self.path)
+                        if entry.name.endswith(".json")
+                        and entry.name != ".json"}
+            keep = _IdSet(n for n in ids if n in existing)
+            self._save_ids(data, keep, stats)
+            kept = list(keep)
+            for column in self.index_columns:
+                with self._index_lock:
+                    index = self._load_index(column, stats)
+                    if index is None:
+                        continue
+                    for name in index.file_ids():
+                        if name not in keep:
+                            index.remove(name)
+                    self._save_index(column, index)
+            if self.bloom_columns is not None:
+                self._rebuild_blooms(kept, stats)
+            if self.numeric_columns:
+                self._rebuild_numeric(self.numeric_columns, kept, stats)
+        return len(ids) - len(kept)
+
+    def _rebuild_blooms(self,
+                        kept: list[str],
+                        stats: OperationStats | None,
+                        ) -> None:
+        """Write filters sized for the table, under the exclusive lock."""
+        capacity = max(2 * len(kept), _BLOOM_MIN_CAPACITY)
+        bloom = BloomFilter(capacity)
+        for name in kept:
+            bloom.add(name)
+        self._save_bloom(".bloom", bloom)
+        column_blooms = {c: BloomFilter(capacity)
+                         for c in self.bloom_columns or ()}
+        if column_blooms:
+            for _, record in self.iter_records(kept, stats):
+                for column, column_bloom in column_blooms.items():
+                    if column in record:
+                        column_bloom.add(str(record[column]))
+        for column, column_bloom in column_blooms.items():
+            self._save_bloom(f".bloom-{column}", column_bloom)
+
+    def _set_index_columns(self, data: dict[str, Any]) -> None:
+        """Remember the indexed and numeric columns listed in ``.json``."""
+        self.index_columns = data.get(META.INDEXES, [])
+        self.numeric_columns = data.get(META.NUMERIC, [])
+        self._index_columns_read = True
+
+    def _numeric_files(self, column: str) -> tuple[Path, Path]:
+        """Return paths of the value and id files of a sidecar."""
+        return self.path / f".num-{column}", self.path / f".numids-{column}"
+
+    def _append_numeric(self,
+                        column: str,
+                        items: Sequence[tuple[str, Any]],
+                        ) -> None:
+        """Append rows to a sidecar, under the exclusive table lock."""
+        values, lines = encode_rows(items)
+        if not lines:
+            return
+        # Values first: a reader never replays an id without its value.
+        for path, raw in zip(self._numeric_files(column), (values, lines),
+                             strict=True):
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+            except FileNotFoundError:
+                return
+            try:
+                os.write(fd, raw)
+            finally:
+                os.close(fd)
+
+    def _rebuild_numeric(self,
+                         columns: Sequence[str],
+                         names: list[str],
+                         stats: OperationStats | None,
+                         ) -> None:
+        """Write sidecars of every record, under the exclusive lock."""
+        rows: dict[str, list[tuple[str, Any]]] = {c: [] for c in columns}
+        for name, record in self.iter_records(names, stats):
+            for column, column_rows in rows.items():
+                if column in record:
+                    column_rows.append((name, record[column]))
+        for column, column_rows in rows.items():
+            values, lines = encode_rows(column_rows)
+            values_path, ids_path = self._numeric_files(column)
+            write_atomic(values_path, values)
+            write_atomic(ids_path, lines)
+
+    def _index_file(self, column: str) -> Path:
+        """Return path of the journal of a column index."""
+        return self.path / f".idx-{column}"
+
+    def _save_index(self, column: str, index: _ColumnIndex) -> None:
+        """Replace a journal with a snapshot of the index.
+
+        A new generation id tells readers to reload it from the start.
+        """
+        generation = uuid.uuid4().hex
+        raw = (json.dumps(["#", generation]) + "\n"
+               + index.snapshot()).encode()
+        path = self._index_file(column)
+        write_atomic(path, raw)
+        st = path.stat()
+        self._indexes[column] = ((st.st_ino, st.st_mtime_ns, st.st_size),
+                                 generation, len(raw), index)
+
+    def _append_index(self, column: str, lines: list[list[Any]]) -> None:
+        """Append changes to a journal, under the exclusive table lock."""
+        if not lines:
+            return
+        raw = "".join(json.dumps(line) + "\n" for line in lines).encode()
+        try:
+            fd = os.open(self._index_file(column), os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            return
+        try:
+            os.write(fd, raw)
+        finally:
+            os.close(fd)
+
+    def _load_index(self,
+                    column: str,
+                    stats: OperationStats | None,
+                    ) -> _ColumnIndex | None:
+        """Return a column index with every journal line applied.
+
+        The caller holds ``_index_lock``.
+        """
+        path = self._index_file(column)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._indexes.pop(column, None)
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._indexes.get(column)
+        if cached is not None and cached[0] == key:
+            return cached[3]
+        with Path.open(path, "rb") as f:
+            header = f.readline()
+            generation = json.loads(header)[1]
+            if cached is not None and cached[1] == generation:
+                offset, index = cached[2], cached[3]
+                f.seek(offset)
+            else:
+                offset, index = len(header), _ColumnIndex()
+            raw = f.read()
+        if stats is not None:
+            stats.files_opened += 1
+            stats.bytes_read += len(header) + len(raw)
+        # A line being appended right now is replayed next time.
+        end = raw.rfind(b"\n") + 1
+        index.replay(raw[:end])
+        self._indexes[column] = (key, generation, offset + end, index)
+        return index
+
+    def index_candidates(self,
+                         column: str,
+                         operator: str,
+                         value: Any,  # noqa: ANN401
+                         stats: OperationStats | None = None,
+                         ) -> list[str] | None:
+        """Return file ids that may satisfy a condition, from an index.
+
+        Parameters
+        ----------
+        column : str
+            Column of the condition.
+        operator : str
+            Operator of the condition.
+        value : Any
+            Condition value converted to the column type.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str] | None
+            Candidate file ids in insertion order, None if the column
+            has no index.
+        """
+        with self._index_lock:
+            index = self._load_index(column, stats)
+            if index is None:
+                return None
+            return index.candidates(operator, value)
+
+    def equal_ids(self,
+                  column: str,
+                  values: Iterable[Any],
+                  *,
+                  generator: bool,
+                  stats: OperationStats | None = None,
+                  ) -> list[str]:
+        """Return file ids of records whose column may equal a value.
+
+        Parameters
+        ----------
+        column : str
+            The ``id_generator`` column or an indexed column.
+        values : Iterable[Any]
+            Values to look up.
+        generator : bool
+            Whether records are named by ``column``.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str]
+            Candidate file ids, to be read and checked.
+        """
+        if generator:
+            return [str(value) for value in values
+                    if self.might_contain(None, value)]
+        names: dict[str, None] = {}
+        for value in values:
+            if self.might_contain(column, value):
+                names.update(dict.fromkeys(
+                    self.index_candidates(column, EQ, value, stats) or ()))
+        return list(names)
+
+    def index_order(self,
+                    column: str,
+                    *,
+                    descending: bool,
+                    stats: OperationStats | None = None,
+                    ) -> list[str] | None:
+        """Return every file id sorted by a column, from an index.
+
+        Parameters
+        ----------
+        column : str
+            Column to sort by.
+        descending : bool
+            Largest values first.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str] | None
+            File ids by column value followed by ids of records without
+            the column, None if the column has no index.
+        """
+        names = self.read_file_ids(stats)
+        with self._index_lock:
+            index = self._load_index(column, stats)
+            if index is None:
+                return None
+            ordered = index.ordered(descending=descending)
+        indexed = set(ordered)
+        ordered.extend(name for name in names if name not in indexed)
+        return ordered
+
+    def build_index(self,
+                    column: str,
+                    stats: OperationStats | None = None,
+                    ) -> int:
+        """Index a column of every record.
+
+        Parameters
+        ----------
+        column : str
+            Column to index.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        int
+            Number of indexed records.
+        """
+        with self.lock.exclusive():
+            data, ids = self._load_ids(stats)
+            index = _ColumnIndex()
+            for name, record in self.iter_records(list(ids), stats):
+                if column in record:
+                    index.add(name, record[column])
+            with self._index_lock:
+                self._save_index(column, index)
+            columns: list[str] = data.get(META.INDEXES, [])
+            if column not in columns:
+                self._file_ids = None
+                self._save_ids({**data, META.INDEXES: [*columns, column]},
+                               ids)
+        return len(index)
+
+    def build_numeric(self,
+                      column: str,
+                      stats: OperationStats | None = None,
+                      ) -> int:
+        """Write the int64 sidecar of an INT column of every record.
+
+        Parameters
+        ----------
+        column : str
+            INT column.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        int
+            Number of rows.
+        """
+        with self.lock.exclusive():
+            data, ids = self._load_ids(stats)
+            self._rebuild_numeric([column], list(ids), stats)
+            columns: list[str] = data.get(META.NUMERIC, [])
+            if column not in columns:
+                self._file_ids = None
+                self._save_ids({**data, META.NUMERIC: [*columns, column]},
+                               ids)
+            size = self._numeric_files(column)[0].stat().st_size
+        return size // 8
+
+    def numeric_candidates(self,
+                           column: str,
+                           operator: str,
+                           value: Any,  # noqa: ANN401
+                           stats: OperationStats | None = None,
+                           ) -> list[str] | None:
+        """Return file ids that may satisfy a condition, from a sidecar.
+
+        Parameters
+        ----------
+        column : str
+            Column of the condition.
+        operator : str
+            Operator of the condition.
+        value : Any
+            Condition value converted to the column type.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str] | None
+            Candidate file ids in row order, None if NumPy is missing,
+            the column has no sidecar or the condition is not an int64
+            comparison.
+        """
+        if not can_filter(operator, value):
+            return None
+        values_path, ids_path = self._numeric_files(column)
+        # The shared lock keeps a rebuild from pairing new ids with old
+        # values.
+        with self.lock.shared(), self._index_lock:
+            try:
+                with Path.open(ids_path, "rb") as f:
+                    inode = os.fstat(f.fileno()).st_ino
+                    sidecar = self._numeric.get(column)
+                    if sidecar is None or sidecar.inode != inode:
+                        sidecar = _NumericColumn(inode)
+                    f.seek(sidecar.offset)
+                    raw = f.read()
+            except FileNotFoundError:
+                self._numeric.pop(column, None)
+                return None
+            sidecar.replay(raw[:raw.rfind(b"\n") + 1])
+            self._numeric[column] = sidecar
+            names = sidecar.candidates(values_path, operator, value)
+        if stats is not None:
+            stats.files_opened += 2
+            stats.bytes_read += len(raw) + 8 * len(sidecar.ids)
+        return names
+
+    @property
+    def tracks_columns(self) -> bool:
+        """Whether replaced records may need filter or index updates."""
+        return (not self._index_columns_read or bool(self.bloom_columns)
+                or bool(self.index_columns) or bool(self.numeric_columns))
+
+    def record_updated(self, file_id: str | int, data: dict[str, Any]) -> None:
+        """Add the new values of a replaced record to filters and indexes.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+        data : dict[str, Any]
+            New record.
+        """
+        if not self._index_columns_read:
+            self.read_file_ids()
+        if not self.tracks_columns:
+            return
+        with self.lock.exclusive():
+            self._track_values([(str(file_id), data)])
+
+    def records_changed(self,
+                        items: Sequence[tuple[str, dict[str, Any]]],
+                        ) -> None:
+        """Add changed values of rewritten records to filters and indexes.
+
+        Every Bloom filter is saved and every index journal appended to
+        once for the whole batch.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, dict[str, Any]]]
+            File ids and their changed fields.
+        """
+        if not self._index_columns_read:
+            self.read_file_ids()
+        if not items or not self.tracks_columns:
+            return
+        with self.lock.exclusive():
+            self._track_values(items)
+
+    def _track_values(self,
+                      items: Sequence[tuple[str, dict[str, Any]]],
+                      ) -> None:
+        """Add column values of records to filters and indexes.
+
+        The caller holds the exclusive table lock.
+        """
+        for column in self.bloom_columns or ():
+            values = [data[column] for _, data in items if column in data]
+            name = f".bloom-{column}"
+            bloom = self._load_bloom(name) if values else None
+            if bloom is not None:
+                for value in values:
+                    bloom.add(str(value))
+                self._save_bloom(name, bloom)
+        for column in self.index_columns:
+            self._append_index(column, [[ADD, file_id, data[column]]
+                                        for file_id, data in items
+                                        if column in data])
+        for column in self.numeric_columns:
+            self._append_numeric(column, [(file_id, data[column])
+                                          for file_id, data in items
+                                          if column in data])
+
+    def patch_record(self,
+                     file_id: str | int,
+                     changes: dict[str, Any],
+                     stats: OperationStats | None = None,
+                     ) -> dict[str, Any]:
+        """Write the fields of a record that differ from ``changes``.
+
+        The record is first compared without a lock, so a patch that
+        changes nothing costs one read. Otherwise it is read again,
+        changed and written under the exclusive table lock, and only the
+        filters and indexes of changed columns are updated.
+
+        Parameters
+        ----------
+        file_id : str | int
+            Name of file in table.
+        changes : dict[str, Any]
+            New values of some columns.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        dict[str, Any]
+            Changed fields, empty if nothing was written.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the record does not exist.
+        """
+
+        def diff(record: dict[str, Any] | None) -> dict[str, Any]:
+            if record is None:
+                raise self.not_found(file_id)
+            return changed_fields(record, changes)
+
+        if not diff(self.read_record(file_id, stats)):
+            return {}
+        if not self._index_columns_read:
+            self.read_file_ids()
+        with self.lock.exclusive():
+            record = self.read_record(file_id, stats)
+            changed = diff(record)
+            if changed and record is not None:
+                record.update(changed)
+                self.write_record(file_id, record, stats)
+                self._track_values([(str(file_id), changed)])
+        return changed
@@ -0,0 +1,205 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Messages between the local server and its clients.
+
+Every message is a JSON object preceded by its length as a 4-byte big
+endian integer. BYTES and DATETIME values, the only API values that are
+not JSON, travel as tagged objects.
+"""
+
+from __future__ import annotations
+
+import base64
+import builtins
+import json
+import struct
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pyfiles_db import errors
+
+if TYPE_CHECKING:
+    import asyncio
+    import socket
+
+HEADER = struct.Struct(">I")
+_BYTES = "__pyfiles_db_bytes__"
+_DATETIME = "__pyfiles_db_datetime__"
+
+
+def _default(value: object) -> dict[str, str]:
+    if isinstance(value, bytes):
+        return {_BYTES: base64.b85encode(value).decode()}
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _object_hook(obj: dict[str, Any]) -> Any:  # noqa: ANN401
+    if len(obj) == 1:
+        if _BYTES in obj:
+            return base64.b85decode(obj[_BYTES])
+        if _DATETIME in obj:
+            return datetime.fromisoformat(obj[_DATETIME])
+    return obj
+
+
+def frame(message: dict[str, Any]) -> bytes:
+    """Encode a message with its length prefix.
+
+    Parameters
+    ----------
+    message : dict[str, Any]
+        Message of JSON values, bytes and datetimes.
+
+    Returns
+    -------
+    bytes
+        Bytes to send.
+
+    Raises
+    ------
+    TypeError
+        If a value cannot be sent.
+    """
+    body = json.dumps(message, default=_default).encode()
+    return HEADER.pack(len(body)) + body
+
+
+def parse(body: bytes) -> dict[str, Any]:
+    """Decode the body of a message.
+
+    Parameters
+    ----------
+    body : bytes
+        Message without its length prefix.
+
+    Returns
+    -------
+    dict[str, Any]
+        The message.
+    """
+    message: dict[str, Any] = json.loads(body, object_hook=_object_hook)
+    return message
+
+
+def recv(sock: socket.socket) -> dict[str, Any]:
+    """Read one message from a blocking socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+
+    Returns
+    -------
+    dict[str, Any]
+        The message.
+
+    Raises
+    ------
+    ConnectionError
+        If the peer closed the connection.
+    """
+    (size,) = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    return parse(_recv_exactly(sock, size))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    while view:
+        received = sock.recv_into(view)
+        if not received:
+            msg = "pyfiles_db server closed the connection"
+            raise ConnectionError(msg)
+        view = view[received:]
+    return bytes(buffer)
+
+
+async def read(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one message from a stream.
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        Stream of the connection.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The message, None when the peer closed the connection.
+    """
+    import asyncio  # noqa: PLC0415
+
+    try:
+        (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+        return parse(await reader.readexactly(size))
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def dump_error(error: BaseException) -> dict[str, Any]:
+    """Describe an exception so a client can raise it again.
+
+    Parameters
+    ----------
+    error : BaseException
+        Exception raised by the manager.
+
+    Returns
+    -------
+    dict[str, Any]
+        Type name, arguments and attributes of the exception.
+    """
+    attrs = {name: value for name, value in vars(error).items()
+             if isinstance(value, str | int | float | bool | None)}
+    return {"type": type(error).__name__,
+            "args": [a if isinstance(a, str | int | float | bool | None)
+                     else str(a) for a in error.args],
+            "attrs": attrs}
+
+
+def load_error(error: dict[str, Any]) -> Exception:
+    """Rebuild an exception raised on the server.
+
+    Errors of ``pyfiles_db.errors`` and built-in errors keep their type;
+    others become a RuntimeError naming it.
+
+    Parameters
+    ----------
+    error : dict[str, Any]
+        Exception as described by ``dump_error``.
+
+    Returns
+    -------
+    Exception
+        Exception to raise.
+    """
+    cls = getattr(errors, error["type"], None) or getattr(
+        builtins, error["type"], None)
+    if not (isinstance(cls, type) and issubclass(cls, Exception)):
+        detail = ", ".join(map(str, error["args"]))
+        return RuntimeError(f"{error['type']}: {detail}")
+    if issubclass(cls, OSError):
+        # Sets errno, strerror and filename from the arguments.
+        return cls(*error["args"])
+    # Errors of pyfiles_db take keyword arguments, so skip __init__.
+    rebuilt = cls.__new__(cls)
+    rebuilt.args = tuple(error["args"])
+    vars(rebuilt).update(error["attrs"])
+    return rebuilt
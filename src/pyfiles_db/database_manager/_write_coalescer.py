@@ -0,0 +1,154 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Write coalescing for the async database manager."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pyfiles_db.metrics import OperationStats
+
+
+@dataclass
+class _PendingWrite:
+    """Mutation waiting for the next commit of its table.
+
+    Exactly one of ``data`` (insert) and ``file_id`` (delete) is set.
+    """
+
+    data: dict[str, Any] | None = None
+    file_id: str | None = None
+    stats: OperationStats | None = None
+    future: asyncio.Future[str] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class _WriteCoalescer:
+    """Merge concurrent mutations of one table into a single commit.
+
+    The first mutation schedules a flush after ``window`` seconds (zero
+    means the next event loop iteration). Everything submitted until the
+    flush starts is handed to ``flush`` as one batch, and each caller is
+    resolved when that batch is written. Flushes of the same table never
+    overlap.
+
+    Parameters
+    ----------
+    flush : Callable[[list[_PendingWrite]], Awaitable[None]]
+        Writes a batch and resolves the future of every mutation.
+    window : float
+        Seconds to wait for more mutations before flushing.
+    """
+
+    def __init__(self,
+                 flush: Callable[[list[_PendingWrite]], Awaitable[None]],
+                 window: float = 0.0,
+                 ) -> None:
+        """Init coalescer.
+
+        Parameters
+        ----------
+        flush : Callable[[list[_PendingWrite]], Awaitable[None]]
+            Writes a batch and resolves the future of every mutation.
+        window : float
+            Seconds to wait for more mutations before flushing.
+        """
+        self._flush = flush
+        self._window = window
+        self._lock = asyncio.Lock()
+        self._pending: list[_PendingWrite] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Strong references, the event loop only keeps weak ones.
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def insert(self,
+                     data: dict[str, Any],
+                     stats: OperationStats | None = None,
+                     ) -> str:
+        """Queue a new record.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Record to save.
+        stats : OperationStats | None, optional
+            Counters of the calling operation.
+
+        Returns
+        -------
+        str
+            File id of the saved record.
+        """
+        return await self._submit(_PendingWrite(data=data, stats=stats))
+
+    async def delete(self,
+                     file_id: str,
+                     stats: OperationStats | None = None,
+                     ) -> str:
+        """Queue removal of a record.
+
+        Parameters
+        ----------
+        file_id : str
+            Name of file in table.
+        stats : OperationStats | None, optional
+            Counters of the calling operation.
+
+        Returns
+        -------
+        str
+            File id of the removed record.
+        """
+        return await self._submit(_PendingWrite(file_id=file_id, stats=stats))
+
+    async def _submit(self, write: _PendingWrite) -> str:
+        self._pending.append(write)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._drain())
+            self._running.add(self._flush_task)
+            self._flush_task.add_done_callback(self._drained)
+        return await write.future
+
+    async def _drain(self) -> None:
+        batch: list[_PendingWrite] = []
+        try:
+            await asyncio.sleep(self._window)
+            async with self._lock:
+                batch, self._pending = self._pending, []
+                self._flush_task = None
+                await self._flush(batch)
+        except Exception as e:  # noqa: BLE001 - handed to every caller
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(e)
+        except BaseException:
+            # Cancelled, e.g. at loop shutdown: no caller waits forever.
+            for write in batch:
+                write.future.cancel()
+            raise
+
+    def _drained(self, task: asyncio.Task[None]) -> None:
+        """Cancel the queued writes of a flush cancelled before its batch."""
+        self._running.discard(task)
+        if task.cancelled() and self._flush_task is task:
+            batch, self._pending = self._pending, []
+            self._flush_task = None
+            for write in batch:
+                write.future.cancel()
@@ -14,29 +14,121 @@
 
 """Async database manager."""
 
+from __future__ import annotations
+
+import asyncio
 import json
+import time
+import uuid
+from collections import deque
+from functools import partial
+from itertools import groupby
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-import aiofiles
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
+from pyfiles_db.database_manager._bulk import (
+    BATCH_SIZE,
+    CSV,
+    JSONL,
+    RowWriter,
+    check_bulk,
+    chunked,
+    read_rows,
+    row_filter,
+)
 from pyfiles_db.database_manager._db import _AsyncDB
+from pyfiles_db.database_manager._instrument import (
+    combine_sinks,
+    observe,
+    set_access_path,
+)
+from pyfiles_db.database_manager._join import (
+    GENERATOR,
+    HASH,
+    INDEX,
+    build_hash,
+    join_columns,
+    join_keys,
+    probe_hash,
+)
+from pyfiles_db.database_manager._key_locks import _KeyLocks
+from pyfiles_db.database_manager._query import (
+    EQ,
+    ORDERINGS,
+    TEXT_OPERATORS,
+    _Condition,
+    matcher,
+    order_rows,
+    parse_condition,
+    sort_method,
+)
+from pyfiles_db.database_manager._schema import _Collector, _Schema
+from pyfiles_db.database_manager._single_flight import _SingleFlight
+from pyfiles_db.database_manager._storage import (
+    _MetaStorage,
+    _TableStorage,
+    changed_fields,
+    in_index_order,
+    removed_ids,
+    written_ids,
+)
+from pyfiles_db.database_manager._write_coalescer import (
+    _PendingWrite,
+    _WriteCoalescer,
+)
 from pyfiles_db.database_manager.meta import META
 from pyfiles_db.errors import (
     DataIsUncorrectError,
+    DuplicateIdError,
+    InvalidConditionError,
     NotFoundColumnError,
     NotFoundTableError,
     TableAlreadyAvaibleError,
-    UnknownDataTypeError,
 )
-from pyfiles_db.utils import infinite_natural_numbers
+from pyfiles_db.metrics import OperationStats
+from pyfiles_db.utils import IOExecutor
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Iterable, Sequence
+
+    from pyfiles_db.database_manager._schema import FindResult, Record
+
+    # File ids and stored records handed from the readers to a result.
+    Rows = Iterable[tuple[str, dict[str, Any]]]
+    from pyfiles_db.metrics import MetricsSink, SlowQueryLog
+    from pyfiles_db.utils import ResultCache
+
+T = TypeVar("T")
+
+# Records read or written by one job of the I/O pool.
+_IO_BATCH = 256
+
+
+def _keep_all(_: dict[str, Any]) -> bool:
+    """Keep every record, empty ones included."""
+    return True
+
+
+def _retrieve(task: asyncio.Future[Any]) -> None:
+    """Retrieve the error of an abandoned read so it is not logged."""
+    if not task.cancelled():
+        task.exception()
 
 
 class _DBasync(_AsyncDB):
-    def __init__(self, storage: str | Path, meta_file: str) -> None:
+    def __init__(self,  # noqa: PLR0913 - keyword-only options
+                 storage: str | Path,
+                 meta_file: str,
+                 *,
+                 write_window: float = 0.0,
+                 io_workers: int | None = None,
+                 metrics: MetricsSink | None = None,
+                 slow_query_log: SlowQueryLog | None = None,
+                 initial_meta: dict[str, Any] | None = None,
+                 result_cache: ResultCache | None = None,
+                 bloom_max_age: float = 0.0,
+                 scan_readahead: int | None = None,
+                 ) -> None:
         """Initialize the asynchronous database manager.
 
         Parameters
@@ -45,21 +137,168 @@ class _DBasync(_AsyncDB):
             Path to the database location.
         meta_file : str
             Name of the meta file.
+        write_window : float, optional
+            Seconds to collect concurrent ``new_data``/``delete`` calls
+            of one table into a single index and meta write, by default
+            0.0 (calls made in the same event loop iteration).
+        io_workers : int | None, optional
+            Threads of the dedicated I/O pool that runs whole operations
+            as single jobs, by default ``min(32, cpu_count + 4)``. 0
+            disables the pool and dispatches every file call separately
+            through ``aiofiles``.
+        metrics : MetricsSink | None, optional
+            Receiver of per-operation counters, by default None (off).
+            Coalesced index writes are reported as ``commit``.
+        slow_query_log : SlowQueryLog | None, optional
+            Log of slow queries, by default None (off).
+        initial_meta : dict[str, Any] | None, optional
+            Meta information of a new database. The storage folder and
+            meta file are created on first use, by default None (the
+            database must exist).
+        result_cache : ResultCache | None, optional
+            Cache of ``find`` results, invalidated by every write to the
+            table, by default None (off).
+        bloom_max_age : float, optional
+            Seconds a loaded Bloom filter is trusted without checking
+            for changes by other processes, by default 0.0 (one ``stat``
+            per lookup).
+        scan_readahead : int | None, optional
+            Read the records of full scans in inode order, with this
+            many record files announced ahead to the kernel, and return
+            them in index order. By default None (read in index order).
         """
         self._storage = Path(storage)
         self._meta_file = meta_file
-        self._id_generators: dict[str, Generator[Any, Any, Any]] = {}
-        self._load_meta()
+        self._meta_storage = _MetaStorage(self._storage, meta_file,
+                                          initial_meta)
+        self._tables: dict[str, _TableStorage] = {}
+        # Record validators, compiled once per table.
+        self._schemas: dict[str, _Schema] = {}
+        self._write_window = write_window
+        self._writers: dict[str, _WriteCoalescer] = {}
+        self._io = IOExecutor(io_workers) if io_workers != 0 else None
+        self._metrics = metrics
+        self._slow_query_log = slow_query_log
+        self._sink = combine_sinks(metrics, slow_query_log)
+        self._result_cache = result_cache
+        self._bloom_max_age = bloom_max_age
+        self._scan_readahead = scan_readahead
+        # Identical concurrent finds share one read; writes bump the
+        # table version, which is part of the key.
+        self._reads = _SingleFlight()
+        # Upserts of one key run one at a time.
+        self._upserts = _KeyLocks()
+        self._versions: dict[str, int] = {}
+        # Loaded on first use, so creating a manager touches no files.
+        self._meta_data: dict[str, Any] | None = None
+
+    @property
+    def metrics(self) -> MetricsSink | None:
+        """Receiver of per-operation counters, None when off."""
+        return self._metrics
+
+    @property
+    def slow_query_log(self) -> SlowQueryLog | None:
+        """Log of slow queries, None when off."""
+        return self._slow_query_log
+
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """Cache of ``find`` results, None when off."""
+        return self._result_cache
+
+    @property
+    def coalesced_reads(self) -> int:
+        """Number of ``find`` calls served by an identical running one."""
+        return self._reads.coalesced
+
+    def _bump(self, table: str) -> None:
+        """Invalidate cached and in-flight results of a changed table."""
+        self._versions[table] = self._versions.get(table, 0) + 1
+        if self._result_cache is not None:
+            self._result_cache.bump(table)
+
+    @property
+    def _meta(self) -> dict[str, Any]:
+        """Meta information, read from file on first access."""
+        if self._meta_data is None:
+            self._meta_data = self._meta_storage.read()
+        return self._meta_data
+
+    @_meta.setter
+    def _meta(self, meta: dict[str, Any]) -> None:
+        self._meta_data = meta
 
     def _load_meta(self) -> None:
         """Load meta information from file."""
-        with Path.open(self._storage / self._meta_file, "r") as f:
-            self._meta = json.load(f)
+        self._meta = self._meta_storage.read()
+
+    def _schema(self, table: str) -> _Schema:
+        """Return the record validator of a table folder.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+
+        Returns
+        -------
+        _Schema
+            Validator compiled from the table columns.
+        """
+        schema = self._schemas.get(table)
+        if schema is None:
+            schema = _Schema(table, self._meta[table][META.COLUMNS])
+            self._schemas[table] = schema
+        return schema
+
+    def _table_storage(self, table: str) -> _TableStorage:
+        """Return storage of a table folder.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+
+        Returns
+        -------
+        _TableStorage
+            Storage of the table.
+        """
+        storage = self._tables.get(table)
+        if storage is None:
+            storage = _TableStorage(self._storage / table,
+                                    self._meta[table].get(META.BLOOM),
+                                    self._bloom_max_age)
+            self._tables[table] = storage
+        return storage
+
+    def _writer(self, table: str) -> _WriteCoalescer:
+        """Return the write coalescer of a table.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+
+        Returns
+        -------
+        _WriteCoalescer
+            Coalescer serializing writes of the table.
+        """
+        writer = self._writers.get(table)
+        if writer is None:
+            async def flush(batch: list[_PendingWrite]) -> None:
+                await self._flush_writes(table, batch)
+            writer = _WriteCoalescer(flush, self._write_window)
+            self._writers[table] = writer
+        return writer
 
     async def create_table(
             self, table_name: str,
             columns: dict[str, Any],
             id_generator: str | int | None = None,
+            bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
             ) -> None:
         """Create a table (async).
 
@@ -71,49 +310,332 @@ class _DBasync(_AsyncDB):
             Columns mapping to their data types.
         id_generator : str | None
             Generator for file names. Default None.
+        bloom : bool | Sequence[str]
+            True keeps a Bloom filter over file ids, so lookups of absent
+            ids skip the disk. A sequence of columns keeps filters over
+            their values too. Default False.
 
         Raises
         ------
         TableAlreadyAvaibleError
             If the table already exists.
+        NotFoundColumnError
+            If a Bloom filter column is not a column of the table.
+        UnknownDataTypeError
+            If a column type is not INT, TEXT, FLOAT, BOOL, DATETIME or
+            BYTES.
         """
         # Table. columns is maybe {"USER_ID": "INT", "NAME": "TEXT"}
         table = self._meta[META.TABLE_PREFIX] + table_name
-        if table in self._meta[META.TABLES]:
-            raise TableAlreadyAvaibleError
+        schema = _Schema(table, columns)
         if id_generator is None:
             id_generator = 0
-            self._id_generators[table] = infinite_natural_numbers(id_generator)
-        await self._mkdir_for_table(table)
-        self._meta[META.TABLES].append(table)
-        self._meta[table] = {
-            META.COLUMNS: columns,
-            META.GENERATOR: id_generator}
-        await self._update_meta()
+        bloom_columns = (None if bloom is False
+                         else [] if bloom is True else list(bloom))
+        for column in bloom_columns or ():
+            if column not in columns:
+                raise NotFoundColumnError(column_name=column,
+                                          table_name=table)
+
+        def add_table(meta: dict[str, Any]) -> None:
+            if table in meta[META.TABLES]:
+                raise TableAlreadyAvaibleError
+            storage = _TableStorage(self._storage / table, bloom_columns,
+                                    self._bloom_max_age)
+            storage.create()
+            self._tables[table] = storage
+            self._schemas[table] = schema
+            meta[META.TABLES].append(table)
+            meta[table] = {
+                META.COLUMNS: columns,
+                META.GENERATOR: id_generator}
+            if bloom_columns is not None:
+                meta[table][META.BLOOM] = bloom_columns
 
-    async def _update_meta(self) -> None:
-        """Update meta file."""
-        async with aiofiles.open(
-                self._storage / self._meta_file,
-                mode="w",
-                                ) as f:
-            await f.write(json.dumps(self._meta))
+        # Lock waits and the meta rewrite run off the event loop.
+        self._meta, _ = await self._run(self._meta_storage.update, add_table)
 
-    async def _mkdir_for_table(self, table: str | Path) -> None:
-        """Create the on-disk folder and index file for a table.
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+        """Run a blocking job off the event loop.
 
         Parameters
         ----------
-        table : str | Path
-            Name of the table folder.
+        fn : Callable[..., T]
+            Blocking job.
+        *args : Any
+            Arguments of the job.
+
+        Returns
+        -------
+        T
+            Value returned by the job.
+        """
+        if self._io is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self._io.run(fn, *args)
+
+    def io_stats(self) -> dict[str, int]:
+        """Return counters of the I/O pool.
+
+        Returns
+        -------
+        dict[str, int]
+            Pool size, queue depth, active and completed jobs. Empty when
+            the pool is disabled.
+        """
+        if self._io is None:
+            return {}
+        return self._io.stats()
+
+    def close(self) -> None:
+        """Stop the I/O pool threads and close the table folders."""
+        if self._io is not None:
+            self._io.shutdown()
+        for storage in self._tables.values():
+            storage.close()
+
+    async def _read_record(self,
+                           storage: _TableStorage,
+                           file_id: str | int,
+                           stats: OperationStats | None = None,
+                           ) -> dict[str, Any] | None:
+        """Read and decode a record file.
+
+        Parameters
+        ----------
+        storage : _TableStorage
+            Storage of the table.
+        file_id : str | int
+            Name of file in table.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The record, None if the file does not exist.
+        """
+        if self._io is not None:
+            return await self._io.run(storage.read_record, file_id, stats)
+        # aiofiles is only needed without the pool.
+        import aiofiles  # noqa: PLC0415
+
+        if stats is not None:
+            stats.files_opened += 1
+        try:
+            async with aiofiles.open(storage.record_path(file_id), "rb") as f:
+                content = await f.read()
+        except FileNotFoundError:
+            return None
+        if stats is not None:
+            stats.bytes_read += len(content)
+            stats.records_decoded += 1
+        decoded: dict[str, Any] = json.loads(content)
+        return decoded
+
+    async def _read_matching(self,
+                             storage: _TableStorage,
+                             names: Sequence[str],
+                             predicate: Callable[[dict[str, Any]], bool],
+                             stats: OperationStats | None = None,
+                             readahead: int | None = None,
+                             ) -> list[tuple[str, dict[str, Any]]]:
+        """Read records and keep those matching ``predicate``.
+
+        With the I/O pool every batch of records is read, decoded and
+        filtered by one job, and batches run in parallel. With
+        ``readahead`` the records are read in inode order.
+
+        Parameters
+        ----------
+        storage : _TableStorage
+            Storage of the table.
+        names : Sequence[str]
+            File ids to read.
+        predicate : Callable[[dict[str, Any]], bool]
+            Filter for decoded records.
+        stats : OperationStats | None, optional
+            Counters of the running operation.
+        readahead : int | None, optional
+            Record files announced ahead when reading in inode order,
+            by default None (read in ``names`` order).
+
+        Returns
+        -------
+        list[tuple[str, dict[str, Any]]]
+            File ids and records in ``names`` order.
+        """
+        index_names = names
+        if readahead is not None:
+            names = await self._run(storage.physical_order, names)
+        result: list[tuple[str, dict[str, Any]]] = []
+        await self._read_into(storage, names, predicate, stats, result.extend,
+                              readahead or 0)
+        if readahead is None:
+            return result
+        return in_index_order(index_names, result)
+
+    async def _read_into(self,  # noqa: PLR0913
+                         storage: _TableStorage,
+                         names: Sequence[str],
+                         predicate: Callable[[dict[str, Any]], bool],
+                         stats: OperationStats | None,
+                         extend: Callable[[Rows], None],
+                         readahead: int = 0,
+                         ) -> None:
+        """Read records matching ``predicate`` and hand them over in order.
+
+        Parameters
+        ----------
+        storage : _TableStorage
+            Storage of the table.
+        names : Sequence[str]
+            File ids to read.
+        predicate : Callable[[dict[str, Any]], bool]
+            Filter for decoded records.
+        stats : OperationStats | None
+            Counters of the running operation.
+        extend : Callable[[Rows], None]
+            Takes every batch of matching records in ``names`` order.
+        readahead : int, optional
+            Record files announced ahead, by default 0.
+        """
+        if self._io is None:
+            for name in names:
+                record = await self._read_record(storage, name, stats)
+                if record is not None and predicate(record):
+                    extend([(name, record)])
+        else:
+            await self._read_batches(self._io, storage, names, predicate,
+                                     stats, extend, readahead)
+
+    async def _read_batches(self,  # noqa: PLR0913
+                            io: IOExecutor,
+                            storage: _TableStorage,
+                            names: Sequence[str],
+                            predicate: Callable[[dict[str, Any]], bool],
+                            stats: OperationStats | None,
+                            extend: Callable[[Rows], None],
+                            readahead: int,
+                            ) -> None:
+        """Read, decode and filter batches of records on the I/O pool.
+
+        Batches run in parallel and are handed to ``extend`` in order as
+        soon as each one and those before it are done.
+        """
+
+        def job(batch: Sequence[str],
+                job_stats: OperationStats | None,
+                ) -> list[tuple[str, dict[str, Any]]]:
+            return [(name, record)
+                    for name, record in storage.iter_records(
+                        batch, job_stats, readahead)
+                    if predicate(record)]
+
+        # Every job counts on its own object, merged once all finished.
+        jobs = [(names[i:i + _IO_BATCH],
+                 None if stats is None
+                 else OperationStats(stats.operation, stats.table))
+                for i in range(0, len(names), _IO_BATCH)]
+        pending = deque(asyncio.ensure_future(io.run(job, batch, job_stats))
+                        for batch, job_stats in jobs)
+        try:
+            while pending:
+                extend(await pending[0])
+                # Dropped once handed over, so only batches finished out
+                # of order are held.
+                pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_retrieve)
+            if stats is not None:
+                for _, job_stats in jobs:
+                    if job_stats is not None:
+                        stats.merge(job_stats)
+
+    async def _write_records(self,
+                             storage: _TableStorage,
+                             items: Sequence[tuple[str | int, dict[str, Any]]],
+                             *,
+                             new: bool = False,
+                             ) -> list[int | BaseException]:
+        """Replace record files atomically.
+
+        Parameters
+        ----------
+        storage : _TableStorage
+            Storage of the table.
+        items : Sequence[tuple[str | int, dict[str, Any]]]
+            File ids and records to save.
+        new : bool, optional
+            Only create the record files, by default False.
+
+        Returns
+        -------
+        list[int | BaseException]
+            Size of every written record, or the error that stopped it
+            (FileExistsError for a record file that exists when ``new``
+            is set).
+        """
+        if self._io is not None:
+            io = self._io
+            write_records = partial(storage.write_records, new=new)
+            batches = await asyncio.gather(
+                *(io.run(write_records, items[i:i + _IO_BATCH])
+                  for i in range(0, len(items), _IO_BATCH)))
+            return [result for batch in batches for result in batch]
+        import aiofiles.os  # noqa: PLC0415
+
+        async def write(path: Path, data: dict[str, Any]) -> int:
+            # Writes of one record can run at once on the event loop
+            # thread, so the name is unique per write.
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            text = json.dumps(data)
+            async with aiofiles.open(tmp, mode="w") as f:
+                await f.write(text)
+            if not new:
+                await aiofiles.os.replace(tmp, path)
+                return len(text)
+            try:
+                await aiofiles.os.link(tmp, path)
+            finally:
+                await aiofiles.os.remove(tmp)
+            return len(text)
+
+        return await asyncio.gather(
+            *(write(storage.record_path(file_id), data)
+              for file_id, data in items),
+            return_exceptions=True)
+
+    async def _remove_records(self,
+                              storage: _TableStorage,
+                              file_ids: Sequence[str],
+                              ) -> list[BaseException | None]:
+        """Remove record files.
+
+        Parameters
+        ----------
+        storage : _TableStorage
+            Storage of the table.
+        file_ids : Sequence[str]
+            File ids to remove.
+
+        Returns
+        -------
+        list[BaseException | None]
+            Error of every file id (FileNotFoundError for a missing
+            record), None when it was removed.
         """
-        (self._storage / table).mkdir(parents=False, exist_ok=True)
-        async with aiofiles.open(
-            self._storage / table / ".json",
-            mode="w",
-            ) as f:
-            await f.write(json.dumps({META.FILE_IDS: []}))
+        if self._io is not None:
+            return list(await self._io.run(storage.remove_records, file_ids))
+        import aiofiles.os  # noqa: PLC0415
 
+        results = await asyncio.gather(
+            *(aiofiles.os.remove(storage.record_path(file_id))
+              for file_id in file_ids),
+            return_exceptions=True)
+        return [r if isinstance(r, BaseException) else None for r in results]
 
     async def new_data(self, table_name: str, data: dict[str, Any]) -> None:
         """Add new data to the table (async).
@@ -124,221 +646,1628 @@ class _DBasync(_AsyncDB):
             Name of the table.
         data : dict[str, Any]
             The record to save.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        DuplicateIdError
+            If the ``id_generator`` value is taken by a saved record.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        if not self._check_table(table_name):
-            raise NotFoundTableError(table_name=table_name)
-        if not self._check_data(self._meta[table_name][META.COLUMNS], data):
-            raise DataIsUncorrectError(data=data)
-        file_name = ""
-        if (self._meta[table_name][META.GENERATOR] is None or
-         isinstance(self._meta[table_name][META.GENERATOR], int)):
-            if self._id_generators.get(table_name) is None:
-                self._id_generators[table_name] = infinite_natural_numbers(
-                    self._meta[table_name][META.GENERATOR])
-            file_name = next(self._id_generators[table_name])
-            self._meta[table_name][META.GENERATOR] += 1
-            await self._update_meta()
-        else:
-            file_name = data[self._meta[table_name][META.GENERATOR]]
-        async with aiofiles.open(
-                self._storage / table_name / f"{file_name}.json",
-                mode="w") as f:
-            await f.write(json.dumps(data))
-        async with aiofiles.open(
-            self._storage / table_name / ".json") as f:
-            content = await f.read()
-            data = json.loads(content)
-            data[META.FILE_IDS].append(str(file_name))
-        async with aiofiles.open(
-            self._storage / table_name / ".json", mode="w") as f:
-            await f.write(json.dumps(data))
+        with observe(self._sink, "new_data", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            data = self._schema(table_name).validate(data)
+            await self._writer(table_name).insert(data, stats)
 
-    def _check_table(self, table: str) -> bool:
-        """Check table for exists.
+    async def insert_many(self,
+                          table_name: str,
+                          records: Sequence[dict[str, Any]],
+                          ) -> list[str]:
+        """Save several records with one validation pass.
+
+        Records are checked column by column before anything is written,
+        then queued together, so the write coalescer commits them in one
+        batch with whatever else is queued for the table.
 
         Parameters
         ----------
-        table : str
-            name of table
+        table_name : str
+            Name of the table.
+        records : Sequence[dict[str, Any]]
+            Records to save.
 
         Returns
         -------
-        bool
-            exist table
+        list[str]
+            File ids of the records, in order.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        DuplicateIdError
+            If the ``id_generator`` value is taken by a saved record.
         """
-        return table in self._meta[META.TABLES]
+        with observe(self._sink, "insert_many", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            stored = self._schema(table_name).validate_many(records)
+            return await self._insert_batch(table_name, stored, stats)
 
-    def _check_data(self, columns: dict[str, str],
-                    data: dict[str, Any]) -> bool:
-        """Check type data.
+    async def _insert_batch(self,
+                            table_name: str,
+                            stored: list[dict[str, Any]],
+                            stats: OperationStats | None,
+                            ) -> list[str]:
+        """Queue checked records on the write coalescer together.
 
         Parameters
         ----------
-        columns : dict[str, str]
-            col of table
-        data : dict[str, Any]
-            new information
+        table_name : str
+            Name of the table folder.
+        stored : list[dict[str, Any]]
+            Records in their stored form.
+        stats : OperationStats | None
+            Counters of the running operation.
 
         Returns
         -------
-        bool
-            Data is correct
+        list[str]
+            File ids of the saved records.
+        """
+        writer = self._writer(table_name)
+        return list(await asyncio.gather(
+            *(writer.insert(data, stats) for data in stored)))
+
+    async def import_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           *,
+                           batch_size: int = BATCH_SIZE,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Stream records from a JSON lines file into a table.
+
+        See ``import_csv``; every line is one JSON object, with DATETIME
+        values as ISO 8601 strings and BYTES values as base85 strings.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read.
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of imported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of imported records.
         """
-        for key, val in data.items():
-            if (self._change_type(val, columns[key]) != val):
-                return False
-        return True
+        return await self._import_file(table_name, Path(path), JSONL,
+                                       batch_size, progress)
 
-    def _change_type(self, value: str, column_type: str) -> Any:  # noqa: ANN401
-        """Change data type.
+    async def import_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         *,
+                         batch_size: int = BATCH_SIZE,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Stream records from a CSV file into a table.
+
+        The file is read lazily, so memory stays bounded by one chunk.
+        Every chunk of ``batch_size`` records is validated column by
+        column and written like ``insert_many``: one id allocation and
+        one rewrite of the id list, Bloom filters and indexes per
+        chunk. Chunks before an invalid record stay imported.
 
         Parameters
         ----------
-        value : str
-            value
-        column_type : str
-            data type
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read, with a header row of column names. Empty
+            values are missing fields; other values are in the text form
+            of their column type (``true``/``false`` for BOOL, ISO 8601
+            for DATETIME, base85 for BYTES).
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of imported records
+            and the seconds elapsed, by default None.
 
         Returns
         -------
-        Any
-            correct data type
+        int
+            Number of imported records.
 
         Raises
         ------
-        ValueError
-            if column_type is unknown
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
         """
-        match column_type:
-            case "INT":
-                return int(value)
-            case "TEXT":
-                return str(value)
-            case _:
-                raise UnknownDataTypeError
+        return await self._import_file(table_name, Path(path), CSV,
+                                       batch_size, progress)
 
+    async def export_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           condition: str | None = None,
+                           *,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Stream records of a table into a JSON lines file.
 
-    async def find(self,
-                   table_name: str,
-                   condition: str,
-                   ) -> list[dict[str, Any]]:
-        """Find information in table.
+        See ``export_csv``; every record is written as one JSON object.
 
         Parameters
         ----------
         table_name : str
-            name of table
-        condition : str
-            condition, maybe "id == 5"
+            Name of the table.
+        path : str | Path
+            File to write, replaced if it exists.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None (every
+            record).
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of exported records
+            and the seconds elapsed, by default None.
 
         Returns
         -------
-        list[dict[str, Any]]
-            all data when find condition
+        int
+            Number of exported records.
+        """
+        return await self._export_file(table_name, Path(path), JSONL,
+                                       condition, progress)
+
+    async def export_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         condition: str | None = None,
+                         *,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Stream records of a table into a CSV file.
+
+        Records are read and written in chunks instead of being
+        collected like ``find`` results, so memory stays bounded. A
+        condition narrows the records read like in ``find``.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to write, replaced if it exists. It starts with a
+            header row of the table columns.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None (every
+            record).
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of exported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of exported records.
 
         Raises
         ------
         ValueError
-            Table not found error
-        ValueError
-            Column not found error
+            Table not found, column not found or invalid condition.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        if not self._check_table(table_name):
-            raise NotFoundTableError(table_name=table_name)
-        column_name, value = condition.replace(" ", "").split("==")
-        if not self._check_column_in_table(table_name, column_name):
-            raise NotFoundColumnError(column_name=column_name,
-                                      table_name=table_name)
-        value = self._change_type(value,
-                                  self._meta[table_name][META.COLUMNS][column_name])
-        if self._meta[table_name][META.GENERATOR] == column_name:
+        return await self._export_file(table_name, Path(path), CSV,
+                                       condition, progress)
+
+    async def _import_file(self,
+                           table_name: str,
+                           path: Path,
+                           fmt: str,
+                           batch_size: int,
+                           progress: Callable[[int, float], None] | None,
+                           ) -> int:
+        """Import a file chunk by chunk, see ``import_csv``.
+
+        Chunks are read and parsed on the I/O pool.
+        """
+        check_bulk(fmt, batch_size)
+        with observe(self._sink, f"import_{fmt}", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            schema = self._schema(table_name)
+            chunks = chunked(read_rows(path, fmt, schema), batch_size)
+            start = time.perf_counter()
+            total = 0
+            while chunk := await self._run(next, chunks, None):
+                await self._insert_batch(
+                    table_name, schema.validate_many(chunk), stats)
+                total += len(chunk)
+                if progress is not None:
+                    progress(total, time.perf_counter() - start)
+            return total
+
+    async def _export_file(self,
+                           table_name: str,
+                           path: Path,
+                           fmt: str,
+                           condition: str | None,
+                           progress: Callable[[int, float], None] | None,
+                           ) -> int:
+        """Export records chunk by chunk, see ``export_csv``.
+
+        Every chunk is read in parallel on the I/O pool.
+        """
+        check_bulk(fmt, BATCH_SIZE)
+        with observe(self._sink, f"export_{fmt}", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            storage = self._table_storage(table_name)
+            keep: Callable[[dict[str, Any]], bool] = _keep_all
+            if condition is None:
+                names = await self._run(storage.read_file_ids, stats)
+            else:
+                cond, value = self._parse_condition(table_name, condition)
+                access_path, names = await self._run(
+                    self._plan, table_name, cond.column, cond.operator,
+                    value, stats)
+                set_access_path(stats, access_path)
+                keep = row_filter(cond.column,
+                                  matcher(cond.operator, value))
+            schema = self._schema(table_name)
+            f = await self._run(partial(Path.open, path, "w",
+                                        encoding="utf-8", newline=""))
+            start = time.perf_counter()
+            total = 0
             try:
-                async with aiofiles.open(
-                    self._storage / table_name / f"{value}.json") as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                    if isinstance(data, dict):
-                        return [{str(value): data}]
-                    return []
-            except FileNotFoundError:
-                return []
-        async with aiofiles.open(
-            self._storage / table_name / ".json") as f:
-            content = await f.read()
-            data = json.loads(content)
-            names = data[META.FILE_IDS]
-        result: list[dict[str, Any]] = []
-        for name in names:
-            async with aiofiles.open(
-                    self._storage / table_name / f"{name}.json") as f:
-                content = await f.read()
-                d = json.loads(content)
-                if d[column_name] == value and isinstance(d, dict):
-                    result.append({str(name): d})
-        return result
+                writer = await self._run(RowWriter, f, fmt, schema)
+                for i in range(0, len(names), BATCH_SIZE):
+                    rows = await self._read_matching(
+                        storage, names[i:i + BATCH_SIZE], keep, stats)
+                    await self._run(writer.write,
+                                    [record for _, record in rows])
+                    total += len(rows)
+                    if progress is not None:
+                        progress(total, time.perf_counter() - start)
+            finally:
+                await self._run(f.close)
+            return total
 
-    def _check_column_in_table(self, table_name: str, column_name: str) -> bool:
-        """Check column in table on exist.
+    async def _flush_writes(self,
+                            table: str,
+                            batch: list[_PendingWrite],
+                            ) -> None:
+        """Write a batch of mutations of one table.
+
+        Runs of inserts and runs of deletes are committed in submission
+        order, each with one meta and one index write.
 
         Parameters
         ----------
-        table_name : str
-            name of table
-        column_name : str
-            name of column
+        table : str
+            Name of the table folder.
+        batch : list[_PendingWrite]
+            Mutations collected by the coalescer.
+        """
+        short_name = table.removeprefix(self._meta[META.TABLE_PREFIX])
+        for is_insert, run in groupby(batch,
+                                      key=lambda w: w.data is not None):
+            with observe(self._sink, "commit", short_name) as stats:
+                # Bumped before the waiting callers resume, so they read
+                # their own writes.
+                try:
+                    if is_insert:
+                        await self._flush_inserts(table, list(run), stats)
+                    else:
+                        await self._flush_deletes(table, list(run), stats)
+                finally:
+                    self._bump(table)
 
-        Returns
-        -------
-        bool
-            exist column
+    async def _flush_inserts(self,
+                             table: str,
+                             batch: list[_PendingWrite],
+                             stats: OperationStats | None,
+                             ) -> None:
+        """Save records and append their ids in one commit.
+
+        A generated id taken by a saved record, by an earlier write of
+        the batch or by another process writing it at the same time
+        fails its caller with DuplicateIdError instead.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+        batch : list[_PendingWrite]
+            Pending inserts.
+        stats : OperationStats | None
+            Counters of the commit.
         """
-        return column_name in self._meta[table_name][META.COLUMNS]
+        storage = self._table_storage(table)
+        records = [write.data for write in batch if write.data is not None]
+        generator = self._meta[table][META.GENERATOR]
+        names: list[str | int]
+        if generator is None or isinstance(generator, int):
+            self._meta, ids = await self._run(
+                self._meta_storage.allocate_ids, table, len(records))
+            names = list(ids)
+        else:
+            names = [data[generator] for data in records]
+            seen = await self._run(storage.known,
+                                   [str(name) for name in names], stats)
+            kept: list[tuple[str | int, _PendingWrite]] = []
+            for name, write in zip(names, batch, strict=True):
+                if str(name) in seen:
+                    write.future.set_exception(self._duplicate(table, name))
+                    continue
+                seen.add(str(name))
+                kept.append((name, write))
+            names = [name for name, _ in kept]
+            batch = [write for _, write in kept]
+            records = [write.data for write in batch
+                       if write.data is not None]
+        results = await self._write_records(
+            storage, list(zip(names, records, strict=True)),
+            new=generator is not None and not isinstance(generator, int))
+        added: list[str] = []
+        added_records: list[dict[str, Any]] = []
+        for name, write, result in zip(names, batch, results, strict=True):
+            if isinstance(result, BaseException):
+                # An existing file was taken by another process since
+                # the check.
+                write.future.set_exception(
+                    self._duplicate(table, name)
+                    if isinstance(result, FileExistsError) else result)
+                continue
+            added.append(str(name))
+            if write.data is not None:
+                added_records.append(write.data)
+            if write.stats is not None:
+                write.stats.files_opened += 1
+                write.stats.bytes_written += result
+        await self._run(storage.commit, added, (), stats, added_records)
+        for name, write in zip(names, batch, strict=True):
+            if not write.future.done():
+                write.future.set_result(str(name))
 
-    async def update(self,
-               table_name: str,
-               file_id: str,
-               new_data: dict[str, Any],
-               ) -> None:
-        """Update data with file_id.
+    async def _flush_deletes(self,
+                             table: str,
+                             batch: list[_PendingWrite],
+                             stats: OperationStats | None,
+                             ) -> None:
+        """Remove records and drop their ids in one commit.
 
-        Get file_id from find method.
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+        batch : list[_PendingWrite]
+            Pending deletes.
+        stats : OperationStats | None
+            Counters of the commit.
+        """
+        storage = self._table_storage(table)
+        file_ids = [str(write.file_id) for write in batch]
+        errors = await self._remove_records(storage, file_ids)
+        removed: list[str] = []
+        for file_id, write, error in zip(file_ids, batch, errors, strict=True):
+            if error is not None:
+                write.future.set_exception(error)
+            else:
+                removed.append(file_id)
+        await self._run(storage.commit, (), removed, stats)
+        for file_id, write in zip(file_ids, batch, strict=True):
+            if not write.future.done():
+                write.future.set_result(file_id)
+
+    def _duplicate(self, table: str, file_id: str | int) -> DuplicateIdError:
+        """Return the error of a generated id that is already taken.
 
         Parameters
         ----------
-        file_id : str
-            unique file name
-        new_data : dict[str, Any]
-            new data when need save
+        table : str
+            Name of the table folder.
+        file_id : str | int
+            The taken id.
+
+        Returns
+        -------
+        DuplicateIdError
+            Error naming the table without its prefix.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        async with aiofiles.open(
-            self._storage / table_name / f"{file_id}.json",
-            mode="w") as f:
-            await f.write(json.dumps(new_data))
+        return DuplicateIdError(
+            file_id=str(file_id),
+            table_name=table.removeprefix(self._meta[META.TABLE_PREFIX]))
 
-    async def delete(self,
-                table_name: str,
-                file_id: str,
-                ) -> None:
-        """Delete data with file_id.
+    def _check_table(self, table: str) -> bool:
+        """Check table for exists.
 
         Parameters
         ----------
-        table_name : str
-            name of table db
-        file_id : str
-            name of file in table
+        table : str
+            name of table
+
+        Returns
+        -------
+        bool
+            exist table
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        if not (self._storage / table_name / f"{file_id}.json").exists():
-            raise FileNotFoundError
-        (self._storage / table_name / f"{file_id}.json").unlink()
-        async with aiofiles.open(self._storage / table_name / ".json") as f:
-            data = json.loads(await f.read())
-        data[META.FILE_IDS].remove(str(file_id))
-        async with aiofiles.open(
-            self._storage / table_name / ".json",
-            "w") as f:
-            await f.write(json.dumps(data))
+        if table in self._meta[META.TABLES]:
+            return True
+        # The table may have been created by another process.
+        self._load_meta()
+        return table in self._meta[META.TABLES]
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["dict"] = ...,
+                   ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["record"],
+                   ) -> list[Record]: ...
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["columns"],
+                   ) -> dict[str, Sequence[Any]]: ...
+
+    async def find(self,  # noqa: PLR0913 - keyword-only options
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = None,
+                   descending: bool = False,
+                   limit: int | None = None,
+                   result_type: str = "dict",
+                   ) -> (list[dict[str, Any]] | list[Record]
+                         | dict[str, Sequence[Any]]):
+        """Find records in a table matching a condition.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition string: ``"id == 5"``, ``"name STARTSWITH 'Jo'"``
+            or ``"email CONTAINS '@corp'"`` (TEXT columns only).
+        order_by : str | None, optional
+            Column to sort the records by, by default None (``FILE_IDS``
+            order). Records without the column come last.
+        descending : bool, optional
+            Largest values first, by default False.
+        limit : int | None, optional
+            Maximum number of records to return, by default None (all).
+            With ``order_by`` a bounded heap keeps the first ``limit``
+            records, or the records are read in the order of an index on
+            ``order_by`` until ``limit`` of them match.
+        result_type : str, optional
+            ``"dict"`` (default) returns ``{file_id: record}`` dicts;
+            ``"record"`` returns instances of a slotted class generated
+            from the table columns, with a ``file_id`` attribute;
+            ``"columns"`` returns ``file_id`` and every column mapped to
+            one sequence of values (``array("q")`` for INT and
+            ``array("d")`` for FLOAT columns, lists otherwise).
+
+        Returns
+        -------
+        list[dict[str, Any]] | list[Record] | dict[str, Sequence[Any]]
+            Records that match the condition.
+
+        Raises
+        ------
+        ValueError
+            Table not found, column not found, invalid condition,
+            negative limit or unknown result type.
+        """
+        with observe(self._sink, "find", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            cond, value = self._parse_condition(table_name, condition)
+            self._check_order(table_name, order_by, limit)
+            schema = self._schema(table_name)
+            schema.check_result_type(result_type)
+            order = None if order_by is None else (order_by, descending)
+            cache = self._result_cache
+            key = (cond.column, cond.operator, value, order, limit)
+            result = None
+            if cache is not None:
+                version = cache.version(table_name)
+                result = cache.get(table_name, key)
+                if result is not None and stats is not None:
+                    stats.cache_hits += 1
+                    stats.access_path = "cache"
+            if result is not None:
+                return schema.shape(result, result_type)
+            # Without a cache the result is built in the requested type
+            # while the records are read.
+            shaped = "dict" if cache is not None else result_type
+            found, shared = await self._reads.run(
+                (table_name, key, self._versions.get(table_name, 0), shaped),
+                partial(self._find_records, table_name, cond, value, stats,
+                        order, limit, shaped))
+            if shared and stats is not None:
+                stats.coalesced += 1
+                stats.access_path = "coalesced"
+            if cache is None:
+                return found
+            # Read with result_type "dict".
+            result = cast("list[dict[str, Any]]", found)
+            if not shared:
+                cache.put(table_name, key, version, result)
+            return schema.shape(result, result_type)
+
+    async def _find_records(self,  # noqa: PLR0913
+                            table_name: str,
+                            cond: _Condition,
+                            value: Any,  # noqa: ANN401
+                            stats: OperationStats | None,
+                            order: tuple[str, bool] | None,
+                            limit: int | None,
+                            result_type: str,
+                            ) -> FindResult:
+        """Read the result of ``find``, shared by identical calls.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        cond : _Condition
+            Parsed condition.
+        value : Any
+            Condition value in its stored form.
+        stats : OperationStats | None
+            Counters of the first caller.
+        order : tuple[str, bool] | None
+            Sort column and direction.
+        limit : int | None
+            Maximum number of records.
+        result_type : str
+            Type checked by ``check_result_type``.
+
+        Returns
+        -------
+        FindResult
+            Decoded records in the result type.
+        """
+        collector = _Collector(self._schema(table_name), result_type)
+        await self._collect(table_name, cond, value, stats, order, limit,
+                            collector.extend)
+        return collector.result()
+
+    async def explain(self,
+                      table_name: str,
+                      condition: str,
+                      *,
+                      order_by: str | None = None,
+                      descending: bool = False,
+                      limit: int | None = None,
+                      ) -> dict[str, Any]:
+        """Report how ``find`` would locate records, without reading them.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition as accepted by ``find``.
+        order_by : str | None, optional
+            Column to sort by, as accepted by ``find``.
+        descending : bool, optional
+            Largest values first, by default False.
+        limit : int | None, optional
+            Maximum number of records, as accepted by ``find``.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``access_path`` (``"generator"``, ``"bloom"``, ``"index"``,
+            ``"numeric"``, ``"index_order"`` or ``"scan"``),
+            ``candidates``, the number of records that would at most be
+            read and verified, and ``sort`` (``None``, ``"index"``,
+            ``"heap"`` or ``"full"``).
+
+        Raises
+        ------
+        ValueError
+            Table not found, column not found, invalid condition or
+            negative limit.
+        """
+        prefixed = self._meta[META.TABLE_PREFIX] + table_name
+        if not self._check_table(prefixed):
+            raise NotFoundTableError(table_name=prefixed)
+        cond, value = self._parse_condition(prefixed, condition)
+        self._check_order(prefixed, order_by, limit)
+        order = None if order_by is None else (order_by, descending)
+        access_path, names = await self._run(
+            self._plan, prefixed, cond.column, cond.operator, value, None,
+            order)
+        return {"table": table_name, "column": cond.column,
+                "operator": cond.operator, "value": value,
+                "access_path": access_path, "candidates": len(names),
+                "sort": sort_method(access_path, order, limit)}
+
+    def _parse_condition(self,
+                         table_name: str,
+                         condition: str,
+                         ) -> tuple[_Condition, Any]:
+        """Parse a condition and convert its value to the column type.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        condition : str
+            Condition passed to ``find``.
+
+        Returns
+        -------
+        tuple[_Condition, Any]
+            Parsed condition and typed value.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If the column does not exist.
+        InvalidConditionError
+            If a text operator is used on a non-TEXT column, or an
+            ordering on a BYTES column.
+        """
+        cond = parse_condition(condition)
+        if not self._check_column_in_table(table_name, cond.column):
+            raise NotFoundColumnError(column_name=cond.column,
+                                      table_name=table_name)
+        column_type = self._meta[table_name][META.COLUMNS][cond.column]
+        if cond.operator in TEXT_OPERATORS and column_type != "TEXT":
+            raise InvalidConditionError(
+                condition, f"{cond.operator} needs a TEXT column")
+        if cond.operator in ORDERINGS and column_type == "BYTES":
+            raise InvalidConditionError(
+                condition, f"{cond.operator} is undefined for BYTES")
+        return cond, self._schema(table_name).parse(cond.column, cond.value)
+
+    def _check_order(self,
+                     table_name: str,
+                     order_by: str | None,
+                     limit: int | None,
+                     ) -> None:
+        """Validate the ordering options of ``find``.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        order_by : str | None
+            Column to sort by.
+        limit : int | None
+            Maximum number of records.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If ``order_by`` is not a column of the table.
+        ValueError
+            If ``limit`` is negative.
+        """
+        if (order_by is not None
+                and not self._check_column_in_table(table_name, order_by)):
+            raise NotFoundColumnError(column_name=order_by,
+                                      table_name=table_name)
+        if limit is not None and limit < 0:
+            msg = f"limit must not be negative, got {limit}"
+            raise ValueError(msg)
+
+    def _plan(self,  # noqa: PLR0913
+              table_name: str,
+              column_name: str,
+              operator: str,
+              value: Any,  # noqa: ANN401
+              stats: OperationStats | None,
+              order: tuple[str, bool] | None = None,
+              ) -> tuple[str, list[str]]:
+        """Choose how to locate records and list the file ids to read.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        column_name : str
+            Column of the condition.
+        operator : str
+            Operator of the condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None, optional
+            Column to sort by and whether descending. Without a narrower
+            access path an index on the column gives the read order.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            Access path and candidate file ids.
+        """
+        storage = self._table_storage(table_name)
+        if operator == EQ:
+            if self._meta[table_name][META.GENERATOR] == column_name:
+                if storage.might_contain(None, value):
+                    return "generator", [str(value)]
+                return "bloom", []
+            if not storage.might_contain(column_name, value):
+                return "bloom", []
+        lookups = [("index", storage.index_candidates),
+                   ("numeric", storage.numeric_candidates)]
+        if operator != EQ:
+            # Vectorized comparisons beat filtering distinct index values.
+            lookups.reverse()
+        for path, candidates in lookups:
+            names = candidates(column_name, operator, value, stats)
+            if names is not None:
+                return path, names
+        if order is not None:
+            names = storage.index_order(order[0], descending=order[1],
+                                        stats=stats)
+            if names is not None:
+                return "index_order", names
+        return "scan", storage.read_file_ids(stats)
+
+    async def _lookup(self,  # noqa: PLR0913
+                      table_name: str,
+                      cond: _Condition,
+                      value: Any,  # noqa: ANN401
+                      stats: OperationStats | None,
+                      order: tuple[str, bool] | None = None,
+                      limit: int | None = None,
+                      ) -> list[dict[str, Any]]:
+        """Read records matching a parsed condition.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        cond : _Condition
+            Parsed condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None, optional
+            Column to sort by and whether descending.
+        limit : int | None, optional
+            Maximum number of records.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Matching records keyed by file id.
+        """
+        result: list[dict[str, Any]] = []
+        await self._collect(
+            table_name, cond, value, stats, order, limit,
+            lambda rows: result.extend({name: d} for name, d in rows))
+        return result
+
+    async def _collect(self,  # noqa: PLR0913
+                       table_name: str,
+                       cond: _Condition,
+                       value: Any,  # noqa: ANN401
+                       stats: OperationStats | None,
+                       order: tuple[str, bool] | None,
+                       limit: int | None,
+                       extend: Callable[[Rows], None],
+                       ) -> None:
+        """Hand records matching a parsed condition to ``extend``.
+
+        Without ``order_by`` every batch is handed over, in order, as
+        soon as it is read, so the caller can convert it right away.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        cond : _Condition
+            Parsed condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None
+            Column to sort by and whether descending.
+        limit : int | None
+            Maximum number of records.
+        extend : Callable[[Rows], None]
+            Takes file ids and stored records in result order.
+        """
+        access_path, names = await self._run(
+            self._plan, table_name, cond.column, cond.operator, value, stats,
+            order)
+        set_access_path(stats, access_path)
+        storage = self._table_storage(table_name)
+        if access_path == "generator":
+            # The record file is named by the value.
+            data = await self._read_record(storage, value, stats)
+            if isinstance(data, dict) and limit != 0:
+                extend([(names[0], data)])
+            return
+        if stats is not None and access_path in {"index", "numeric"}:
+            stats.candidates += len(names)
+        match = matcher(cond.operator, value)
+        column_name = cond.column
+
+        def predicate(d: dict[str, Any]) -> bool:
+            return (isinstance(d, dict) and column_name in d
+                    and match(d[column_name]))
+
+        # Every record of a scan is read anyway: read them in disk order.
+        ahead = self._scan_readahead if access_path == "scan" else None
+        if order is not None and access_path != "index_order":
+            matches = await self._read_matching(storage, names, predicate,
+                                                stats, ahead)
+            extend(order_rows(matches, order[0], descending=order[1],
+                              limit=limit))
+        elif limit is not None:
+            # Records already come in order: read batches until enough
+            # of them match.
+            left = limit
+            step = max(limit, _IO_BATCH)
+            for start in range(0, len(names), step):
+                if left <= 0:
+                    break
+                matches = await self._read_matching(
+                    storage, names[start:start + step], predicate, stats)
+                extend(matches[:left])
+                left -= len(matches)
+        elif ahead is not None:
+            extend(await self._read_matching(storage, names, predicate,
+                                             stats, ahead))
+        else:
+            await self._read_into(storage, names, predicate, stats, extend)
+
+    async def join(self,
+                   left_table: str,
+                   right_table: str,
+                   on: str | tuple[str, str],
+                   condition: str | None = None,
+                   ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables on equal column values.
+
+        The left records are the ones matching ``condition`` (all records
+        without it). For every distinct join value the right records are
+        read straight from their files when the right column is the
+        ``id_generator`` of the table, or looked up in its column index,
+        as long as there are fewer values than right records. Otherwise
+        the smaller side is read into a hash table and the larger side is
+        probed against it.
+
+        Parameters
+        ----------
+        left_table : str
+            Name of the left table.
+        right_table : str
+            Name of the right table.
+        on : str | tuple[str, str]
+            Join column of both tables, or ``(left, right)`` columns.
+        condition : str | None, optional
+            Condition on the left table as accepted by ``find``, by
+            default None.
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            ``{"left": {file_id: record}, "right": {file_id: record}}``
+            for every pair of records with equal, present join values.
+            Pairs come in the order of the side that is streamed.
+
+        Raises
+        ------
+        NotFoundTableError
+            If a table does not exist.
+        NotFoundColumnError
+            If a join column does not exist.
+        """
+        with observe(self._sink, "join", left_table, condition) as stats:
+            prefix = self._meta[META.TABLE_PREFIX]
+            left, right = prefix + left_table, prefix + right_table
+            left_key, right_key = join_columns(on)
+            self._check_join_column(left, left_key)
+            self._check_join_column(right, right_key)
+            if condition is None:
+                left_storage = self._table_storage(left)
+                names = await self._run(left_storage.read_file_ids, stats)
+                left_rows = await self._read_matching(
+                    left_storage, names, lambda _: True, stats)
+            else:
+                cond, value = self._parse_condition(left, condition)
+                left_rows = [row for found in await self._lookup(
+                                 left, cond, value, stats)
+                             for row in found.items()]
+            left_count = len(left_rows)
+            right_storage = self._table_storage(right)
+            right_names = await self._run(right_storage.read_file_ids, stats)
+            path = HASH
+            if left_count < len(right_names):
+                if self._meta[right][META.GENERATOR] == right_key:
+                    path = GENERATOR
+                elif right_key in right_storage.index_columns:
+                    path = INDEX
+            set_access_path(stats, path)
+            if path == HASH:
+                right_rows = await self._read_matching(
+                    right_storage, right_names, lambda _: True, stats)
+                if left_count <= len(right_names):
+                    return self._decode_pairs(left, right, probe_hash(
+                        build_hash(left_rows, left_key), right_rows,
+                        right_key, build_left=True))
+            else:
+                # Read only the right records of the left join values.
+                names = await self._run(
+                    partial(right_storage.equal_ids,
+                            generator=path == GENERATOR, stats=stats),
+                    right_key, join_keys(left_rows, left_key))
+                right_rows = await self._read_matching(
+                    right_storage, names, lambda _: True, stats)
+            return self._decode_pairs(left, right, probe_hash(
+                build_hash(right_rows, right_key), left_rows, left_key,
+                build_left=False))
+
+    def _check_join_column(self, table_name: str, column_name: str) -> None:
+        """Check a table and its join column exist.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        column_name : str
+            Join column.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
+        """
+        if not self._check_table(table_name):
+            raise NotFoundTableError(table_name=table_name)
+        if not self._check_column_in_table(table_name, column_name):
+            raise NotFoundColumnError(column_name=column_name,
+                                      table_name=table_name)
+
+    def _decode_pairs(self,
+                      left: str,
+                      right: str,
+                      result: list[dict[str, dict[str, Any]]],
+                      ) -> list[dict[str, dict[str, Any]]]:
+        """Turn stored records of a ``join`` result into API values.
+
+        Parameters
+        ----------
+        left : str
+            Name of the left table folder.
+        right : str
+            Name of the right table folder.
+        result : list[dict[str, dict[str, Any]]]
+            Joined pairs, as read. A record may be part of several pairs.
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            The same result.
+        """
+        decoded: set[int] = set()
+        for side, table in (("left", left), ("right", right)):
+            schema = self._schema(table)
+            if not schema.codec:
+                continue
+            for row in result:
+                for record in row[side].values():
+                    if id(record) not in decoded:
+                        decoded.add(id(record))
+                        schema.decode(record)
+        return result
+
+    def _check_column_in_table(self, table_name: str, column_name: str) -> bool:
+        """Check column in table on exist.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table
+        column_name : str
+            name of column
+
+        Returns
+        -------
+        bool
+            exist column
+        """
+        return column_name in self._meta[table_name][META.COLUMNS]
+
+    async def update(self,
+               table_name: str,
+               file_id: str,
+               new_data: dict[str, Any],
+               ) -> None:
+        """Update data with file_id.
+
+        Get file_id from find method.
+
+        Parameters
+        ----------
+        file_id : str
+            unique file name
+        new_data : dict[str, Any]
+            new data when need save
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        """
+        with observe(self._sink, "update", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            new_data = self._check_changes(table_name, new_data)
+            try:
+                [result] = await self._write_records(
+                    self._table_storage(table_name), [(file_id, new_data)])
+            finally:
+                self._bump(table_name)
+            if isinstance(result, BaseException):
+                raise result
+            storage = self._table_storage(table_name)
+            if storage.tracks_columns:
+                await self._run(storage.record_updated, file_id, new_data)
+            if stats is not None:
+                stats.files_opened += 1
+                stats.bytes_written += result
+
+    async def patch(self,
+                    table_name: str,
+                    file_id: str,
+                    changes: dict[str, Any],
+                    ) -> bool:
+        """Change some fields of a record.
+
+        Fields equal to the stored values are ignored. When nothing
+        changes, the record is not written and no filter, index or cached
+        result is touched; otherwise only the indexes of changed columns
+        are updated.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        file_id : str
+            Name of file in table, as returned by ``find``.
+        changes : dict[str, Any]
+            New values of some columns.
+
+        Returns
+        -------
+        bool
+            True if the record was written.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a changed column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or the ``id_generator`` column,
+            which names the record file, would change.
+        FileNotFoundError
+            If the record does not exist.
+        """
+        with observe(self._sink, "patch", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            changes = self._check_changes(table_name, changes)
+            generator = self._meta[table_name][META.GENERATOR]
+            if (isinstance(generator, str) and generator in changes
+                    and str(changes[generator]) != str(file_id)):
+                raise DataIsUncorrectError(data=changes)
+            storage = self._table_storage(table_name)
+            if not storage.might_contain(None, file_id):
+                raise storage.not_found(file_id)
+            return await self._patch(table_name, file_id, changes, stats)
+
+    async def upsert(self,
+                     table_name: str,
+                     data: dict[str, Any],
+                     *,
+                     on: str | None = None,
+                     ) -> str:
+        """Insert a record, or patch the record with the same key.
+
+        Concurrent upserts of one key value run one after another, so
+        only the first of them inserts. An ``id_generator`` key saved
+        meanwhile by another process is patched instead.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        data : dict[str, Any]
+            Record to save.
+        on : str | None, optional
+            Key column, by default the ``id_generator`` column. Other
+            columns are looked up like ``find`` does, preferably through
+            an index.
+
+        Returns
+        -------
+        str
+            File id of the inserted or patched record.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or the key is missing.
+        ValueError
+            If no ``on`` is given for a table without an ``id_generator``
+            column.
+        """
+        with observe(self._sink, "upsert", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            data = self._check_changes(table_name, data)
+            key = self._upsert_key(table_name, on)
+            if key not in data:
+                raise DataIsUncorrectError(data=data)
+            async with self._upserts.hold((table_name, key, data[key])):
+                return await self._upsert(table_name, key, data, stats)
+
+    async def _upsert(self,
+                      table_name: str,
+                      key: str,
+                      data: dict[str, Any],
+                      stats: OperationStats | None,
+                      ) -> str:
+        """Patch the record with the key of ``data``, or insert it.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        key : str
+            Key column.
+        data : dict[str, Any]
+            Checked record.
+        stats : OperationStats | None
+            Counters of the running operation.
+
+        Returns
+        -------
+        str
+            File id of the inserted or patched record.
+        """
+        storage = self._table_storage(table_name)
+        if key == self._meta[table_name][META.GENERATOR]:
+            set_access_path(stats, "generator")
+            file_id: str | None = str(data[key])
+            if not storage.might_contain(None, file_id):
+                file_id = None
+        else:
+            access_path, names = await self._run(
+                self._plan, table_name, key, EQ, data[key], stats)
+            set_access_path(stats, access_path)
+            value = data[key]
+            matches = await self._read_matching(
+                storage, names, lambda d: d.get(key) == value, stats)
+            file_id = matches[0][0] if matches else None
+        if file_id is not None:
+            try:
+                await self._patch(table_name, file_id, data, stats)
+            except FileNotFoundError:
+                pass
+            else:
+                return file_id
+        try:
+            return await self._writer(table_name).insert(data, stats)
+        except DuplicateIdError as e:
+            await self._patch(table_name, e.file_id, data, stats)
+            return e.file_id
+
+    def _check_changes(self,
+                       table_name: str,
+                       data: dict[str, Any],
+                       ) -> dict[str, Any]:
+        """Check a table exists and values fit its columns.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        data : dict[str, Any]
+            Values by column.
+
+        Returns
+        -------
+        dict[str, Any]
+            Values in their stored form.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type.
+        """
+        if not self._check_table(table_name):
+            raise NotFoundTableError(table_name=table_name)
+        return self._schema(table_name).validate(data)
+
+    def _upsert_key(self, table_name: str, on: str | None) -> str:
+        """Return the key column of an upsert.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        on : str | None
+            Key column given by the caller.
+
+        Returns
+        -------
+        str
+            ``on``, or the ``id_generator`` column.
+
+        Raises
+        ------
+        ValueError
+            If there is no key column.
+        """
+        if on is not None:
+            return on
+        generator = self._meta[table_name][META.GENERATOR]
+        if not isinstance(generator, str):
+            msg = f"upsert into {table_name} needs an 'on' column"
+            raise ValueError(msg)  # noqa: TRY004
+        return generator
+
+    async def _patch(self,
+                     table_name: str,
+                     file_id: str,
+                     changes: dict[str, Any],
+                     stats: OperationStats | None,
+                     ) -> bool:
+        """Write changed fields and invalidate cached results if any.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        file_id : str
+            Name of file in table.
+        changes : dict[str, Any]
+            Checked new values.
+        stats : OperationStats | None
+            Counters of the running operation.
+
+        Returns
+        -------
+        bool
+            True if the record was written.
+        """
+        try:
+            changed = await self._run(
+                self._table_storage(table_name).patch_record, file_id,
+                changes, stats)
+        except FileNotFoundError:
+            raise
+        except BaseException:
+            self._bump(table_name)
+            raise
+        if changed:
+            self._bump(table_name)
+        return bool(changed)
+
+    async def delete(self,
+                table_name: str,
+                file_id: str,
+                ) -> None:
+        """Delete data with file_id.
+
+        Parameters
+        ----------
+        table_name : str
+            name of table db
+        file_id : str
+            name of file in table
+        """
+        with observe(self._sink, "delete", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            storage = self._table_storage(table_name)
+            if not storage.might_contain(None, file_id):
+                raise storage.not_found(file_id)
+            await self._writer(table_name).delete(str(file_id), stats)
+
+    async def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete every record matching a condition.
+
+        Matching records are located like ``find`` does, their files are
+        removed, and the file id list and column indexes are rewritten
+        once for all of them.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition as accepted by ``find``.
+
+        Returns
+        -------
+        int
+            Number of deleted records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        OSError
+            If a record file could not be removed; the other records are
+            still deleted.
+        """
+        with observe(self._sink, "delete_where", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            cond, value = self._parse_condition(table_name, condition)
+            names = [name for found in await self._lookup(
+                         table_name, cond, value, stats)
+                     for name in found]
+            if not names:
+                return 0
+            storage = self._table_storage(table_name)
+            try:
+                errors = await self._remove_records(storage, names)
+                dropped, deleted, error = removed_ids(names, errors)
+                await self._run(storage.commit, (), dropped, stats)
+            finally:
+                self._bump(table_name)
+            if error is not None:
+                raise error
+            return deleted
+
+    async def update_where(self,
+                           table_name: str,
+                           condition: str,
+                           changes: dict[str, Any],
+                           ) -> int:
+        """Change fields of every record matching a condition.
+
+        Records whose fields already have the new values are not
+        written. Changed values are added to Bloom filters and column
+        indexes once for all records.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition as accepted by ``find``.
+        changes : dict[str, Any]
+            New values of some columns.
+
+        Returns
+        -------
+        int
+            Number of written records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a changed column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or would change the
+            ``id_generator`` column.
+        OSError
+            If a record file could not be written; the other records are
+            still changed.
+        """
+        with observe(self._sink, "update_where", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            changes = self._check_changes(table_name, changes)
+            if self._meta[table_name][META.GENERATOR] in changes:
+                raise DataIsUncorrectError(data=changes)
+            cond, value = self._parse_condition(table_name, condition)
+            items = [(name, record, diff)
+                     for found in await self._lookup(table_name, cond, value,
+                                                     stats)
+                     for name, record in found.items()
+                     if (diff := changed_fields(record, changes))]
+            if not items:
+                return 0
+            storage = self._table_storage(table_name)
+            try:
+                results = await self._write_records(
+                    storage,
+                    [(name, record | diff) for name, record, diff in items])
+                written, error = written_ids(items, results, stats)
+                await self._run(storage.records_changed, written)
+            finally:
+                self._bump(table_name)
+            if error is not None:
+                raise error
+            return len(written)
+
+    async def create_index(self,
+                           table_name: str,
+                           column_name: str,
+                           ) -> int:
+        """Index a column for ``==``, ``STARTSWITH`` and ``CONTAINS``.
+
+        The index keeps distinct values sorted for prefix lookups and
+        splits TEXT values into trigrams for substring lookups. Every
+        later write keeps it up to date.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            Column to index.
+
+        Returns
+        -------
+        int
+            Number of indexed records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
+        """
+        with observe(self._sink, "create_index", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            if not self._check_column_in_table(table_name, column_name):
+                raise NotFoundColumnError(column_name=column_name,
+                                          table_name=table_name)
+            storage = self._table_storage(table_name)
+            return await self._run(storage.build_index, column_name, stats)
+
+    async def create_numeric_index(self,
+                                   table_name: str,
+                                   column_name: str,
+                                   ) -> int:
+        """Keep an int64 sidecar of an INT column for comparisons.
+
+        The column values of every record are written as contiguous
+        int64 values to ``.num-<column>``, with their file ids in
+        ``.numids-<column>``, and every later write appends to them.
+        With NumPy installed, ``find`` evaluates ``==``, ``!=``, ``<``,
+        ``<=``, ``>`` and ``>=`` on a memory map of the values as one
+        vectorized mask and reads only the matching records. Without
+        NumPy the sidecar is kept up to date but not used.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            INT column.
+
+        Returns
+        -------
+        int
+            Number of rows in the sidecar.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
+        ValueError
+            If the column is not INT.
+        """
+        with observe(self._sink, "create_numeric_index",
+                     table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            if not self._check_column_in_table(table_name, column_name):
+                raise NotFoundColumnError(column_name=column_name,
+                                          table_name=table_name)
+            column_type = self._meta[table_name][META.COLUMNS][column_name]
+            if column_type != "INT":
+                msg = f"{column_name} is {column_type}, not INT"
+                raise ValueError(msg)
+            storage = self._table_storage(table_name)
+            return await self._run(storage.build_numeric, column_name,
+                                   stats)
+
+    async def compact(self, table_name: str) -> int:
+        """Drop ids of missing records and rebuild Bloom filters.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            Number of file ids dropped from the index.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        """
+        with observe(self._sink, "compact", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            try:
+                return await self._run(
+                    self._table_storage(table_name).compact, stats)
+            finally:
+                self._bump(table_name)
@@ -0,0 +1,676 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Clients of the local server, with the API of the managers."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import socket
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+from pyfiles_db.database_manager import _wire
+from pyfiles_db.database_manager._db import _DB, _AsyncDB
+from pyfiles_db.database_manager._schema import Record, _Schema
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class _DBclient(_DB):
+    """Synchronous client of ``python -m pyfiles_db serve``.
+
+    Every method sends the call to the server and waits for its answer,
+    so it behaves like the same method of ``_DBsync`` on the storage the
+    server owns. Calls of several threads are serialized on the single
+    connection. A call that fails or times out while waiting drops the
+    connection, so a late answer never reaches the next call; the next
+    call connects again. Import and export files are opened by the
+    server, so their paths must be reachable from it.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the server socket.
+    timeout : float | None, optional
+        Seconds to wait for an answer, by default None (forever).
+    """
+
+    def __init__(self, path: str | Path, timeout: float | None = None) -> None:
+        """Connect to the server.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the server socket.
+        timeout : float | None, optional
+            Seconds to wait for an answer.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._sock: socket.socket | None = self._connect()
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._schemas: dict[str, _Schema] = {}
+
+    def _connect(self) -> socket.socket:
+        """Open a connection to the server."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.path))
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _call(self,
+              method: str,
+              *args: Any,  # noqa: ANN401
+              progress: Callable[[int, float], None] | None = None,
+              **kwargs: Any,  # noqa: ANN401
+              ) -> Any:  # noqa: ANN401
+        """Run a manager method on the server and return its result."""
+        if progress is not None:
+            kwargs["progress"] = True
+        with self._lock:
+            if self._sock is None:
+                self._sock = self._connect()
+            request_id = next(self._ids)
+            try:
+                self._sock.sendall(_wire.frame({"id": request_id,
+                                                "method": method,
+                                                "args": list(args),
+                                                "kwargs": kwargs}))
+                while True:
+                    reply = _wire.recv(self._sock)
+                    if reply.get("id") != request_id:
+                        # An answer to a call that gave up waiting.
+                        continue
+                    if "progress" not in reply:
+                        break
+                    if progress is not None:
+                        progress(*reply["progress"])
+            except BaseException:
+                # The rest of the answer may still come; never read it
+                # as the answer to another call.
+                self.close()
+                raise
+        if "error" in reply:
+            raise _wire.load_error(reply["error"])
+        return reply["result"]
+
+    def _schema(self, table_name: str) -> _Schema:
+        """Return the record shapes of a table, asked once."""
+        schema = self._schemas.get(table_name)
+        if schema is None:
+            schema = _Schema(*self._call("schema", table_name))
+            self._schemas[table_name] = schema
+        return schema
+
+    def create_table(self, table_name: str,
+                     columns: dict[str, str],
+                     id_generator: str | int | None = None,
+                     bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
+                     ) -> None:
+        """Create a table, see ``_DBsync.create_table``."""
+        self._call("create_table", table_name, columns, id_generator,
+                   bloom if isinstance(bloom, bool) else list(bloom))
+
+    def new_data(self, table_name: str, data: dict[str, Any]) -> None:
+        """Add a record, see ``_DBsync.new_data``."""
+        self._call("new_data", table_name, data)
+
+    def insert_many(self,
+                    table_name: str,
+                    records: Sequence[dict[str, Any]],
+                    ) -> list[str]:
+        """Add records, see ``_DBsync.insert_many``."""
+        ids: list[str] = self._call("insert_many", table_name, list(records))
+        return ids
+
+    def import_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     *,
+                     batch_size: int = 10_000,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Import a JSON lines file, see ``_DBsync.import_jsonl``."""
+        count: int = self._call("import_jsonl", table_name,
+                                str(Path(path).resolve()),
+                                batch_size=batch_size, progress=progress)
+        return count
+
+    def import_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   *,
+                   batch_size: int = 10_000,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Import a CSV file, see ``_DBsync.import_csv``."""
+        count: int = self._call("import_csv", table_name,
+                                str(Path(path).resolve()),
+                                batch_size=batch_size, progress=progress)
+        return count
+
+    def export_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     condition: str | None = None,
+                     *,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Export to a JSON lines file, see ``_DBsync.export_jsonl``."""
+        count: int = self._call("export_jsonl", table_name,
+                                str(Path(path).resolve()), condition,
+                                progress=progress)
+        return count
+
+    def export_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   condition: str | None = None,
+                   *,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Export to a CSV file, see ``_DBsync.export_csv``."""
+        count: int = self._call("export_csv", table_name,
+                                str(Path(path).resolve()), condition,
+                                progress=progress)
+        return count
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["dict"] = ...,
+             ) -> list[dict[str, Any]]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["record"],
+             ) -> list[Record]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["columns"],
+             ) -> dict[str, Sequence[Any]]: ...
+
+    def find(self,  # noqa: PLR0913 - keyword-only options
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = None,
+             descending: bool = False,
+             limit: int | None = None,
+             result_type: str = "dict",
+             ) -> (list[dict[str, Any]] | list[Record]
+                   | dict[str, Sequence[Any]]):
+        """Find records, see ``_DBsync.find``.
+
+        Records travel as dicts and are shaped here.
+        """
+        schema = None
+        if result_type != "dict":
+            schema = self._schema(table_name)
+            schema.check_result_type(result_type)
+        result: list[dict[str, Any]] = self._call(
+            "find", table_name, condition, order_by=order_by,
+            descending=descending, limit=limit)
+        if schema is None:
+            return result
+        return schema.shape(result, result_type)
+
+    def update(self,
+               table_name: str,
+               file_id: str,
+               new_data: dict[str, Any],
+               ) -> None:
+        """Replace a record, see ``_DBsync.update``."""
+        self._call("update", table_name, file_id, new_data)
+
+    def patch(self,
+              table_name: str,
+              file_id: str,
+              changes: dict[str, Any],
+              ) -> bool:
+        """Change fields of a record, see ``_DBsync.patch``."""
+        changed: bool = self._call("patch", table_name, file_id, changes)
+        return changed
+
+    def upsert(self,
+               table_name: str,
+               data: dict[str, Any],
+               *,
+               on: str | None = None,
+               ) -> str:
+        """Insert or replace a record, see ``_DBsync.upsert``."""
+        file_id: str = self._call("upsert", table_name, data, on=on)
+        return file_id
+
+    def delete(self, table_name: str, file_id: str) -> None:
+        """Delete a record, see ``_DBsync.delete``."""
+        self._call("delete", table_name, file_id)
+
+    def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete matching records, see ``_DBsync.delete_where``."""
+        count: int = self._call("delete_where", table_name, condition)
+        return count
+
+    def update_where(self,
+                     table_name: str,
+                     condition: str,
+                     changes: dict[str, Any],
+                     ) -> int:
+        """Change matching records, see ``_DBsync.update_where``."""
+        count: int = self._call("update_where", table_name, condition,
+                                changes)
+        return count
+
+    def create_index(self, table_name: str, column_name: str) -> int:
+        """Build a column index, see ``_DBsync.create_index``."""
+        count: int = self._call("create_index", table_name, column_name)
+        return count
+
+    def create_numeric_index(self, table_name: str, column_name: str) -> int:
+        """Build a numeric sidecar, see ``_DBsync.create_numeric_index``."""
+        count: int = self._call("create_numeric_index", table_name,
+                                column_name)
+        return count
+
+    def explain(self,
+                table_name: str,
+                condition: str,
+                *,
+                order_by: str | None = None,
+                descending: bool = False,
+                limit: int | None = None,
+                ) -> dict[str, Any]:
+        """Report the plan of a find, see ``_DBsync.explain``."""
+        plan: dict[str, Any] = self._call(
+            "explain", table_name, condition, order_by=order_by,
+            descending=descending, limit=limit)
+        return plan
+
+    def join(self,
+             left_table: str,
+             right_table: str,
+             on: str | tuple[str, str],
+             condition: str | None = None,
+             ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables, see ``_DBsync.join``."""
+        pairs: list[dict[str, dict[str, Any]]] = self._call(
+            "join", left_table, right_table, on, condition)
+        return pairs
+
+    def compact(self, table_name: str) -> int:
+        """Repair the index of a table, see ``_DBsync.compact``."""
+        dropped: int = self._call("compact", table_name)
+        return dropped
+
+
+class _DBclientAsync(_AsyncDB):
+    """Asynchronous client of ``python -m pyfiles_db serve``.
+
+    Calls are sent on one connection without waiting for earlier
+    answers, so concurrent calls of one process run concurrently on the
+    server, where their writes are coalesced. Otherwise every method
+    behaves like the same method of ``_DBasync``.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the server socket, connected on the first call.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Init client.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the server socket.
+        """
+        self.path = Path(path)
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._connecting = asyncio.Lock()
+        self._ids = itertools.count()
+        self._pending: dict[int, tuple[
+            asyncio.Future[Any], Callable[[int, float], None] | None]] = {}
+        self._schemas: dict[str, _Schema] = {}
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        """Return the connection, opened on first use."""
+        async with self._connecting:
+            if self._writer is None:
+                reader, self._writer = await asyncio.open_unix_connection(
+                    self.path)
+                self._reader_task = asyncio.create_task(self._receive(reader))
+            return self._writer
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        """Hand every answer to the call waiting for it."""
+        try:
+            while (reply := await _wire.read(reader)) is not None:
+                future, progress = self._pending.get(reply["id"], (None, None))
+                if future is None:
+                    continue
+                if "progress" in reply:
+                    if progress is not None:
+                        progress(*reply["progress"])
+                    continue
+                del self._pending[reply["id"]]
+                if future.done():
+                    continue
+                if "error" in reply:
+                    future.set_exception(_wire.load_error(reply["error"]))
+                else:
+                    future.set_result(reply["result"])
+        finally:
+            self._writer = None
+            error = ConnectionError("pyfiles_db server closed the connection")
+            for future, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def _call(self,
+                    method: str,
+                    *args: Any,  # noqa: ANN401
+                    progress: Callable[[int, float], None] | None = None,
+                    **kwargs: Any,  # noqa: ANN401
+                    ) -> Any:  # noqa: ANN401
+        """Run a manager method on the server and return its result."""
+        if progress is not None:
+            kwargs["progress"] = True
+        writer = await self._connect()
+        request_id = next(self._ids)
+        future: asyncio.Future[Any] = (
+            asyncio.get_running_loop().create_future())
+        self._pending[request_id] = (future, progress)
+        writer.write(_wire.frame({"id": request_id, "method": method,
+                                  "args": list(args), "kwargs": kwargs}))
+        try:
+            await writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _schema(self, table_name: str) -> _Schema:
+        """Return the record shapes of a table, asked once."""
+        schema = self._schemas.get(table_name)
+        if schema is None:
+            schema = _Schema(*await self._call("schema", table_name))
+            self._schemas[table_name] = schema
+        return schema
+
+    async def create_table(self, table_name: str,
+                           columns: dict[str, str],
+                           id_generator: str | int | None = None,
+                           bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
+                           ) -> None:
+        """Create a table, see ``_DBasync.create_table``."""
+        await self._call("create_table", table_name, columns, id_generator,
+                         bloom if isinstance(bloom, bool) else list(bloom))
+
+    async def new_data(self, table_name: str, data: dict[str, Any]) -> None:
+        """Add a record, see ``_DBasync.new_data``."""
+        await self._call("new_data", table_name, data)
+
+    async def insert_many(self,
+                          table_name: str,
+                          records: Sequence[dict[str, Any]],
+                          ) -> list[str]:
+        """Add records, see ``_DBasync.insert_many``."""
+        ids: list[str] = await self._call("insert_many", table_name,
+                                          list(records))
+        return ids
+
+    async def import_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           *,
+                           batch_size: int = 10_000,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Import a JSON lines file, see ``_DBasync.import_jsonl``."""
+        count: int = await self._call("import_jsonl", table_name,
+                                      str(Path(path).resolve()),
+                                      batch_size=batch_size, progress=progress)
+        return count
+
+    async def import_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         *,
+                         batch_size: int = 10_000,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Import a CSV file, see ``_DBasync.import_csv``."""
+        count: int = await self._call("import_csv", table_name,
+                                      str(Path(path).resolve()),
+                                      batch_size=batch_size, progress=progress)
+        return count
+
+    async def export_jsonl(self,
+                           table_name: str,
+                           path: str | Path,
+                           condition: str | None = None,
+                           *,
+                           progress: Callable[[int, float], None] | None = None,
+                           ) -> int:
+        """Export to a JSON lines file, see ``_DBasync.export_jsonl``."""
+        count: int = await self._call("export_jsonl", table_name,
+                                      str(Path(path).resolve()), condition,
+                                      progress=progress)
+        return count
+
+    async def export_csv(self,
+                         table_name: str,
+                         path: str | Path,
+                         condition: str | None = None,
+                         *,
+                         progress: Callable[[int, float], None] | None = None,
+                         ) -> int:
+        """Export to a CSV file, see ``_DBasync.export_csv``."""
+        count: int = await self._call("export_csv", table_name,
+                                      str(Path(path).resolve()), condition,
+                                      progress=progress)
+        return count
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["dict"] = ...,
+                   ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["record"],
+                   ) -> list[Record]: ...
+
+    @overload
+    async def find(self,
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = ...,
+                   descending: bool = ...,
+                   limit: int | None = ...,
+                   result_type: Literal["columns"],
+                   ) -> dict[str, Sequence[Any]]: ...
+
+    async def find(self,  # noqa: PLR0913 - keyword-only options
+                   table_name: str,
+                   condition: str,
+                   *,
+                   order_by: str | None = None,
+                   descending: bool = False,
+                   limit: int | None = None,
+                   result_type: str = "dict",
+                   ) -> (list[dict[str, Any]] | list[Record]
+                         | dict[str, Sequence[Any]]):
+        """Find records, see ``_DBasync.find``.
+
+        Records travel as dicts and are shaped here.
+        """
+        schema = None
+        if result_type != "dict":
+            schema = await self._schema(table_name)
+            schema.check_result_type(result_type)
+        result: list[dict[str, Any]] = await self._call(
+            "find", table_name, condition, order_by=order_by,
+            descending=descending, limit=limit)
+        if schema is None:
+            return result
+        return schema.shape(result, result_type)
+
+    async def update(self,
+                     table_name: str,
+                     file_id: str,
+                     new_data: dict[str, Any],
+                     ) -> None:
+        """Replace a record, see ``_DBasync.update``."""
+        await self._call("update", table_name, file_id, new_data)
+
+    async def patch(self,
+                    table_name: str,
+                    file_id: str,
+                    changes: dict[str, Any],
+                    ) -> bool:
+        """Change fields of a record, see ``_DBasync.patch``."""
+        changed: bool = await self._call("patch", table_name, file_id, changes)
+        return changed
+
+    async def upsert(self,
+                     table_name: str,
+                     data: dict[str, Any],
+                     *,
+                     on: str | None = None,
+                     ) -> str:
+        """Insert or replace a record, see ``_DBasync.upsert``."""
+        file_id: str = await self._call("upsert", table_name, data, on=on)
+        return file_id
+
+    async def delete(self, table_name: str, file_id: str) -> None:
+        """Delete a record, see ``_DBasync.delete``."""
+        await self._call("delete", table_name, file_id)
+
+    async def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete matching records, see ``_DBasync.delete_where``."""
+        count: int = await self._call("delete_where", table_name, condition)
+        return count
+
+    async def update_where(self,
+                           table_name: str,
+                           condition: str,
+                           changes: dict[str, Any],
+                           ) -> int:
+        """Change matching records, see ``_DBasync.update_where``."""
+        count: int = await self._call("update_where", table_name, condition,
+                                      changes)
+        return count
+
+    async def create_index(self, table_name: str, column_name: str) -> int:
+        """Build a column index, see ``_DBasync.create_index``."""
+        count: int = await self._call("create_index", table_name, column_name)
+        return count
+
+    async def create_numeric_index(self,
+                                   table_name: str,
+                                   column_name: str,
+                                   ) -> int:
+        """Build a numeric sidecar, see ``_DBasync.create_numeric_index``."""
+        count: int = await self._call("create_numeric_index", table_name,
+                                      column_name)
+        return count
+
+    async def explain(self,
+                      table_name: str,
+                      condition: str,
+                      *,
+                      order_by: str | None = None,
+                      descending: bool = False,
+                      limit: int | None = None,
+                      ) -> dict[str, Any]:
+        """Report the plan of a find, see ``_DBasync.explain``."""
+        plan: dict[str, Any] = await self._call(
+            "explain", table_name, condition, order_by=order_by,
+            descending=descending, limit=limit)
+        return plan
+
+    async def join(self,
+                   left_table: str,
+                   right_table: str,
+                   on: str | tuple[str, str],
+                   condition: str | None = None,
+                   ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables, see ``_DBasync.join``."""
+        pairs: list[dict[str, dict[str, Any]]] = await self._call(
+            "join", left_table, right_table, on, condition)
+        return pairs
+
+    async def compact(self, table_name: str) -> int:
+        """Repair the index of a table, see ``_DBasync.compact``."""
+        dropped: int = await self._call("compact", table_name)
+        return dropped
@@ -27,3 +27,6 @@ class META:
     TABLE_PREFIX: str = "TABLE_PREFIX"
     GENERATOR: str = "GENERATOR"
     FILE_IDS: str = "FILE_IDS"
+    BLOOM: str = "BLOOM"
+    INDEXES: str = "INDEXES"
+    NUMERIC: str = "NUMERIC"
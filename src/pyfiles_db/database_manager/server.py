@@ -0,0 +1,211 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Local server owning one storage, for clients on the same host."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import signal
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyfiles_db.database_manager import _wire
+from pyfiles_db.database_manager._db import _AsyncDB
+from pyfiles_db.database_manager.meta import META
+from pyfiles_db.errors import NotFoundTableError
+
+if TYPE_CHECKING:
+    from pyfiles_db.database_manager.async_db import _DBasync
+
+# Public API of the managers, the only methods a client may call.
+METHODS = frozenset(_AsyncDB.__abstractmethods__) - {"__init__"}
+_PROGRESS = frozenset({"import_jsonl", "import_csv", "export_jsonl",
+                       "export_csv"})
+
+
+class Server:
+    """Serve one storage to local processes over a Unix socket.
+
+    Requests of every connection run concurrently on one async manager,
+    so writes of many processes are coalesced by its write window and
+    reads share its result cache, without cross-process file locking on
+    the hot path. Import and export paths are opened by the server.
+
+    Parameters
+    ----------
+    db : _DBasync
+        Manager that owns the storage.
+    path : str | Path
+        Path of the socket, created with mode 0600.
+    """
+
+    def __init__(self, db: _DBasync, path: str | Path) -> None:
+        """Init server.
+
+        Parameters
+        ----------
+        db : _DBasync
+            Manager that owns the storage.
+        path : str | Path
+            Path of the socket.
+        """
+        self.db = db
+        self.path = Path(path)
+        self._server: asyncio.AbstractServer | None = None
+        # Connection handlers, finished by close.
+        self._connections: dict[asyncio.Task[Any], asyncio.StreamWriter] = {}
+
+    async def start(self) -> None:
+        """Listen on the socket, replacing a stale one.
+
+        Raises
+        ------
+        FileExistsError
+            If the path exists and is not a socket.
+        """
+        if self.path.is_socket():
+            self.path.unlink()
+        elif self.path.exists():
+            msg = f"{self.path} exists and is not a socket"
+            raise FileExistsError(msg)
+        self._server = await asyncio.start_unix_server(self._connection,
+                                                       path=self.path)
+        self.path.chmod(0o600)
+
+    async def serve_forever(self) -> None:
+        """Start and serve until cancelled, then close."""
+        if self._server is None:
+            await self.start()
+        if self._server is None:  # pragma: no cover - set by start
+            return
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop listening, remove the socket and close the manager."""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections)
+            await self._server.wait_closed()
+            self._server = None
+            self.path.unlink(missing_ok=True)
+        self.db.close()
+
+    async def _connection(self,
+                          reader: asyncio.StreamReader,
+                          writer: asyncio.StreamWriter,
+                          ) -> None:
+        """Run the requests of one client until it disconnects."""
+        current = asyncio.current_task()
+        if current is not None:
+            self._connections[current] = writer
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while (request := await _wire.read(reader)) is not None:
+                task = asyncio.create_task(self._handle(request, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        finally:
+            if current is not None:
+                del self._connections[current]
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _handle(self,
+                      request: dict[str, Any],
+                      writer: asyncio.StreamWriter,
+                      ) -> None:
+        """Run one request and send its result or error."""
+        request_id = request.get("id")
+        try:
+            result = await self._call(request, writer)
+            reply = _wire.frame({"id": request_id, "result": result})
+        except Exception as e:  # noqa: BLE001 - raised again by the client
+            reply = _wire.frame({"id": request_id,
+                                 "error": _wire.dump_error(e)})
+        if not writer.is_closing():
+            writer.write(reply)
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+
+    async def _call(self,
+                    request: dict[str, Any],
+                    writer: asyncio.StreamWriter,
+                    ) -> Any:  # noqa: ANN401
+        """Dispatch a request to the manager."""
+        method = request["method"]
+        args = request.get("args", [])
+        kwargs = request.get("kwargs", {})
+        if method == "schema":
+            return self._table_schema(*args)
+        if method not in METHODS:
+            msg = f"Unknown method {method!r}"
+            raise ValueError(msg)
+        if method in _PROGRESS and kwargs.pop("progress", False):
+            kwargs["progress"] = partial(_send_progress, writer,
+                                         request.get("id"))
+        return await getattr(self.db, method)(*args, **kwargs)
+
+    def _table_schema(self, table_name: str) -> list[Any]:
+        """Return folder name and columns of a table."""
+        meta = self.db._meta  # noqa: SLF001 - the server owns the manager
+        table = meta[META.TABLE_PREFIX] + table_name
+        if table not in meta:
+            raise NotFoundTableError(table_name=table)
+        return [table, meta[table][META.COLUMNS]]
+
+
+def _send_progress(writer: asyncio.StreamWriter,
+                   request_id: int | None,
+                   rows: int,
+                   seconds: float,
+                   ) -> None:
+    """Report progress of an import or export to its client."""
+    if not writer.is_closing():
+        writer.write(_wire.frame({"id": request_id,
+                                  "progress": [rows, seconds]}))
+
+
+def serve(db: _DBasync, path: str | Path) -> None:
+    """Serve a storage until interrupted or terminated.
+
+    Parameters
+    ----------
+    db : _DBasync
+        Manager that owns the storage.
+    path : str | Path
+        Path of the socket, removed on exit.
+    """
+    with contextlib.suppress(KeyboardInterrupt, asyncio.CancelledError):
+        asyncio.run(_serve_until_signal(Server(db, path)))
+
+
+async def _serve_until_signal(server: Server) -> None:
+    """Serve, turning SIGTERM into a clean shutdown."""
+    task = asyncio.current_task()
+    if task is not None:
+        with contextlib.suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM,
+                                                          task.cancel)
+    await server.serve_forever()
@@ -14,27 +14,88 @@
 
 """Sync database manager."""
 
-import json
+from __future__ import annotations
+
+import time
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from pyfiles_db.database_manager._bulk import (
+    BATCH_SIZE,
+    CSV,
+    JSONL,
+    RowWriter,
+    check_bulk,
+    chunked,
+    read_rows,
+    row_filter,
+)
 from pyfiles_db.database_manager._db import _DB
+from pyfiles_db.database_manager._instrument import (
+    combine_sinks,
+    observe,
+    set_access_path,
+)
+from pyfiles_db.database_manager._join import (
+    GENERATOR,
+    HASH,
+    INDEX,
+    Row,
+    build_hash,
+    join_columns,
+    join_keys,
+    probe_hash,
+)
+from pyfiles_db.database_manager._query import (
+    EQ,
+    ORDERINGS,
+    TEXT_OPERATORS,
+    _Condition,
+    matcher,
+    order_rows,
+    parse_condition,
+    sort_method,
+)
+from pyfiles_db.database_manager._schema import _Collector, _Schema
+from pyfiles_db.database_manager._storage import (
+    _MetaStorage,
+    _TableStorage,
+    changed_fields,
+    in_index_order,
+    removed_ids,
+    written_ids,
+)
 from pyfiles_db.database_manager.meta import META
 from pyfiles_db.errors import (
     DataIsUncorrectError,
+    DuplicateIdError,
+    InvalidConditionError,
     NotFoundColumnError,
     NotFoundTableError,
     TableAlreadyAvaibleError,
-    UnknownDataTypeError,
 )
-from pyfiles_db.utils import infinite_natural_numbers
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Iterable, Sequence
+
+    from pyfiles_db.database_manager._schema import Record
+    from pyfiles_db.metrics import MetricsSink, OperationStats, SlowQueryLog
+    from pyfiles_db.utils import ResultCache
 
 
 class _DBsync(_DB):
-    def __init__(self, storage: str | Path, meta_file: str) -> None:
+    def __init__(self,  # noqa: PLR0913 - keyword-only options
+                 storage: str | Path,
+                 meta_file: str,
+                 *,
+                 metrics: MetricsSink | None = None,
+                 slow_query_log: SlowQueryLog | None = None,
+                 initial_meta: dict[str, Any] | None = None,
+                 result_cache: ResultCache | None = None,
+                 bloom_max_age: float = 0.0,
+                 scan_readahead: int | None = None,
+                 ) -> None:
         """Initialize the synchronous database manager.
 
         Parameters
@@ -43,19 +104,121 @@ class _DBsync(_DB):
             Path to the database location.
         meta_file : str
             Name of the meta file.
+        metrics : MetricsSink | None, optional
+            Receiver of per-operation counters, by default None (off).
+        slow_query_log : SlowQueryLog | None, optional
+            Log of slow queries, by default None (off).
+        initial_meta : dict[str, Any] | None, optional
+            Meta information of a new database. The storage folder and
+            meta file are created on first use, by default None (the
+            database must exist).
+        result_cache : ResultCache | None, optional
+            Cache of ``find`` results, invalidated by every write to the
+            table, by default None (off).
+        bloom_max_age : float, optional
+            Seconds a loaded Bloom filter is trusted without checking
+            for changes by other processes, by default 0.0 (one ``stat``
+            per lookup).
+        scan_readahead : int | None, optional
+            Read the records of full scans in inode order, with this
+            many record files announced ahead to the kernel, and return
+            them in index order. By default None (read in index order).
         """
         self._storage = Path(storage)
         self._meta_file = meta_file
-        self._load_meta()
-        self._id_generators: dict[str, Generator[Any, Any, Any]] = {}
+        self._meta_storage = _MetaStorage(self._storage, meta_file,
+                                          initial_meta)
+        self._tables: dict[str, _TableStorage] = {}
+        # Record validators, compiled once per table.
+        self._schemas: dict[str, _Schema] = {}
+        self._metrics = metrics
+        self._slow_query_log = slow_query_log
+        self._sink = combine_sinks(metrics, slow_query_log)
+        self._result_cache = result_cache
+        self._bloom_max_age = bloom_max_age
+        self._scan_readahead = scan_readahead
+        # Loaded on first use, so creating a manager touches no files.
+        self._meta_data: dict[str, Any] | None = None
+
+    @property
+    def metrics(self) -> MetricsSink | None:
+        """Receiver of per-operation counters, None when off."""
+        return self._metrics
+
+    @property
+    def slow_query_log(self) -> SlowQueryLog | None:
+        """Log of slow queries, None when off."""
+        return self._slow_query_log
+
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """Cache of ``find`` results, None when off."""
+        return self._result_cache
+
+    def _bump(self, table: str) -> None:
+        """Invalidate cached results of a changed table."""
+        if self._result_cache is not None:
+            self._result_cache.bump(table)
+
+    @property
+    def _meta(self) -> dict[str, Any]:
+        """Meta information, read from file on first access."""
+        if self._meta_data is None:
+            self._meta_data = self._meta_storage.read()
+        return self._meta_data
+
+    @_meta.setter
+    def _meta(self, meta: dict[str, Any]) -> None:
+        self._meta_data = meta
 
     def _load_meta(self) -> None:
         """Load meta information from file."""
-        with Path.open(self._storage / self._meta_file, "r") as f:
-            self._meta = json.load(f)
+        self._meta = self._meta_storage.read()
+
+    def _schema(self, table: str) -> _Schema:
+        """Return the record validator of a table folder.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+
+        Returns
+        -------
+        _Schema
+            Validator compiled from the table columns.
+        """
+        schema = self._schemas.get(table)
+        if schema is None:
+            schema = _Schema(table, self._meta[table][META.COLUMNS])
+            self._schemas[table] = schema
+        return schema
+
+    def _table_storage(self, table: str) -> _TableStorage:
+        """Return storage of a table folder.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+
+        Returns
+        -------
+        _TableStorage
+            Storage of the table.
+        """
+        storage = self._tables.get(table)
+        if storage is None:
+            storage = _TableStorage(self._storage / table,
+                                    self._meta[table].get(META.BLOOM),
+                                    self._bloom_max_age)
+            self._tables[table] = storage
+        return storage
 
     def create_table(self, table_name: str, columns: dict[str, str],
-                     id_generator: str | int | None = None) -> None:
+                     id_generator: str | int | None = None,
+                     bloom: bool | Sequence[str] = False,  # noqa: FBT001, FBT002
+                     ) -> None:
         """Create a table (sync).
 
         Parameters
@@ -66,78 +229,484 @@ class _DBsync(_DB):
             Columns mapping to their data types.
         id_generator : str | None
             Generator for file names. Default None.
+        bloom : bool | Sequence[str]
+            True keeps a Bloom filter over file ids, so lookups of absent
+            ids skip the disk. A sequence of columns keeps filters over
+            their values too. Default False.
 
         Raises
         ------
         TableAlreadyAvaibleError
             If the table already exists.
+        NotFoundColumnError
+            If a Bloom filter column is not a column of the table.
+        UnknownDataTypeError
+            If a column type is not INT, TEXT, FLOAT, BOOL, DATETIME or
+            BYTES.
         """
         # Table. columns is maybe {"USER_ID": "INT", "NAME": "TEXT"}
         table = self._meta[META.TABLE_PREFIX] + table_name
-        if table in self._meta[META.TABLES]:
-            raise TableAlreadyAvaibleError
+        schema = _Schema(table, columns)
         if id_generator is None:
             id_generator = 0
-            self._id_generators[table] = infinite_natural_numbers(id_generator)
-        self._mkdir_for_table(table)
-        self._meta[META.TABLES].append(table)
-        self._meta[table] = {
-            META.COLUMNS: columns,
-            META.GENERATOR: id_generator}
-        self._update_meta()
+        bloom_columns = (None if bloom is False
+                         else [] if bloom is True else list(bloom))
+        for column in bloom_columns or ():
+            if column not in columns:
+                raise NotFoundColumnError(column_name=column,
+                                          table_name=table)
+
+        def add_table(meta: dict[str, Any]) -> None:
+            if table in meta[META.TABLES]:
+                raise TableAlreadyAvaibleError
+            storage = _TableStorage(self._storage / table, bloom_columns,
+                                    self._bloom_max_age)
+            storage.create()
+            self._tables[table] = storage
+            self._schemas[table] = schema
+            meta[META.TABLES].append(table)
+            meta[table] = {
+                META.COLUMNS: columns,
+                META.GENERATOR: id_generator}
+            if bloom_columns is not None:
+                meta[table][META.BLOOM] = bloom_columns
+
+        self._meta, _ = self._meta_storage.update(add_table)
+
+    def new_data(self, table_name: str, data: dict[str, Any]) -> None:
+        """Save new data to the table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        data : dict[str, Any]
+            Record to save.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        DuplicateIdError
+            If the ``id_generator`` value is taken by a saved record.
+        """
+        with observe(self._sink, "new_data", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            data = self._schema(table_name).validate(data)
+            self._insert(table_name, data, stats)
+
+    def insert_many(self,
+                    table_name: str,
+                    records: Sequence[dict[str, Any]],
+                    ) -> list[str]:
+        """Save several records with one validation pass and one commit.
+
+        Records are checked column by column before anything is written,
+        file ids are allocated at once, and the id list, Bloom filters
+        and column indexes are updated once for the whole batch.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        records : Sequence[dict[str, Any]]
+            Records to save.
 
-    def _update_meta(self) -> None:
-        """Update meta file."""
-        with Path.open(self._storage / self._meta_file, mode="w") as f:
-            json.dump(self._meta, f)
+        Returns
+        -------
+        list[str]
+            File ids of the records, in order.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        DuplicateIdError
+            If the ``id_generator`` value is taken by a saved record.
+        OSError
+            If a record file could not be written; the other records are
+            still saved.
+        """
+        with observe(self._sink, "insert_many", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            stored = self._schema(table_name).validate_many(records)
+            return self._insert_batch(table_name, stored, stats)
 
-    def _mkdir_for_table(self, table: str | Path) -> None:
-        """Create the on-disk folder and index file for a table.
+    def _insert_batch(self,
+                      table_name: str,
+                      stored: list[dict[str, Any]],
+                      stats: OperationStats | None,
+                      ) -> list[str]:
+        """Save checked records with one id allocation and one commit.
 
         Parameters
         ----------
-        table : str | Path
+        table_name : str
             Name of the table folder.
+        stored : list[dict[str, Any]]
+            Records in their stored form.
+        stats : OperationStats | None
+            Counters of the running operation.
+
+        Returns
+        -------
+        list[str]
+            File ids of the saved records.
+
+        Raises
+        ------
+        DuplicateIdError
+            If a generated id is taken by a saved record or repeated in
+            the batch; the first record with it is still saved.
+        OSError
+            If a record file could not be written; the other records are
+            still saved.
         """
-        (self._storage / table).mkdir(parents=False, exist_ok=True)
-        with Path.open(self._storage / table / ".json", mode="w") as f:
-            json.dump({META.FILE_IDS: []}, f)
+        if not stored:
+            return []
+        storage = self._table_storage(table_name)
+        generator = self._meta[table_name][META.GENERATOR]
+        names: list[str | int]
+        if generator is None or isinstance(generator, int):
+            self._meta, ids = self._meta_storage.allocate_ids(
+                table_name, len(stored))
+            names = list(ids)
+        else:
+            names = [data[generator] for data in stored]
+        error: OSError | DuplicateIdError | None = None
+        if generator is not None and not isinstance(generator, int):
+            seen = storage.known([str(name) for name in names], stats)
+            items = []
+            for name, data in zip(names, stored, strict=True):
+                if str(name) in seen:
+                    error = error or self._duplicate(table_name, name)
+                    continue
+                seen.add(str(name))
+                items.append((name, data))
+            names = [name for name, _ in items]
+            stored = [data for _, data in items]
+        added: list[str] = []
+        added_records: list[dict[str, Any]] = []
+        try:
+            results = storage.write_records(
+                list(zip(names, stored, strict=True)),
+                new=generator is not None and not isinstance(generator, int))
+            for name, data, result in zip(names, stored, results,
+                                          strict=True):
+                if isinstance(result, OSError):
+                    # An existing file was taken by another process
+                    # since the check.
+                    error = error or (
+                        self._duplicate(table_name, name)
+                        if isinstance(result, FileExistsError) else result)
+                    continue
+                added.append(str(name))
+                added_records.append(data)
+                if stats is not None:
+                    stats.files_opened += 1
+                    stats.bytes_written += result
+            storage.commit(added, (), stats, added_records)
+        finally:
+            self._bump(table_name)
+        if error is not None:
+            raise error
+        return added
 
-    def new_data(self, table_name: str, data: dict[str, Any]) -> None:
-        """Save new data to the table.
+    def import_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     *,
+                     batch_size: int = BATCH_SIZE,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Stream records from a JSON lines file into a table.
+
+        See ``import_csv``; every line is one JSON object, with DATETIME
+        values as ISO 8601 strings and BYTES values as base85 strings.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read.
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of imported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of imported records.
+        """
+        return self._import_file(table_name, Path(path), JSONL, batch_size,
+                                 progress)
+
+    def import_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   *,
+                   batch_size: int = BATCH_SIZE,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Stream records from a CSV file into a table.
+
+        The file is read lazily, so memory stays bounded by one chunk.
+        Every chunk of ``batch_size`` records is validated column by
+        column and written like ``insert_many``: one id allocation and
+        one rewrite of the id list, Bloom filters and indexes per
+        chunk. Chunks before an invalid record stay imported.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to read, with a header row of column names. Empty
+            values are missing fields; other values are in the text form
+            of their column type (``true``/``false`` for BOOL, ISO 8601
+            for DATETIME, base85 for BYTES).
+        batch_size : int, optional
+            Records validated and written together, by default 10000.
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of imported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of imported records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        """
+        return self._import_file(table_name, Path(path), CSV, batch_size,
+                                 progress)
+
+    def _import_file(self,
+                     table_name: str,
+                     path: Path,
+                     fmt: str,
+                     batch_size: int,
+                     progress: Callable[[int, float], None] | None,
+                     ) -> int:
+        """Import a file chunk by chunk, see ``import_csv``."""
+        check_bulk(fmt, batch_size)
+        with observe(self._sink, f"import_{fmt}", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            schema = self._schema(table_name)
+            start = time.perf_counter()
+            total = 0
+            for chunk in chunked(read_rows(path, fmt, schema), batch_size):
+                self._insert_batch(table_name, schema.validate_many(chunk),
+                                   stats)
+                total += len(chunk)
+                if progress is not None:
+                    progress(total, time.perf_counter() - start)
+            return total
+
+    def export_jsonl(self,
+                     table_name: str,
+                     path: str | Path,
+                     condition: str | None = None,
+                     *,
+                     progress: Callable[[int, float], None] | None = None,
+                     ) -> int:
+        """Stream records of a table into a JSON lines file.
+
+        See ``export_csv``; every record is written as one JSON object.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        path : str | Path
+            File to write, replaced if it exists.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None (every
+            record).
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of exported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of exported records.
+        """
+        return self._export_file(table_name, Path(path), JSONL, condition,
+                                 progress)
+
+    def export_csv(self,
+                   table_name: str,
+                   path: str | Path,
+                   condition: str | None = None,
+                   *,
+                   progress: Callable[[int, float], None] | None = None,
+                   ) -> int:
+        """Stream records of a table into a CSV file.
+
+        Records are read and written in chunks instead of being
+        collected like ``find`` results, so memory stays bounded. A
+        condition narrows the records read like in ``find``.
 
         Parameters
         ----------
         table_name : str
             Name of the table.
+        path : str | Path
+            File to write, replaced if it exists. It starts with a
+            header row of the table columns.
+        condition : str | None, optional
+            Condition as accepted by ``find``, by default None (every
+            record).
+        progress : Callable[[int, float], None] | None, optional
+            Called after every chunk with the number of exported records
+            and the seconds elapsed, by default None.
+
+        Returns
+        -------
+        int
+            Number of exported records.
+
+        Raises
+        ------
+        ValueError
+            Table not found, column not found or invalid condition.
+        """
+        return self._export_file(table_name, Path(path), CSV, condition,
+                                 progress)
+
+    def _export_file(self,
+                     table_name: str,
+                     path: Path,
+                     fmt: str,
+                     condition: str | None,
+                     progress: Callable[[int, float], None] | None,
+                     ) -> int:
+        """Export records chunk by chunk, see ``export_csv``."""
+        check_bulk(fmt, BATCH_SIZE)
+        with observe(self._sink, f"export_{fmt}", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            storage = self._table_storage(table_name)
+            rows: Iterable[tuple[str, dict[str, Any]]]
+            if condition is None:
+                rows = storage.iter_records(storage.read_file_ids(stats),
+                                            stats)
+            else:
+                cond, value = self._parse_condition(table_name, condition)
+                access_path, names = self._plan(table_name, cond.column,
+                                                cond.operator, value, stats)
+                set_access_path(stats, access_path)
+                keep = row_filter(cond.column,
+                                  matcher(cond.operator, value))
+                rows = ((name, record) for name, record
+                        in storage.iter_records(names, stats)
+                        if keep(record))
+            start = time.perf_counter()
+            total = 0
+            with Path.open(path, "w", encoding="utf-8", newline="") as f:
+                writer = RowWriter(f, fmt, self._schema(table_name))
+                for chunk in chunked(rows, BATCH_SIZE):
+                    writer.write(record for _, record in chunk)
+                    total += len(chunk)
+                    if progress is not None:
+                        progress(total, time.perf_counter() - start)
+            return total
+
+    def _insert(self,
+                table_name: str,
+                data: dict[str, Any],
+                stats: OperationStats | None,
+                ) -> str:
+        """Save a checked record.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
         data : dict[str, Any]
             Record to save.
+        stats : OperationStats | None
+            Counters of the running operation.
+
+        Returns
+        -------
+        str
+            File id of the record.
+
+        Raises
+        ------
+        DuplicateIdError
+            If the generated id is taken by a saved record.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        if not self._check_table(table_name):
-            raise NotFoundTableError(table_name=table_name)
-        if not self._check_data(self._meta[table_name][META.COLUMNS], data):
-            raise DataIsUncorrectError(data=data)
-        file_name = ""
+        storage = self._table_storage(table_name)
+        file_name: str | int
+        new = False
         if (self._meta[table_name][META.GENERATOR] is None or
          isinstance(self._meta[table_name][META.GENERATOR], int)):
-            if self._id_generators.get(table_name) is None:
-                self._id_generators[table_name] = infinite_natural_numbers(
-                    self._meta[table_name][META.GENERATOR])
-            file_name = next(self._id_generators[table_name])
-            self._meta[table_name][META.GENERATOR] += 1
-            self._update_meta()
+            self._meta, ids = self._meta_storage.allocate_ids(
+                table_name, 1)
+            file_name = ids[0]
         else:
             file_name = data[self._meta[table_name][META.GENERATOR]]
-        with Path.open(
-                self._storage / table_name / f"{file_name}.json",
-                mode="w") as f:
-            json.dump(data, f)
-        with Path.open(self._storage / table_name / ".json", mode="r") as f:
-            data = json.load(f)
-            data[META.FILE_IDS].append(str(file_name))
-        with Path.open(self._storage / table_name / ".json", mode="w") as f:
-            json.dump(data, f)
+            if storage.known([str(file_name)], stats):
+                raise self._duplicate(table_name, file_name)
+            # Another process may take the id before the commit.
+            new = True
+        try:
+            try:
+                storage.write_record(file_name, data, stats, new=new)
+            except FileExistsError:
+                raise self._duplicate(table_name, file_name) from None
+            storage.commit([str(file_name)], (), stats, [data])
+        finally:
+            self._bump(table_name)
+        return str(file_name)
+
+    def _duplicate(self, table: str, file_id: str | int) -> DuplicateIdError:
+        """Return the error of a generated id that is already taken.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table folder.
+        file_id : str | int
+            The taken id.
+
+        Returns
+        -------
+        DuplicateIdError
+            Error naming the table without its prefix.
+        """
+        return DuplicateIdError(
+            file_id=str(file_id),
+            table_name=table.removeprefix(self._meta[META.TABLE_PREFIX]))
 
     def _check_table(self, table: str) -> bool:
         """Check whether a table exists.
@@ -152,84 +721,541 @@ class _DBsync(_DB):
         bool
             True if the table exists.
         """
+        if table in self._meta[META.TABLES]:
+            return True
+        # The table may have been created by another process.
+        self._load_meta()
         return table in self._meta[META.TABLES]
 
-    def _check_data(self, columns: dict[str, str],
-                    data: dict[str, Any]) -> bool:
-        """Validate data types for a record against table columns.
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["dict"] = ...,
+             ) -> list[dict[str, Any]]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["record"],
+             ) -> list[Record]: ...
+
+    @overload
+    def find(self,
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = ...,
+             descending: bool = ...,
+             limit: int | None = ...,
+             result_type: Literal["columns"],
+             ) -> dict[str, Sequence[Any]]: ...
+
+    def find(self,  # noqa: PLR0913 - keyword-only options
+             table_name: str,
+             condition: str,
+             *,
+             order_by: str | None = None,
+             descending: bool = False,
+             limit: int | None = None,
+             result_type: str = "dict",
+             ) -> (list[dict[str, Any]] | list[Record]
+                   | dict[str, Sequence[Any]]):
+        """Find records in a table matching a condition.
 
         Parameters
         ----------
-        columns : dict[str, str]
-            Column definitions for the table.
-        data : dict[str, Any]
-            Record to validate.
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition string: ``"id == 5"``, ``"name STARTSWITH 'Jo'"``
+            or ``"email CONTAINS '@corp'"`` (TEXT columns only).
+        order_by : str | None, optional
+            Column to sort the records by, by default None (``FILE_IDS``
+            order). Records without the column come last.
+        descending : bool, optional
+            Largest values first, by default False.
+        limit : int | None, optional
+            Maximum number of records to return, by default None (all).
+            With ``order_by`` a bounded heap keeps the first ``limit``
+            records, or the records are read in the order of an index on
+            ``order_by`` until ``limit`` of them match.
+        result_type : str, optional
+            ``"dict"`` (default) returns ``{file_id: record}`` dicts;
+            ``"record"`` returns instances of a slotted class generated
+            from the table columns, with a ``file_id`` attribute;
+            ``"columns"`` returns ``file_id`` and every column mapped to
+            one sequence of values (``array("q")`` for INT and
+            ``array("d")`` for FLOAT columns, lists otherwise).
 
         Returns
         -------
-        bool
-            True if the record matches the declared column types.
+        list[dict[str, Any]] | list[Record] | dict[str, Sequence[Any]]
+            Records that match the condition.
+
+        Raises
+        ------
+        ValueError
+            Table not found, column not found, invalid condition,
+            negative limit or unknown result type.
         """
-        for key, val in data.items():
-            if (self._change_type(val, columns[key]) != val):
-                return False
-        return True
+        with observe(self._sink, "find", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            cond, value = self._parse_condition(table_name, condition)
+            self._check_order(table_name, order_by, limit)
+            schema = self._schema(table_name)
+            schema.check_result_type(result_type)
+            order = None if order_by is None else (order_by, descending)
+            cache = self._result_cache
+            key = (cond.column, cond.operator, value, order, limit)
+            result = None
+            if cache is not None:
+                version = cache.version(table_name)
+                result = cache.get(table_name, key)
+                if result is not None and stats is not None:
+                    stats.cache_hits += 1
+                    stats.access_path = "cache"
+            if result is None:
+                rows = self._rows(table_name, cond, value, stats, order,
+                                  limit)
+                if cache is None:
+                    # Built while the records are read.
+                    collector = _Collector(schema, result_type)
+                    collector.extend(rows)
+                    return collector.result()
+                result = [{name: schema.decode(d)} for name, d in rows]
+                cache.put(table_name, key, version, result)
+            return schema.shape(result, result_type)
 
-    def find(self,
-             table_name: str,
-             condition: str,
-             ) -> list[dict[str, Any]]:
-        """Find records in a table matching a simple condition.
+    def explain(self,
+                table_name: str,
+                condition: str,
+                *,
+                order_by: str | None = None,
+                descending: bool = False,
+                limit: int | None = None,
+                ) -> dict[str, Any]:
+        """Report how ``find`` would locate records, without reading them.
 
         Parameters
         ----------
         table_name : str
             Name of the table.
         condition : str
-            Condition string, e.g. "id == 5".
+            Condition as accepted by ``find``.
+        order_by : str | None, optional
+            Column to sort by, as accepted by ``find``.
+        descending : bool, optional
+            Largest values first, by default False.
+        limit : int | None, optional
+            Maximum number of records, as accepted by ``find``.
 
         Returns
         -------
-        list[dict[str, Any]]
-            Records that match the condition.
+        dict[str, Any]
+            ``access_path`` (``"generator"``, ``"bloom"``, ``"index"``,
+            ``"numeric"``, ``"index_order"`` or ``"scan"``),
+            ``candidates``, the number of records that would at most be
+            read and verified, and ``sort`` (``None``, ``"index"``,
+            ``"heap"`` or ``"full"``).
 
         Raises
         ------
         ValueError
-            Table not found or column not found.
+            Table not found, column not found, invalid condition or
+            negative limit.
+        """
+        prefixed = self._meta[META.TABLE_PREFIX] + table_name
+        if not self._check_table(prefixed):
+            raise NotFoundTableError(table_name=prefixed)
+        cond, value = self._parse_condition(prefixed, condition)
+        self._check_order(prefixed, order_by, limit)
+        order = None if order_by is None else (order_by, descending)
+        access_path, names = self._plan(
+            prefixed, cond.column, cond.operator, value, None, order)
+        return {"table": table_name, "column": cond.column,
+                "operator": cond.operator, "value": value,
+                "access_path": access_path, "candidates": len(names),
+                "sort": sort_method(access_path, order, limit)}
+
+    def _parse_condition(self,
+                         table_name: str,
+                         condition: str,
+                         ) -> tuple[_Condition, Any]:
+        """Parse a condition and convert its value to the column type.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        condition : str
+            Condition passed to ``find``.
+
+        Returns
+        -------
+        tuple[_Condition, Any]
+            Parsed condition and typed value.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If the column does not exist.
+        InvalidConditionError
+            If a text operator is used on a non-TEXT column, or an
+            ordering on a BYTES column.
+        """
+        cond = parse_condition(condition)
+        if not self._check_column_in_table(table_name, cond.column):
+            raise NotFoundColumnError(column_name=cond.column,
+                                      table_name=table_name)
+        column_type = self._meta[table_name][META.COLUMNS][cond.column]
+        if cond.operator in TEXT_OPERATORS and column_type != "TEXT":
+            raise InvalidConditionError(
+                condition, f"{cond.operator} needs a TEXT column")
+        if cond.operator in ORDERINGS and column_type == "BYTES":
+            raise InvalidConditionError(
+                condition, f"{cond.operator} is undefined for BYTES")
+        return cond, self._schema(table_name).parse(cond.column, cond.value)
+
+    def _check_order(self,
+                     table_name: str,
+                     order_by: str | None,
+                     limit: int | None,
+                     ) -> None:
+        """Validate the ordering options of ``find``.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        order_by : str | None
+            Column to sort by.
+        limit : int | None
+            Maximum number of records.
+
+        Raises
+        ------
+        NotFoundColumnError
+            If ``order_by`` is not a column of the table.
+        ValueError
+            If ``limit`` is negative.
+        """
+        if (order_by is not None
+                and not self._check_column_in_table(table_name, order_by)):
+            raise NotFoundColumnError(column_name=order_by,
+                                      table_name=table_name)
+        if limit is not None and limit < 0:
+            msg = f"limit must not be negative, got {limit}"
+            raise ValueError(msg)
+
+    def _plan(self,  # noqa: PLR0913
+              table_name: str,
+              column_name: str,
+              operator: str,
+              value: Any,  # noqa: ANN401
+              stats: OperationStats | None,
+              order: tuple[str, bool] | None = None,
+              ) -> tuple[str, list[str]]:
+        """Choose how to locate records and list the file ids to read.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        column_name : str
+            Column of the condition.
+        operator : str
+            Operator of the condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None, optional
+            Column to sort by and whether descending. Without a narrower
+            access path an index on the column gives the read order.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            Access path and candidate file ids.
+        """
+        storage = self._table_storage(table_name)
+        if operator == EQ:
+            if self._meta[table_name][META.GENERATOR] == column_name:
+                if storage.might_contain(None, value):
+                    return "generator", [str(value)]
+                return "bloom", []
+            if not storage.might_contain(column_name, value):
+                return "bloom", []
+        lookups = [("index", storage.index_candidates),
+                   ("numeric", storage.numeric_candidates)]
+        if operator != EQ:
+            # Vectorized comparisons beat filtering distinct index values.
+            lookups.reverse()
+        for path, candidates in lookups:
+            names = candidates(column_name, operator, value, stats)
+            if names is not None:
+                return path, names
+        if order is not None:
+            names = storage.index_order(order[0], descending=order[1],
+                                        stats=stats)
+            if names is not None:
+                return "index_order", names
+        return "scan", storage.read_file_ids(stats)
+
+    def _lookup(self,  # noqa: PLR0913
+                table_name: str,
+                cond: _Condition,
+                value: Any,  # noqa: ANN401
+                stats: OperationStats | None,
+                order: tuple[str, bool] | None = None,
+                limit: int | None = None,
+                ) -> list[dict[str, Any]]:
+        """Read records matching a parsed condition.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        cond : _Condition
+            Parsed condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None, optional
+            Column to sort by and whether descending.
+        limit : int | None, optional
+            Maximum number of records.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Matching records keyed by file id.
+        """
+        return [{name: d} for name, d in self._rows(
+            table_name, cond, value, stats, order, limit)]
+
+    def _rows(self,  # noqa: PLR0913
+              table_name: str,
+              cond: _Condition,
+              value: Any,  # noqa: ANN401
+              stats: OperationStats | None,
+              order: tuple[str, bool] | None = None,
+              limit: int | None = None,
+              ) -> Iterable[tuple[str, dict[str, Any]]]:
+        """Read records matching a parsed condition, lazily if possible.
+
+        Without ``order_by`` records are read as the result is consumed.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        cond : _Condition
+            Parsed condition.
+        value : Any
+            Value converted to the column type.
+        stats : OperationStats | None
+            Counters of the running operation.
+        order : tuple[str, bool] | None, optional
+            Column to sort by and whether descending.
+        limit : int | None, optional
+            Maximum number of records.
+
+        Returns
+        -------
+        Iterable[tuple[str, dict[str, Any]]]
+            File ids and stored records in result order.
+        """
+        access_path, names = self._plan(table_name, cond.column,
+                                        cond.operator, value, stats, order)
+        set_access_path(stats, access_path)
+        storage = self._table_storage(table_name)
+        if access_path == "generator":
+            # The record file is named by the value.
+            data = storage.read_record(value, stats)
+            if isinstance(data, dict) and limit != 0:
+                return [(names[0], data)]
+            return []
+        if stats is not None and access_path in {"index", "numeric"}:
+            stats.candidates += len(names)
+        match = matcher(cond.operator, value)
+        rows: Iterable[tuple[str, dict[str, Any]]]
+        if (access_path == "scan" and self._scan_readahead is not None
+                and (limit is None or order is not None)):
+            # Every record is read anyway: read them in disk order.
+            rows = in_index_order(names, (
+                (name, d) for name, d in storage.iter_records(
+                    storage.physical_order(names), stats,
+                    self._scan_readahead)
+                if isinstance(d, dict) and cond.column in d
+                and match(d[cond.column])))
+        else:
+            rows = ((str(name), d)
+                    for name, d in storage.iter_records(names, stats)
+                    if isinstance(d, dict) and cond.column in d
+                    and match(d[cond.column]))
+        if order is not None and access_path != "index_order":
+            rows = order_rows(rows, order[0], descending=order[1],
+                              limit=limit)
+        elif limit is not None:
+            # Records already come in order: stop reading at the limit.
+            rows = islice(rows, limit)
+        return rows
+
+    def join(self,
+             left_table: str,
+             right_table: str,
+             on: str | tuple[str, str],
+             condition: str | None = None,
+             ) -> list[dict[str, dict[str, Any]]]:
+        """Join two tables on equal column values.
+
+        The left records are the ones matching ``condition`` (all records
+        without it). For every distinct join value the right records are
+        read straight from their files when the right column is the
+        ``id_generator`` of the table, or looked up in its column index,
+        as long as there are fewer values than right records. Otherwise
+        the smaller side is read once into a hash table and the larger
+        side is streamed through it.
+
+        Parameters
+        ----------
+        left_table : str
+            Name of the left table.
+        right_table : str
+            Name of the right table.
+        on : str | tuple[str, str]
+            Join column of both tables, or ``(left, right)`` columns.
+        condition : str | None, optional
+            Condition on the left table as accepted by ``find``, by
+            default None.
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            ``{"left": {file_id: record}, "right": {file_id: record}}``
+            for every pair of records with equal, present join values.
+            Pairs come in the order of the side that is streamed.
+
+        Raises
+        ------
+        NotFoundTableError
+            If a table does not exist.
+        NotFoundColumnError
+            If a join column does not exist.
+        """
+        with observe(self._sink, "join", left_table, condition) as stats:
+            prefix = self._meta[META.TABLE_PREFIX]
+            left, right = prefix + left_table, prefix + right_table
+            left_key, right_key = join_columns(on)
+            self._check_join_column(left, left_key)
+            self._check_join_column(right, right_key)
+            left_rows: list[Row] | Iterable[Row]
+            if condition is None:
+                left_storage = self._table_storage(left)
+                names = left_storage.read_file_ids(stats)
+                left_count = len(names)
+                left_rows = left_storage.iter_records(names, stats)
+            else:
+                cond, value = self._parse_condition(left, condition)
+                left_rows = [row for found in self._lookup(left, cond, value,
+                                                           stats)
+                             for row in found.items()]
+                left_count = len(left_rows)
+            right_storage = self._table_storage(right)
+            right_names = right_storage.read_file_ids(stats)
+            path = HASH
+            if left_count < len(right_names):
+                if self._meta[right][META.GENERATOR] == right_key:
+                    path = GENERATOR
+                elif right_key in right_storage.index_columns:
+                    path = INDEX
+            set_access_path(stats, path)
+            if path == HASH:
+                right_rows = right_storage.iter_records(right_names, stats)
+                if left_count <= len(right_names):
+                    return self._decode_pairs(left, right, probe_hash(
+                        build_hash(left_rows, left_key), right_rows,
+                        right_key, build_left=True))
+            else:
+                # Read only the right records of the left join values.
+                left_rows = list(left_rows)
+                names = right_storage.equal_ids(
+                    right_key, join_keys(left_rows, left_key),
+                    generator=path == GENERATOR, stats=stats)
+                right_rows = right_storage.iter_records(names, stats)
+            return self._decode_pairs(left, right, probe_hash(
+                build_hash(right_rows, right_key), left_rows, left_key,
+                build_left=False))
+
+    def _check_join_column(self, table_name: str, column_name: str) -> None:
+        """Check a table and its join column exist.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        column_name : str
+            Join column.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
         if not self._check_table(table_name):
             raise NotFoundTableError(table_name=table_name)
-        column_name, value = condition.replace(" ", "").split("==")
         if not self._check_column_in_table(table_name, column_name):
             raise NotFoundColumnError(column_name=column_name,
                                       table_name=table_name)
-        value = self._change_type(value,
-                                  self._meta[table_name][META.COLUMNS][column_name])
-        if self._meta[table_name][META.GENERATOR] == column_name:
-            try:
-                with Path.open(
-                    self._storage / table_name / f"{value}.json",
-                    mode="r") as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return [{str(value): data}]
-                    return []
-            except FileNotFoundError:
-                return []
-        with Path.open(
-            self._storage / table_name / ".json",mode="r") as f:
-            data = json.load(f)
-            names = data[META.FILE_IDS]
-        result: list[dict[str, Any]] = []
-        for name in names:
-            with Path.open(
-                    self._storage / table_name / f"{name}.json",
-                    mode="r") as f:
-                d = json.load(f)
-                if d[column_name] == value and isinstance(d, dict):
-                    result.append({str(name): d})
+
+    def _decode_pairs(self,
+                      left: str,
+                      right: str,
+                      result: list[dict[str, dict[str, Any]]],
+                      ) -> list[dict[str, dict[str, Any]]]:
+        """Turn stored records of a ``join`` result into API values.
+
+        Parameters
+        ----------
+        left : str
+            Name of the left table folder.
+        right : str
+            Name of the right table folder.
+        result : list[dict[str, dict[str, Any]]]
+            Joined pairs, as read. A record may be part of several pairs.
+
+        Returns
+        -------
+        list[dict[str, dict[str, Any]]]
+            The same result.
+        """
+        decoded: set[int] = set()
+        for side, table in (("left", left), ("right", right)):
+            schema = self._schema(table)
+            if not schema.codec:
+                continue
+            for row in result:
+                for record in row[side].values():
+                    if id(record) not in decoded:
+                        decoded.add(id(record))
+                        schema.decode(record)
         return result
 
     def _check_column_in_table(self, table_name: str, column_name: str) -> bool:
@@ -249,56 +1275,260 @@ class _DBsync(_DB):
         """
         return column_name in self._meta[table_name][META.COLUMNS]
 
-    def _change_type(self, value: str, column_type: str) -> Any:  # noqa: ANN401
-        """Change data type.
+    def update(self,
+               table_name: str,
+               file_id: str,
+               new_data: dict[str, Any],
+               ) -> None:
+        """Update data with file_id.
+
+        Get file_id from find method.
+
+        Parameters
+        ----------
+        file_id : str
+            unique  file name
+        new_data : dict[str, Any]
+            new data when need save
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a field is not a column.
+        DataIsUncorrectError
+            If a value does not have the column type.
+        """
+        with observe(self._sink, "update", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            new_data = self._check_changes(table_name, new_data)
+            storage = self._table_storage(table_name)
+            try:
+                storage.write_record(file_id, new_data, stats)
+                storage.record_updated(file_id, new_data)
+            finally:
+                self._bump(table_name)
+
+    def patch(self,
+              table_name: str,
+              file_id: str,
+              changes: dict[str, Any],
+              ) -> bool:
+        """Change some fields of a record.
+
+        Fields equal to the stored values are ignored. When nothing
+        changes, the record is not written and no filter, index or cached
+        result is touched; otherwise only the indexes of changed columns
+        are updated.
 
         Parameters
         ----------
-        value : str
-            value
-        column_type : str
-            data type
+        table_name : str
+            Name of the table.
+        file_id : str
+            Name of file in table, as returned by ``find``.
+        changes : dict[str, Any]
+            New values of some columns.
 
         Returns
         -------
-        Any
-            correct data type
+        bool
+            True if the record was written.
 
         Raises
         ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a changed column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or the ``id_generator`` column,
+            which names the record file, would change.
+        FileNotFoundError
+            If the record does not exist.
+        """
+        with observe(self._sink, "patch", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            changes = self._check_changes(table_name, changes)
+            generator = self._meta[table_name][META.GENERATOR]
+            if (isinstance(generator, str) and generator in changes
+                    and str(changes[generator]) != str(file_id)):
+                raise DataIsUncorrectError(data=changes)
+            storage = self._table_storage(table_name)
+            if not storage.might_contain(None, file_id):
+                raise storage.not_found(file_id)
+            return self._patch(table_name, file_id, changes, stats)
+
+    def upsert(self,
+               table_name: str,
+               data: dict[str, Any],
+               *,
+               on: str | None = None,
+               ) -> str:
+        """Insert a record, or patch the record with the same key.
+
+        An ``id_generator`` key saved by another process after the lookup
+        is patched instead of inserted twice.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        data : dict[str, Any]
+            Record to save.
+        on : str | None, optional
+            Key column, by default the ``id_generator`` column. Other
+            columns are looked up like ``find`` does, preferably through
+            an index.
+
+        Returns
+        -------
+        str
+            File id of the inserted or patched record.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or the key is missing.
         ValueError
-            if column_type is unknown
+            If no ``on`` is given for a table without an ``id_generator``
+            column.
         """
-        match column_type:
-            case "INT":
-                return int(value)
-            case "TEXT":
-                return str(value)
-            case _:
-                raise UnknownDataTypeError
+        with observe(self._sink, "upsert", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            data = self._check_changes(table_name, data)
+            key = self._upsert_key(table_name, on)
+            if key not in data:
+                raise DataIsUncorrectError(data=data)
+            storage = self._table_storage(table_name)
+            if key == self._meta[table_name][META.GENERATOR]:
+                set_access_path(stats, "generator")
+                file_id: str | None = str(data[key])
+                if not storage.might_contain(None, file_id):
+                    file_id = None
+            else:
+                access_path, names = self._plan(table_name, key, EQ,
+                                                data[key], stats)
+                set_access_path(stats, access_path)
+                file_id = next(
+                    (name for name, record in storage.iter_records(names,
+                                                                   stats)
+                     if record.get(key) == data[key]), None)
+            if file_id is not None:
+                try:
+                    self._patch(table_name, file_id, data, stats)
+                except FileNotFoundError:
+                    pass
+                else:
+                    return file_id
+            try:
+                return self._insert(table_name, data, stats)
+            except DuplicateIdError as e:
+                # Inserted by another process since the lookup.
+                self._patch(table_name, e.file_id, data, stats)
+                return e.file_id
 
+    def _check_changes(self,
+                       table_name: str,
+                       data: dict[str, Any],
+                       ) -> dict[str, Any]:
+        """Check a table exists and values fit its columns.
 
-    def update(self,
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        data : dict[str, Any]
+            Values by column.
+
+        Returns
+        -------
+        dict[str, Any]
+            Values in their stored form.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type.
+        """
+        if not self._check_table(table_name):
+            raise NotFoundTableError(table_name=table_name)
+        return self._schema(table_name).validate(data)
+
+    def _upsert_key(self, table_name: str, on: str | None) -> str:
+        """Return the key column of an upsert.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table folder.
+        on : str | None
+            Key column given by the caller.
+
+        Returns
+        -------
+        str
+            ``on``, or the ``id_generator`` column.
+
+        Raises
+        ------
+        ValueError
+            If there is no key column.
+        """
+        if on is not None:
+            return on
+        generator = self._meta[table_name][META.GENERATOR]
+        if not isinstance(generator, str):
+            msg = f"upsert into {table_name} needs an 'on' column"
+            raise ValueError(msg)  # noqa: TRY004
+        return generator
+
+    def _patch(self,
                table_name: str,
                file_id: str,
-               new_data: dict[str, Any],
-               ) -> None:
-        """Update data with file_id.
-
-        Get file_id from find method.
+               changes: dict[str, Any],
+               stats: OperationStats | None,
+               ) -> bool:
+        """Write changed fields and invalidate cached results if any.
 
         Parameters
         ----------
+        table_name : str
+            Name of the table folder.
         file_id : str
-            unique  file name
-        new_data : dict[str, Any]
-            new data when need save
+            Name of file in table.
+        changes : dict[str, Any]
+            Checked new values.
+        stats : OperationStats | None
+            Counters of the running operation.
+
+        Returns
+        -------
+        bool
+            True if the record was written.
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        with Path.open(
-            self._storage / table_name / f"{file_id}.json",
-            mode="w") as f:
-            json.dump(new_data, f)
+        try:
+            changed = self._table_storage(table_name).patch_record(
+                file_id, changes, stats)
+        except FileNotFoundError:
+            raise
+        except BaseException:
+            self._bump(table_name)
+            raise
+        if changed:
+            self._bump(table_name)
+        return bool(changed)
 
     def delete(self,
                 table_name: str,
@@ -313,12 +1543,243 @@ class _DBsync(_DB):
         file_id : str
             name of file in table
         """
-        table_name = self._meta[META.TABLE_PREFIX] + table_name
-        if not (self._storage / table_name / f"{file_id}.json").exists():
-            raise FileNotFoundError
-        (self._storage / table_name / f"{file_id}.json").unlink()
-        with Path.open(self._storage / table_name / ".json") as f:
-            data = json.load(f)
-        data[META.FILE_IDS].remove(str(file_id))
-        with Path.open(self._storage / table_name / ".json", "w") as f:
-            json.dump(data, f)
+        with observe(self._sink, "delete", table_name,
+                     access_path="file_id") as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            storage = self._table_storage(table_name)
+            if not storage.might_contain(None, file_id):
+                raise storage.not_found(file_id)
+            try:
+                # Raises FileNotFoundError when the record does not exist.
+                storage.remove_record(file_id)
+                storage.commit((), [str(file_id)], stats)
+            finally:
+                self._bump(table_name)
+
+    def delete_where(self, table_name: str, condition: str) -> int:
+        """Delete every record matching a condition.
+
+        Matching records are located like ``find`` does, their files are
+        removed, and the file id list and column indexes are rewritten
+        once for all of them.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition as accepted by ``find``.
+
+        Returns
+        -------
+        int
+            Number of deleted records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        OSError
+            If a record file could not be removed; the other records are
+            still deleted.
+        """
+        with observe(self._sink, "delete_where", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            cond, value = self._parse_condition(table_name, condition)
+            names = [name for found in self._lookup(table_name, cond, value,
+                                                    stats)
+                     for name in found]
+            if not names:
+                return 0
+            storage = self._table_storage(table_name)
+            try:
+                errors = storage.remove_records(names)
+                dropped, deleted, error = removed_ids(names, errors)
+                storage.commit((), dropped, stats)
+            finally:
+                self._bump(table_name)
+            if error is not None:
+                raise error
+            return deleted
+
+    def update_where(self,
+                     table_name: str,
+                     condition: str,
+                     changes: dict[str, Any],
+                     ) -> int:
+        """Change fields of every record matching a condition.
+
+        Records whose fields already have the new values are not
+        written. Changed values are added to Bloom filters and column
+        indexes once for all records.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        condition : str
+            Condition as accepted by ``find``.
+        changes : dict[str, Any]
+            New values of some columns.
+
+        Returns
+        -------
+        int
+            Number of written records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If a changed column does not exist.
+        DataIsUncorrectError
+            If a value has the wrong type or would change the
+            ``id_generator`` column.
+        OSError
+            If a record file could not be written; the other records are
+            still changed.
+        """
+        with observe(self._sink, "update_where", table_name,
+                     condition) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            changes = self._check_changes(table_name, changes)
+            if self._meta[table_name][META.GENERATOR] in changes:
+                raise DataIsUncorrectError(data=changes)
+            cond, value = self._parse_condition(table_name, condition)
+            items = [(name, record, diff)
+                     for found in self._lookup(table_name, cond, value, stats)
+                     for name, record in found.items()
+                     if (diff := changed_fields(record, changes))]
+            if not items:
+                return 0
+            storage = self._table_storage(table_name)
+            try:
+                results = storage.write_records(
+                    [(name, record | diff) for name, record, diff in items])
+                written, error = written_ids(items, results, stats)
+                storage.records_changed(written)
+            finally:
+                self._bump(table_name)
+            if error is not None:
+                raise error
+            return len(written)
+
+    def create_index(self,
+                     table_name: str,
+                     column_name: str,
+                     ) -> int:
+        """Index a column for ``==``, ``STARTSWITH`` and ``CONTAINS``.
+
+        The index keeps distinct values sorted for prefix lookups and
+        splits TEXT values into trigrams for substring lookups. Every
+        later write keeps it up to date.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            Column to index.
+
+        Returns
+        -------
+        int
+            Number of indexed records.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
+        """
+        with observe(self._sink, "create_index", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            if not self._check_column_in_table(table_name, column_name):
+                raise NotFoundColumnError(column_name=column_name,
+                                          table_name=table_name)
+            storage = self._table_storage(table_name)
+            return storage.build_index(column_name, stats)
+
+    def create_numeric_index(self,
+                             table_name: str,
+                             column_name: str,
+                             ) -> int:
+        """Keep an int64 sidecar of an INT column for comparisons.
+
+        The column values of every record are written as contiguous
+        int64 values to ``.num-<column>``, with their file ids in
+        ``.numids-<column>``, and every later write appends to them.
+        With NumPy installed, ``find`` evaluates ``==``, ``!=``, ``<``,
+        ``<=``, ``>`` and ``>=`` on a memory map of the values as one
+        vectorized mask and reads only the matching records. Without
+        NumPy the sidecar is kept up to date but not used.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        column_name : str
+            INT column.
+
+        Returns
+        -------
+        int
+            Number of rows in the sidecar.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        NotFoundColumnError
+            If the column does not exist.
+        ValueError
+            If the column is not INT.
+        """
+        with observe(self._sink, "create_numeric_index",
+                     table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            if not self._check_column_in_table(table_name, column_name):
+                raise NotFoundColumnError(column_name=column_name,
+                                          table_name=table_name)
+            column_type = self._meta[table_name][META.COLUMNS][column_name]
+            if column_type != "INT":
+                msg = f"{column_name} is {column_type}, not INT"
+                raise ValueError(msg)
+            storage = self._table_storage(table_name)
+            return storage.build_numeric(column_name, stats)
+
+    def compact(self, table_name: str) -> int:
+        """Drop ids of missing records and rebuild Bloom filters.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            Number of file ids dropped from the index.
+
+        Raises
+        ------
+        NotFoundTableError
+            If the table does not exist.
+        """
+        with observe(self._sink, "compact", table_name) as stats:
+            table_name = self._meta[META.TABLE_PREFIX] + table_name
+            if not self._check_table(table_name):
+                raise NotFoundTableError(table_name=table_name)
+            try:
+                return self._table_storage(table_name).compact(stats)
+            finally:
+                self._bump(table_name)
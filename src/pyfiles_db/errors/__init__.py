@@ -18,6 +18,8 @@
 from .eror_path_not_avaible import PathNotAvaibleError
 from .error_data_is_uncorrect import DataIsUncorrectError
 from .error_db_not_loaded import DbNotLoadedError
+from .error_duplicate_id import DuplicateIdError
+from .error_invalid_condition import InvalidConditionError
 from .error_not_found import NotFoundColumnError, NotFoundTableError
 from .error_unknown_data_type import UnknownDataTypeError
 from .table_already_exist import TableAlreadyAvaibleError
@@ -25,6 +27,8 @@ from .table_already_exist import TableAlreadyAvaibleError
 __all__ = [
            "DataIsUncorrectError",
            "DbNotLoadedError",
+           "DuplicateIdError",
+           "InvalidConditionError",
            "NotFoundColumnError",
            "NotFoundTableError",
            "PathNotAvaibleError",
@@ -0,0 +1,49 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Error DuplicateIdError."""
+
+class DuplicateIdError(Exception):
+    """Raised when a new record reuses the file id of a saved record.
+
+    Parameters
+    ----------
+    Exception : _type_
+        Base exception
+    """
+
+    def __init__(self, file_id: str, table_name: str) -> None:
+        """Init.
+
+        Parameters
+        ----------
+        file_id : str
+            File id that is already taken.
+        table_name : str
+            Name of the table.
+        """
+        self.file_id = file_id
+        self.table_name = table_name
+        super().__init__(f"Id '{file_id}' already exists in {table_name}.")
+
+    def __str__(self) -> str:
+        """Print Exception.
+
+        Returns
+        -------
+        str
+            String info message
+        """
+        return (f"ERROR: ID **'{self.file_id}'** already exists in "
+                f"TABLE **'{self.table_name}'**")
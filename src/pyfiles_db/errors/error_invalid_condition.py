@@ -0,0 +1,48 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Eror InvalidConditionError."""
+
+class InvalidConditionError(ValueError):
+    """Error InvalidConditionError.
+
+    Parameters
+    ----------
+    ValueError : _type_
+        Base exception
+    """
+
+    def __init__(self, condition: str, reason: str) -> None:
+        """Init.
+
+        Parameters
+        ----------
+        condition : str
+            condition passed to find
+        reason : str
+            why the condition can not be used
+        """
+        self.condition = condition
+        self.reason = reason
+        super().__init__(f"Invalid condition '{condition}': {reason}.")
+
+    def __str__(self) -> str:
+        """Print Exception.
+
+        Returns
+        -------
+        str
+            String info message
+        """
+        return f"Invalid condition '{self.condition}': {self.reason}."
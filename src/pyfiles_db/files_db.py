@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from pyfiles_db.database_manager import META, _DBasync, _DBsync
+from pyfiles_db.database_manager.meta import META
 
 try:
     from typing import Self
@@ -24,16 +24,18 @@ except ImportError:
     from typing_extensions import Self  # noqa: UP035 for Python < 3.11
 
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from .errors import (
-    PathNotAvaibleError,
-)
-
 if TYPE_CHECKING:
-    from pyfiles_db.database_manager._db import _AsyncDB
+    from pyfiles_db.database_manager import (
+        _DBasync,
+        _DBclient,
+        _DBclientAsync,
+        _DBsync,
+    )
+    from pyfiles_db.metrics import MetricsSink, SlowQueryLog
+    from pyfiles_db.utils import ResultCache
 
 BASE_PATH_STORAGE = Path(__file__).parent.parent.parent / "database"
 
@@ -58,16 +60,22 @@ class FilesDB:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def init_sync(self,
+    def init_sync(self,  # noqa: PLR0913 - keyword-only options
              storage: Path | str | None = None,
              *,
              meta_file: str = "meta.json",
              meta: dict[str, Any] | None = None,
+             metrics: MetricsSink | None = None,
+             slow_query_log: SlowQueryLog | None = None,
+             result_cache: ResultCache | None = None,
+             bloom_max_age: float = 0.0,
+             scan_readahead: int | None = None,
             ) -> _DBsync:
         """Initialize a new synchronous database connection.
 
         If a database is already loaded this returns a connection. If not,
-        creates the base meta information and returns a new connection.
+        returns a new connection that creates the base meta information on
+        first use.
 
         Parameters
         ----------
@@ -75,28 +83,62 @@ class FilesDB:
             Path to database location, by default None
         meta_file : str, optional
             Name of meta file, by default "meta.json"
+        metrics : MetricsSink | None, optional
+            Receiver of per-operation counters, e.g. an
+            ``InMemoryRegistry``, by default None (off).
+        slow_query_log : SlowQueryLog | None, optional
+            Log of queries slower than its threshold, by default None
+            (off).
+        result_cache : ResultCache | None, optional
+            Cache of ``find`` results, invalidated by writes to the
+            table, by default None (off).
+        bloom_max_age : float, optional
+            Seconds a loaded Bloom filter is trusted without a ``stat``
+            for changes by other processes, by default 0.0.
+        scan_readahead : int | None, optional
+            Read full scans in inode order with this many record files
+            announced ahead, by default None (index order).
 
         Returns
         -------
         _DBsync
             Synchronous database manager instance.
         """
-        storage = self._configure_database(
+        from pyfiles_db.database_manager.sync_db import (  # noqa: PLC0415
+            _DBsync,
+        )
+
+        storage, initial_meta = self._configure_database(
             storage=storage,
             meta_file=meta_file,
             meta=meta)
-        return _DBsync(storage=storage, meta_file=self._meta_file)
-
-    def init_async(self,
+        return _DBsync(storage=storage,
+                       meta_file=self._meta_file,
+                       metrics=metrics,
+                       slow_query_log=slow_query_log,
+                       initial_meta=initial_meta,
+                       result_cache=result_cache,
+                       bloom_max_age=bloom_max_age,
+                       scan_readahead=scan_readahead)
+
+    def init_async(self,  # noqa: PLR0913 - keyword-only options
              storage: Path | str | None = None,
              *,
              meta_file: str = "meta.json",
              meta: dict[str, Any] | None = None,
-            ) -> _AsyncDB:
+             write_window: float = 0.0,
+             io_workers: int | None = None,
+             metrics: MetricsSink | None = None,
+             slow_query_log: SlowQueryLog | None = None,
+             result_cache: ResultCache | None = None,
+             bloom_max_age: float = 0.0,
+             scan_readahead: int | None = None,
+            ) -> _DBasync:
         """Initialize a new asynchronous database connection.
 
         If a database is already loaded this returns a connection. If not,
-        creates the base meta information and returns a new async manager.
+        returns a new async manager that creates the base meta information
+        on first use.
 
         Parameters
         ----------
@@ -104,32 +146,128 @@ class FilesDB:
             Path to database location, by default None
         meta_file : str, optional
             Name of meta file, by default "meta.json"
+        write_window : float, optional
+            Seconds to collect concurrent writes of one table into a
+            single index and meta write, by default 0.0
+        io_workers : int | None, optional
+            Threads of the dedicated I/O pool, by default sized from the
+            CPU count. 0 dispatches every file call through ``aiofiles``.
+        metrics : MetricsSink | None, optional
+            Receiver of per-operation counters, e.g. an
+            ``InMemoryRegistry``, by default None (off).
+        slow_query_log : SlowQueryLog | None, optional
+            Log of queries slower than its threshold, by default None
+            (off).
+        result_cache : ResultCache | None, optional
+            Cache of ``find`` results, invalidated by writes to the
+            table, by default None (off).
+        bloom_max_age : float, optional
+            Seconds a loaded Bloom filter is trusted without a ``stat``
+            for changes by other processes, by default 0.0.
+        scan_readahead : int | None, optional
+            Read full scans in inode order with this many record files
+            announced ahead, by default None (index order).
 
         Returns
         -------
-        _AsyncDB
+        _DBasync
             Asynchronous database manager instance.
         """
-        storage = self._configure_database(
+        from pyfiles_db.database_manager.async_db import (  # noqa: PLC0415
+            _DBasync,
+        )
+
+        storage, initial_meta = self._configure_database(
             storage=storage,
             meta_file=meta_file,
             meta=meta)
-        return _DBasync(storage=storage, meta_file=self._meta_file)
+        return _DBasync(storage=storage,
+                        meta_file=self._meta_file,
+                        write_window=write_window,
+                        io_workers=io_workers,
+                        metrics=metrics,
+                        slow_query_log=slow_query_log,
+                        initial_meta=initial_meta,
+                        result_cache=result_cache,
+                        bloom_max_age=bloom_max_age,
+                        scan_readahead=scan_readahead)
+
+    def connect_sync(self,
+                     socket: Path | str,
+                     *,
+                     timeout: float | None = None,
+                     ) -> _DBclient:
+        """Connect to a ``python -m pyfiles_db serve`` server.
+
+        Parameters
+        ----------
+        socket : Path | str
+            Path of the server socket.
+        timeout : float | None, optional
+            Seconds to wait for an answer, by default None (forever).
+
+        Returns
+        -------
+        _DBclient
+            Client with the API of the synchronous manager.
+        """
+        from pyfiles_db.database_manager.client import (  # noqa: PLC0415
+            _DBclient,
+        )
+
+        return _DBclient(socket, timeout)
+
+    def connect_async(self, socket: Path | str) -> _DBclientAsync:
+        """Connect to a ``python -m pyfiles_db serve`` server (async).
+
+        Parameters
+        ----------
+        socket : Path | str
+            Path of the server socket, connected on the first call.
+
+        Returns
+        -------
+        _DBclientAsync
+            Client with the API of the asynchronous manager.
+        """
+        from pyfiles_db.database_manager.client import (  # noqa: PLC0415
+            _DBclientAsync,
+        )
+
+        return _DBclientAsync(socket)
 
     def _configure_database(
                             self,
                             storage: str | Path | None,
                             meta_file: str,
                             meta: dict[str, Any] | None,
-                           )-> str | Path:
+                           )-> tuple[str | Path, dict[str, Any]]:
+        """Resolve storage path and meta information of a new database.
+
+        No files are touched here: the manager creates the storage folder
+        and meta file on first use.
+
+        Parameters
+        ----------
+        storage : str | Path | None
+            Path to database location, None for the default one.
+        meta_file : str
+            Name of meta file.
+        meta : dict[str, Any] | None
+            Raw meta information from user.
+
+        Returns
+        -------
+        tuple[str | Path, dict[str, Any]]
+            Storage path and meta information written if the database
+            does not exist yet.
+        """
         if meta is None:
             meta = {}
         self._meta_file = meta_file
         if storage is None:
             storage = BASE_PATH_STORAGE
-        if self._check_storage(storage=storage):
-            self._create_base_meta_information(storage, meta=meta)
-        return storage
+        return storage, self._configure_meta(meta)
 
     def _base_meta(self) -> dict[str, Any]:
         """Return base meta information.
@@ -186,52 +324,3 @@ class FilesDB:
             self._valid_key_value(key, value)
             new_meta[key] = value
         return new_meta
-
-
-    def _create_base_meta_information(self,
-                                      storage: str | Path,
-                                      meta: dict[str, Any]) -> None:
-        """Create base meta structure files.
-
-        Parameters
-        ----------
-        storage : str | Path
-            path to database location
-        meta : dict[str, Any]
-           raw meta information from user
-        """
-        meta = self._configure_meta(meta)
-        storage = Path(storage)
-        with Path.open(storage / self._meta_file, "w") as f:
-            json.dump(meta, f)
-
-    def _check_storage(self, storage: str | Path) -> bool:
-        """Check storage availability and create folder if needed.
-
-        Parameters
-        ----------
-        storage : str | Path
-            Path to database location.
-
-        Returns
-        -------
-        bool
-            True if the meta file already exists (database exists).
-            False if the meta file does not exist yet.
-
-        Raises
-        ------
-        PathNotAvaibleError
-            If the path is not available.
-        NotADirectoryError
-            If the path exists but is not a directory.
-        """
-        storage = Path(storage)
-        storage.mkdir(parents=True, exist_ok=True)
-        if not storage.exists():
-            raise PathNotAvaibleError
-        if not storage.is_dir():
-            raise NotADirectoryError
-        return not (storage / self._meta_file).exists()
-
-
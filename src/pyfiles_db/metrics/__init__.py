@@ -0,0 +1,43 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metrics of database operations."""
+
+from typing import TYPE_CHECKING
+
+from pyfiles_db.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .operation_stats import OperationStats
+    from .registry import Histogram, InMemoryRegistry
+    from .sink import CallbackSink, MetricsSink
+    from .slow_query import SlowQueryLog
+
+__all__ = [
+    "CallbackSink",
+    "Histogram",
+    "InMemoryRegistry",
+    "MetricsSink",
+    "OperationStats",
+    "SlowQueryLog",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OperationStats": ".operation_stats",
+    "Histogram": ".registry",
+    "InMemoryRegistry": ".registry",
+    "CallbackSink": ".sink",
+    "MetricsSink": ".sink",
+    "SlowQueryLog": ".slow_query",
+})
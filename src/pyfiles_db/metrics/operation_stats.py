@@ -0,0 +1,72 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Counters of a single database operation."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """What one call of a database manager did.
+
+    The manager fills these counters while the operation runs and hands
+    the object to the metrics sink when it finishes. ``access_path`` tells
+    how records were located: ``"generator"`` (file named by the
+    condition value), ``"scan"`` (every record of the table),
+    ``"file_id"`` (file id given by the caller), ``"cache"`` (result
+    cache hit), ``"coalesced"`` (result of an identical ``find`` already
+    running, see ``coalesced``), ``"bloom"`` (absent key rejected by a
+    Bloom filter), ``"index"`` (``candidates`` file ids selected by a
+    column index, then read and verified) or ``"numeric"``
+    (``candidates`` selected by a vectorized comparison on an int64
+    sidecar, then verified).
+
+    Parameters
+    ----------
+    operation : str
+        Name of the method, e.g. ``"find"``.
+    table : str
+        Name of the table.
+    """
+
+    operation: str
+    table: str
+    condition: str | None = None
+    access_path: str | None = None
+    elapsed: float = 0.0
+    error: bool = False
+    files_opened: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    records_decoded: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    candidates: int = 0
+
+    def merge(self, other: "OperationStats") -> None:
+        """Add the I/O counters of ``other`` to this operation.
+
+        Parameters
+        ----------
+        other : OperationStats
+            Counters collected by a part of this operation.
+        """
+        self.files_opened += other.files_opened
+        self.bytes_read += other.bytes_read
+        self.bytes_written += other.bytes_written
+        self.records_decoded += other.records_decoded
+        self.cache_hits += other.cache_hits
+        self.coalesced += other.coalesced
+        self.candidates += other.candidates
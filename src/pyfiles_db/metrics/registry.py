@@ -0,0 +1,246 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory metrics registry."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyfiles_db.metrics.operation_stats import OperationStats
+
+# Upper bounds of latency buckets in seconds, as used by Prometheus clients.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Counters summed per operation and table.
+COUNTERS = ("calls", "errors", "files_opened", "bytes_read", "bytes_written",
+            "records_decoded", "cache_hits", "coalesced", "candidates")
+
+
+@dataclass
+class Histogram:
+    """Latency histogram with fixed buckets.
+
+    ``counts[i]`` is the number of observations in ``buckets[i - 1] <
+    x <= buckets[i]``; the last count is the ``+Inf`` bucket.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Create empty buckets."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add an observation.
+
+        Parameters
+        ----------
+        value : float
+            Latency in seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of its bucket.
+
+        Parameters
+        ----------
+        q : float
+            Quantile in ``[0, 1]``.
+
+        Returns
+        -------
+        float
+            Upper bound of the bucket holding the quantile, ``inf`` for
+            the overflow bucket and 0.0 without observations.
+        """
+        count = sum(self.counts)
+        if not count:
+            return 0.0
+        rank = max(1, math.ceil(q * count))
+        seen = 0
+        for bound, bucket in zip((*self.buckets, math.inf), self.counts,
+                                 strict=True):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return math.inf  # pragma: no cover - counts always reach rank
+
+
+class InMemoryRegistry:
+    """Sink aggregating operations per (operation, table).
+
+    Thread safe. ``snapshot`` returns plain data that can be exported,
+    and ``exposition`` renders the Prometheus text format.
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...], optional
+        Upper bounds of latency buckets in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Init registry.
+
+        Parameters
+        ----------
+        buckets : tuple[float, ...], optional
+            Upper bounds of latency buckets in seconds.
+        """
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, str], dict[str, int]] = {}
+        self._latency: dict[tuple[str, str], Histogram] = {}
+
+    def record(self, stats: OperationStats) -> None:
+        """Aggregate a finished operation.
+
+        Parameters
+        ----------
+        stats : OperationStats
+            Counters of the operation.
+        """
+        key = (stats.operation, stats.table)
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = dict.fromkeys(COUNTERS, 0)
+                self._latency[key] = Histogram(self._buckets)
+            counters["calls"] += 1
+            counters["errors"] += stats.error
+            counters["files_opened"] += stats.files_opened
+            counters["bytes_read"] += stats.bytes_read
+            counters["bytes_written"] += stats.bytes_written
+            counters["records_decoded"] += stats.records_decoded
+            counters["cache_hits"] += stats.cache_hits
+            counters["coalesced"] += stats.coalesced
+            counters["candidates"] += stats.candidates
+            self._latency[key].observe(stats.elapsed)
+
+    def counters(self, operation: str, table: str) -> dict[str, int]:
+        """Return counters of an operation on a table.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the operation.
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        dict[str, int]
+            Counters, all zero if nothing was recorded.
+        """
+        with self._lock:
+            return dict(self._counters.get((operation, table),
+                                           dict.fromkeys(COUNTERS, 0)))
+
+    def histogram(self, operation: str, table: str) -> Histogram:
+        """Return a copy of the latency histogram.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the operation.
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        Histogram
+            Latency histogram, empty if nothing was recorded.
+        """
+        with self._lock:
+            histogram = self._latency.get((operation, table))
+            if histogram is None:
+                return Histogram(self._buckets)
+            return Histogram(histogram.buckets, list(histogram.counts),
+                             histogram.total)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return everything recorded so far.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One entry per (operation, table) with counters, latency sum
+            and bucket counts.
+        """
+        with self._lock:
+            return [{
+                "operation": operation,
+                "table": table,
+                **counters,
+                "latency_sum": self._latency[operation, table].total,
+                "latency_buckets": dict(zip(
+                    (*self._buckets, math.inf),
+                    self._latency[operation, table].counts,
+                    strict=True)),
+            } for (operation, table), counters in self._counters.items()]
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._counters.clear()
+            self._latency.clear()
+
+    def exposition(self, prefix: str = "pyfiles_db") -> str:
+        """Render metrics in the Prometheus text format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of metric names, by default "pyfiles_db".
+
+        Returns
+        -------
+        str
+            Counters as ``<prefix>_<counter>_total`` and latency as the
+            ``<prefix>_operation_seconds`` histogram.
+        """
+        lines: list[str] = []
+        snapshot = self.snapshot()
+        for counter in COUNTERS:
+            name = f"{prefix}_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(
+                f'{name}{{operation="{entry["operation"]}",'
+                f'table="{entry["table"]}"}} {entry[counter]}'
+                for entry in snapshot)
+        name = f"{prefix}_operation_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        for entry in snapshot:
+            labels = (f'operation="{entry["operation"]}",'
+                      f'table="{entry["table"]}"')
+            cumulative = 0
+            for bound, count in entry["latency_buckets"].items():
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else repr(bound)
+                lines.append(
+                    f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {entry['latency_sum']}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,69 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metrics sinks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyfiles_db.metrics.operation_stats import OperationStats
+
+
+class MetricsSink(Protocol):
+    """Receiver of finished operations."""
+
+    def record(self, stats: OperationStats) -> None:
+        """Handle a finished operation.
+
+        Called on the thread that ran the operation, keep it cheap.
+
+        Parameters
+        ----------
+        stats : OperationStats
+            Counters of the operation.
+        """
+
+
+class CallbackSink:
+    """Sink passing every finished operation to a function.
+
+    Parameters
+    ----------
+    callback : Callable[[OperationStats], None]
+        Called with the counters of each operation.
+    """
+
+    def __init__(self, callback: Callable[[OperationStats], None]) -> None:
+        """Init sink.
+
+        Parameters
+        ----------
+        callback : Callable[[OperationStats], None]
+            Called with the counters of each operation.
+        """
+        self._callback = callback
+
+    def record(self, stats: OperationStats) -> None:
+        """Pass the operation to the callback.
+
+        Parameters
+        ----------
+        stats : OperationStats
+            Counters of the operation.
+        """
+        self._callback(stats)
@@ -0,0 +1,143 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Slow-query log."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from logging.handlers import RotatingFileHandler
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pyfiles_db.metrics.operation_stats import OperationStats
+
+# Operations that locate records and may be slow.
+QUERY_OPERATIONS = frozenset({"find", "join", "update", "patch", "upsert",
+                              "delete", "update_where", "delete_where"})
+
+
+class SlowQueryLog:
+    """Sink keeping queries slower than a threshold.
+
+    Every query (``find``, ``join``, ``update``, ``patch``, ``upsert``,
+    ``delete`` or their ``*_where`` forms) that took at least
+    ``threshold`` seconds is turned into an entry with the table,
+    condition, access path, files read, bytes decoded and elapsed time.
+    Entries are written as JSON lines to a rotating file and/or passed to
+    a callback.
+
+    Parameters
+    ----------
+    threshold : float
+        Minimal elapsed time in seconds of a logged query.
+    path : str | Path | None, optional
+        Log file, rotated at ``max_bytes`` keeping ``backup_count`` old
+        files.
+    callback : Callable[[dict[str, Any]], None] | None, optional
+        Called with every entry.
+    max_bytes : int, optional
+        Size of the log file before rotation, by default 10 MiB.
+    backup_count : int, optional
+        Rotated files kept, by default 5.
+
+    Raises
+    ------
+    ValueError
+        If neither ``path`` nor ``callback`` is given.
+    """
+
+    def __init__(self,
+                 threshold: float,
+                 *,
+                 path: str | Path | None = None,
+                 callback: Callable[[dict[str, Any]], None] | None = None,
+                 max_bytes: int = 10 * 1024 * 1024,
+                 backup_count: int = 5,
+                 ) -> None:
+        """Init slow-query log.
+
+        Parameters
+        ----------
+        threshold : float
+            Minimal elapsed time in seconds of a logged query.
+        path : str | Path | None, optional
+            Log file, rotated at ``max_bytes``.
+        callback : Callable[[dict[str, Any]], None] | None, optional
+            Called with every entry.
+        max_bytes : int, optional
+            Size of the log file before rotation, by default 10 MiB.
+        backup_count : int, optional
+            Rotated files kept, by default 5.
+
+        Raises
+        ------
+        ValueError
+            If neither ``path`` nor ``callback`` is given.
+        """
+        if path is None and callback is None:
+            msg = "SlowQueryLog needs a path or a callback"
+            raise ValueError(msg)
+        self.threshold = threshold
+        self._callback = callback
+        self._handler: RotatingFileHandler | None = None
+        if path is not None:
+            # Records go straight to the handler, so they never reach the
+            # application's loggers.
+            self._handler = RotatingFileHandler(path, maxBytes=max_bytes,
+                                                backupCount=backup_count,
+                                                encoding="utf-8",
+                                                delay=True)
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def record(self, stats: OperationStats) -> None:
+        """Log the operation if it is a slow query.
+
+        Parameters
+        ----------
+        stats : OperationStats
+            Counters of the operation.
+        """
+        if (stats.elapsed < self.threshold
+                or stats.operation not in QUERY_OPERATIONS):
+            return
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "operation": stats.operation,
+            "table": stats.table,
+            "condition": stats.condition,
+            "access_path": stats.access_path,
+            "candidates": stats.candidates,
+            "files_opened": stats.files_opened,
+            "records_decoded": stats.records_decoded,
+            "bytes_read": stats.bytes_read,
+            "elapsed_ms": round(stats.elapsed * 1000, 3),
+            "error": stats.error,
+        }
+        if self._handler is not None:
+            self._handler.handle(logging.makeLogRecord(
+                {"msg": json.dumps(entry), "levelno": logging.WARNING,
+                 "levelname": "WARNING"}))
+        if self._callback is not None:
+            self._callback(entry)
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self._handler is not None:
+            self._handler.close()
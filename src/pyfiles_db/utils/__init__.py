@@ -14,6 +14,40 @@
 
 """Utils."""
 
-from .infinity_number_generator import infinite_natural_numbers
+from typing import TYPE_CHECKING
 
-__all__ = ["infinite_natural_numbers"]
+from .lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .atomic_write import write_atomic
+    from .bloom_filter import BloomFilter
+    from .dir_fd import DirHandle, FdPool
+    from .file_lock import FileLock
+    from .infinity_number_generator import infinite_natural_numbers
+    from .io_executor import IOExecutor
+    from .result_cache import ResultCache
+    from .shared_cache import SharedResultCache
+
+__all__ = [
+    "BloomFilter",
+    "DirHandle",
+    "FdPool",
+    "FileLock",
+    "IOExecutor",
+    "ResultCache",
+    "SharedResultCache",
+    "infinite_natural_numbers",
+    "write_atomic",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "write_atomic": ".atomic_write",
+    "BloomFilter": ".bloom_filter",
+    "DirHandle": ".dir_fd",
+    "FdPool": ".dir_fd",
+    "FileLock": ".file_lock",
+    "infinite_natural_numbers": ".infinity_number_generator",
+    "IOExecutor": ".io_executor",
+    "ResultCache": ".result_cache",
+    "SharedResultCache": ".shared_cache",
+})
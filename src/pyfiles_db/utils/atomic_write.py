@@ -0,0 +1,62 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Atomic file replacement."""
+
+import os
+import threading
+from pathlib import Path
+
+
+def write_atomic(path: Path,
+                 data: str | bytes,
+                 *,
+                 exclusive: bool = False,
+                 ) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file.
+
+    The content goes to a temporary sibling first and is moved over
+    ``path`` with ``os.replace``. The temporary name does not end with
+    ``.json``, so it is never mistaken for a record.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file.
+    data : str | bytes
+        Text or bytes to write.
+    exclusive : bool, optional
+        Link the temporary file to ``path`` instead, so the write fails
+        when ``path`` exists, even if another process creates it at the
+        same time. By default False.
+
+    Raises
+    ------
+    FileExistsError
+        If ``exclusive`` is set and ``path`` exists.
+    """
+    tmp = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        with Path.open(tmp, mode="w") as f:
+            f.write(data)
+    if not exclusive:
+        Path.replace(tmp, path)
+        return
+    try:
+        os.link(tmp, path)
+    finally:
+        tmp.unlink()
@@ -0,0 +1,138 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bloom filter."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+
+_MAGIC = b"PFBF"
+# Magic, capacity, count, hash count and size in bits.
+_HEADER = struct.Struct("<4sQQIQ")
+
+
+class BloomFilter:
+    """Set membership with no false negatives.
+
+    ``key in bloom`` is False only for keys that were never added, so a
+    miss can skip the disk. False positives happen at about
+    ``error_rate`` while no more than ``capacity`` keys are added and
+    grow past it.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Keys the filter is sized for, by default 1024.
+    error_rate : float, optional
+        False positive rate at capacity, by default 0.01.
+    """
+
+    def __init__(self,
+                 capacity: int = 1024,
+                 error_rate: float = 0.01,
+                 ) -> None:
+        """Init empty filter.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Keys the filter is sized for, by default 1024.
+        error_rate : float, optional
+            False positive rate at capacity, by default 0.01.
+        """
+        self.capacity = max(capacity, 1)
+        bits = -self.capacity * math.log(error_rate) / math.log(2) ** 2
+        self.size = max(math.ceil(bits / 8) * 8, 64)
+        self.hashes = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray(self.size // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key.
+
+        Parameters
+        ----------
+        key : str
+            Key to add.
+        """
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Return False if ``key`` was certainly never added."""
+        if not isinstance(key, str):
+            return False
+        return all(self._bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._positions(key))
+
+    @property
+    def saturated(self) -> bool:
+        """Whether more keys than ``capacity`` were added."""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter.
+
+        Returns
+        -------
+        bytes
+            Header followed by the bit array.
+        """
+        return _HEADER.pack(_MAGIC, self.capacity, self.count, self.hashes,
+                            self.size) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> BloomFilter:
+        """Load a filter saved by :meth:`to_bytes`.
+
+        Parameters
+        ----------
+        raw : bytes
+            Serialized filter.
+
+        Returns
+        -------
+        BloomFilter
+            The filter.
+
+        Raises
+        ------
+        ValueError
+            If ``raw`` is not a serialized filter.
+        """
+        if len(raw) < _HEADER.size:
+            msg = "truncated bloom filter"
+            raise ValueError(msg)
+        magic, capacity, count, hashes, size = _HEADER.unpack_from(raw)
+        bits = raw[_HEADER.size:]
+        if magic != _MAGIC or len(bits) * 8 != size:
+            msg = "corrupted bloom filter"
+            raise ValueError(msg)
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.count = count
+        bloom.hashes = hashes
+        bloom.size = size
+        bloom._bits = bytearray(bits)  # noqa: SLF001
+        return bloom
@@ -0,0 +1,433 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Directory descriptors and a pool of open record files."""
+
+from __future__ import annotations
+
+import errno
+import itertools
+import os
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+# ``dir_fd`` relative I/O needs POSIX ``openat``/``unlinkat``/``pread``.
+SUPPORTED = (os.open in os.supports_dir_fd and os.unlink in os.supports_dir_fd
+             and hasattr(os, "O_DIRECTORY") and hasattr(os, "pread"))
+_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_WILLNEED = getattr(os, "POSIX_FADV_WILLNEED", None)
+_tokens = itertools.count()
+
+
+class _Entry:
+    """Pooled descriptor of one version of a file."""
+
+    __slots__ = ("fd", "key", "retired", "users")
+
+    def __init__(self, fd: int, key: tuple[int, int, int]) -> None:
+        self.fd = fd
+        self.key = key
+        self.users = 1
+        self.retired = False
+
+
+class FdPool:
+    """Bounded LRU pool of read-only file descriptors.
+
+    A file is reopened when ``fstatat`` shows another inode, mtime or
+    size, so files replaced with ``os.replace`` are never read stale.
+    Least recently used descriptors are closed above ``max_open``; one
+    still being read is closed by its last reader.
+
+    Parameters
+    ----------
+    max_open : int, optional
+        Maximum number of pooled descriptors, by default 256. Zero
+        opens and closes the file on every read.
+    """
+
+    def __init__(self, max_open: int = 256) -> None:
+        """Init empty pool.
+
+        Parameters
+        ----------
+        max_open : int, optional
+            Maximum number of pooled descriptors.
+        """
+        self.max_open = max_open
+        self._entries: OrderedDict[tuple[int, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of pooled descriptors."""
+        return len(self._entries)
+
+    def read(self, dir_fd: int, token: int, name: str) -> bytes:
+        """Read a whole file relative to a directory descriptor.
+
+        Parameters
+        ----------
+        dir_fd : int
+            Descriptor of the directory.
+        token : int
+            Id of the directory in the pool.
+        name : str
+            File name in the directory.
+
+        Returns
+        -------
+        bytes
+            Content of the file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        if not self.max_open:
+            fd = os.open(name, os.O_RDONLY | _CLOEXEC, dir_fd=dir_fd)
+            try:
+                return _read_all(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+        st = os.stat(name, dir_fd=dir_fd)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get((token, name))
+            if entry is not None and entry.key == key:
+                entry.users += 1
+                self._entries.move_to_end((token, name))
+            else:
+                entry = None
+        if entry is None:
+            entry = self._open(dir_fd, token, name)
+        try:
+            return _read_all(entry.fd, entry.key[2])
+        finally:
+            self._release(entry)
+
+    def _open(self, dir_fd: int, token: int, name: str) -> _Entry:
+        """Open a file and pool it, evicting the least recently used."""
+        try:
+            fd = os.open(name, os.O_RDONLY | _CLOEXEC, dir_fd=dir_fd)
+        except OSError as e:
+            if e.errno != errno.EMFILE:
+                raise
+            # Out of descriptors: give back every idle one and retry.
+            self.clear()
+            fd = os.open(name, os.O_RDONLY | _CLOEXEC, dir_fd=dir_fd)
+        st = os.fstat(fd)
+        entry = _Entry(fd, (st.st_ino, st.st_mtime_ns, st.st_size))
+        with self._lock:
+            self._retire(self._entries.pop((token, name), None))
+            self._entries[token, name] = entry
+            while len(self._entries) > self.max_open:
+                self._retire(self._entries.popitem(last=False)[1])
+        return entry
+
+    def _retire(self, entry: _Entry | None) -> None:
+        """Close a descriptor dropped from the pool, under the lock."""
+        if entry is None:
+            return
+        entry.retired = True
+        if not entry.users:
+            os.close(entry.fd)
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.users -= 1
+            if entry.retired and not entry.users:
+                os.close(entry.fd)
+
+    def forget(self, token: int, name: str) -> None:
+        """Close the descriptor of a replaced or removed file.
+
+        Parameters
+        ----------
+        token : int
+            Id of the directory in the pool.
+        name : str
+            File name in the directory.
+        """
+        with self._lock:
+            self._retire(self._entries.pop((token, name), None))
+
+    def drop(self, token: int) -> None:
+        """Close every descriptor of a directory.
+
+        Parameters
+        ----------
+        token : int
+            Id of the directory in the pool.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == token]:
+                self._retire(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Close every pooled descriptor."""
+        with self._lock:
+            while self._entries:
+                self._retire(self._entries.popitem()[1])
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    """Read ``size`` bytes from the start of a file, or up to its end."""
+    data = os.pread(fd, size, 0)
+    if len(data) == size:
+        return data
+    parts = [data]
+    offset = len(data)
+    while chunk := os.pread(fd, max(size - offset, 65536), offset):
+        parts.append(chunk)
+        offset += len(chunk)
+    return b"".join(parts)
+
+
+# Shared by every table, so the number of open record files stays
+# bounded however many tables a process uses.
+RECORD_FILES = FdPool()
+
+
+class DirHandle:
+    """Directory kept open for relative file I/O.
+
+    Names are resolved with ``dir_fd`` against a descriptor opened on
+    first use, so the kernel walks one path component per file instead
+    of the whole path. Where ``dir_fd`` is not supported, names are
+    joined to the path.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the directory.
+    pool : FdPool, optional
+        Pool of descriptors of read files, by default ``RECORD_FILES``.
+    """
+
+    def __init__(self, path: Path, pool: FdPool = RECORD_FILES) -> None:
+        """Init handle.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the directory.
+        pool : FdPool, optional
+            Pool of descriptors of read files.
+        """
+        self.path = path
+        self._pool = pool
+        self._token = next(_tokens)
+        self._fd: list[int] = []
+        self._lock = threading.Lock()
+        weakref.finalize(self, _close, self._fd, pool, self._token)
+
+    def fileno(self) -> int | None:
+        """Return the directory descriptor, opening it on first use.
+
+        Returns
+        -------
+        int | None
+            Descriptor, None where ``dir_fd`` is not supported.
+        """
+        if not SUPPORTED:
+            return None
+        if not self._fd:
+            with self._lock:
+                if not self._fd:
+                    self._fd.append(os.open(
+                        self.path, os.O_RDONLY | os.O_DIRECTORY | _CLOEXEC))
+        return self._fd[0]
+
+    def read(self, name: str) -> bytes:
+        """Read a file of the directory.
+
+        Parameters
+        ----------
+        name : str
+            File name.
+
+        Returns
+        -------
+        bytes
+            Content of the file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        dir_fd = self.fileno()
+        if dir_fd is None:
+            return (self.path / name).read_bytes()
+        return self._pool.read(dir_fd, self._token, name)
+
+    def read_many(self,
+                  names: Iterable[str],
+                  readahead: int = 0,
+                  ) -> Iterator[tuple[str, bytes | None]]:
+        """Read files one after another, announcing the next ones.
+
+        The next ``readahead`` files are kept open and passed to
+        ``posix_fadvise(WILLNEED)``, so the kernel reads them while the
+        current one is processed. The pool is bypassed: a scan would
+        only evict the hot files from it.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            File names in the order to read them.
+        readahead : int, optional
+            Files announced ahead, by default 0 (read one by one).
+
+        Yields
+        ------
+        tuple[str, bytes | None]
+            File name and content, None if the file does not exist.
+        """
+        dir_fd = self.fileno()
+        if dir_fd is None or readahead <= 0:
+            for name in names:
+                try:
+                    yield name, self.read(name)
+                except FileNotFoundError:
+                    yield name, None
+            return
+        pending = iter(names)
+        window: deque[tuple[str, int | None]] = deque()
+        try:
+            for name in pending:
+                window.append((name, _open_ahead(dir_fd, name)))
+                if len(window) > readahead:
+                    yield _read_next(window)
+            while window:
+                yield _read_next(window)
+        finally:
+            for _, fd in window:
+                if fd is not None:
+                    os.close(fd)
+
+    def write_atomic(self,
+                     name: str,
+                     data: str | bytes,
+                     *,
+                     exclusive: bool = False,
+                     ) -> None:
+        """Replace a file of the directory atomically.
+
+        Parameters
+        ----------
+        name : str
+            File name.
+        data : str | bytes
+            Text or bytes to write.
+        exclusive : bool, optional
+            Only create the file: fail if it exists, even if another
+            process creates it at the same time. By default False.
+
+        Raises
+        ------
+        FileExistsError
+            If ``exclusive`` is set and the file exists.
+        """
+        dir_fd = self.fileno()
+        if dir_fd is None:
+            from pyfiles_db.utils.atomic_write import (  # noqa: PLC0415
+                write_atomic,
+            )
+            write_atomic(self.path / name, data, exclusive=exclusive)
+            return
+        raw = data.encode() if isinstance(data, str) else data
+        tmp = f"{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _CLOEXEC,
+                     0o644, dir_fd=dir_fd)
+        try:
+            view = memoryview(raw)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        if not exclusive:
+            os.replace(tmp, name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            self._pool.forget(self._token, name)
+            return
+        try:
+            os.link(tmp, name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        finally:
+            os.unlink(tmp, dir_fd=dir_fd)
+        self._pool.forget(self._token, name)
+
+    def remove(self, name: str) -> None:
+        """Remove a file of the directory.
+
+        Parameters
+        ----------
+        name : str
+            File name.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        dir_fd = self.fileno()
+        if dir_fd is None:
+            (self.path / name).unlink()
+            return
+        try:
+            os.unlink(name, dir_fd=dir_fd)
+        finally:
+            self._pool.forget(self._token, name)
+
+    def close(self) -> None:
+        """Close the directory and its pooled files; reopened on use."""
+        with self._lock:
+            _close(self._fd, self._pool, self._token)
+
+
+def _open_ahead(dir_fd: int, name: str) -> int | None:
+    """Open a file and ask the kernel to start reading it."""
+    try:
+        fd = os.open(name, os.O_RDONLY | _CLOEXEC, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return None
+    if _WILLNEED is not None:
+        os.posix_fadvise(fd, 0, 0, _WILLNEED)
+    return fd
+
+
+def _read_next(window: deque[tuple[str, int | None]],
+               ) -> tuple[str, bytes | None]:
+    """Read and close the oldest file of a read-ahead window."""
+    name, fd = window.popleft()
+    if fd is None:
+        return name, None
+    try:
+        return name, _read_all(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _close(fd: list[int], pool: FdPool, token: int) -> None:
+    """Close a directory descriptor and the pooled files under it."""
+    pool.drop(token)
+    while fd:
+        os.close(fd.pop())
@@ -0,0 +1,90 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cross-process file locks."""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is POSIX only
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+class FileLock:
+    """Reader/writer lock backed by ``fcntl.flock`` on a lock file.
+
+    Every acquisition opens its own file descriptor, so the lock also
+    excludes threads of the same process. On platforms without ``fcntl``
+    the lock is a no-op.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the lock file, created on first use.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Init lock.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the lock file.
+        """
+        self.path = path
+
+    @contextmanager
+    def shared(self) -> Generator[None, None, None]:
+        """Hold a shared (read) lock.
+
+        Yields
+        ------
+        None
+            While the lock is held.
+        """
+        with self._hold(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Generator[None, None, None]:
+        """Hold an exclusive (write) lock.
+
+        Yields
+        ------
+        None
+            While the lock is held.
+        """
+        with self._hold(exclusive=True):
+            yield
+
+    @contextmanager
+    def _hold(self, *, exclusive: bool) -> Generator[None, None, None]:
+        if fcntl is None:  # pragma: no cover - fcntl is POSIX only
+            yield
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
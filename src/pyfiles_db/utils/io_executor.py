@@ -0,0 +1,121 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dedicated thread pool for batched file I/O."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+class IOExecutor:
+    """Thread pool that runs whole I/O jobs off the event loop.
+
+    A job is a plain function doing any number of blocking file
+    operations, so one thread hop covers e.g. reading and decoding a
+    batch of records instead of one hop per ``open``/``read``/``close``.
+
+    Parameters
+    ----------
+    max_workers : int | None, optional
+        Number of threads, by default ``min(32, cpu_count + 4)``.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Init executor.
+
+        Parameters
+        ----------
+        max_workers : int | None, optional
+            Number of threads, by default ``min(32, cpu_count + 4)``.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="pyfiles_db-io")
+        self._counters = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._peak_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs submitted but not started yet."""
+        return self._queued
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+        """Run ``fn(*args)`` on the pool.
+
+        Parameters
+        ----------
+        fn : Callable[..., T]
+            Blocking job.
+        *args : Any
+            Arguments of the job.
+
+        Returns
+        -------
+        T
+            Value returned by the job.
+        """
+        with self._counters:
+            self._queued += 1
+            self._peak_queue_depth = max(self._peak_queue_depth,
+                                         self._queued)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._job, fn, args)
+
+    def _job(self, fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+        with self._counters:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._counters:
+                self._active -= 1
+                self._completed += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return pool counters.
+
+        Returns
+        -------
+        dict[str, int]
+            ``max_workers``, current ``queue_depth`` and ``active`` jobs,
+            ``peak_queue_depth`` and ``completed`` jobs.
+        """
+        with self._counters:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "peak_queue_depth": self._peak_queue_depth,
+                "completed": self._completed,
+            }
+
+    def shutdown(self) -> None:
+        """Wait for running jobs and stop the threads."""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,58 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy package exports."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def lazy_exports(package: str,
+                 exports: dict[str, str],
+                 ) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module ``__getattr__``/``__dir__`` importing exports on use.
+
+    Parameters
+    ----------
+    package : str
+        ``__name__`` of the package.
+    exports : dict[str, str]
+        Exported name to the relative module defining it.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        ``__getattr__`` and ``__dir__`` for the package.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401, N807
+        module = exports.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name without calling __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*sys.modules[package].__dict__, *exports})
+
+    return __getattr__, __dir__
@@ -0,0 +1,208 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of query results."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+Result = list[dict[str, Any]]
+
+
+def copy_result(result: Result) -> Result:
+    """Copy a result down to the record dicts (their values are scalars).
+
+    Parameters
+    ----------
+    result : Result
+        Result of ``find``.
+
+    Returns
+    -------
+    Result
+        Copy that can be changed without changing ``result``.
+    """
+    return [{name: dict(record) for name, record in item.items()}
+            for item in result]
+
+
+@dataclass(slots=True)
+class _Entry:
+    version: int
+    expires: float
+    result: Result
+
+
+class ResultCache:
+    """LRU cache of ``find`` results invalidated by table versions.
+
+    Every write to a table bumps its version, which makes all results
+    cached for that table stale at once; they are dropped when next
+    looked up or evicted. Entries also expire after ``ttl`` seconds,
+    which bounds staleness caused by writes of other processes. Results
+    are copied in and out, so callers may mutate what they get.
+
+    Parameters
+    ----------
+    max_records : int, optional
+        Records held by all entries together before the least recently
+        used entries are evicted, by default 10000.
+    ttl : float | None, optional
+        Seconds an entry stays valid, by default None (until the table
+        changes).
+    """
+
+    def __init__(self,
+                 max_records: int = 10_000,
+                 ttl: float | None = None,
+                 ) -> None:
+        """Init result cache.
+
+        Parameters
+        ----------
+        max_records : int, optional
+            Records held by all entries together, by default 10000.
+        ttl : float | None, optional
+            Seconds an entry stays valid, by default None.
+        """
+        self.max_records = max_records
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, Hashable], _Entry] = (
+            OrderedDict())
+        self._versions: dict[str, int] = {}
+        self._records = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def version(self, table: str) -> int:
+        """Return the current version of a table.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            Version, read it before running the query to cache.
+        """
+        return self._versions.get(table, 0)
+
+    def bump(self, table: str) -> None:
+        """Invalidate every cached result of a table.
+
+        Parameters
+        ----------
+        table : str
+            Name of the changed table.
+        """
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def get(self, table: str, key: Hashable) -> Result | None:
+        """Return a copy of a cached result.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+        key : Hashable
+            Normalized condition and options of the query.
+
+        Returns
+        -------
+        Result | None
+            The result, None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is not None and (
+                    entry.version != self._versions.get(table, 0)
+                    or entry.expires < time.monotonic()):
+                self._drop((table, key))
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end((table, key))
+            self._hits += 1
+            return copy_result(entry.result)
+
+    def put(self,
+            table: str,
+            key: Hashable,
+            version: int,
+            result: Result,
+            ) -> None:
+        """Cache a copy of a result.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+        key : Hashable
+            Normalized condition and options of the query.
+        version : int
+            Version of the table read before the query ran. A result of
+            a query that raced with a write is not cached.
+        result : Result
+            Result of the query.
+        """
+        if len(result) > self.max_records:
+            return
+        expires = (math.inf if self.ttl is None
+                   else time.monotonic() + self.ttl)
+        with self._lock:
+            if version != self._versions.get(table, 0):
+                return
+            self._drop((table, key))
+            self._entries[(table, key)] = _Entry(version, expires,
+                                                 copy_result(result))
+            self._records += len(result)
+            while self._records > self.max_records:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._records = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns
+        -------
+        dict[str, int]
+            ``hits``, ``misses``, ``entries`` and ``records`` held.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses,
+                    "entries": len(self._entries), "records": self._records}
+
+    def _drop(self, key: tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._records -= len(entry.result)
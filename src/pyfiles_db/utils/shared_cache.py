@@ -0,0 +1,330 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Cache of query results shared by the processes of a host."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pyfiles_db.database_manager._wire import _default, _object_hook
+
+from .file_lock import FileLock
+from .result_cache import Result, ResultCache
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+_MAGIC = b"PFDBSHM1"
+# Magic, data size, buckets, version slots, head (bytes ever written).
+_HEADER = struct.Struct("8sQQQQ")
+_HEADER_SIZE = 64
+_VERSION = struct.Struct("Q")
+# Key hash, position + 1 (0 when empty), length, table version, records.
+_BUCKET = struct.Struct("QQQQQ")
+
+
+class SharedResultCache(ResultCache):
+    """``find`` result cache in ``multiprocessing.shared_memory``.
+
+    Every process that opens a cache with the same ``name`` maps the
+    same segment, so workers of one host share a warm copy of hot
+    results instead of each reading the records again. A write in any
+    of them bumps the table version in the segment, which makes the
+    results cached for that table stale in all of them.
+
+    Results are JSON encoded into a ring buffer; the newest entries
+    overwrite the oldest, and a fixed table of buckets maps key hashes
+    to them. Access is serialized by a ``flock`` on a file in the
+    temporary directory. The segment outlives the processes until
+    ``unlink`` is called.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the shared memory segment, by default ``"pyfiles_db"``.
+    size : int, optional
+        Bytes of cached results, by default 64 MiB. Ignored when the
+        segment already exists.
+    buckets : int, optional
+        Number of entries the segment can index, by default 65536.
+    max_records : int, optional
+        Records of the largest result cached, by default 10000.
+    ttl : float | None, optional
+        Seconds an entry stays valid, by default None (until the table
+        changes).
+
+    Raises
+    ------
+    ValueError
+        If a segment with this name exists but is not a cache.
+    """
+
+    # Tables hash into version slots; a collision only invalidates more.
+    VERSION_SLOTS = 4096
+
+    def __init__(self,
+                 name: str = "pyfiles_db",
+                 size: int = 64 << 20,
+                 buckets: int = 65_536,
+                 *,
+                 max_records: int = 10_000,
+                 ttl: float | None = None,
+                 ) -> None:
+        """Open or create the shared cache.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the shared memory segment.
+        size : int, optional
+            Bytes of cached results.
+        buckets : int, optional
+            Number of entries the segment can index.
+        max_records : int, optional
+            Records of the largest result cached.
+        ttl : float | None, optional
+            Seconds an entry stays valid.
+        """
+        super().__init__(max_records, ttl)
+        self.name = name
+        self._flock = FileLock(Path(tempfile.gettempdir()) / f"{name}.lock")
+        with self._flock.exclusive():
+            try:
+                self._shm = shared_memory.SharedMemory(
+                    name, create=True,
+                    size=(_HEADER_SIZE + self.VERSION_SLOTS * _VERSION.size
+                          + buckets * _BUCKET.size + size))
+                created = True
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name)
+                created = False
+            if os.name == "posix":
+                # The segment is shared on purpose; without this the
+                # first process to exit would unlink it for everyone.
+                resource_tracker.unregister(f"/{self._shm.name}",
+                                            "shared_memory")
+            buf = self._shm.buf
+            if buf is None:  # pragma: no cover - None only after close
+                msg = f"Shared memory {name!r} is closed"
+                raise ValueError(msg)
+            self._buf = buf
+            if created:
+                _HEADER.pack_into(self._buf, 0, _MAGIC, size, buckets,
+                                  self.VERSION_SLOTS, 0)
+            header = _HEADER.unpack_from(self._buf)
+        if header[0] != _MAGIC:
+            self._shm.close()
+            msg = f"Shared memory {name!r} is not a result cache"
+            raise ValueError(msg)
+        self._size: int = header[1]
+        self._buckets: int = header[2]
+        self._slots: int = header[3]
+        self._bucket_offset: int = _HEADER_SIZE + self._slots * _VERSION.size
+        self._data_offset: int = (self._bucket_offset
+                                  + self._buckets * _BUCKET.size)
+
+    def _slot(self, table: str) -> int:
+        """Return offset of the version of a table."""
+        return (_HEADER_SIZE
+                + zlib.crc32(table.encode()) % self._slots * _VERSION.size)
+
+    def version(self, table: str) -> int:
+        """Return the current version of a table.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            Version, read it before running the query to cache.
+        """
+        version: int = _VERSION.unpack_from(self._buf,
+                                            self._slot(table))[0]
+        return version
+
+    def bump(self, table: str) -> None:
+        """Invalidate every cached result of a table in all processes.
+
+        Parameters
+        ----------
+        table : str
+            Name of the changed table.
+        """
+        offset = self._slot(table)
+        with self._flock.exclusive():
+            version = _VERSION.unpack_from(self._buf, offset)[0]
+            _VERSION.pack_into(self._buf, offset, version + 1)
+
+    def get(self, table: str, key: Hashable) -> Result | None:
+        """Return a cached result.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+        key : Hashable
+            Normalized condition and options of the query.
+
+        Returns
+        -------
+        Result | None
+            The result, None on a miss.
+        """
+        digest, text_key = _hash(table, key)
+        bucket = self._bucket(digest)
+        raw = None
+        with self._flock.shared():
+            found, pos, length, version, _ = _BUCKET.unpack_from(
+                self._buf, bucket)
+            if (found == digest and pos
+                    and version == self.version(table)
+                    and self._head() <= pos - 1 + self._size):
+                start = self._data_offset + (pos - 1) % self._size
+                raw = bytes(self._buf[start:start + length])
+        if raw is not None:
+            entry_table, entry_key, expires, result = json.loads(
+                raw, object_hook=_object_hook)
+            if (entry_table == table and entry_key == text_key
+                    and (expires is None or expires > time.time())):
+                self._hits += 1
+                cached: Result = result
+                return cached
+        self._misses += 1
+        return None
+
+    def put(self,
+            table: str,
+            key: Hashable,
+            version: int,
+            result: Result,
+            ) -> None:
+        """Cache a result for every process.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+        key : Hashable
+            Normalized condition and options of the query.
+        version : int
+            Version of the table read before the query ran. A result of
+            a query that raced with a write is not cached.
+        result : Result
+            Result of the query. ``DATETIME`` and ``BYTES`` values are
+            tagged the way the server protocol sends them; a result
+            that still cannot be encoded is not cached.
+        """
+        if len(result) > self.max_records:
+            return
+        digest, text_key = _hash(table, key)
+        expires = None if self.ttl is None else time.time() + self.ttl
+        try:
+            raw = json.dumps([table, text_key, expires, result],
+                             default=_default).encode()
+        except (TypeError, ValueError):
+            return
+        if len(raw) > self._size // 4:
+            return
+        bucket = self._bucket(digest)
+        with self._flock.exclusive():
+            if version != self.version(table):
+                return
+            head = self._head()
+            offset = head % self._size
+            if offset + len(raw) > self._size:
+                # Entries never wrap; skip the tail of the ring.
+                head += self._size - offset
+                offset = 0
+            start = self._data_offset + offset
+            self._buf[start:start + len(raw)] = raw
+            _BUCKET.pack_into(self._buf, bucket, digest, head + 1,
+                              len(raw), version, len(result))
+            self._set_head(head + len(raw))
+
+    def clear(self) -> None:
+        """Drop every entry in all processes."""
+        with self._flock.exclusive():
+            end = self._data_offset
+            self._buf[self._bucket_offset:end] = bytes(
+                end - self._bucket_offset)
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns
+        -------
+        dict[str, int]
+            ``hits`` and ``misses`` of this process, ``entries`` and
+            ``records`` held in the segment (stale ones included until
+            overwritten).
+        """
+        entries = records = 0
+        with self._flock.shared():
+            head = self._head()
+            for bucket in range(self._bucket_offset, self._data_offset,
+                                _BUCKET.size):
+                _, pos, _, _, count = _BUCKET.unpack_from(self._buf,
+                                                          bucket)
+                if pos and head <= pos - 1 + self._size:
+                    entries += 1
+                    records += count
+        return {"hits": self._hits, "misses": self._misses,
+                "entries": entries, "records": records}
+
+    def close(self) -> None:
+        """Unmap the segment from this process."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment; processes that mapped it keep their map."""
+        if os.name == "posix":
+            # ``unlink`` unregisters the name again.
+            resource_tracker.register(f"/{self._shm.name}", "shared_memory")
+        self._shm.unlink()
+
+    def _bucket(self, digest: int) -> int:
+        return self._bucket_offset + digest % self._buckets * _BUCKET.size
+
+    def _head(self) -> int:
+        head: int = _VERSION.unpack_from(self._buf, _HEADER.size - 8)[0]
+        return head
+
+    def _set_head(self, head: int) -> None:
+        _VERSION.pack_into(self._buf, _HEADER.size - 8, head)
+
+
+def _hash(table: str, key: Hashable) -> tuple[int, str]:
+    """Return the 64-bit hash and the text of a cache key.
+
+    ``repr`` of the normalized key (a tuple of scalars) is the same in
+    every process, unlike ``hash`` of strings.
+    """
+    text = repr(key)
+    digest = hashlib.blake2b(f"{table}\0{text}".encode(), digest_size=8)
+    # Zero marks an empty bucket.
+    return int.from_bytes(digest.digest()) or 1, text
@@ -27,4 +27,4 @@ def cleanup_after_test() -> Generator[Any, Any, Any]:
     """Delete database after test."""
     yield
     path = Path() / "database"
-    shutil.rmtree(path)
+    shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,53 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Smoke test of the benchmark runner."""
+
+import json
+from pathlib import Path
+
+from benchmarks.runner import BenchmarkConfig, main, run
+
+OPERATIONS = {"new_data", "find_id", "find_scan", "update", "delete"}
+
+
+def test_benchmark_run() -> None:
+    """Test that every operation of every mode is reported."""
+    rows = 30
+    report = run(BenchmarkConfig(rows=[rows], lookups=5, scans=2, updates=5,
+                                 deletes=5, concurrency=8))
+    results = report["results"]
+    if {(r["mode"], r["operation"]) for r in results} != {
+            (mode, op) for mode in ("sync", "async") for op in OPERATIONS}:
+        raise AssertionError(results)
+    for r in results:
+        if r["rows"] != rows or not r["p50_ms"] <= r["p95_ms"] <= r["p99_ms"]:
+            raise AssertionError(r)
+    new_data = next(r for r in results if r["operation"] == "new_data")
+    if new_data["count"] != rows:
+        raise AssertionError(new_data)
+
+
+def test_benchmark_main_output(tmp_path: Path) -> None:
+    """Test the command line writes JSON results."""
+    output = tmp_path / "results.json"
+    code = main(["--rows", "10", "--modes", "sync", "--lookups", "2",
+                 "--scans", "1", "--updates", "2", "--deletes", "2",
+                 "--label", "abc123", "--output", str(output)])
+    if code != 0:
+        raise AssertionError(code)
+    report = json.loads(output.read_text())
+    if report["environment"]["label"] != "abc123":
+        raise AssertionError(report["environment"])
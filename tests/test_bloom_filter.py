@@ -0,0 +1,127 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test Bloom filters of tables."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import SlowQueryLog
+from pyfiles_db.utils import BloomFilter
+
+data = [
+    {"id": 1, "first_name": "John", "number": 8},
+    {"id": 2, "first_name": "Jane", "number": 12},
+    {"id": 3, "first_name": "Alex", "number": 8},
+]
+COLUMNS = {"id": "INT", "first_name": "TEXT", "number": "INT"}
+MAX_FALSE_POSITIVES = 30
+
+
+def test_bloom_filter() -> None:
+    """Test no false negatives, the error rate and serialization."""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"key{i}")
+    if not all(f"key{i}" in bloom for i in range(1000)):
+        raise AssertionError
+    false_positives = sum(f"other{i}" in bloom for i in range(1000))
+    if false_positives > MAX_FALSE_POSITIVES:
+        raise AssertionError(false_positives)
+    loaded = BloomFilter.from_bytes(bloom.to_bytes())
+    if loaded.count != bloom.count or "key7" not in loaded:
+        raise AssertionError
+    with pytest.raises(ValueError, match="corrupted"):
+        BloomFilter.from_bytes(bloom.to_bytes()[:-1])
+
+
+def test_sync_bloom_skips_disk(tmp_path: Path) -> None:
+    """Test absent keys are answered without opening record files."""
+    table_name = "test_bloom_sync"
+    entries: list[dict[str, Any]] = []
+    db = FilesDB().init_sync(
+        storage=tmp_path,
+        slow_query_log=SlowQueryLog(0.0, callback=entries.append))
+    db.create_table(table_name, COLUMNS, id_generator="id",
+                    bloom=["first_name"])
+    for d in data:
+        db.new_data(table_name, d)
+
+    if db.find(table_name, "id == 99") != []:
+        raise AssertionError
+    if db.find(table_name, "first_name == Nobody") != []:
+        raise AssertionError
+    if db.find(table_name, "id == 2") != [{"2": data[1]}]:
+        raise AssertionError
+    if db.find(table_name, "first_name == Alex") != [{"3": data[2]}]:
+        raise AssertionError
+    with pytest.raises(FileNotFoundError):
+        db.delete(table_name, "99")
+    paths = [(e["access_path"], e["files_opened"]) for e in entries]
+    if paths[:2] != [("bloom", 0), ("bloom", 0)] or paths[4][0] != "file_id":
+        raise AssertionError(paths)
+    if paths[2][0] != "generator" or paths[3][0] != "scan":
+        raise AssertionError(paths)
+
+    # Keys added by another manager are seen through the stat check.
+    other = FilesDB().init_sync(storage=tmp_path)
+    other.new_data(table_name, {"id": 4, "first_name": "Kate", "number": 1})
+    if db.find(table_name, "first_name == Kate") == []:
+        raise AssertionError
+
+
+def test_compact_rebuilds_bloom(tmp_path: Path) -> None:
+    """Test compact drops lost ids and forgets deleted keys."""
+    table_name = "test_bloom_compact"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id", bloom=True)
+    for d in data:
+        db.new_data(table_name, d)
+    db.delete(table_name, "1")
+    (tmp_path / f"TABLE_{table_name}" / "2.json").unlink()
+    if db.compact(table_name) != 1:
+        raise AssertionError
+    with pytest.raises(FileNotFoundError):
+        db.delete(table_name, "1")
+    if db.find(table_name, "id == 3") != [{"3": data[2]}]:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_bloom(tmp_path: Path) -> None:
+    """Test coalesced inserts update the filters."""
+    table_name = "test_bloom_async"
+    entries: list[dict[str, Any]] = []
+    db = FilesDB().init_async(
+        storage=tmp_path,
+        slow_query_log=SlowQueryLog(0.0, callback=entries.append))
+    await db.create_table(table_name, COLUMNS, id_generator="id",
+                          bloom=["number"])
+    for d in data:
+        await db.new_data(table_name, d)
+    if len(await db.find(table_name, "number == 8")) != 2:  # noqa: PLR2004
+        raise AssertionError
+    if await db.find(table_name, "number == 5") != []:
+        raise AssertionError
+    with pytest.raises(FileNotFoundError):
+        await db.delete(table_name, "42")
+    if await db.compact(table_name) != 0:
+        raise AssertionError
+    db.close()
+    if [e["access_path"] for e in entries] != ["scan", "bloom", "file_id"]:
+        raise AssertionError(entries)
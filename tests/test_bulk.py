@@ -0,0 +1,175 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test streaming import and export of JSON lines and CSV files."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.__main__ import main
+from pyfiles_db.errors import DataIsUncorrectError, NotFoundColumnError
+from pyfiles_db.files_db import FilesDB
+
+COLUMNS = {"id": "INT", "name": "TEXT", "score": "FLOAT",
+           "active": "BOOL", "ts": "DATETIME", "blob": "BYTES"}
+TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def write_jsonl(path: Path, count: int) -> None:
+    """Write ``count`` JSON lines of COLUMNS."""
+    path.write_text("".join(
+        json.dumps({"id": i, "name": f"user{i}", "score": i / 2,
+                    "active": i % 2 == 0, "ts": TS.isoformat(),
+                    "blob": "Xk~0{Zv"}) + "\n"
+        for i in range(count)), encoding="utf-8")
+
+
+def test_sync_import_export(tmp_path: Path) -> None:
+    """Test JSON lines and CSV round trips in chunks."""
+    db = FilesDB().init_sync(storage=tmp_path / "db")
+    db.create_table("src", COLUMNS, id_generator="id", bloom=True)
+    db.create_table("dst", COLUMNS, id_generator="id")
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 5)
+
+    seen: list[int] = []
+    total = db.import_jsonl("src", source, batch_size=2,
+                            progress=lambda rows, _: seen.append(rows))
+    if total != 5 or seen != [2, 4, 5]:  # noqa: PLR2004
+        raise AssertionError(seen)
+    record = db.find("src", "id == 3")[0]["3"]
+    if record != {"id": 3, "name": "user3", "score": 1.5, "active": False,
+                  "ts": TS, "blob": b"hello"}:
+        raise AssertionError(record)
+
+    exported = tmp_path / "out.csv"
+    if db.export_csv("src", exported) != 5:  # noqa: PLR2004
+        raise AssertionError
+    lines = exported.read_text(encoding="utf-8").splitlines()
+    if lines[0] != "id,name,score,active,ts,blob" or lines[1] != (
+            "0,user0,0.0,true,2024-01-01T00:00:00+00:00,Xk~0{Zv"):
+        raise AssertionError(lines[:2])
+    if db.import_csv("dst", exported) != 5:  # noqa: PLR2004
+        raise AssertionError
+    if db.find("dst", "score >= 0") != db.find("src", "score >= 0"):
+        raise AssertionError
+
+    filtered = tmp_path / "filtered.jsonl"
+    if db.export_jsonl("src", filtered, "active == true") != 3:  # noqa: PLR2004
+        raise AssertionError
+    first = json.loads(filtered.read_text(encoding="utf-8").splitlines()[0])
+    if first["ts"] != TS.isoformat() or first["blob"] != "Xk~0{Zv":
+        raise AssertionError(first)
+
+
+def test_sync_import_errors(tmp_path: Path) -> None:
+    """Test invalid rows stop an import after the chunks before them."""
+    db = FilesDB().init_sync(storage=tmp_path / "db")
+    db.create_table("t", COLUMNS, id_generator="id")
+    source = tmp_path / "in.csv"
+    source.write_text("id,name,active\n1,a,true\n2,b,true\n3,c,maybe\n",
+                      encoding="utf-8")
+    with pytest.raises(DataIsUncorrectError):
+        db.import_csv("t", source, batch_size=2)
+    if [name for r in db.find("t", "active == true") for name in r] != [
+            "1", "2"]:
+        raise AssertionError
+    source.write_text("id,email\n4,x\n", encoding="utf-8")
+    with pytest.raises(NotFoundColumnError):
+        db.import_csv("t", source)
+    with pytest.raises(ValueError, match="batch_size"):
+        db.import_csv("t", source, batch_size=0)
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line reports progress and throughput."""
+    storage = tmp_path / "db"
+    FilesDB().init_sync(storage=storage).create_table(
+        "t", COLUMNS, id_generator="id")
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 3)
+    if main(["--storage", str(storage), "import", "t", str(source)]) != 0:
+        raise AssertionError
+    if "imported 3 records" not in capsys.readouterr().err:
+        raise AssertionError
+    target = tmp_path / "out.csv"
+    main(["--storage", str(storage), "--quiet", "export", "t", str(target),
+          "--condition", "id > 0"])
+    if capsys.readouterr().err or len(
+            target.read_text(encoding="utf-8").splitlines()) != 3:  # noqa: PLR2004
+        raise AssertionError
+    with pytest.raises(SystemExit):
+        main(["--storage", str(storage), "export", "t", "out.txt"])
+
+
+@pytest.mark.asyncio
+async def test_async_import_export(tmp_path: Path) -> None:
+    """Test import and export on the async manager."""
+    db = FilesDB().init_async(storage=tmp_path / "db")
+    await db.create_table("t", COLUMNS, id_generator="id")
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 7)
+    if await db.import_jsonl("t", source, batch_size=3) != 7:  # noqa: PLR2004
+        raise AssertionError
+    target = tmp_path / "out.csv"
+    if await db.export_csv("t", target, "id < 4") != 4:  # noqa: PLR2004
+        raise AssertionError
+    found = await db.find("t", "id == 6")
+    if found[0]["6"]["blob"] != b"hello":
+        raise AssertionError(found)
+
+
+@pytest.mark.asyncio
+async def test_export_parity_with_empty_records(tmp_path: Path) -> None:
+    """Test sync and async exports write the same rows, empty ones too."""
+    table_name = "test_export_parity"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"name": "TEXT"})
+    db.new_data(table_name, {})
+    db.new_data(table_name, {"name": "John"})
+    sync_path, async_path = tmp_path / "sync.jsonl", tmp_path / "async.jsonl"
+    if db.export_jsonl(table_name, sync_path) != 2:  # noqa: PLR2004
+        raise AssertionError
+    adb = FilesDB().init_async(storage=tmp_path)
+    if await adb.export_jsonl(table_name, async_path) != 2:  # noqa: PLR2004
+        raise AssertionError
+    if async_path.read_text() != sync_path.read_text():
+        raise AssertionError(async_path.read_text())
+
+
+@pytest.mark.asyncio
+async def test_find_after_csv_with_empty_cells(tmp_path: Path) -> None:
+    """Test filters skip records an empty CSV cell left without a field."""
+    source = tmp_path / "in.csv"
+    source.write_text("name,age\na,3\nb,\nc,3\n", encoding="utf-8")
+    db = FilesDB().init_sync(storage=tmp_path / "db")
+    db.create_table("u", {"name": "TEXT", "age": "INT"})
+    if db.import_csv("u", source) != 3:  # noqa: PLR2004
+        raise AssertionError
+    if len(db.find("u", "age == 3")) != 2:  # noqa: PLR2004
+        raise AssertionError
+    adb = FilesDB().init_async(storage=tmp_path / "db")
+    if len(await adb.find("u", "age == 3", order_by="name")) != 2:  # noqa: PLR2004
+        raise AssertionError
+    if await adb.update_where("u", "age == 3", {"name": "d"}) != 2:  # noqa: PLR2004
+        raise AssertionError
+    if db.delete_where("u", "age == 3") != 2:  # noqa: PLR2004
+        raise AssertionError
+    if [r["name"] for found in db.find("u", "name == b")
+            for r in found.values()] != ["b"]:
+        raise AssertionError
@@ -0,0 +1,150 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test column types, record validation and bulk inserts."""
+
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.errors import (
+    DataIsUncorrectError,
+    InvalidConditionError,
+    NotFoundColumnError,
+    UnknownDataTypeError,
+)
+from pyfiles_db.files_db import FilesDB
+
+COLUMNS = {"id": "INT", "score": "FLOAT", "active": "BOOL",
+           "ts": "DATETIME", "blob": "BYTES"}
+TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def test_sync_column_types(tmp_path: Path) -> None:
+    """Test wide column types round-trip and work in conditions."""
+    table_name = "test_types_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.new_data(table_name, {"id": 1, "score": 1.5, "active": True,
+                             "ts": TS, "blob": b"\x00\xffdata"})
+    # Naive datetimes are UTC; ints are valid FLOAT values.
+    db.new_data(table_name, {"id": 2, "score": 3, "active": False,
+                             "ts": datetime(2024, 6, 1), "blob": b""})  # noqa: DTZ001
+
+    stored = json.loads(
+        (tmp_path / f"TABLE_{table_name}" / "1.json").read_text())
+    if stored["ts"] != 1704067200000000 or stored["blob"] != "0RLoRbYT":  # noqa: PLR2004
+        raise AssertionError(stored)
+
+    if db.find(table_name, "id == 1") != [
+            {"1": {"id": 1, "score": 1.5, "active": True, "ts": TS,
+                   "blob": b"\x00\xffdata"}}]:
+        raise AssertionError
+    second = db.find(table_name, "id == 2")[0]["2"]
+    if second["ts"] != datetime(2024, 6, 1, tzinfo=UTC) or second[
+            "score"] != 3.0:  # noqa: PLR2004
+        raise AssertionError(second)
+
+    if [*db.find(table_name, "ts == 2024-01-01T00:00:00+00:00")[0]] != [
+            "1"]:
+        raise AssertionError
+    # Other offsets name the same instant.
+    if [*db.find(table_name, "ts == 2024-01-01T03:00:00+03:00")[0]] != [
+            "1"]:
+        raise AssertionError
+    if [*db.find(table_name, "active == false")[0]] != ["2"]:
+        raise AssertionError
+    if [*db.find(table_name, "score == 3")[0]] != ["2"]:
+        raise AssertionError
+    if [*db.find(table_name, "blob == ")[0]] != ["2"]:
+        raise AssertionError
+    with pytest.raises(InvalidConditionError):
+        db.find(table_name, "active == maybe")
+
+    db.patch(table_name, "2", {"ts": TS + timedelta(days=1)})
+    if db.find(table_name, "id == 2")[0]["2"]["ts"] != datetime(
+            2024, 1, 2, 3, tzinfo=timezone(timedelta(hours=3))):
+        raise AssertionError
+
+
+def test_sync_validation(tmp_path: Path) -> None:
+    """Test unknown types, unknown columns and wrong values are rejected."""
+    table_name = "test_validation_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    with pytest.raises(UnknownDataTypeError):
+        db.create_table(table_name, {"id": "INT", "x": "DECIMAL"})
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    with pytest.raises(NotFoundColumnError):
+        db.new_data(table_name, {"id": 1, "email": "x"})
+    with pytest.raises(DataIsUncorrectError):
+        db.new_data(table_name, {"id": 1, "active": 1})
+    with pytest.raises(DataIsUncorrectError):
+        db.new_data(table_name, {"id": True})
+    with pytest.raises(DataIsUncorrectError):
+        db.new_data(table_name, {"id": 1, "ts": "2024-01-01"})
+    if db.find(table_name, "id == 1") != []:
+        raise AssertionError
+
+
+def test_sync_insert_many(tmp_path: Path) -> None:
+    """Test bulk insert validates the batch before writing any of it."""
+    table_name = "test_insert_many_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"name": "TEXT", "ts": "DATETIME"},
+                    bloom=True)
+    records = [{"name": f"user{i}", "ts": TS + timedelta(hours=i)}
+               for i in range(5)]
+    with pytest.raises(DataIsUncorrectError):
+        db.insert_many(table_name, [*records, {"name": 5}])
+    if db.find(table_name, "name STARTSWITH user") != []:
+        raise AssertionError
+
+    ids = db.insert_many(table_name, records)
+    if len(set(ids)) != len(records):
+        raise AssertionError(ids)
+    found = db.find(table_name, "name == user3")
+    if [*found[0]] != [ids[3]] or found[0][ids[3]]["ts"] != TS + timedelta(
+            hours=3):
+        raise AssertionError(found)
+    if db.insert_many(table_name, []) != []:
+        raise AssertionError
+    if db.new_data(table_name, {"name": "late", "ts": TS}) is not None:
+        raise AssertionError
+    if len(db.find(table_name, "ts == 2024-01-01T00:00:00+00:00")) != 2:  # noqa: PLR2004
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_column_types(tmp_path: Path) -> None:
+    """Test column types and bulk inserts on the async manager."""
+    table_name = "test_types_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    records = [{"id": i, "score": i / 2, "active": i % 2 == 0,
+                "ts": TS + timedelta(minutes=i), "blob": f"k{i}".encode()}
+               for i in range(4)]
+    with pytest.raises(NotFoundColumnError):
+        await db.insert_many(table_name, [*records, {"id": 9, "x": 1}])
+    if await db.insert_many(table_name, records) != ["0", "1", "2", "3"]:
+        raise AssertionError
+    found = await db.find(table_name, "blob == k2")
+    if found != [{"2": records[2]}]:
+        raise AssertionError(found)
+    found = await db.find(table_name, "active == true",
+                          order_by="ts", descending=True)
+    if [name for record in found for name in record] != ["2", "0"]:
+        raise AssertionError(found)
@@ -0,0 +1,99 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test directory descriptors and the record file pool."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.utils import DirHandle, FdPool
+from pyfiles_db.utils import dir_fd as dir_fd_module
+
+needs_dir_fd = pytest.mark.skipif(not dir_fd_module.SUPPORTED,
+                                  reason="dir_fd is not supported")
+
+
+@needs_dir_fd
+def test_pool_reopens_replaced_files(tmp_path: Path) -> None:
+    """Test reads after an outside replace, and the LRU bound."""
+    pool = FdPool(max_open=2)
+    handle = DirHandle(tmp_path, pool)
+    for i in range(3):
+        (tmp_path / f"{i}.json").write_text(f"[{i}]")
+    for i in range(3):
+        if handle.read(f"{i}.json") != f"[{i}]".encode():
+            raise AssertionError(i)
+    if len(pool) != 2:  # noqa: PLR2004
+        raise AssertionError(len(pool))
+
+    # Replaced behind the pool's back: the stat key no longer matches.
+    (tmp_path / "tmp").write_text("[10, 20]")
+    Path.replace(tmp_path / "tmp", tmp_path / "2.json")
+    if handle.read("2.json") != b"[10, 20]":
+        raise AssertionError
+
+    handle.write_atomic("2.json", "[30]")
+    if handle.read("2.json") != b"[30]":
+        raise AssertionError
+    handle.remove("2.json")
+    with pytest.raises(FileNotFoundError):
+        handle.read("2.json")
+    if sorted(p.name for p in tmp_path.iterdir()) != ["0.json", "1.json"]:
+        raise AssertionError
+
+    fd = handle.fileno()
+    handle.close()
+    if len(pool):
+        raise AssertionError
+    with pytest.raises(OSError):  # noqa: PT011
+        os.fstat(fd)  # type: ignore[arg-type]
+    if handle.read("0.json") != b"[0]":
+        raise AssertionError
+
+
+def test_fallback_without_dir_fd(tmp_path: Path,
+                                 monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test path based I/O where dir_fd is not supported."""
+    monkeypatch.setattr(dir_fd_module, "SUPPORTED", False)
+    handle = DirHandle(tmp_path, FdPool())
+    handle.write_atomic("1.json", b"{}")
+    if handle.fileno() is not None or handle.read("1.json") != b"{}":
+        raise AssertionError
+    with pytest.raises(FileExistsError):
+        handle.write_atomic("1.json", b"[]", exclusive=True)
+    if handle.read("1.json") != b"{}":
+        raise AssertionError
+    handle.remove("1.json")
+    if list(tmp_path.iterdir()):
+        raise AssertionError
+
+
+def test_table_record_io(tmp_path: Path) -> None:
+    """Test reads, updates and deletes of records through the folder."""
+    table_name = "test_dir_fd"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"name": "TEXT"})
+    db.new_data(table_name, {"name": "a"})
+    if db.find(table_name, "name == a") != [{"0": {"name": "a"}}]:
+        raise AssertionError
+    db.update(table_name, "0", {"name": "b"})
+    if db.find(table_name, "name == b") != [{"0": {"name": "b"}}]:
+        raise AssertionError
+    db.delete(table_name, "0")
+    with pytest.raises(FileNotFoundError):
+        db.delete(table_name, "0")
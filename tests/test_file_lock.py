@@ -0,0 +1,62 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test cross-process writes."""
+
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager._id_set import _IdSet
+from pyfiles_db.files_db import FilesDB
+
+PROCESSES = 4
+ROWS = 25
+
+
+def insert_rows(table_name: str) -> None:
+    """Insert rows from a worker process."""
+    db = FilesDB().init_sync()
+    for i in range(ROWS):
+        db.new_data(table_name, {"number": i})
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is POSIX only")
+def test_sync_parallel_processes_new_data() -> None:
+    """Test that parallel processes do not lose ids."""
+    table_name = "test_parallel_processes"
+    db = FilesDB().init_sync()
+    db.create_table(table_name, {"number": "INT"})
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=insert_rows, args=(table_name,))
+               for _ in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        if worker.exitcode != 0:
+            raise AssertionError(worker.exitcode)
+
+    table = Path("database") / f"TABLE_{table_name}"
+    with Path.open(table / ".json") as f:
+        ids = list(_IdSet.from_json(json.load(f)["FILE_IDS"]))
+    if sorted(ids, key=int) != [str(i) for i in range(PROCESSES * ROWS)]:
+        raise AssertionError(ids)
+    if len(list(table.glob("*.json"))) != PROCESSES * ROWS + 1:
+        raise AssertionError
@@ -0,0 +1,176 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the resident file id set and duplicate ids."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager._id_set import _IdSet
+from pyfiles_db.errors import DuplicateIdError
+from pyfiles_db.files_db import FilesDB
+
+COLUMNS = {"id": "TEXT", "number": "INT"}
+
+
+def file_ids(storage: Path, table_name: str) -> list[str | int | list[int]]:
+    """Read the raw id list of a table."""
+    index = storage / f"TABLE_{table_name}" / ".json"
+    ids: list[str | int | list[int]] = json.loads(index.read_text())[
+        "FILE_IDS"]
+    return ids
+
+
+def test_id_set_round_trip() -> None:
+    """Test decimal runs are folded and insertion order is kept."""
+    ids = _IdSet(["0", "1", "2", "5", "a", "7", "8", "007", "2"])
+    if len(ids) != 8 or "007" not in ids or "9" in ids:  # noqa: PLR2004
+        raise AssertionError(list(ids))
+    if ids.add("a") or not ids.discard("5") or ids.discard("5"):
+        raise AssertionError(list(ids))
+    encoded = ids.to_json()
+    if encoded != [[0, 2], "a", [7, 8], "007"]:
+        raise AssertionError(encoded)
+    if list(_IdSet.from_json(encoded)) != list(ids):
+        raise AssertionError(list(_IdSet.from_json(encoded)))
+    # Plain lists written before the compact form, with repeats.
+    if list(_IdSet.from_json(["3", "x", "3", 4])) != ["3", "x", "4"]:
+        raise AssertionError
+
+
+def test_sync_generated_ids_are_one_run(tmp_path: Path) -> None:
+    """Test auto ids are stored as a single pair."""
+    table_name = "test_id_run"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"number": "INT"})
+    db.insert_many(table_name, [{"number": i} for i in range(50)])
+    db.delete(table_name, "49")
+    if file_ids(tmp_path, table_name) != [[0, 48]]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+
+
+def test_sync_duplicate_id(tmp_path: Path) -> None:
+    """Test a taken generator id is rejected before it is written."""
+    table_name = "test_duplicate_id"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.new_data(table_name, {"id": "a", "number": 1})
+    with pytest.raises(DuplicateIdError, match="'a'"):
+        db.new_data(table_name, {"id": "a", "number": 2})
+    if db.find(table_name, "id == a") != [{"a": {"id": "a", "number": 1}}]:
+        raise AssertionError
+
+    with pytest.raises(DuplicateIdError, match="'b'"):
+        db.insert_many(table_name, [{"id": "b", "number": 3},
+                                    {"id": "b", "number": 4},
+                                    {"id": "c", "number": 5}])
+    if file_ids(tmp_path, table_name) != ["a", "b", "c"]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+    if db.find(table_name, "id == b") != [{"b": {"id": "b", "number": 3}}]:
+        raise AssertionError
+
+    # An upsert of a saved id patches it instead.
+    db.upsert(table_name, {"id": "a", "number": 6})
+    db.delete(table_name, "a")
+    db.new_data(table_name, {"id": "a", "number": 7})
+    if file_ids(tmp_path, table_name) != ["b", "c", "a"]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+
+
+def test_sync_ids_reloaded_after_other_writer(tmp_path: Path) -> None:
+    """Test a resident id set sees writes of another handle."""
+    table_name = "test_id_reload"
+    first = FilesDB().init_sync(storage=tmp_path)
+    first.create_table(table_name, COLUMNS, id_generator="id")
+    first.new_data(table_name, {"id": "a", "number": 1})
+    second = FilesDB().init_sync(storage=tmp_path)
+    second.new_data(table_name, {"id": "b", "number": 2})
+    with pytest.raises(DuplicateIdError):
+        first.new_data(table_name, {"id": "b", "number": 3})
+    if len(first.find(table_name, "number > 0")) != 2:  # noqa: PLR2004
+        raise AssertionError
+
+
+def test_sync_reads_plain_id_list(tmp_path: Path) -> None:
+    """Test tables written with a plain string list still load."""
+    table_name = "test_plain_ids"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"number": "INT"})
+    db.insert_many(table_name, [{"number": i} for i in range(3)])
+    index = tmp_path / f"TABLE_{table_name}" / ".json"
+    index.write_text(json.dumps({"FILE_IDS": ["0", "1", "2", "1"]}))
+
+    reopened = FilesDB().init_sync(storage=tmp_path)
+    if len(reopened.find(table_name, "number >= 0")) != 3:  # noqa: PLR2004
+        raise AssertionError
+    reopened.new_data(table_name, {"number": 3})
+    if file_ids(tmp_path, table_name) != [[0, 3]]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+
+
+@pytest.mark.asyncio
+async def test_async_duplicate_id(tmp_path: Path) -> None:
+    """Test concurrent inserts of one id save it once."""
+    table_name = "test_async_duplicate_id"
+    db = FilesDB().init_async(storage=tmp_path, write_window=0.01)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    results = await asyncio.gather(
+        *(db.new_data(table_name, {"id": "a", "number": i})
+          for i in range(3)),
+        return_exceptions=True)
+    errors = [r for r in results if isinstance(r, DuplicateIdError)]
+    if len(errors) != 2:  # noqa: PLR2004
+        raise AssertionError(results)
+    with pytest.raises(DuplicateIdError):
+        await db.new_data(table_name, {"id": "a", "number": 9})
+    if file_ids(tmp_path, table_name) != ["a"]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+    found = await db.find(table_name, "id == a")
+    if found != [{"a": {"id": "a", "number": 0}}]:
+        raise AssertionError(found)
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_id_written_by_other_process(tmp_path: Path) -> None:
+    """Test an id written but not yet committed elsewhere is not replaced."""
+    table_name = "test_racing_id"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    # Another process passed the check and wrote "a" and "b", but has not
+    # added them to the index yet.
+    folder = tmp_path / f"TABLE_{table_name}"
+    for name in "ab":
+        (folder / f"{name}.json").write_text(
+            json.dumps({"id": name, "number": 0}))
+    with pytest.raises(DuplicateIdError, match="'a'"):
+        db.new_data(table_name, {"id": "a", "number": 1})
+    with pytest.raises(DuplicateIdError, match="'b'"):
+        db.insert_many(table_name, [{"id": "b", "number": 2},
+                                    {"id": "c", "number": 3}])
+    # Through aiofiles, then through the I/O pool.
+    for io_workers in (0, 2):
+        adb = FilesDB().init_async(storage=tmp_path, io_workers=io_workers)
+        with pytest.raises(DuplicateIdError, match="'a'"):
+            await adb.new_data(table_name, {"id": "a", "number": 4})
+        adb.close()
+    if file_ids(tmp_path, table_name) != ["c"]:
+        raise AssertionError(file_ids(tmp_path, table_name))
+    if json.loads((folder / "a.json").read_text())["number"] != 0:
+        raise AssertionError
+    if [p.name for p in folder.iterdir() if p.suffix == ".tmp"]:
+        raise AssertionError
@@ -0,0 +1,54 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the dedicated I/O pool of the async manager."""
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+
+data = [{"id": i, "number": i % 3} for i in range(300)]
+DELETED_ID = 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("io_workers", [None, 2, 0])
+async def test_async_io_workers(io_workers: int | None) -> None:
+    """Test that the pool and the aiofiles fallback agree."""
+    table_name = f"test_io_workers_{io_workers}"
+    db = FilesDB().init_async(io_workers=io_workers)
+    await db.create_table(table_name, {"id": "INT", "number": "INT"},
+                          id_generator="id")
+    for d in data:
+        await db.new_data(table_name, d)
+    await db.update(table_name, "4", {"id": 4, "number": 0})
+    await db.delete(table_name, str(DELETED_ID))
+
+    result = await db.find(table_name, "number == 0")
+    expected = [{str(d["id"]): d} for d in data
+                if d["number"] == 0 and d["id"] != DELETED_ID]
+    expected.insert(1, {"4": {"id": 4, "number": 0}})
+    if result != expected:
+        raise AssertionError(result)
+    if await db.find(table_name, f"id == {DELETED_ID}") != []:
+        raise AssertionError
+
+    stats = db.io_stats()
+    if io_workers == 0:
+        if stats != {}:
+            raise AssertionError(stats)
+    elif stats["queue_depth"] != 0 or stats["completed"] == 0:
+        raise AssertionError(stats)
+    db.close()
@@ -0,0 +1,119 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test joins between tables."""
+
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.errors import NotFoundColumnError
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import CallbackSink, OperationStats
+
+users = [
+    {"id": 1, "name": "John"},
+    {"id": 2, "name": "Anna"},
+    {"id": 3, "name": "Alex"},
+]
+orders = [
+    {"order_id": 10, "user_id": 2, "item": "book"},
+    {"order_id": 11, "user_id": 1, "item": "pen"},
+    {"order_id": 12, "user_id": 2, "item": "lamp"},
+    {"order_id": 13, "user_id": 9, "item": "cup"},
+    {"order_id": 14, "user_id": 3, "item": "desk"},
+    {"order_id": 15, "user_id": 1, "item": "mug"},
+]
+USERS = {"id": "INT", "name": "TEXT"}
+ORDERS = {"order_id": "INT", "user_id": "INT", "item": "TEXT"}
+
+
+def pairs(result: list[dict[str, dict[str, object]]]) -> set[tuple[str, str]]:
+    """Return (left file id, right file id) of a join result."""
+    return {(*row["left"], *row["right"]) for row in result}
+
+
+EXPECTED = {("10", "2"), ("11", "1"), ("12", "2"), ("14", "3"), ("15", "1")}
+
+
+def test_sync_join_strategies(tmp_path: Path) -> None:
+    """Test hash, generator and index joins return the same pairs."""
+    seen: list[OperationStats] = []
+    db = FilesDB().init_sync(storage=tmp_path,
+                             metrics=CallbackSink(seen.append))
+    db.create_table("users", USERS, id_generator="id")
+    db.create_table("users_seq", USERS)
+    db.create_table("orders", ORDERS, id_generator="order_id")
+    for user in users:
+        db.new_data("users", user)
+        db.new_data("users_seq", user)
+    for order in orders:
+        db.new_data("orders", order)
+
+    def path_of_last_join() -> str:
+        return next(str(s.access_path) for s in reversed(seen)
+                    if s.operation == "join")
+
+    # Every order: the users side is smaller, so it is hashed.
+    result = db.join("orders", "users", on=("user_id", "id"))
+    if pairs(result) != EXPECTED or path_of_last_join() != "hash":
+        raise AssertionError(result)
+    row = next(r for r in result if "10" in r["left"])
+    if row["right"] != {"2": users[1]} or row["left"]["10"] != orders[0]:
+        raise AssertionError(row)
+
+    # Few orders: users are read by file name, no scan.
+    result = db.join("orders", "users", on=("user_id", "id"),
+                     condition="item == pen")
+    if pairs(result) != {("11", "1")} or path_of_last_join() != "generator":
+        raise AssertionError(result)
+
+    # Users without generator: scan and hash, then through an index.
+    seq = {("11", "0")}
+    result = db.join("orders", "users_seq", on=("user_id", "id"),
+                     condition="item == pen")
+    if pairs(result) != seq or path_of_last_join() != "hash":
+        raise AssertionError(result)
+    db.create_index("users_seq", "id")
+    result = db.join("orders", "users_seq", on=("user_id", "id"),
+                     condition="item == pen")
+    if pairs(result) != seq or path_of_last_join() != "index":
+        raise AssertionError(result)
+
+    # The smaller left side is hashed and the users are probed.
+    result = db.join("users", "orders", on=("id", "user_id"))
+    if {(r, lft) for lft, r in pairs(result)} != EXPECTED:
+        raise AssertionError(result)
+    with pytest.raises(NotFoundColumnError):
+        db.join("orders", "users", on="user_id")
+
+
+@pytest.mark.asyncio
+async def test_async_join(tmp_path: Path) -> None:
+    """Test the async manager joins with a hash table and by file name."""
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table("users", USERS, id_generator="id")
+    await db.create_table("orders", ORDERS, id_generator="order_id")
+    for user in users:
+        await db.new_data("users", user)
+    for order in orders:
+        await db.new_data("orders", order)
+    result = await db.join("orders", "users", on=("user_id", "id"))
+    if pairs(result) != EXPECTED:
+        raise AssertionError(result)
+    result = await db.join("orders", "users", on=("user_id", "id"),
+                           condition="item == lamp")
+    if pairs(result) != {("12", "2")}:
+        raise AssertionError(result)
+    db.close()
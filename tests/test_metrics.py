@@ -0,0 +1,94 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test operation metrics."""
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import CallbackSink, InMemoryRegistry, OperationStats
+
+data = [
+    {"id": 1, "first_name": "John", "number": 8},
+    {"id": 2, "first_name": "Jane", "number": 12},
+    {"id": 3, "first_name": "Alex", "number": 8},
+]
+
+
+def test_sync_metrics_registry() -> None:
+    """Test counters and latency of sync operations."""
+    table_name = "test_metrics_sync"
+    registry = InMemoryRegistry()
+    db = FilesDB().init_sync(metrics=registry)
+    if db.metrics is not registry:
+        raise AssertionError
+    db.create_table(table_name, {"id": "INT", "first_name": "TEXT",
+                                 "number": "INT"}, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+    db.find(table_name, "number == 8")
+    db.find(table_name, "id == 2")
+    db.update(table_name, "2", {"id": 2, "first_name": "Jane", "number": 1})
+    db.delete(table_name, "3")
+    with pytest.raises(FileNotFoundError):
+        db.delete(table_name, "3")
+
+    new_data = registry.counters("new_data", table_name)
+    if new_data["calls"] != len(data) or new_data["bytes_written"] == 0:
+        raise AssertionError(new_data)
+    find = registry.counters("find", table_name)
+    # Three records for the scan (the id list is resident), one by id.
+    if (find["calls"], find["files_opened"], find["records_decoded"]) != (
+            2, 4, 4):
+        raise AssertionError(find)
+    delete = registry.counters("delete", table_name)
+    if (delete["calls"], delete["errors"]) != (2, 1):
+        raise AssertionError(delete)
+    if sum(registry.histogram("find", table_name).counts) != 2:  # noqa: PLR2004
+        raise AssertionError
+    text = registry.exposition()
+    if (f'pyfiles_db_calls_total{{operation="find",table="{table_name}"}} 2'
+            not in text):
+        raise AssertionError(text)
+
+
+@pytest.mark.asyncio
+async def test_async_metrics_callback() -> None:
+    """Test that async operations and commits reach the callback."""
+    table_name = "test_metrics_async"
+    seen: list[OperationStats] = []
+    db = FilesDB().init_async(metrics=CallbackSink(seen.append))
+    await db.create_table(table_name, {"id": "INT", "first_name": "TEXT",
+                                       "number": "INT"}, id_generator="id")
+    for d in data:
+        await db.new_data(table_name, d)
+    await db.find(table_name, "number == 8")
+
+    operations = [stats.operation for stats in seen]
+    if operations.count("new_data") != len(data) or "commit" not in operations:
+        raise AssertionError(operations)
+    find = next(stats for stats in seen if stats.operation == "find")
+    if find.records_decoded != len(data) or find.bytes_read == 0:
+        raise AssertionError(find)
+    if any(stats.bytes_written == 0 for stats in seen
+           if stats.operation == "new_data"):
+        raise AssertionError(seen)
+
+
+def test_metrics_disabled() -> None:
+    """Test that metrics are off by default."""
+    db = FilesDB().init_sync()
+    if db.metrics is not None:
+        raise AssertionError
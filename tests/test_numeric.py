@@ -0,0 +1,137 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test comparison conditions and numeric sidecars."""
+
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager import _DBsync
+from pyfiles_db.errors import InvalidConditionError
+from pyfiles_db.files_db import FilesDB
+
+COLUMNS = {"id": "INT", "name": "TEXT", "age": "INT", "blob": "BYTES"}
+PEOPLE = [{"id": i, "name": f"user{i}", "age": 20 + i % 5}
+          for i in range(10)]
+
+
+def ids(result: list[dict[str, object]]) -> list[str]:
+    """Return file ids of a find result."""
+    return [name for record in result for name in record]
+
+
+def test_sync_comparisons(tmp_path: Path) -> None:
+    """Test comparisons by scan and by column index."""
+    table_name = "test_compare_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.insert_many(table_name, PEOPLE)
+
+    expected = {"age >= 23": ["3", "4", "8", "9"],
+                "age<21": ["0", "5"],
+                "age != 20": ["1", "2", "3", "4", "6", "7", "8", "9"],
+                "name > user7": ["8", "9"],
+                "name <= 'user1'": ["0", "1"]}
+    for condition, names in expected.items():
+        if ids(db.find(table_name, condition)) != names:
+            raise AssertionError(condition)
+    if db.explain(table_name, "age > 22")["access_path"] != "scan":
+        raise AssertionError
+
+    db.create_index(table_name, "age")
+    plan = db.explain(table_name, "age > 22")
+    if plan["access_path"] != "index" or plan["candidates"] != 4:  # noqa: PLR2004
+        raise AssertionError(plan)
+    for condition, names in expected.items():
+        if sorted(ids(db.find(table_name, condition))) != names:
+            raise AssertionError(condition)
+
+    with pytest.raises(InvalidConditionError):
+        db.find(table_name, "blob < abc")
+    with pytest.raises(InvalidConditionError):
+        db.find(table_name, "age < old")
+
+
+def numeric_table(tmp_path: Path, table_name: str) -> _DBsync:
+    """Return a sync database with a numeric index on ``age``."""
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.insert_many(table_name, PEOPLE)
+    if db.create_numeric_index(table_name, "age") != len(PEOPLE):
+        raise AssertionError
+    return db
+
+
+def test_sync_numeric_index(tmp_path: Path) -> None:
+    """Test vectorized comparisons select candidates."""
+    pytest.importorskip("numpy")
+    table_name = "test_numeric_sync"
+    db = numeric_table(tmp_path, table_name)
+    with pytest.raises(ValueError, match="not INT"):
+        db.create_numeric_index(table_name, "name")
+    values = tmp_path / f"TABLE_{table_name}" / ".num-age"
+    if values.stat().st_size != 8 * len(PEOPLE):
+        raise AssertionError
+    plan = db.explain(table_name, "age >= 23")
+    if plan["access_path"] != "numeric" or plan["candidates"] != 4:  # noqa: PLR2004
+        raise AssertionError(plan)
+    if ids(db.find(table_name, "age >= 23")) != ["3", "4", "8", "9"]:
+        raise AssertionError
+    if ids(db.find(table_name, "age == 24")) != ["4", "9"]:
+        raise AssertionError
+    # Values beyond int64 fall back to the other access paths.
+    if db.explain(table_name, f"age < {2**70}")["access_path"] != "scan":
+        raise AssertionError
+
+
+def test_sync_numeric_writes(tmp_path: Path) -> None:
+    """Test sidecar rows follow writes and are rebuilt by compact."""
+    pytest.importorskip("numpy")
+    table_name = "test_numeric_writes"
+    db = numeric_table(tmp_path, table_name)
+    values = tmp_path / f"TABLE_{table_name}" / ".num-age"
+    # Later writes append rows; stale rows are checked against records.
+    db.new_data(table_name, {"id": 10, "name": "new", "age": 2**70})
+    db.patch(table_name, "3", {"age": 1})
+    db.delete(table_name, "4")
+    if ids(db.find(table_name, "age >= 23")) != ["8", "9", "10"]:
+        raise AssertionError
+    if ids(db.find(table_name, "age < 20")) != ["3"]:
+        raise AssertionError
+
+    db.compact(table_name)
+    if values.stat().st_size != 8 * len(PEOPLE):
+        raise AssertionError
+    if ids(db.find(table_name, "age >= 23")) != ["8", "9", "10"]:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_numeric_index(tmp_path: Path) -> None:
+    """Test numeric sidecars on the async manager."""
+    pytest.importorskip("numpy")
+    table_name = "test_numeric_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.insert_many(table_name, PEOPLE[:5])
+    await db.create_numeric_index(table_name, "age")
+    await db.insert_many(table_name, PEOPLE[5:])
+    found = await db.find(table_name, "age > 22", order_by="id",
+                          descending=True, limit=3)
+    if ids(found) != ["9", "8", "4"]:
+        raise AssertionError(found)
+    if (await db.explain(table_name, "age > 22"))["access_path"] != "numeric":
+        raise AssertionError
@@ -0,0 +1,134 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test ordered and limited find results."""
+
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.errors import NotFoundColumnError
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import InMemoryRegistry
+
+data = [
+    {"id": 1, "name": "John", "email": "john@corp.com", "age": 30},
+    {"id": 2, "name": "Joanna", "email": "jo@mail.org", "age": 25},
+    {"id": 3, "name": "Alex", "email": "alex@corp.com", "age": 41},
+    {"id": 4, "name": "Bojo", "email": "bojo@home.net", "age": 19},
+    {"id": 5, "name": "Mary", "email": "mary@corp.com", "age": 33},
+    # No age: sorts last in both directions.
+    {"id": 6, "name": "Zed", "email": "zed@x.io"},
+    {"id": 7, "name": "Ann", "email": "ann@corp.com", "age": 25},
+]
+COLUMNS = {"id": "INT", "name": "TEXT", "email": "TEXT", "age": "INT"}
+ALL = "email CONTAINS '@'"
+
+
+def ids(result: list[dict[str, object]]) -> list[str]:
+    """Return file ids of a find result."""
+    return [name for record in result for name in record]
+
+
+def test_sync_order_by_heap(tmp_path: Path) -> None:
+    """Test sorting and top-k selection without an index."""
+    table_name = "test_order_by_heap"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+
+    if ids(db.find(table_name, ALL, order_by="age")) != [
+            "4", "2", "7", "1", "5", "3", "6"]:
+        raise AssertionError
+    if ids(db.find(table_name, ALL, order_by="age", descending=True)) != [
+            "3", "5", "1", "2", "7", "4", "6"]:
+        raise AssertionError
+    top = db.find(table_name, ALL, order_by="age", descending=True, limit=2)
+    if ids(top) != ["3", "5"]:
+        raise AssertionError(top)
+    if ids(db.find(table_name, ALL, order_by="name", limit=3)) != [
+            "3", "7", "4"]:
+        raise AssertionError
+    if ids(db.find(table_name, ALL, limit=3)) != ["1", "2", "3"]:
+        raise AssertionError
+    if db.find(table_name, "id == 3", limit=0) != []:
+        raise AssertionError
+    plan = db.explain(table_name, ALL, order_by="age", limit=2)
+    if (plan["access_path"], plan["sort"]) != ("scan", "heap"):
+        raise AssertionError(plan)
+
+    with pytest.raises(ValueError, match="limit"):
+        db.find(table_name, ALL, limit=-1)
+    with pytest.raises(NotFoundColumnError):
+        db.find(table_name, ALL, order_by="missing")
+
+
+def test_sync_order_by_index(tmp_path: Path) -> None:
+    """Test an index on the sort column gives the order and stops early."""
+    table_name = "test_order_by_index"
+    metrics = InMemoryRegistry()
+    db = FilesDB().init_sync(storage=tmp_path, metrics=metrics)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+    expected = {
+        (desc, limit): ids(db.find(table_name, ALL, order_by="age",
+                                   descending=desc, limit=limit))
+        for desc in (False, True) for limit in (None, 2)}
+    db.create_index(table_name, "age")
+
+    for (desc, limit), found in expected.items():
+        result = db.find(table_name, ALL, order_by="age", descending=desc,
+                         limit=limit)
+        if ids(result) != found:
+            raise AssertionError((desc, limit, result))
+    plan = db.explain(table_name, ALL, order_by="age", limit=2)
+    if (plan["access_path"], plan["sort"]) != ("index_order", "index"):
+        raise AssertionError(plan)
+
+    metrics.reset()
+    result = db.find(table_name, "email CONTAINS 'corp'", order_by="age",
+                     descending=True, limit=2)
+    if ids(result) != ["3", "5"]:
+        raise AssertionError(result)
+    (entry,) = metrics.snapshot()
+    if entry["records_decoded"] != 2:  # noqa: PLR2004
+        raise AssertionError(entry)
+
+    db.update(table_name, "4", {"id": 4, "name": "Bojo",
+                                "email": "bojo@home.net", "age": 60})
+    if ids(db.find(table_name, ALL, order_by="age", descending=True,
+                   limit=1)) != ["4"]:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_order_by(tmp_path: Path) -> None:
+    """Test the async manager sorts with a heap and with an index."""
+    table_name = "test_order_by_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        await db.new_data(table_name, d)
+    heap = await db.find(table_name, ALL, order_by="age", limit=3)
+    if ids(heap) != ["4", "2", "7"]:
+        raise AssertionError(heap)
+    await db.create_index(table_name, "age")
+    walked = await db.find(table_name, ALL, order_by="age", limit=3)
+    if walked != heap:
+        raise AssertionError(walked)
+    if ids(await db.find(table_name, ALL, limit=2)) != ["1", "2"]:
+        raise AssertionError
+    db.close()
@@ -0,0 +1,162 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test partial updates and upserts."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.errors import DataIsUncorrectError, NotFoundColumnError
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import CallbackSink, OperationStats
+
+COLUMNS = {"id": "INT", "name": "TEXT", "age": "INT"}
+
+
+def ids(result: list[dict[str, object]]) -> list[str]:
+    """Return file ids of a find result."""
+    return [name for record in result for name in record]
+
+
+def test_sync_patch(tmp_path: Path) -> None:
+    """Test patch writes changed fields only and skips no-op changes."""
+    table_name = "test_patch_sync"
+    seen: list[OperationStats] = []
+    db = FilesDB().init_sync(storage=tmp_path,
+                             metrics=CallbackSink(seen.append))
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.new_data(table_name, {"id": 1, "name": "John", "age": 30})
+    db.create_index(table_name, "name")
+    journal = tmp_path / f"TABLE_{table_name}" / ".idx-name"
+    record = tmp_path / f"TABLE_{table_name}" / "1.json"
+
+    size, mtime = journal.stat().st_size, record.stat().st_mtime_ns
+    if db.patch(table_name, "1", {"age": 30, "name": "John"}):
+        raise AssertionError
+    if seen[-1].bytes_written or record.stat().st_mtime_ns != mtime:
+        raise AssertionError(seen[-1])
+
+    # Only the changed column reaches its index.
+    if not db.patch(table_name, "1", {"age": 31}):
+        raise AssertionError
+    if journal.stat().st_size != size:
+        raise AssertionError
+    if db.find(table_name, "id == 1") != [
+            {"1": {"id": 1, "name": "John", "age": 31}}]:
+        raise AssertionError
+    db.patch(table_name, "1", {"name": "Jack"})
+    if ids(db.find(table_name, "name STARTSWITH Ja")) != ["1"]:
+        raise AssertionError
+    if db.find(table_name, "name == John") != []:
+        raise AssertionError
+
+    with pytest.raises(NotFoundColumnError):
+        db.patch(table_name, "1", {"email": "x"})
+    with pytest.raises(DataIsUncorrectError):
+        db.patch(table_name, "1", {"age": "31"})
+    with pytest.raises(DataIsUncorrectError):
+        db.patch(table_name, "1", {"id": 2})
+    with pytest.raises(FileNotFoundError):
+        db.patch(table_name, "7", {"age": 1})
+
+
+def test_sync_upsert(tmp_path: Path) -> None:
+    """Test upsert by id_generator column and by another column."""
+    table_name = "test_upsert_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    if db.upsert(table_name, {"id": 1, "name": "John", "age": 30}) != "1":
+        raise AssertionError
+    if db.upsert(table_name, {"id": 1, "name": "John", "age": 31}) != "1":
+        raise AssertionError
+    if db.find(table_name, "id == 1") != [
+            {"1": {"id": 1, "name": "John", "age": 31}}]:
+        raise AssertionError
+
+    seq = "test_upsert_seq"
+    db.create_table(seq, COLUMNS)
+    with pytest.raises(ValueError, match="'on'"):
+        db.upsert(seq, {"id": 1, "name": "John", "age": 30})
+    first = db.upsert(seq, {"id": 1, "name": "John", "age": 30}, on="name")
+    db.create_index(seq, "name")
+    again = db.upsert(seq, {"name": "John", "age": 40}, on="name")
+    other = db.upsert(seq, {"name": "Anna", "age": 20}, on="name")
+    if first != again or other == first:
+        raise AssertionError((first, again, other))
+    if db.find(seq, "name == John") != [
+            {first: {"id": 1, "name": "John", "age": 40}}]:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_patch_upsert(tmp_path: Path) -> None:
+    """Test patch and upsert on the async manager."""
+    table_name = "test_patch_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.upsert(table_name, {"id": 1, "name": "John", "age": 30})
+    await db.upsert(table_name, {"id": 2, "name": "Anna", "age": 25})
+    if await db.patch(table_name, "2", {"age": 25}):
+        raise AssertionError
+    if not await db.patch(table_name, "2", {"age": 26}):
+        raise AssertionError
+    await db.upsert(table_name, {"id": 1, "name": "Johnny"})
+    result = await db.find(table_name, "age == 30")
+    if result != [{"1": {"id": 1, "name": "Johnny", "age": 30}}]:
+        raise AssertionError(result)
+    if ids(await db.find(table_name, "age == 26")) != ["2"]:
+        raise AssertionError
+    db.close()
+
+
+def test_sync_upsert_after_other_writer(tmp_path: Path) -> None:
+    """Test an id saved by another handle after the lookup is patched."""
+    table_name = "test_upsert_race_sync"
+    first = FilesDB().init_sync(storage=tmp_path, bloom_max_age=60.0)
+    first.create_table(table_name, COLUMNS, id_generator="id", bloom=True)
+    # Loads the id filter, which then misses the next insert.
+    first.find(table_name, "id == 7")
+    second = FilesDB().init_sync(storage=tmp_path)
+    second.new_data(table_name, {"id": 7, "name": "John", "age": 30})
+
+    if first.upsert(table_name, {"id": 7, "name": "Jane", "age": 31}) != "7":
+        raise AssertionError
+    if second.find(table_name, "id == 7") != [
+            {"7": {"id": 7, "name": "Jane", "age": 31}}]:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_upserts(tmp_path: Path) -> None:
+    """Test concurrent upserts of one new key insert it once."""
+    table_name = "test_upsert_concurrent"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    results = await asyncio.gather(
+        *(db.upsert(table_name, {"id": 7, "name": f"user{i}", "age": i})
+          for i in range(5)))
+    if results != ["7"] * 5:
+        raise AssertionError(results)
+    await asyncio.gather(
+        *(db.upsert(table_name, {"id": 8, "name": "same", "age": i},
+                    on="name")
+          for i in range(5)))
+    if len(await db.find(table_name, "name == same")) != 1:
+        raise AssertionError
+    if await db.find(table_name, "id == 7") != [
+            {"7": {"id": 7, "name": "user4", "age": 4}}]:
+        raise AssertionError
+    db.close()
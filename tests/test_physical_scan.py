@@ -0,0 +1,99 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test full scans read in inode order."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager import _DBsync
+from pyfiles_db.database_manager._storage import _TableStorage
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import InMemoryRegistry
+from pyfiles_db.utils import DirHandle, FdPool
+
+COLUMNS = {"id": "INT", "group": "INT"}
+TABLE = "test_physical_scan"
+
+
+def churn(db: _DBsync, storage: Path) -> None:
+    """Fill a table, then rewrite and delete records out of order."""
+    db.create_table(TABLE, COLUMNS, id_generator="id")
+    db.insert_many(TABLE, [{"id": i, "group": i % 3} for i in range(30)])
+    for i in range(0, 30, 4):
+        db.update(TABLE, str(i), {"id": i, "group": 0})
+    for i in range(1, 30, 7):
+        db.delete(TABLE, str(i))
+    # A record file missing from the index is never returned.
+    folder = storage / f"TABLE_{TABLE}"
+    (folder / "99.json").write_text(json.dumps({"id": 99, "group": 0}))
+
+
+def test_sync_physical_scan(tmp_path: Path) -> None:
+    """Test inode order scans return what index order scans return."""
+    registry = InMemoryRegistry()
+    plain = FilesDB().init_sync(storage=tmp_path)
+    churn(plain, tmp_path)
+    physical = FilesDB().init_sync(storage=tmp_path, scan_readahead=8,
+                                   metrics=registry)
+    for condition in ("group == 0", "group != 5", "id >= 10"):
+        if physical.find(TABLE, condition) != plain.find(TABLE, condition):
+            raise AssertionError(condition)
+    ordered = {"order_by": "group", "descending": True, "limit": 5}
+    if (physical.find(TABLE, "id >= 0", **ordered)
+            != plain.find(TABLE, "id >= 0", **ordered)):
+        raise AssertionError
+    # 25 records, the orphan file is not opened.
+    if registry.counters("find", TABLE)["records_decoded"] != 4 * 25:
+        raise AssertionError(registry.counters("find", TABLE))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("io_workers", [None, 0])
+async def test_async_physical_scan(tmp_path: Path,
+                                   io_workers: int | None) -> None:
+    """Test inode order scans of the async manager."""
+    plain = FilesDB().init_sync(storage=tmp_path)
+    churn(plain, tmp_path)
+    db = FilesDB().init_async(storage=tmp_path, scan_readahead=4,
+                              io_workers=io_workers)
+    for condition in ("group == 0", "id < 12"):
+        if await db.find(TABLE, condition) != plain.find(TABLE, condition):
+            raise AssertionError(condition)
+    db.close()
+
+
+def test_physical_order_and_readahead(tmp_path: Path) -> None:
+    """Test ids sorted by inode and reads through a read-ahead window."""
+    storage = _TableStorage(tmp_path)
+    names = [str(i) for i in range(10)]
+    for name in names:
+        (tmp_path / f"{name}.json").write_text(json.dumps({"n": name}))
+    (tmp_path / "5.json").unlink()
+    ordered = storage.physical_order([*names, "missing"])
+    inodes = [(tmp_path / f"{n}.json").stat().st_ino for n in ordered]
+    if sorted(ordered) != sorted(set(names) - {"5"}) or inodes != sorted(
+            inodes):
+        raise AssertionError(ordered)
+
+    handle = DirHandle(tmp_path, FdPool())
+    read = list(handle.read_many((f"{n}.json" for n in names), readahead=3))
+    if [name for name, _ in read] != [f"{n}.json" for n in names]:
+        raise AssertionError
+    if read[5][1] is not None or read[6][1] != b'{"n": "6"}':
+        raise AssertionError(read)
+    handle.close()
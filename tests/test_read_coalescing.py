@@ -0,0 +1,71 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test coalescing of identical concurrent finds."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import InMemoryRegistry
+
+COLUMNS = {"id": "INT", "name": "TEXT"}
+TABLE = "test_read_coalescing"
+
+
+@pytest.mark.asyncio
+async def test_identical_finds_share_one_read(tmp_path: Path) -> None:
+    """Test concurrent finds read once and get independent copies."""
+    registry = InMemoryRegistry()
+    db = FilesDB().init_async(storage=tmp_path, metrics=registry)
+    await db.create_table(TABLE, COLUMNS, id_generator="id")
+    await db.insert_many(TABLE, [{"id": i, "name": "a"} for i in range(5)])
+
+    results = await asyncio.gather(*(db.find(TABLE, "name == a")
+                                     for _ in range(20)))
+    if db.coalesced_reads != 19:  # noqa: PLR2004
+        raise AssertionError(db.coalesced_reads)
+    counters = registry.counters("find", TABLE)
+    if (counters["coalesced"], counters["records_decoded"]) != (19, 5):
+        raise AssertionError(counters)
+    results[0][0]["0"]["name"] = "changed"
+    if any(r[0]["0"]["name"] != "a" for r in results[1:]):
+        raise AssertionError
+
+    # Finished reads are not reused, other conditions are not merged.
+    await asyncio.gather(db.find(TABLE, "name == a"),
+                         db.find(TABLE, "id == 1"))
+    if db.coalesced_reads != 19:  # noqa: PLR2004
+        raise AssertionError(db.coalesced_reads)
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller(tmp_path: Path) -> None:
+    """Test cancelling the first caller does not cancel the shared read."""
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(TABLE, COLUMNS, id_generator="id")
+    await db.new_data(TABLE, {"id": 1, "name": "a"})
+    first = asyncio.ensure_future(db.find(TABLE, "id == 1"))
+    second = asyncio.ensure_future(db.find(TABLE, "id == 1"))
+    await asyncio.sleep(0)
+    first.cancel()
+    if await second != [{"1": {"id": 1, "name": "a"}}]:
+        raise AssertionError
+    if db.coalesced_reads != 1:
+        raise AssertionError
+    db.close()
@@ -0,0 +1,219 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test record and columnar results of find."""
+
+import sys
+from array import array
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager import Record
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.utils import ResultCache
+
+COLUMNS = {"id": "INT", "name": "TEXT", "age": "INT", "ts": "DATETIME"}
+TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def test_sync_record_results(tmp_path: Path) -> None:
+    """Test records carry the file id and fields in slots."""
+    table_name = "test_records_sync"
+    db = FilesDB().init_sync(storage=tmp_path,
+                             result_cache=ResultCache(max_records=100))
+    db.create_table(table_name, COLUMNS)
+    db.new_data(table_name, {"id": 1, "name": "John", "age": 30, "ts": TS})
+    db.new_data(table_name, {"id": 2, "name": "Jack"})
+
+    found = db.find(table_name, "name STARTSWITH J", order_by="id",
+                    result_type="record")
+    if [(r.file_id, r.id, r.name, r.age) for r in found] != [
+            ("0", 1, "John", 30), ("1", 2, "Jack", None)]:
+        raise AssertionError(found)
+    record = found[0]
+    if not isinstance(record, Record) or hasattr(record, "__dict__"):
+        raise AssertionError(type(record))
+    if record.ts != TS or record.to_dict() != {
+            "id": 1, "name": "John", "age": 30, "ts": TS}:
+        raise AssertionError(record)
+    if "file_id='0'" not in repr(record):
+        raise AssertionError(repr(record))
+    if sys.getsizeof(record) >= sys.getsizeof(
+            {"id": 1, "name": "John", "age": 30, "ts": TS}):
+        raise AssertionError
+
+    # Cached dict results convert too, and one table shares one class.
+    again = db.find(table_name, "name STARTSWITH J", order_by="id",
+                    result_type="record")
+    if again != found or type(again[1]) is not type(record):
+        raise AssertionError(again)
+    if db.find(table_name, "id == 1") != [{"0": record.to_dict()}]:
+        raise AssertionError
+
+    with pytest.raises(ValueError, match="result_type"):
+        db.find(table_name, "id == 1", result_type="tuple")  # type: ignore[call-overload]
+
+
+def test_sync_record_bad_columns(tmp_path: Path) -> None:
+    """Test columns that cannot be attributes are rejected."""
+    table_name = "test_records_columns"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"file_id": "INT", "x": "INT"})
+    db.new_data(table_name, {"file_id": 1, "x": 1})
+    with pytest.raises(ValueError, match="file_id"):
+        db.find(table_name, "x == 1", result_type="record")
+    if len(db.find(table_name, "x == 1")) != 1:
+        raise AssertionError
+
+
+def test_sync_column_results(tmp_path: Path) -> None:
+    """Test columnar results use typed arrays for numeric columns."""
+    table_name = "test_columns_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, {"id": "INT", "name": "TEXT",
+                                 "score": "FLOAT", "big": "INT"},
+                    id_generator="id")
+    db.insert_many(table_name, [
+        {"id": 1, "name": "a", "score": 0.5, "big": 2**70},
+        {"id": 2, "name": "b", "score": 2, "big": 1},
+        {"id": 3, "name": "c"}])
+    columns = db.find(table_name, "name CONTAINS ''", order_by="id",
+                      result_type="columns")
+    if columns["file_id"] != ["1", "2", "3"] or columns["name"] != [
+            "a", "b", "c"]:
+        raise AssertionError(columns)
+    if columns["id"] != array("q", [1, 2, 3]):
+        raise AssertionError(columns["id"])
+    # A missing value or one beyond int64 falls back to a list.
+    if columns["score"] != [0.5, 2.0, None] or columns["big"] != [
+            2**70, 1, None]:
+        raise AssertionError(columns)
+    if db.find(table_name, "id == 9", result_type="columns") != {
+            "file_id": [], "id": array("q"), "name": [],
+            "score": array("d"), "big": array("q")}:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_record_results(tmp_path: Path) -> None:
+    """Test record results on the async manager."""
+    table_name = "test_records_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.insert_many(table_name, [{"id": i, "name": f"u{i}", "age": i}
+                                      for i in range(5)])
+    found = await db.find(table_name, "name STARTSWITH u", order_by="age",
+                          descending=True, limit=2, result_type="record")
+    if [(r.file_id, r.age) for r in found] != [("4", 4), ("3", 3)]:
+        raise AssertionError(found)
+    columns = await db.find(table_name, "age == 2", result_type="columns")
+    if columns != {"file_id": ["2"], "id": array("q", [2]),
+                   "name": ["u2"], "age": array("q", [2]), "ts": [None]}:
+        raise AssertionError(columns)
+
+
+@pytest.mark.asyncio
+async def test_async_cached_record_results(tmp_path: Path) -> None:
+    """Test cached async finds shape the result on a miss and a hit."""
+    table_name = "test_records_async_cache"
+    cache = ResultCache(max_records=100)
+    db = FilesDB().init_async(storage=tmp_path, result_cache=cache)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.insert_many(table_name, [{"id": i, "name": f"u{i}", "age": i}
+                                      for i in range(5)])
+    for _ in range(2):
+        found = await db.find(table_name, "age == 2", result_type="record")
+        if len(found) != 1 or not isinstance(found[0], Record) or (
+                found[0].file_id, found[0].name) != ("2", "u2"):
+            raise AssertionError(found)
+        columns = await db.find(table_name, "age == 3",
+                                result_type="columns")
+        if columns != {"file_id": ["3"], "id": array("q", [3]),
+                       "name": ["u3"], "age": array("q", [3]),
+                       "ts": [None]}:
+            raise AssertionError(columns)
+    if cache.stats()["hits"] != 2:  # noqa: PLR2004
+        raise AssertionError(cache.stats())
+    db.close()
+
+
+def test_sync_records_built_while_reading(tmp_path: Path) -> None:
+    """Test uncached record results match dicts, limit and order."""
+    table_name = "test_records_streamed_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    db.insert_many(table_name, [{"id": i, "name": f"u{i}", "age": i % 3,
+                                 "ts": TS} for i in range(30)])
+    for options in [{}, {"limit": 4}, {"order_by": "id", "limit": 3}]:
+        dicts = db.find(table_name, "age == 1", **options)
+        records = db.find(table_name, "age == 1", **options,
+                          result_type="record")
+        if [{r.file_id: r.to_dict()} for r in records] != dicts:
+            raise AssertionError(options)
+    if db.find(table_name, "id == 4", result_type="record")[0].ts != TS:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_records_built_while_reading(tmp_path: Path) -> None:
+    """Test uncached record results match dicts on every access path."""
+    table_name = "test_records_streamed"
+    db = FilesDB().init_async(storage=tmp_path, io_workers=2)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.insert_many(table_name, [
+        {"id": i, "name": f"u{i % 7}", "age": i % 5, "ts": TS}
+        for i in range(600)])
+    await db.create_index(table_name, "name")
+    for condition, options in [("age == 3", {}),
+                               ("age == 3", {"limit": 300}),
+                               ("age >= 1", {"order_by": "id",
+                                             "descending": True}),
+                               ("name == u2", {}),
+                               ("id == 42", {})]:
+        dicts = await db.find(table_name, condition, **options)
+        records = await db.find(table_name, condition, **options,
+                                result_type="record")
+        if [{r.file_id: r.to_dict()} for r in records] != dicts:
+            raise AssertionError(condition, options)
+        if dicts and records[0].ts != TS:
+            raise AssertionError(records[0])
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_async_columns_filled_while_reading(tmp_path: Path) -> None:
+    """Test uncached columns match dicts, batch by batch of the pool."""
+    table_name = "test_columns_streamed"
+    db = FilesDB().init_async(storage=tmp_path, io_workers=2)
+    await db.create_table(table_name, {"id": "INT", "score": "FLOAT",
+                                       "big": "INT"}, id_generator="id")
+    # The value beyond int64 in a late batch turns the array into a list.
+    await db.insert_many(table_name, [
+        {"id": i, "score": i / 2, "big": 2**70 if i == 500 else i}  # noqa: PLR2004
+        for i in range(600)])
+    dicts = await db.find(table_name, "id >= 0")
+    columns = await db.find(table_name, "id >= 0", result_type="columns")
+    if columns["file_id"] != [name for found in dicts for name in found]:
+        raise AssertionError(columns["file_id"][:5])
+    records = [record for found in dicts for record in found.values()]
+    if not isinstance(columns["score"], array) or list(
+            columns["score"]) != [r["score"] for r in records]:
+        raise AssertionError(columns["score"][:5])
+    if not isinstance(columns["big"], list) or columns["big"] != [
+            r["big"] for r in records]:
+        raise AssertionError(columns["big"][:5])
+    db.close()
@@ -0,0 +1,111 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the query result cache."""
+
+import time
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import InMemoryRegistry
+from pyfiles_db.utils import ResultCache
+
+data = [
+    {"id": 1, "first_name": "John", "number": 8},
+    {"id": 2, "first_name": "Jane", "number": 12},
+    {"id": 3, "first_name": "Alex", "number": 8},
+]
+COLUMNS = {"id": "INT", "first_name": "TEXT", "number": "INT"}
+
+
+def test_sync_result_cache() -> None:
+    """Test hits until a write to the table bumps its version."""
+    table_name = "test_result_cache_sync"
+    cache = ResultCache()
+    registry = InMemoryRegistry()
+    db = FilesDB().init_sync(result_cache=cache, metrics=registry)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+
+    first = db.find(table_name, "number == 8")
+    # Same normalized condition, served from the cache.
+    second = db.find(table_name, "number==8")
+    if first != second or len(first) != 2:  # noqa: PLR2004
+        raise AssertionError(second)
+    second[0]["1"]["number"] = 100
+    if db.find(table_name, "number == 8") != first:
+        raise AssertionError
+    counters = registry.counters("find", table_name)
+    if (counters["calls"], counters["cache_hits"]) != (3, 2):
+        raise AssertionError(counters)
+
+    db.update(table_name, "3", {"id": 3, "first_name": "Alex", "number": 1})
+    if [list(r) for r in db.find(table_name, "number == 8")] != [["1"]]:
+        raise AssertionError
+    db.delete(table_name, "1")
+    if db.find(table_name, "number == 8") != []:
+        raise AssertionError
+    db.new_data(table_name, {"id": 4, "first_name": "Kate", "number": 8})
+    if [list(r) for r in db.find(table_name, "number == 8")] != [["4"]]:
+        raise AssertionError
+    stats = cache.stats()
+    if (stats["hits"], stats["misses"]) != (2, 4):
+        raise AssertionError(stats)
+
+
+@pytest.mark.asyncio
+async def test_async_result_cache_reads_own_writes() -> None:
+    """Test a coalesced write invalidates results before callers resume."""
+    table_name = "test_result_cache_async"
+    cache = ResultCache()
+    db = FilesDB().init_async(result_cache=cache)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    await db.new_data(table_name, data[0])
+    if len(await db.find(table_name, "first_name == John")) != 1:
+        raise AssertionError
+    await db.new_data(table_name, {"id": 5, "first_name": "John",
+                                   "number": 0})
+    if len(await db.find(table_name, "first_name == John")) != 2:  # noqa: PLR2004
+        raise AssertionError
+    await db.delete(table_name, "5")
+    if len(await db.find(table_name, "first_name == John")) != 1:
+        raise AssertionError
+    db.close()
+
+
+def test_result_cache_ttl_and_bound() -> None:
+    """Test entries expire and the record bound evicts the oldest ones."""
+    cache = ResultCache(max_records=3, ttl=0.05)
+    row = [{"1": {"id": 1}}]
+    cache.put("t", ("id", 1), cache.version("t"), row)
+    if cache.get("t", ("id", 1)) != row:
+        raise AssertionError
+    time.sleep(0.06)
+    if cache.get("t", ("id", 1)) is not None:
+        raise AssertionError
+
+    cache = ResultCache(max_records=3)
+    for i in range(4):
+        cache.put("t", ("id", i), 0, row)
+    if cache.get("t", ("id", 0)) is not None or cache.stats()["records"] != 3:  # noqa: PLR2004
+        raise AssertionError(cache.stats())
+    # A result computed before a write is not cached.
+    version = cache.version("t")
+    cache.bump("t")
+    cache.put("t", ("id", 9), version, row)
+    if cache.get("t", ("id", 9)) is not None:
+        raise AssertionError
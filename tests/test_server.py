@@ -0,0 +1,148 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the local server and its clients."""
+
+import asyncio
+import contextlib
+import socket
+import threading
+import time
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager import Server, _wire
+from pyfiles_db.errors import NotFoundTableError
+from pyfiles_db.files_db import FilesDB
+
+COLUMNS = {"id": "INT", "name": "TEXT", "blob": "BYTES",
+           "seen": "DATETIME"}
+SEEN = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Generator[Path, None, None]:
+    """Serve a fresh storage from a thread, return the socket path."""
+    path = tmp_path / "db.sock"
+    server = Server(FilesDB().init_async(storage=tmp_path / "db"), path)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    yield path
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_sync_client(socket_path: Path, tmp_path: Path) -> None:
+    """Test the sync client against the server."""
+    db = FilesDB().connect_sync(socket_path)
+    db.create_table("people", COLUMNS, id_generator="id")
+    db.new_data("people", {"id": 1, "name": "a", "blob": b"\x00\xff",
+                           "seen": SEEN})
+    if db.insert_many("people", [{"id": 2, "name": "b"},
+                                 {"id": 3, "name": "b"}]) != ["2", "3"]:
+        raise AssertionError
+    if db.find("people", "id == 1") != [
+            {"1": {"id": 1, "name": "a", "blob": b"\x00\xff",
+                   "seen": SEEN}}]:
+        raise AssertionError
+    records = db.find("people", "name == b", result_type="record")
+    if [r.file_id for r in records] != ["2", "3"]:
+        raise AssertionError
+    if db.find("people", "name == b", result_type="columns")["id"][1] != 3:  # noqa: PLR2004
+        raise AssertionError
+    if db.update_where("people", "name == b", {"name": "c"}) != 2:  # noqa: PLR2004
+        raise AssertionError
+    db.delete("people", "3")
+    if db.explain("people", "name == c")["access_path"] != "scan":
+        raise AssertionError
+
+    with pytest.raises(NotFoundTableError) as error:
+        db.find("missing", "id == 1")
+    if error.value.table_name != "TABLE_missing":
+        raise AssertionError(str(error.value))
+    with pytest.raises(FileNotFoundError):
+        db.delete("people", "3")
+
+    done: list[int] = []
+    exported = tmp_path / "out.jsonl"
+    count = db.export_jsonl("people", exported,
+                            progress=lambda rows, _: done.append(rows))
+    if count != 2 or done != [2] or not exported.exists():  # noqa: PLR2004
+        raise AssertionError(done)
+    db.close()
+
+
+def _late_server(listener: socket.socket) -> None:
+    """Answer the first call after its client gave up, then on time."""
+    for delay in (0.3, 0.0):
+        try:
+            conn, _ = listener.accept()
+        except TimeoutError:
+            return
+        with conn:
+            request = _wire.recv(conn)
+            time.sleep(delay)
+            with contextlib.suppress(OSError):
+                conn.sendall(_wire.frame({"id": request["id"],
+                                          "result": request["method"]}))
+
+
+def test_sync_client_drops_late_answers(tmp_path: Path) -> None:
+    """Test an answer after a timeout is not read by the next call."""
+    path = tmp_path / "late.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+    listener.settimeout(5)
+    thread = threading.Thread(target=_late_server, args=(listener,))
+    thread.start()
+    db = FilesDB().connect_sync(path, timeout=0.1)
+    with pytest.raises(TimeoutError):
+        db.new_data("first", {})
+    time.sleep(0.3)
+    if db.insert_many("second", []) != "insert_many":
+        raise AssertionError
+    db.close()
+    thread.join()
+    listener.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces(tmp_path: Path) -> None:
+    """Test concurrent calls of the async client share one connection."""
+    path = tmp_path / "db.sock"
+    server = Server(FilesDB().init_async(storage=tmp_path / "db",
+                                         write_window=0.01), path)
+    await server.start()
+    db = FilesDB().connect_async(path)
+    await db.create_table("items", {"n": "INT"})
+    await asyncio.gather(*(db.new_data("items", {"n": i})
+                           for i in range(20)))
+    found = await db.find("items", "n >= 0", order_by="n")
+    if [next(iter(r.values()))["n"] for r in found] != list(range(20)):
+        raise AssertionError(found)
+    with pytest.raises(ValueError, match="result_type"):
+        await db.find("items", "n == 1", result_type="rows")
+    db.close()
+    await server.close()
+    if path.exists():
+        raise AssertionError
@@ -0,0 +1,118 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the result cache shared between processes."""
+
+import multiprocessing
+import uuid
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.utils import SharedResultCache
+
+COLUMNS = {"id": "INT", "first_name": "TEXT", "number": "INT"}
+TABLE = "test_shared_cache"
+
+
+@pytest.fixture
+def name() -> Generator[str, None, None]:
+    """Return a fresh segment name and destroy the segment after."""
+    segment = f"pyfiles_db_test_{uuid.uuid4().hex[:12]}"
+    yield segment
+    cache = SharedResultCache(segment, size=1 << 16, buckets=64)
+    cache.unlink()
+    cache.close()
+
+
+def test_entries_and_versions_are_shared(name: str) -> None:
+    """Test two maps of one segment see each other's entries and bumps."""
+    a = SharedResultCache(name, size=1 << 16, buckets=64)
+    b = SharedResultCache(name)
+    key = ("number", "==", 8, None, None)
+    result = [{"1": {"id": 1, "number": 8}}]
+    a.put("t", key, a.version("t"), result)
+    if b.get("t", key) != result or b.get("t", ("other",)) is not None:
+        raise AssertionError
+    b.bump("t")
+    if a.get("t", key) is not None:
+        raise AssertionError
+    # A result read before the bump is not cached.
+    a.put("t", key, 0, result)
+    if b.get("t", key) is not None:
+        raise AssertionError
+
+    # The ring overwrites the oldest entries.
+    big = [{str(i): {"id": i, "text": "x" * 100}} for i in range(30)]
+    for i in range(40):
+        a.put("t", (i,), a.version("t"), big)
+    if a.get("t", (0,)) is not None or a.get("t", (39,)) != big:
+        raise AssertionError
+    a.clear()
+    if b.get("t", (39,)) is not None:
+        raise AssertionError
+    a.close()
+    b.close()
+
+
+def _worker_find(storage: str, segment: str) -> tuple[int, int]:
+    """Find in a fresh process, return records found and cache hits."""
+    cache = SharedResultCache(segment)
+    db = FilesDB().init_sync(storage=storage, result_cache=cache)
+    found = len(db.find(TABLE, "number == 8"))
+    hits = cache.stats()["hits"]
+    cache.close()
+    return found, hits
+
+
+def test_processes_share_results(tmp_path: Path, name: str) -> None:
+    """Test a worker process reads results cached by another one."""
+    cache = SharedResultCache(name, size=1 << 16, buckets=64)
+    db = FilesDB().init_sync(storage=tmp_path, result_cache=cache)
+    db.create_table(TABLE, COLUMNS, id_generator="id")
+    db.insert_many(TABLE, [{"id": i, "first_name": "a", "number": 8 + i % 2}
+                           for i in range(4)])
+    db.find(TABLE, "number == 8")
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        if pool.apply(_worker_find, (str(tmp_path), name)) != (2, 1):
+            raise AssertionError
+        # A write in this process invalidates the worker's view.
+        db.update(TABLE, "1", {"id": 1, "first_name": "a", "number": 8})
+        if pool.apply(_worker_find, (str(tmp_path), name)) != (3, 0):
+            raise AssertionError
+    cache.close()
+
+
+def test_datetime_and_bytes_results(tmp_path: Path, name: str) -> None:
+    """Test results with DATETIME and BYTES values are cached."""
+    cache = SharedResultCache(name, size=1 << 16, buckets=64)
+    db = FilesDB().init_sync(storage=tmp_path, result_cache=cache)
+    db.create_table(TABLE, {"id": "INT", "ts": "DATETIME", "blob": "BYTES"},
+                    id_generator="id")
+    ts = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+    db.new_data(TABLE, {"id": 1, "ts": ts, "blob": b"\x00\xffdata"})
+    first = db.find(TABLE, "id == 1")
+    second = db.find(TABLE, "id == 1")
+    if first != second or cache.stats()["hits"] != 1:
+        raise AssertionError
+    record = second[0]["1"]
+    if record["ts"] != ts or record["blob"] != b"\x00\xffdata":
+        raise AssertionError
+    cache.close()
@@ -0,0 +1,116 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test slow-query log."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import InMemoryRegistry, OperationStats, SlowQueryLog
+
+data = [
+    {"id": 1, "first_name": "John", "number": 8},
+    {"id": 2, "first_name": "Jane", "number": 12},
+    {"id": 3, "first_name": "Alex", "number": 8},
+]
+COLUMNS = {"id": "INT", "first_name": "TEXT", "number": "INT"}
+
+
+def test_sync_slow_query_log(tmp_path: Path) -> None:
+    """Test every query is logged with a zero threshold."""
+    table_name = "test_slow_query_sync"
+    log_path = tmp_path / "slow.log"
+    entries: list[dict[str, Any]] = []
+    registry = InMemoryRegistry()
+    slow_log = SlowQueryLog(0.0, path=log_path, callback=entries.append)
+    db = FilesDB().init_sync(metrics=registry, slow_query_log=slow_log)
+    if db.slow_query_log is not slow_log:
+        raise AssertionError
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+    db.find(table_name, "number == 8")
+    db.find(table_name, "id == 2")
+    db.update(table_name, "2", {"id": 2, "first_name": "Jane", "number": 1})
+    db.delete(table_name, "3")
+    slow_log.close()
+
+    paths = [(e["operation"], e["access_path"]) for e in entries]
+    if paths != [("find", "scan"), ("find", "generator"),
+                 ("update", "file_id"), ("delete", "file_id")]:
+        raise AssertionError(paths)
+    scan = entries[0]
+    if (scan["table"], scan["condition"], scan["files_opened"],
+            scan["records_decoded"]) != (table_name, "number == 8", 3, 3):
+        raise AssertionError(scan)
+    if scan["bytes_read"] == 0 or scan["elapsed_ms"] < 0:
+        raise AssertionError(scan)
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    if [json.loads(line) for line in lines] != entries:
+        raise AssertionError(lines)
+    # The slow log does not take the place of the metrics sink.
+    if registry.counters("new_data", table_name)["calls"] != len(data):
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_slow_query_log() -> None:
+    """Test the async manager logs the access path of its queries."""
+    table_name = "test_slow_query_async"
+    entries: list[dict[str, Any]] = []
+    slow_log = SlowQueryLog(0.0, callback=entries.append)
+    db = FilesDB().init_async(slow_query_log=slow_log)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        await db.new_data(table_name, d)
+    await db.find(table_name, "first_name == Jane")
+    await db.find(table_name, "id == 1")
+    db.close()
+
+    paths = [(e["condition"], e["access_path"]) for e in entries]
+    if paths != [("first_name == Jane", "scan"), ("id == 1", "generator")]:
+        raise AssertionError(paths)
+
+
+def test_slow_query_threshold() -> None:
+    """Test fast queries and other operations are not logged."""
+    entries: list[dict[str, Any]] = []
+    slow_log = SlowQueryLog(0.5, callback=entries.append)
+    slow_log.record(OperationStats("find", "t", elapsed=0.1))
+    slow_log.record(OperationStats("new_data", "t", elapsed=1.0))
+    slow_log.record(OperationStats("find", "t", "id == 1", "scan",
+                                   elapsed=1.0))
+    if [e["condition"] for e in entries] != ["id == 1"]:
+        raise AssertionError(entries)
+    with pytest.raises(ValueError, match="path or a callback"):
+        SlowQueryLog(0.5)
+
+
+def test_slow_query_log_rotates(tmp_path: Path) -> None:
+    """Test the log file is rotated at its size limit."""
+    log_path = tmp_path / "slow.log"
+    slow_log = SlowQueryLog(0.0, path=log_path, max_bytes=512,
+                            backup_count=2)
+    for _ in range(20):
+        slow_log.record(OperationStats("find", "t", "id == 1", "scan"))
+    slow_log.close()
+    if not (tmp_path / "slow.log.1").exists():
+        raise AssertionError
+    if (tmp_path / "slow.log.3").exists():
+        raise AssertionError
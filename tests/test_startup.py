@@ -0,0 +1,64 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test lazy imports and deferred database setup."""
+
+import json
+from pathlib import Path
+
+from benchmarks.startup import main, measure
+from pyfiles_db.database_manager.meta import META
+from pyfiles_db.files_db import FilesDB
+
+
+def test_sync_startup_imports_no_async_modules() -> None:
+    """Test a sync-only process never imports aiofiles or asyncio."""
+    result = measure("sync", 1)
+    if result["heavy_modules"]:
+        raise AssertionError(result)
+
+
+def test_async_startup_defers_aiofiles() -> None:
+    """Test aiofiles is only imported by the fallback file calls."""
+    result = measure("async", 1)
+    if "aiofiles" in result["heavy_modules"]:
+        raise AssertionError(result)
+
+
+def test_storage_created_on_first_use(tmp_path: Path) -> None:
+    """Test creating a manager touches no files until it is used."""
+    storage = tmp_path / "db"
+    db = FilesDB().init_sync(storage=storage,
+                             meta={META.TABLE_PREFIX: "T_"})
+    if storage.exists():
+        raise AssertionError
+    db.create_table("users", {"id": "INT"}, id_generator="id")
+    meta = json.loads((storage / "meta.json").read_text())
+    if meta[META.TABLE_PREFIX] != "T_" or "T_users" not in meta[META.TABLES]:
+        raise AssertionError(meta)
+
+
+def test_startup_budget(tmp_path: Path) -> None:
+    """Test the benchmark fails only when over budget."""
+    output = tmp_path / "startup.json"
+    if main(["--runs", "1", "--modes", "sync", "--budget-ms", "100000",
+             "--output", str(output)]) != 0:
+        raise AssertionError
+    report = json.loads(output.read_text())
+    if report["over_budget"] or report["results"][0]["mode"] != "sync":
+        raise AssertionError(report)
+    if main(["--runs", "1", "--modes", "sync", "--budget-ms", "0",
+             "--output", str(output)]) != 1:
+        raise AssertionError
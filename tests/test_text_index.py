@@ -0,0 +1,137 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test STARTSWITH/CONTAINS conditions and column indexes."""
+
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.errors import InvalidConditionError
+from pyfiles_db.files_db import FilesDB
+
+data = [
+    {"id": 1, "name": "John", "email": "john@corp.com", "age": 30},
+    {"id": 2, "name": "Joanna", "email": "jo@mail.org", "age": 25},
+    {"id": 3, "name": "Alex", "email": "alex@corp.com", "age": 41},
+    {"id": 4, "name": "Bojo", "email": "bojo@home.net", "age": 19},
+    {"id": 5, "name": "Mary Ann", "email": "mary@corp.com", "age": 33},
+]
+COLUMNS = {"id": "INT", "name": "TEXT", "email": "TEXT", "age": "INT"}
+
+
+def ids(result: list[dict[str, object]]) -> list[str]:
+    """Return file ids of a find result."""
+    return [name for record in result for name in record]
+
+
+def test_sync_text_index(tmp_path: Path) -> None:
+    """Test the index answers the same as a scan, from fewer records."""
+    table_name = "test_text_index_sync"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+
+    scanned = db.find(table_name, "name STARTSWITH 'Jo'")
+    if ids(scanned) != ["1", "2"]:
+        raise AssertionError(scanned)
+    plan = db.explain(table_name, "name STARTSWITH 'Jo'")
+    if (plan["access_path"], plan["candidates"]) != ("scan", len(data)):
+        raise AssertionError(plan)
+
+    if db.create_index(table_name, "name") != len(data):
+        raise AssertionError
+    db.create_index(table_name, "email")
+    if db.find(table_name, "name STARTSWITH 'Jo'") != scanned:
+        raise AssertionError
+    plan = db.explain(table_name, "name STARTSWITH Jo")
+    if (plan["access_path"], plan["candidates"]) != ("index", 2):
+        raise AssertionError(plan)
+    if ids(db.find(table_name, "email CONTAINS '@corp'")) != ["1", "3", "5"]:
+        raise AssertionError
+    short_needle = ids(db.find(table_name, "name contains 'jo'"))
+    quoted = ids(db.find(table_name, "name == 'Mary Ann'"))
+    if (short_needle, quoted) != (["4"], ["5"]):
+        raise AssertionError
+    if db.explain(table_name, "name == Alex")["candidates"] != 1:
+        raise AssertionError
+
+
+def test_sync_text_index_follows_writes(tmp_path: Path) -> None:
+    """Test inserts, updates, deletes and compaction keep the index right."""
+    table_name = "test_text_index_writes"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+    db.create_index(table_name, "name")
+    db.create_index(table_name, "email")
+
+    db.new_data(table_name, {"id": 6, "name": "Jolene", "email": "j@x.io",
+                             "age": 50})
+    db.update(table_name, "1", {"id": 1, "name": "Ben", "email": "b@x.io",
+                                "age": 30})
+    db.delete(table_name, "2")
+    if ids(db.find(table_name, "name STARTSWITH 'Jo'")) != ["6"]:
+        raise AssertionError
+    if ids(db.find(table_name, "email CONTAINS '@corp'")) != ["3", "5"]:
+        raise AssertionError
+
+    # Another manager (as another process would) appends to the journal.
+    other = FilesDB().init_sync(storage=tmp_path)
+    other.update(table_name, "4", {"id": 4, "name": "Jo", "email": "",
+                                   "age": 19})
+    if ids(db.find(table_name, "name STARTSWITH 'Jo'")) != ["6", "4"]:
+        raise AssertionError
+
+    journal = tmp_path / f"TABLE_{table_name}" / ".idx-name"
+    size = journal.stat().st_size
+    db.compact(table_name)
+    if journal.stat().st_size >= size:
+        raise AssertionError
+    if ids(other.find(table_name, "name STARTSWITH 'Jo'")) != ["6", "4"]:
+        raise AssertionError
+
+
+def test_invalid_conditions(tmp_path: Path) -> None:
+    """Test text operators need a TEXT column and a known operator."""
+    table_name = "test_text_index_errors"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    with pytest.raises(InvalidConditionError, match="TEXT"):
+        db.find(table_name, "age STARTSWITH 3")
+    with pytest.raises(ValueError, match="Invalid condition"):
+        db.find(table_name, "name LIKE 'Jo%'")
+
+
+@pytest.mark.asyncio
+async def test_async_text_index(tmp_path: Path) -> None:
+    """Test the async manager uses and maintains the index."""
+    table_name = "test_text_index_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        await db.new_data(table_name, d)
+    await db.create_index(table_name, "email")
+    await db.update(table_name, "3", {"id": 3, "name": "Alex",
+                                      "email": "alex@home.net", "age": 41})
+    result = await db.find(table_name, "email CONTAINS '@corp'")
+    if ids(result) != ["1", "5"]:
+        raise AssertionError(result)
+    plan = await db.explain(table_name, "email CONTAINS 'home'")
+    if (plan["access_path"], plan["candidates"]) != ("index", 2):
+        raise AssertionError(plan)
+    db.close()
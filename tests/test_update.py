@@ -16,6 +16,9 @@
 """Test for update data."""
 
 
+import asyncio
+from pathlib import Path
+
 import pytest
 
 from src.pyfiles_db.files_db import FilesDB
@@ -104,3 +107,23 @@ async def test_async_update() -> None:
     if data_id_5[0] != data_id_5_2[0]:
         msg = f"Data is not equal: {data_id_5} == {data_id_5_2}, {file_id_5_2}"
         raise ValueError(msg)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_updates_of_one_record(tmp_path: Path) -> None:
+    """Test concurrent updates of one record never share a temp file."""
+    db_name = "test_update_concurrent"
+    # Without the I/O pool every write goes through aiofiles.
+    db = FilesDB().init_async(storage=tmp_path, io_workers=0)
+    await db.create_table(db_name, {"id": "INT", "note": "TEXT"},
+                          id_generator="id")
+    await db.new_data(db_name, {"id": 1, "note": ""})
+    notes = ["x" * (i * 1000) for i in range(20)]
+    await asyncio.gather(*(db.update(db_name, "1", {"id": 1, "note": note})
+                           for note in notes))
+    found = await db.find(db_name, "id == 1")
+    if found[0]["1"]["note"] not in notes:
+        raise AssertionError
+    folder = tmp_path / f"TABLE_{db_name}"
+    if [p.name for p in folder.iterdir() if p.suffix == ".tmp"]:
+        raise AssertionError
@@ -0,0 +1,103 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test set-based deletes and updates."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager._id_set import _IdSet
+from pyfiles_db.errors import DataIsUncorrectError
+from pyfiles_db.files_db import FilesDB
+from pyfiles_db.metrics import CallbackSink, OperationStats
+
+COLUMNS = {"id": "INT", "name": "TEXT", "age": "INT"}
+data = [{"id": i, "name": f"user{i}", "age": i % 3} for i in range(1, 31)]
+
+
+def ids(result: list[dict[str, object]]) -> list[str]:
+    """Return file ids of a find result."""
+    return [name for record in result for name in record]
+
+
+def test_sync_delete_where(tmp_path: Path) -> None:
+    """Test delete_where removes matches with one index rewrite."""
+    table_name = "test_delete_where"
+    seen: list[OperationStats] = []
+    db = FilesDB().init_sync(storage=tmp_path,
+                             metrics=CallbackSink(seen.append))
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data:
+        db.new_data(table_name, d)
+    db.create_index(table_name, "name")
+
+    if db.delete_where(table_name, "age == 0") != 10:  # noqa: PLR2004
+        raise AssertionError
+    # The id list stays resident, so only records and the rewrite count.
+    index = tmp_path / f"TABLE_{table_name}" / ".json"
+    if (seen[-1].bytes_written, seen[-1].files_opened) != (
+            index.stat().st_size, len(data) + 1):
+        raise AssertionError(seen[-1])
+    names = list(_IdSet.from_json(
+        json.loads(index.read_text())["FILE_IDS"]))
+    if names != [str(d["id"]) for d in data if d["age"] != 0]:
+        raise AssertionError(names)
+    if db.find(table_name, "name == user3") != []:
+        raise AssertionError
+    if db.delete_where(table_name, "age == 0") != 0:
+        raise AssertionError
+
+
+def test_sync_update_where(tmp_path: Path) -> None:
+    """Test update_where writes changed records and keeps indexes right."""
+    table_name = "test_update_where"
+    db = FilesDB().init_sync(storage=tmp_path)
+    db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data[:6]:
+        db.new_data(table_name, d)
+    db.create_index(table_name, "name")
+    db.update(table_name, "4", {"id": 4, "name": "done", "age": 1})
+
+    if db.update_where(table_name, "age == 1", {"name": "done"}) != 1:
+        raise AssertionError
+    if sorted(ids(db.find(table_name, "name == done"))) != ["1", "4"]:
+        raise AssertionError
+    if db.update_where(table_name, "name STARTSWITH user", {"age": 9}) != 4:  # noqa: PLR2004
+        raise AssertionError
+    if ids(db.find(table_name, "age == 9")) != ["2", "3", "5", "6"]:
+        raise AssertionError
+    with pytest.raises(DataIsUncorrectError):
+        db.update_where(table_name, "age == 9", {"id": 1})
+
+
+@pytest.mark.asyncio
+async def test_async_where(tmp_path: Path) -> None:
+    """Test delete_where and update_where on the async manager."""
+    table_name = "test_where_async"
+    db = FilesDB().init_async(storage=tmp_path)
+    await db.create_table(table_name, COLUMNS, id_generator="id")
+    for d in data[:9]:
+        await db.new_data(table_name, d)
+    if await db.update_where(table_name, "age == 2", {"name": "two"}) != 3:  # noqa: PLR2004
+        raise AssertionError
+    if await db.delete_where(table_name, "age == 0") != 3:  # noqa: PLR2004
+        raise AssertionError
+    result = await db.find(table_name, "name == two")
+    if ids(result) != ["2", "5", "8"]:
+        raise AssertionError(result)
+    if len(await db.find(table_name, "name STARTSWITH ''")) != 6:  # noqa: PLR2004
+        raise AssertionError
+    db.close()
@@ -0,0 +1,100 @@
+# Copyright 2025 LangNeuron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test coalescing of concurrent async writes."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from pyfiles_db.database_manager._id_set import _IdSet
+from pyfiles_db.database_manager._write_coalescer import (
+    _PendingWrite,
+    _WriteCoalescer,
+)
+from pyfiles_db.files_db import FilesDB
+
+ROWS = 200
+
+
+def read_file_ids(table_name: str) -> list[str]:
+    """Read file ids of a table from disk."""
+    with Path.open(Path("database") / f"TABLE_{table_name}" / ".json") as f:
+        return list(_IdSet.from_json(json.load(f)["FILE_IDS"]))
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_new_data() -> None:
+    """Test that concurrent inserts keep every id."""
+    table_name = "test_concurrent_new_data"
+    db = FilesDB().init_async()
+    await db.create_table(table_name, {"number": "INT"})
+
+    await asyncio.gather(*(db.new_data(table_name, {"number": i})
+                           for i in range(ROWS)))
+
+    ids = read_file_ids(table_name)
+    if sorted(ids, key=int) != [str(i) for i in range(ROWS)]:
+        raise AssertionError(ids)
+    with Path.open(Path("database") / "meta.json") as f:
+        meta = json.load(f)
+    if meta[f"TABLE_{table_name}"]["GENERATOR"] != ROWS:
+        raise AssertionError(meta)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_mixed_writes() -> None:
+    """Test concurrent inserts and deletes with a write window."""
+    table_name = "test_concurrent_mixed_writes"
+    db = FilesDB().init_async(write_window=0.01)
+    await db.create_table(table_name, {"id": "INT"}, id_generator="id")
+    await asyncio.gather(*(db.new_data(table_name, {"id": i})
+                           for i in range(ROWS)))
+
+    results = await asyncio.gather(
+        *(db.delete(table_name, str(i)) for i in range(0, ROWS, 2)),
+        db.delete(table_name, "missing"),
+        return_exceptions=True)
+
+    if not isinstance(results[-1], FileNotFoundError):
+        raise TypeError(results[-1])
+    if sorted(read_file_ids(table_name), key=int) != [
+            str(i) for i in range(1, ROWS, 2)]:
+        raise AssertionError(read_file_ids(table_name))
+    if await db.find(table_name, "id == 2") != []:
+        raise AssertionError
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_flush_fails_waiters() -> None:
+    """Test callers are released when the flush task is cancelled."""
+    started = asyncio.Event()
+
+    async def flush(_: list[_PendingWrite]) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    coalescer = _WriteCoalescer(flush)
+    first = asyncio.ensure_future(coalescer.insert({"id": 1}))
+    await started.wait()
+    second = asyncio.ensure_future(coalescer.insert({"id": 2}))
+    await asyncio.sleep(0)
+    for task in list(coalescer._running):  # noqa: SLF001
+        task.cancel()
+    _, pending = await asyncio.wait([first, second], timeout=1)
+    if pending or not (first.cancelled() and second.cancelled()):
+        raise AssertionError((first, second))